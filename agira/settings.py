@@ -233,6 +233,14 @@ FIELD_ENCRYPTION_KEY = os.getenv('FIELD_ENCRYPTION_KEY', 'D_GzCwyVvkyI1o5qUh9rle
 # Attachment Storage Configuration
 AGIRA_DATA_DIR = BASE_DIR / os.getenv('AGIRA_DATA_DIR', 'data')
 AGIRA_MAX_ATTACHMENT_SIZE_MB = int(os.getenv('AGIRA_MAX_ATTACHMENT_SIZE_MB', '25'))
+# Let the web server send attachment files: '' (Django streams them),
+# 'x-accel-redirect' (nginx, internal location ATTACHMENT_SENDFILE_URL_PREFIX
+# aliased to AGIRA_DATA_DIR) or 'x-sendfile' (Apache mod_xsendfile)
+ATTACHMENT_SENDFILE = os.getenv('ATTACHMENT_SENDFILE', '')
+ATTACHMENT_SENDFILE_URL_PREFIX = os.getenv('ATTACHMENT_SENDFILE_URL_PREFIX', '/protected-attachments/')
+# PDF/DOCX attachments up to this size are parsed inline on first use; larger
+# ones are extracted by the attachment_text_worker command
+ATTACHMENT_TEXT_INLINE_MAX_MB = float(os.getenv('ATTACHMENT_TEXT_INLINE_MAX_MB', '2'))
 
 # Claude Code Queue Worker Configuration
 # ============================================================================
@@ -286,11 +294,45 @@ REDIS_CACHE_PASSWORD = os.getenv('REDIS_CACHE_PASSWORD', None)
 REDIS_CACHE_SOCKET_TIMEOUT = int(os.getenv('REDIS_CACHE_SOCKET_TIMEOUT', '5'))
 REDIS_CACHE_SOCKET_CONNECT_TIMEOUT = int(os.getenv('REDIS_CACHE_SOCKET_CONNECT_TIMEOUT', '5'))
 
+# RAG Result Cache (extended RAG contexts, uses the Redis connection above)
+RAG_CACHE_ENABLED = os.getenv('RAG_CACHE_ENABLED', 'True') == 'True'
+RAG_CACHE_TTL_SECONDS = int(os.getenv('RAG_CACHE_TTL_SECONDS', '3600'))
+
+# Single-flight deduplication of identical concurrent agent calls (uses the
+# Redis connection above across processes, in-process locking otherwise)
+AGENT_SINGLE_FLIGHT_ENABLED = os.getenv('AGENT_SINGLE_FLIGHT_ENABLED', 'True') == 'True'
+AGENT_SINGLE_FLIGHT_WAIT_SECONDS = float(os.getenv('AGENT_SINGLE_FLIGHT_WAIT_SECONDS', '60'))
+
+# Concurrent agent calls per AI provider and process (AgentService.execute_many)
+AGENT_MAX_CONCURRENCY_PER_PROVIDER = int(os.getenv('AGENT_MAX_CONCURRENCY_PER_PROVIDER', '4'))
+
 # Weaviate Search Configuration
 WEAVIATE_SEARCH_LIMIT = int(os.getenv('WEAVIATE_SEARCH_LIMIT', '25'))
 WEAVIATE_SEARCH_ALPHA = float(os.getenv('WEAVIATE_SEARCH_ALPHA', '0.5'))
 WEAVIATE_SEARCH_MIN_QUERY_LENGTH = int(os.getenv('WEAVIATE_SEARCH_MIN_QUERY_LENGTH', '2'))
 
+# Weaviate Chunking (attachments longer than one chunk are indexed as
+# overlapping, section-aware chunks)
+WEAVIATE_CHUNK_SIZE_CHARS = int(os.getenv('WEAVIATE_CHUNK_SIZE_CHARS', '4000'))
+WEAVIATE_CHUNK_OVERLAP_CHARS = int(os.getenv('WEAVIATE_CHUNK_OVERLAP_CHARS', '400'))
+WEAVIATE_MAX_CHUNKS = int(os.getenv('WEAVIATE_MAX_CHUNKS', '500'))
+
+# Weaviate Client Pool Configuration
+WEAVIATE_POOL_MAX_SIZE = int(os.getenv('WEAVIATE_POOL_MAX_SIZE', '4'))
+WEAVIATE_POOL_HEALTH_CHECK_INTERVAL = float(os.getenv('WEAVIATE_POOL_HEALTH_CHECK_INTERVAL', '30'))
+WEAVIATE_POOL_ACQUIRE_TIMEOUT = float(os.getenv('WEAVIATE_POOL_ACQUIRE_TIMEOUT', '10'))
+
+# Integration HTTP Connection Pool (GitHub and other HTTPClient integrations)
+INTEGRATION_HTTP_MAX_CONNECTIONS = int(os.getenv('INTEGRATION_HTTP_MAX_CONNECTIONS', '20'))
+INTEGRATION_HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv('INTEGRATION_HTTP_MAX_KEEPALIVE_CONNECTIONS', '10'))
+INTEGRATION_HTTP_KEEPALIVE_EXPIRY = float(os.getenv('INTEGRATION_HTTP_KEEPALIVE_EXPIRY', '30'))
+INTEGRATION_HTTP2 = os.getenv('INTEGRATION_HTTP2', 'False') == 'True'
+
+# AI Router Configuration
+# Active AI models are cached per process for this many seconds (0 disables);
+# changes saved in this process invalidate the cache immediately
+AI_MODEL_CACHE_TTL_SECONDS = float(os.getenv('AI_MODEL_CACHE_TTL_SECONDS', '30'))
+
 # Azure AD / MSAL Configuration
 AZURE_AD_ENABLED = os.getenv('AZURE_AD_ENABLED', 'False') == 'True'
 AZURE_AD_TENANT_ID = os.getenv('AZURE_AD_TENANT_ID', '')
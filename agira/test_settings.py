@@ -1,4 +1,7 @@
 """Test settings for running tests without PostgreSQL."""
+import tempfile
+from pathlib import Path
+
 from .settings import *
 
 DATABASES = {
@@ -25,3 +28,6 @@ STORAGES = {
         "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage",
     },
 }
+
+# Keep attachment blobs written by tests out of the repository's data/ directory
+AGIRA_DATA_DIR = Path(tempfile.mkdtemp(prefix='agira-test-data-'))
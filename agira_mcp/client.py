@@ -7,8 +7,13 @@ Claude) and forwards the connecting user's personal token as
 """
 from __future__ import annotations
 
+from collections.abc import Iterator
+
 import httpx
 
+# Page size used when walking the paginated item lists.
+ITEM_PAGE_SIZE = 200
+
 
 class AgiraError(Exception):
     """Raised when the Agira API returns a non-2xx response."""
@@ -37,12 +42,13 @@ class AgiraClient:
             headers["x-agira-user-token"] = user_token
         return headers
 
-    def _request(self, method: str, path: str, *, user_token: str | None = None,
-                 json: dict | None = None) -> dict | list:
+    def _send(self, method: str, path: str, *, user_token: str | None = None,
+              json: dict | None = None, params: dict | None = None) -> httpx.Response:
         url = f"{self.base_url}/api/customgpt/{path.lstrip('/')}"
         try:
             with httpx.Client(timeout=self.timeout) as client:
-                resp = client.request(method, url, headers=self._headers(user_token), json=json)
+                resp = client.request(method, url, headers=self._headers(user_token),
+                                      json=json, params=params)
         except httpx.RequestError as exc:
             raise AgiraError(0, f"Could not reach Agira at {url}: {exc}") from exc
 
@@ -53,11 +59,32 @@ class AgiraClient:
             except Exception:
                 detail = resp.text
             raise AgiraError(resp.status_code, str(detail))
+        return resp
 
+    def _request(self, method: str, path: str, *, user_token: str | None = None,
+                 json: dict | None = None, params: dict | None = None) -> dict | list:
+        resp = self._send(method, path, user_token=user_token, json=json, params=params)
         if not resp.content:
             return {}
         return resp.json()
 
+    def _iter_pages(self, path: str, *, fields: list[str] | None = None,
+                    updated_since: str | None = None,
+                    page_size: int = ITEM_PAGE_SIZE) -> Iterator[list]:
+        """Yield the pages of a paginated item list, following X-Next-Cursor."""
+        params: dict = {"limit": page_size}
+        if fields:
+            params["fields"] = ",".join(fields)
+        if updated_since:
+            params["updated_since"] = updated_since
+        while True:
+            resp = self._send("GET", path, params=params)
+            yield resp.json()
+            cursor = resp.headers.get("x-next-cursor")
+            if not cursor:
+                return
+            params["cursor"] = cursor
+
     # ----- Projects -------------------------------------------------------
     def list_projects(self) -> list:
         return self._request("GET", "projects")
@@ -65,12 +92,18 @@ class AgiraClient:
     def get_project(self, project_id: int) -> dict:
         return self._request("GET", f"projects/{project_id}")
 
-    def get_project_open_items(self, project_id: int) -> list:
-        return self._request("GET", f"projects/{project_id}/open-items")
+    def get_project_open_items(self, project_id: int, *, fields: list[str] | None = None,
+                               updated_since: str | None = None) -> list:
+        return [item for page in self._iter_pages(f"projects/{project_id}/open-items",
+                                                  fields=fields, updated_since=updated_since)
+                for item in page]
 
     # ----- Items ----------------------------------------------------------
-    def list_open_items(self) -> list:
-        return self._request("GET", "items")
+    def list_open_items(self, *, fields: list[str] | None = None,
+                        updated_since: str | None = None) -> list:
+        return [item for page in self._iter_pages("items", fields=fields,
+                                                  updated_since=updated_since)
+                for item in page]
 
     def get_item(self, item_id: int) -> dict:
         return self._request("GET", f"items/{item_id}")
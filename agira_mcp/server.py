@@ -126,18 +126,26 @@ def get_project(project_id: int) -> dict:
 
 
 @mcp.tool()
-def list_open_items(project_id: int | None = None) -> list:
+def list_open_items(project_id: int | None = None, fields: list[str] | None = None,
+                    updated_since: str | None = None) -> list:
     """
     List open items (status != Closed). Optionally scoped to one project.
 
     Each returned item includes ``id`` and ``status`` (the canonical
     ItemStatus value, e.g. "Working", "Review") as top-level fields, so the
     id-to-status mapping never requires a separate lookup.
+
+    Pass ``fields`` (e.g. ``["title", "status", "assigned_to_id"]``) to skip
+    the long text fields (description, user_input, solution_description,
+    pr_description) when only an overview is needed; ``id`` is always
+    included. Pass ``updated_since`` (ISO 8601 date or datetime) to only get
+    items changed since then. Results are fetched page by page.
     """
     client = _client()
     if project_id is not None:
-        return client.get_project_open_items(project_id)
-    return client.list_open_items()
+        return client.get_project_open_items(project_id, fields=fields,
+                                             updated_since=updated_since)
+    return client.list_open_items(fields=fields, updated_since=updated_since)
 
 
 @mcp.tool()
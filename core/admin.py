@@ -5,14 +5,14 @@ from .models import (
     Organisation, ItemType, User, UserOrganisation,
     Project, Node, Release, Change, ChangeApproval, ChangePolicy, ChangePolicyRole,
     Item, ItemRelation, ExternalIssueMapping, ItemComment,
-    Attachment, AttachmentLink, Activity,
+    Attachment, AttachmentLink, AttachmentTextExtract, Activity,
     GitHubConfiguration, WeaviateConfiguration, GooglePSEConfiguration,
     GraphAPIConfiguration, ZammadConfiguration,
-    AIProvider, AIModel, AIJobsHistory,
+    AIProvider, AIModel, AIJobsHistory, AIAgentDedupStats,
     ExternalIssueKind, MailTemplate, OrganisationEmbedProject,
     IssueOpenQuestion, IssueStandardAnswer, GlobalSettings, SystemSetting,
     IssueBlueprintCategory, IssueBlueprint,
-    ClaudeQueueJob
+    ClaudeQueueJob, WeaviateSyncEvent, GitHubResponseCache
 )
 from core.services.github.service import GitHubService
 from core.services.integrations.base import IntegrationError
@@ -462,13 +462,26 @@ class AttachmentLinkAdmin(admin.ModelAdmin):
     readonly_fields = ['created_at']
 
 
+@admin.register(AttachmentTextExtract)
+class AttachmentTextExtractAdmin(admin.ModelAdmin):
+    list_display = ['sha256', 'extractor', 'status', 'page_count', 'extraction_ms', 'attempts', 'updated_at']
+    list_filter = ['status', 'extractor']
+    search_fields = ['sha256', 'last_error']
+    readonly_fields = ['sha256', 'extractor', 'text', 'page_count', 'extraction_ms', 'created_at', 'updated_at']
+
+    def has_add_permission(self, request):
+        # Extracts are created when attachment text is first needed
+        return False
+
+
 @admin.register(Activity)
 class ActivityAdmin(admin.ModelAdmin):
-    list_display = ['created_at', 'verb', 'actor', 'summary', 'target_content_type', 'target_object_id']
+    list_display = ['created_at', 'verb', 'actor', 'project', 'summary', 'target_content_type', 'target_object_id']
     list_filter = ['verb', 'actor', 'created_at']
     search_fields = ['summary', 'verb']
     autocomplete_fields = ['actor']
-    readonly_fields = ['created_at', 'target_content_type', 'target_object_id']
+    list_select_related = ['actor', 'project', 'target_content_type']
+    readonly_fields = ['created_at', 'target_content_type', 'target_object_id', 'project']
     date_hierarchy = 'created_at'
     
     def has_add_permission(self, request):
@@ -527,6 +540,29 @@ class WeaviateConfigurationAdmin(ConfigurationAdmin):
     )
 
 
+@admin.register(WeaviateSyncEvent)
+class WeaviateSyncEventAdmin(admin.ModelAdmin):
+    list_display = ['id', 'object_type', 'object_id', 'action', 'created_at', 'next_attempt_at', 'attempts']
+    list_filter = ['object_type', 'action']
+    search_fields = ['object_id', 'last_error']
+    readonly_fields = ['created_at']
+
+    def has_add_permission(self, request):
+        # Events are written by model signals, not manually
+        return False
+
+
+@admin.register(GitHubResponseCache)
+class GitHubResponseCacheAdmin(admin.ModelAdmin):
+    list_display = ['path', 'etag', 'fetched_at', 'last_used_at']
+    search_fields = ['path']
+    readonly_fields = ['cache_key', 'path', 'etag', 'last_modified', 'payload', 'fetched_at', 'last_used_at']
+
+    def has_add_permission(self, request):
+        # Entries are written by the GitHub client
+        return False
+
+
 @admin.register(GooglePSEConfiguration)
 class GooglePSEConfigurationAdmin(ConfigurationAdmin):
     encrypted_fields = ['api_key']
@@ -623,7 +659,7 @@ class AIModelAdmin(admin.ModelAdmin):
 
 @admin.register(AIJobsHistory)
 class AIJobsHistoryAdmin(admin.ModelAdmin):
-    list_display = ['timestamp', 'agent', 'user', 'provider', 'model', 'status', 'costs', 'duration_ms', 'input_tokens', 'output_tokens']
+    list_display = ['timestamp', 'agent', 'user', 'provider', 'model', 'status', 'costs', 'duration_ms', 'provider_latency_ms', 'router_overhead_ms', 'input_tokens', 'output_tokens']
     list_filter = ['status', 'provider', 'model', 'agent']
     search_fields = ['agent', 'user__username', 'error_message']
     autocomplete_fields = ['user', 'provider', 'model']
@@ -632,7 +668,7 @@ class AIJobsHistoryAdmin(admin.ModelAdmin):
     fieldsets = (
         (None, {'fields': ('agent', 'user', 'status', 'client_ip')}),
         ('AI Provider', {'fields': ('provider', 'model')}),
-        ('Metrics', {'fields': ('input_tokens', 'output_tokens', 'costs', 'duration_ms')}),
+        ('Metrics', {'fields': ('input_tokens', 'output_tokens', 'costs', 'duration_ms', 'provider_latency_ms', 'router_overhead_ms')}),
         ('Metadata', {'fields': ('timestamp', 'error_message')}),
     )
     
@@ -641,6 +677,19 @@ class AIJobsHistoryAdmin(admin.ModelAdmin):
         return False
 
 
+@admin.register(AIAgentDedupStats)
+class AIAgentDedupStatsAdmin(admin.ModelAdmin):
+    list_display = ['date', 'agent', 'deduplicated_calls', 'fallback_calls']
+    list_filter = ['agent']
+    search_fields = ['agent']
+    date_hierarchy = 'date'
+    readonly_fields = ['date', 'agent', 'deduplicated_calls', 'fallback_calls']
+    
+    def has_add_permission(self, request):
+        # Counters are maintained by AgentService, not manually
+        return False
+
+
 @admin.register(ClaudeQueueJob)
 class ClaudeQueueJobAdmin(admin.ModelAdmin):
     list_display = ['id', 'created_at', 'project', 'item', 'kind', 'status', 'parent_job', 'epic_order', 'model', 'auth_mode', 'auth_user', 'pr_number', 'pr_state', 'total_cost_usd', 'num_turns']
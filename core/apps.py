@@ -13,4 +13,16 @@ class CoreConfig(AppConfig):
         except Exception:
             # Ignore errors during import (e.g., during migrations)
             pass
+        
+        # Import AI router cache invalidation signals
+        try:
+            import core.services.ai.signals  # noqa: F401
+        except Exception:
+            pass
+
+        # Import analytics rollup dirty-day signals
+        try:
+            import core.services.analytics.signals  # noqa: F401
+        except Exception:
+            pass
 
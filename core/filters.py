@@ -5,6 +5,7 @@ import django_filters
 from django import forms
 from functools import cached_property
 from .models import Item, Project, ItemType, Organisation, User, Release
+from .services.search import search_items
 
 
 class ItemFilter(django_filters.FilterSet):
@@ -12,7 +13,7 @@ class ItemFilter(django_filters.FilterSet):
     FilterSet for Item model.
     Supports filtering by search query, project, type, organisation, requester, and assigned_to.
     """
-    # Search filter (title or description)
+    # Search filter (title, short description or description)
     q = django_filters.CharFilter(
         method='filter_search',
         label='Search',
@@ -68,13 +69,11 @@ class ItemFilter(django_filters.FilterSet):
     
     def filter_search(self, queryset, name, value):
         """
-        Filter items by search query in title or description.
+        Filter items by search query in title, short description or description,
+        best matches first (see core.services.search).
         """
         if value:
-            from django.db.models import Q
-            return queryset.filter(
-                Q(title__icontains=value) | Q(description__icontains=value)
-            )
+            return search_items(queryset, value)
         return queryset
 
 
@@ -132,6 +131,7 @@ class KanbanFilter(django_filters.FilterSet):
     def filter_search(self, queryset, name, value):
         """
         Filter items by search query in title only.
+        On PostgreSQL this is served by the pg_trgm index on the title.
         """
         if value:
             return queryset.filter(title__icontains=value)
@@ -143,7 +143,7 @@ class RelatedItemsFilter(django_filters.FilterSet):
     FilterSet for related (child) items.
     Supports filtering by search query, type, status, and assigned_to.
     """
-    # Search filter (title or description)
+    # Search filter (title, short description or description)
     q = django_filters.CharFilter(
         method='filter_search',
         label='Search',
@@ -183,13 +183,11 @@ class RelatedItemsFilter(django_filters.FilterSet):
     
     def filter_search(self, queryset, name, value):
         """
-        Filter items by search query in title or description.
+        Filter items by search query in title, short description or description,
+        best matches first (see core.services.search).
         """
         if value:
-            from django.db.models import Q
-            return queryset.filter(
-                Q(title__icontains=value) | Q(description__icontains=value)
-            )
+            return search_items(queryset, value)
         return queryset
 
 
@@ -199,7 +197,7 @@ class EmbedItemFilter(django_filters.FilterSet):
     Supports filtering by status, type, and search query.
     IMPORTANT: Always excludes items where intern=True for security.
     """
-    # Search filter (title or description)
+    # Search filter (title, short description or description)
     q = django_filters.CharFilter(
         method='filter_search',
         label='Search',
@@ -247,13 +245,11 @@ class EmbedItemFilter(django_filters.FilterSet):
     
     def filter_search(self, queryset, name, value):
         """
-        Filter items by search query in title or description.
+        Filter items by search query in title, short description or description,
+        best matches first (see core.services.search).
         """
         if value:
-            from django.db.models import Q
-            return queryset.filter(
-                Q(title__icontains=value) | Q(description__icontains=value)
-            )
+            return search_items(queryset, value)
         return queryset
     
     def filter_status(self, queryset, name, value):
@@ -295,7 +291,7 @@ class ReleaseItemsFilter(django_filters.FilterSet):
     FilterSet for filtering items associated with a release.
     Excludes project and release filters, includes status.
     """
-    # Search filter (title or description)
+    # Search filter (title, short description or description)
     q = django_filters.CharFilter(
         method='filter_search',
         label='Search',
@@ -341,13 +337,11 @@ class ReleaseItemsFilter(django_filters.FilterSet):
     
     def filter_search(self, queryset, name, value):
         """
-        Custom search filter that searches in both title and description fields.
+        Custom search filter that searches in title, short description and
+        description, best matches first (see core.services.search).
         """
-        from django.db.models import Q
         if value:
-            return queryset.filter(
-                Q(title__icontains=value) | Q(description__icontains=value)
-            )
+            return search_items(queryset, value)
         return queryset
 
 
@@ -0,0 +1,139 @@
+"""
+Django management command: attachment text extraction worker.
+
+PDF and DOCX attachments larger than ATTACHMENT_TEXT_INLINE_MAX_MB are not
+parsed in the web request that first needs their text; a pending
+``AttachmentTextExtract`` row is left instead (see
+core.services.storage.text_extraction). This worker extracts those files,
+stores the text per content hash and queues a Weaviate upsert for every
+attachment with that content.
+
+Run modes::
+
+    # cron: extract everything that is due, then exit
+    python manage.py attachment_text_worker --once
+
+    # daemon: keep extracting, poll every 10 seconds when idle
+    python manage.py attachment_text_worker --interval 10
+
+    # only print the number of extracts per status
+    python manage.py attachment_text_worker --stats
+"""
+
+import logging
+import signal
+import time
+
+from django.core.management.base import BaseCommand
+
+from core.services.storage.text_extraction import (
+    DEFAULT_CLAIM_SIZE,
+    DEFAULT_MAX_ATTEMPTS,
+    extract_pending,
+    get_extraction_stats,
+)
+
+logger = logging.getLogger(__name__)
+
+# Default poll interval for daemon mode.
+DEFAULT_INTERVAL_SECONDS = 10
+
+
+class Command(BaseCommand):
+    help = 'Extract the text of large PDF/DOCX attachments queued for background extraction'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Extract all due files, then exit. Ideal for cron.',
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=DEFAULT_INTERVAL_SECONDS,
+            help=f'Daemon poll interval in seconds when idle (default: {DEFAULT_INTERVAL_SECONDS}).',
+        )
+        parser.add_argument(
+            '--claim-size',
+            type=int,
+            default=DEFAULT_CLAIM_SIZE,
+            help=f'Files claimed per pass (default: {DEFAULT_CLAIM_SIZE}).',
+        )
+        parser.add_argument(
+            '--max-attempts',
+            type=int,
+            default=DEFAULT_MAX_ATTEMPTS,
+            help=f'Give up on a file after this many failed attempts (default: {DEFAULT_MAX_ATTEMPTS}).',
+        )
+        parser.add_argument(
+            '--stats',
+            action='store_true',
+            help='Print the number of extracts per status, then exit.',
+        )
+
+    def handle(self, *args, **options):
+        self._stop = False
+
+        if options['stats']:
+            self._write_stats()
+            return
+
+        pass_kwargs = {
+            'claim_size': max(1, options['claim_size']),
+            'max_attempts': options['max_attempts'],
+        }
+
+        if options['once']:
+            while self._extract(pass_kwargs):
+                pass
+            self._write_stats()
+            return
+
+        # Daemon mode: loop until a termination signal arrives.
+        self._install_signal_handlers()
+        self.stdout.write(
+            f"Entering daemon loop (poll interval {options['interval']}s). Ctrl-C to stop."
+        )
+        while not self._stop:
+            if not self._extract(pass_kwargs):
+                self._interruptible_sleep(options['interval'])
+        self.stdout.write(self.style.SUCCESS("Attachment text worker stopped."))
+
+    def _extract(self, pass_kwargs) -> bool:
+        """Run one extraction pass; return True if something was extracted."""
+        try:
+            result = extract_pending(**pass_kwargs)
+        except Exception as e:
+            logger.error(f"Attachment text extraction failed: {e}", exc_info=True)
+            self.stdout.write(self.style.ERROR(f"✗ Extraction pass failed: {e}"))
+            return False
+
+        if result.claimed:
+            self.stdout.write(
+                f"Processed {result.claimed} files: {result.extracted} extracted, {result.failed} failed"
+            )
+            for error in result.errors[:10]:
+                self.stdout.write(self.style.ERROR(f"  ✗ {error}"))
+        # Failed files are backed off; stop once a pass extracted nothing
+        return result.extracted > 0
+
+    def _write_stats(self):
+        stats = get_extraction_stats()
+        self.stdout.write(
+            f"Text extracts: {stats['pending']} pending, {stats['done']} done, {stats['failed']} failed"
+        )
+
+    def _install_signal_handlers(self):
+        def _handler(signum, _frame):
+            self.stdout.write(f"\nReceived signal {signum}, finishing up...")
+            self._stop = True
+
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(sig, _handler)
+
+    def _interruptible_sleep(self, seconds):
+        """Sleep in short slices so a stop signal is honored promptly."""
+        deadline = time.monotonic() + seconds
+        while not self._stop and time.monotonic() < deadline:
+            time.sleep(min(0.5, max(0.0, deadline - time.monotonic())))
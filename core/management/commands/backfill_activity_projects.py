@@ -0,0 +1,126 @@
+"""
+Management command to backfill Activity.project for existing activities.
+
+New activities get their project at log time (ActivityService.log). Older
+rows are resolved from their target, one SQL UPDATE per batch and target
+type: projects are their own project, models with a ``project`` FK (items,
+changes, ...) use it, models with an ``item`` FK (comments, GitHub
+mappings, ...) use the item's project. Activities whose target no longer
+exists keep project NULL.
+"""
+
+import logging
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import FieldDoesNotExist
+from django.core.management.base import BaseCommand
+from django.db.models import IntegerField, OuterRef, Subquery
+from django.db.models.functions import Cast
+
+from core.models import Activity, Item, Project
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 5000
+
+
+def _has_foreign_key(model, name, related_model) -> bool:
+    try:
+        field = model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return False
+    return bool(field.many_to_one and field.concrete and field.related_model is related_model)
+
+
+def _project_subquery(model):
+    """
+    Subquery selecting the project ID of an activity's target, or None if
+    the project can't be derived from this target model.
+    """
+    if model is None or model is Activity:
+        return None
+    if model._meta.pk.get_internal_type() not in ('AutoField', 'BigAutoField', 'IntegerField', 'BigIntegerField'):
+        return None
+
+    target_pk = Cast(OuterRef('target_object_id'), IntegerField())
+    if model is Project:
+        column = 'pk'
+    elif _has_foreign_key(model, 'project', Project):
+        column = 'project_id'
+    elif _has_foreign_key(model, 'item', Item):
+        column = 'item__project_id'
+    else:
+        return None
+    return Subquery(model._default_manager.filter(pk=target_pk).values(column)[:1])
+
+
+class Command(BaseCommand):
+    help = 'Backfill the project of existing activities from their targets'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Show how many activities would be processed without changing them',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help=f'Activities updated per statement (default: {DEFAULT_BATCH_SIZE})',
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options['dry_run']
+        batch_size = max(1, options['batch_size'])
+
+        if dry_run:
+            self.stdout.write(self.style.WARNING('Running in DRY RUN mode - no changes will be made'))
+
+        missing = Activity.objects.filter(project__isnull=True)
+        content_type_ids = missing.values_list('target_content_type', flat=True).distinct()
+        content_types = ContentType.objects.filter(pk__in=list(content_type_ids)).order_by('app_label', 'model')
+
+        total_updated = 0
+        for content_type in content_types:
+            model = content_type.model_class()
+            subquery = _project_subquery(model)
+            rows = missing.filter(target_content_type=content_type)
+            label = f'{content_type.app_label}.{content_type.model}'
+
+            if subquery is None:
+                self.stdout.write(f'  {label}: {rows.count()} activities skipped (no project)')
+                continue
+            if dry_run:
+                self.stdout.write(f'  Would resolve {label}: {rows.count()} activities')
+                continue
+
+            updated = 0
+            resolved = 0
+            last_pk = 0
+            while True:
+                pks = list(
+                    rows.filter(pk__gt=last_pk).order_by('pk').values_list('pk', flat=True)[:batch_size]
+                )
+                if not pks:
+                    break
+                last_pk = pks[-1]
+                batch = Activity.objects.filter(pk__in=pks)
+                updated += batch.update(project_id=subquery)
+                resolved += batch.filter(project__isnull=False).count()
+
+            total_updated += resolved
+            self.stdout.write(f'  {label}: {resolved} of {updated} activities resolved')
+            logger.info(f'Backfilled project for {resolved}/{updated} {label} activities')
+
+        remaining = Activity.objects.filter(project__isnull=True).count()
+        self.stdout.write('\n' + '=' * 60)
+        if dry_run:
+            self.stdout.write(self.style.WARNING(
+                'DRY RUN: Run without --dry-run to apply changes.'
+            ))
+        else:
+            self.stdout.write(self.style.SUCCESS(
+                f'✓ Backfilled the project of {total_updated} activities '
+                f'({remaining} without project remain).'
+            ))
@@ -0,0 +1,143 @@
+"""
+Management command to benchmark the item search of the list and Kanban filters.
+
+Inserts a synthetic dataset (default: 100,000 items) and times the legacy
+``Q(title__icontains=...) | Q(description__icontains=...)`` search against
+core.services.search.search_items(), the way a filtered list page runs it
+(a count plus the first page). Everything runs in one transaction that is
+rolled back, so the database is left as it was.
+
+Run it against PostgreSQL after migrating; on other databases both variants
+fall back to icontains and the numbers say little.
+"""
+
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Q
+
+from core.models import Item, ItemType, Project
+from core.services.search import search_items
+
+DEFAULT_ITEMS = 100_000
+DEFAULT_QUERIES = ['deploy', 'login fehler', 'rechnung', 'timeout api', 'xyzzy']
+PAGE_SIZE = 25
+
+WORDS = [
+    'api', 'backup', 'bestellung', 'cache', 'cluster', 'dashboard', 'datenbank', 'deploy', 'deployment',
+    'dokument', 'email', 'export', 'fehler', 'filter', 'formular', 'import', 'kunde', 'lizenz', 'login',
+    'mandant', 'migration', 'monitoring', 'passwort', 'performance', 'portal', 'rechnung', 'release',
+    'report', 'rolle', 'schnittstelle', 'server', 'session', 'sync', 'ticket', 'timeout', 'update',
+    'upload', 'user', 'vertrag', 'webhook', 'workflow', 'zertifikat',
+    'nach', 'beim', 'wird', 'nicht', 'after', 'when', 'fails', 'slow', 'missing', 'wrong', 'new', 'add',
+]
+
+
+class Command(BaseCommand):
+    help = 'Benchmark the item filter search on a synthetic dataset (rolled back afterwards)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--items',
+            type=int,
+            default=DEFAULT_ITEMS,
+            help=f'Number of synthetic items to insert (default: {DEFAULT_ITEMS})',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=2000,
+            help='Items per bulk insert (default: 2000)',
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=5,
+            help='Runs per query; the median is reported (default: 5)',
+        )
+        parser.add_argument(
+            '--query',
+            action='append',
+            dest='queries',
+            help='Search query to time (repeatable, default: a built-in set)',
+        )
+        parser.add_argument(
+            '--explain',
+            action='store_true',
+            help='Print the query plan of the indexed search for each query',
+        )
+
+    def handle(self, *args, **options):
+        queries = options['queries'] or DEFAULT_QUERIES
+        repeat = max(1, options['repeat'])
+
+        if connection.vendor != 'postgresql':
+            self.stdout.write(self.style.WARNING(
+                f'Database is {connection.vendor}, not PostgreSQL - both variants use icontains'
+            ))
+
+        with transaction.atomic():
+            inserted = self._insert_items(options['items'], options['batch_size'])
+            if connection.vendor == 'postgresql':
+                with connection.cursor() as cursor:
+                    cursor.execute('ANALYZE core_item')
+
+            self.stdout.write(
+                f'\n{"query":<20} {"legacy hits":>11} {"legacy ms":>10} {"indexed hits":>12} {"indexed ms":>11}'
+            )
+            for query in queries:
+                legacy = Item.objects.filter(Q(title__icontains=query) | Q(description__icontains=query))
+                indexed = search_items(Item.objects.all(), query)
+                legacy_hits, legacy_ms = self._time(legacy, repeat)
+                indexed_hits, indexed_ms = self._time(indexed, repeat)
+                self.stdout.write(
+                    f'{query:<20} {legacy_hits:>11} {legacy_ms:>10.1f} {indexed_hits:>12} {indexed_ms:>11.1f}'
+                )
+                if options['explain']:
+                    self.stdout.write(indexed[:PAGE_SIZE].explain())
+
+            transaction.set_rollback(True)
+
+        self.stdout.write('\n' + '=' * 60)
+        self.stdout.write(self.style.SUCCESS(
+            f'✓ Benchmarked {len(queries)} queries over {inserted} synthetic items (rolled back).'
+        ))
+
+    def _insert_items(self, count, batch_size):
+        """Insert ``count`` items with reproducible pseudo-random texts."""
+        rng = random.Random(42)
+        project = Project.objects.create(name='Search Benchmark')
+        item_type, _created = ItemType.objects.get_or_create(key='benchmark', defaults={'name': 'Benchmark'})
+
+        def text(low, high):
+            return ' '.join(rng.choices(WORDS, k=rng.randint(low, high)))
+
+        inserted = 0
+        while inserted < count:
+            batch = [
+                Item(
+                    project=project,
+                    type=item_type,
+                    title=text(4, 8).capitalize(),
+                    short_description=text(15, 30),
+                    description=text(80, 200),
+                )
+                for _ in range(min(batch_size, count - inserted))
+            ]
+            Item.objects.bulk_create(batch, batch_size=batch_size)
+            inserted += len(batch)
+        self.stdout.write(f'  Inserted {inserted} synthetic items')
+        return inserted
+
+    def _time(self, queryset, repeat):
+        """Median milliseconds for a count plus the first page, like a list view."""
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            matches = queryset.count()
+            list(queryset[:PAGE_SIZE])
+            timings.append((time.perf_counter() - started) * 1000)
+        return matches, statistics.median(timings)
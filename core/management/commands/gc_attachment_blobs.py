@@ -0,0 +1,54 @@
+"""
+Management command to delete attachment blobs no attachment references.
+"""
+
+from django.core.management.base import BaseCommand
+from django.template.defaultfilters import filesizeformat
+
+from core.services.storage import AttachmentStorageService
+from core.services.storage.blobs import DEFAULT_GC_GRACE_SECONDS
+
+
+class Command(BaseCommand):
+    help = 'Delete unreferenced blobs from the attachment blob store and report disk savings'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Show what would be deleted without making changes',
+        )
+        parser.add_argument(
+            '--grace-hours',
+            type=float,
+            default=DEFAULT_GC_GRACE_SECONDS / 3600,
+            help='Keep unreferenced blobs younger than this (default: 1 hour)',
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options['dry_run']
+        storage = AttachmentStorageService()
+
+        result = storage.blobs.collect_garbage(
+            grace_seconds=int(options['grace_hours'] * 3600),
+            dry_run=dry_run,
+        )
+
+        if dry_run:
+            self.stdout.write(self.style.WARNING(
+                f'DRY RUN: Would delete {result.deleted} of {result.scanned} blobs '
+                f'({filesizeformat(result.freed_bytes)}).'
+            ))
+        else:
+            self.stdout.write(self.style.SUCCESS(
+                f'Deleted {result.deleted} of {result.scanned} blobs '
+                f'({filesizeformat(result.freed_bytes)} freed).'
+            ))
+
+        stats = storage.blobs.stats()
+        self.stdout.write(
+            f'Blob store: {stats.attachments} attachments in {stats.blobs} blobs, '
+            f'{filesizeformat(stats.logical_bytes)} logical, '
+            f'{filesizeformat(stats.physical_bytes)} on disk, '
+            f'{filesizeformat(stats.saved_bytes)} saved by deduplication'
+        )
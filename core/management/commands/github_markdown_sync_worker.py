@@ -80,6 +80,10 @@ class Command(BaseCommand):
         self.stdout.write(f"  Files created: {markdown_stats['total_files_created']}")
         self.stdout.write(f"  Files updated: {markdown_stats['total_files_updated']}")
         self.stdout.write(f"  Files skipped: {markdown_stats['total_files_skipped']}")
+        self.stdout.write(
+            f"  GitHub requests: {markdown_stats['total_requests']} "
+            f"({markdown_stats['total_requests_saved']} saved by tree discovery)"
+        )
         if markdown_stats['total_errors'] > 0:
             self.stdout.write(self.style.ERROR(f"  Errors: {markdown_stats['total_errors']}"))
         
@@ -118,6 +122,8 @@ class Command(BaseCommand):
             'total_files_created': 0,
             'total_files_updated': 0,
             'total_files_skipped': 0,
+            'total_requests': 0,
+            'total_requests_saved': 0,
             'total_errors': 0,
             'rate_limited': False,
         }
@@ -159,6 +165,8 @@ class Command(BaseCommand):
                 stats['total_files_created'] += project_stats['files_created']
                 stats['total_files_updated'] += project_stats['files_updated']
                 stats['total_files_skipped'] += project_stats['files_skipped']
+                stats['total_requests'] += project_stats.get('requests', 0)
+                stats['total_requests_saved'] += project_stats.get('requests_saved', 0)
                 stats['total_errors'] += len(project_stats['errors'])
                 
                 # Log results
@@ -168,6 +176,18 @@ class Command(BaseCommand):
                     f"{project_stats['files_updated']} updated, "
                     f"{project_stats['files_skipped']} skipped"
                 )
+                if 'requests' in project_stats:
+                    self.stdout.write(
+                        f"    GitHub requests: {project_stats['requests']} "
+                        f"(saved {project_stats['requests_saved']})"
+                    )
+                    logger.info(
+                        "Markdown sync %s/%s: %s GitHub requests, %s saved by tree discovery",
+                        project.github_owner,
+                        project.github_repo,
+                        project_stats['requests'],
+                        project_stats['requests_saved'],
+                    )
                 
                 # Log errors if any
                 for error in project_stats['errors']:
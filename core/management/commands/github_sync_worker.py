@@ -6,10 +6,15 @@ updates Item statuses, links PRs, and pushes content to Weaviate.
 """
 
 import logging
-from datetime import timedelta
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from datetime import datetime, timedelta, timezone as dt_timezone
 from typing import Optional, Dict, Any, List
 from django.core.management.base import BaseCommand, CommandError
-from django.db import transaction
+from django.db import connection, transaction
 from django.utils import timezone
 
 from core.models import (
@@ -19,7 +24,18 @@ from core.models import (
     ItemStatus,
     Project,
 )
+from core.services.activity import ActivityService
 from core.services.github.service import GitHubService
+from core.services.github.response_cache import (
+    get_conditional_stats,
+    prune as prune_response_cache,
+    reset_conditional_stats,
+)
+from core.services.github.rate_budget import (
+    DEFAULT_MAX_WAIT_SECONDS,
+    DEFAULT_RESERVE,
+    RateBudget,
+)
 from core.services.integrations.base import IntegrationError
 from core.services.weaviate.service import (
     upsert_instance,
@@ -34,6 +50,18 @@ logger = logging.getLogger(__name__)
 RECENTLY_CLOSED_THRESHOLD_HOURS = 2
 
 
+@dataclass
+class FetchedMapping:
+    """GitHub and Weaviate reads for one mapping, gathered by a pool thread."""
+    mapping: ExternalIssueMapping
+    issue_data: Optional[Dict[str, Any]] = None
+    new_state: Optional[str] = None
+    pr_data: Dict[int, Dict[str, Any]] = field(default_factory=dict)
+    should_push: bool = False
+    deferred: bool = False
+    error: Optional[Exception] = None
+
+
 class Command(BaseCommand):
     help = 'Synchronize GitHub issues/PRs with Agira items and push to Weaviate (syncs non-closed items and recently closed items)'
 
@@ -55,17 +83,38 @@ class Command(BaseCommand):
             action='store_true',
             help='Show what would be synced without making changes',
         )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=1,
+            help='Fetch up to N mappings from GitHub in parallel; writes are applied per batch (default: 1, sequential)',
+        )
+        parser.add_argument(
+            '--rate-reserve',
+            type=int,
+            default=DEFAULT_RESERVE,
+            help=f'GitHub requests to leave unused per rate limit window in concurrent mode (default: {DEFAULT_RESERVE})',
+        )
+        parser.add_argument(
+            '--max-rate-wait',
+            type=float,
+            default=DEFAULT_MAX_WAIT_SECONDS,
+            help=f'Seconds to wait for a rate limit reset before deferring mappings (default: {DEFAULT_MAX_WAIT_SECONDS:g})',
+        )
 
     def handle(self, *args, **options):
         """Execute the sync worker."""
         batch_size = options['batch_size']
         project_id = options.get('project_id')
         dry_run = options['dry_run']
+        concurrency = max(1, options.get('concurrency') or 1)
+        self._timings = defaultdict(float)
 
         if dry_run:
             self.stdout.write(self.style.WARNING('Running in DRY RUN mode - no changes will be made'))
 
         self.stdout.write("Starting GitHub sync worker...")
+        reset_conditional_stats()
 
         # Initialize GitHub service
         github_service = GitHubService()
@@ -122,6 +171,20 @@ class Command(BaseCommand):
 
         if total == 0:
             self.stdout.write(self.style.SUCCESS("No mappings to sync"))
+        elif concurrency > 1:
+            budget = RateBudget(
+                reserve=options.get('rate_reserve', DEFAULT_RESERVE),
+                max_wait=options.get('max_rate_wait', DEFAULT_MAX_WAIT_SECONDS),
+            )
+            counts = self._sync_concurrently(
+                queryset, total, batch_size, github_service, dry_run, concurrency, budget,
+            )
+            synced_count = counts['synced']
+            status_updated_count = counts['status_updated']
+            prs_linked_count = counts['prs_linked']
+            weaviate_pushed_count = counts['weaviate_pushed']
+            error_count = counts['errors']
+            deferred_count = counts['deferred']
         else:
             # Process in batches
             synced_count = 0
@@ -129,6 +192,7 @@ class Command(BaseCommand):
             prs_linked_count = 0
             weaviate_pushed_count = 0
             error_count = 0
+            deferred_count = 0
 
             for batch_start in range(0, total, batch_size):
                 batch_end = min(batch_start + batch_size, total)
@@ -173,14 +237,49 @@ class Command(BaseCommand):
             self.stdout.write(f"  Objects pushed to Weaviate: {weaviate_pushed_count}")
             if error_count > 0:
                 self.stdout.write(self.style.ERROR(f"  Errors: {error_count}"))
+            if deferred_count > 0:
+                self.stdout.write(self.style.WARNING(
+                    f"  Deferred (rate budget exhausted): {deferred_count}"
+                ))
+            if self._timings:
+                phases = ', '.join(f"{name} {seconds:.1f}s" for name, seconds in self._timings.items())
+                self.stdout.write(f"  Phase timings: {phases}")
+        self._write_api_budget()
         
         self.stdout.write("=" * 60)
 
+        if not dry_run:
+            try:
+                pruned = prune_response_cache()
+                if pruned:
+                    logger.info(f"Pruned {pruned} stale GitHub response cache entries")
+            except Exception as e:
+                logger.warning(f"Could not prune GitHub response cache: {e}")
+
         if dry_run:
             self.stdout.write(self.style.WARNING('\nDRY RUN - No changes were made'))
         else:
             self.stdout.write(self.style.SUCCESS('\n✓ GitHub sync completed successfully'))
 
+    def _write_api_budget(self):
+        """Print conditional request hit ratio and the remaining GitHub rate limit."""
+        stats = get_conditional_stats()
+        if stats['hit_ratio'] is not None:
+            self.stdout.write(
+                f"  GitHub GETs: {stats['hits']} not modified (304), {stats['misses']} fetched "
+                f"(cache hit ratio {stats['hit_ratio'] * 100:.1f}%)"
+            )
+        if stats['rate_limit_remaining'] is not None:
+            line = f"  Rate limit remaining: {stats['rate_limit_remaining']}"
+            if stats['rate_limit_limit'] is not None:
+                line += f"/{stats['rate_limit_limit']}"
+            if stats['rate_limit_reset'] is not None:
+                reset_at = timezone.localtime(
+                    datetime.fromtimestamp(stats['rate_limit_reset'], tz=dt_timezone.utc)
+                )
+                line += f" (resets {reset_at.strftime('%H:%M:%S')})"
+            self.stdout.write(line)
+
     def _sync_mapping(
         self,
         mapping: ExternalIssueMapping,
@@ -210,73 +309,268 @@ class Command(BaseCommand):
         item = mapping.item
         
         old_mapping_state = mapping.state
-        old_item_status = item.status
 
         # 1. Sync mapping state from GitHub
+        started = time.perf_counter()
         if not dry_run:
             github_service.sync_mapping(mapping)
         
         # Reload to get updated state
         mapping.refresh_from_db()
         state_changed = old_mapping_state != mapping.state
+        self._timings['sync'] += time.perf_counter() - started
 
         self.stdout.write(
             f"  Issue #{mapping.number}: {old_mapping_state} → {mapping.state}"
         )
 
         # 2. Update Item status if issue was closed
-        # Skip status update if:
-        # - Item is already TESTING (no need to update)
-        # - Item is CLOSED (preserve final state - closed items should not be reopened)
-        # - Item is READY_FOR_RELEASE (preserve manually set higher status)
-        should_update_status = (
-            mapping.state == 'closed' and
-            item.status not in (ItemStatus.TESTING, ItemStatus.CLOSED, ItemStatus.READY_FOR_RELEASE)
-        )
-        if should_update_status:
-            if not dry_run:
-                with transaction.atomic():
-                    item.status = ItemStatus.TESTING
-                    item.save(update_fields=['status'])
-                
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f"    ✓ Updated Item #{item.id} status: {old_item_status} → Testing"
-                    )
-                )
-            else:
-                self.stdout.write(
-                    self.style.WARNING(
-                        f"    [DRY RUN] Would update Item #{item.id} status to Testing"
-                    )
-                )
-            result['status_updated'] = True
+        result['status_updated'] = self._update_item_status(item, mapping.state, dry_run=dry_run)
 
         # 3. Link related PRs
+        started = time.perf_counter()
         linked_prs = self._link_prs_for_issue(
             mapping,
             github_service,
             dry_run=dry_run,
         )
         result['prs_linked'] = linked_prs
+        self._timings['link_prs'] += time.perf_counter() - started
 
         # 4. Push to Weaviate if status changed or not yet synced
+        started = time.perf_counter()
         should_push = self._should_push_to_weaviate(mapping, state_changed)
         
         if should_push:
-            if not dry_run:
-                pushed = self._push_to_weaviate(mapping, github_service)
-                result['weaviate_pushed'] = pushed
-            else:
-                self.stdout.write(
-                    self.style.WARNING(
-                        f"    [DRY RUN] Would push to Weaviate"
-                    )
-                )
-                result['weaviate_pushed'] = True
+            result['weaviate_pushed'] = self._push_or_report(mapping, github_service, dry_run=dry_run)
+        self._timings['weaviate'] += time.perf_counter() - started
 
         return result
 
+    def _update_item_status(self, item: Item, mapping_state: str, dry_run: bool = False) -> bool:
+        """
+        Move the item to Testing once its GitHub issue is closed.
+        
+        Returns:
+            True if the status was (or, in dry-run mode, would be) updated
+        """
+        old_item_status = item.status
+        # Skip status update if:
+        # - Item is already TESTING (no need to update)
+        # - Item is CLOSED (preserve final state - closed items should not be reopened)
+        # - Item is READY_FOR_RELEASE (preserve manually set higher status)
+        should_update_status = (
+            mapping_state == 'closed' and
+            item.status not in (ItemStatus.TESTING, ItemStatus.CLOSED, ItemStatus.READY_FOR_RELEASE)
+        )
+        if not should_update_status:
+            return False
+
+        if not dry_run:
+            with transaction.atomic():
+                item.status = ItemStatus.TESTING
+                item.save(update_fields=['status'])
+            
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"    ✓ Updated Item #{item.id} status: {old_item_status} → Testing"
+                )
+            )
+        else:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"    [DRY RUN] Would update Item #{item.id} status to Testing"
+                )
+            )
+        return True
+
+    def _push_or_report(
+        self,
+        mapping: ExternalIssueMapping,
+        github_service: GitHubService,
+        dry_run: bool = False,
+        issue_data: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """Push a mapping to Weaviate, or report what would be pushed in dry-run mode."""
+        if not dry_run:
+            return self._push_to_weaviate(mapping, github_service, issue_data=issue_data)
+        self.stdout.write(
+            self.style.WARNING(
+                f"    [DRY RUN] Would push to Weaviate"
+            )
+        )
+        return True
+
+    def _sync_concurrently(
+        self,
+        queryset,
+        total: int,
+        batch_size: int,
+        github_service: GitHubService,
+        dry_run: bool,
+        concurrency: int,
+        budget: RateBudget,
+    ) -> Counter:
+        """
+        Sync mappings with a bounded thread pool.
+        
+        Per batch, pool threads perform all GitHub and Weaviate reads (gated by
+        the shared rate budget); the main thread then applies the writes of
+        the whole batch in one transaction and pushes the changed mappings to
+        Weaviate after it commits.
+        
+        Returns:
+            Counter with synced, status_updated, prs_linked, weaviate_pushed,
+            errors and deferred
+        """
+        counts = Counter()
+        client = github_service._get_client()
+        self.stdout.write(f"Concurrent mode: {concurrency} workers, reserving {budget.reserve} requests")
+
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='github-sync') as executor:
+            for batch_start in range(0, total, batch_size):
+                batch_end = min(batch_start + batch_size, total)
+                self.stdout.write(f"\nProcessing batch {batch_start + 1}-{batch_end} of {total}...")
+                batch = list(queryset[batch_start:batch_end])
+
+                started = time.perf_counter()
+                fetched_batch = list(executor.map(
+                    lambda mapping: self._fetch_mapping(mapping, github_service, client, budget),
+                    batch,
+                ))
+                self._timings['fetch'] += time.perf_counter() - started
+
+                started = time.perf_counter()
+                self._apply_batch(fetched_batch, github_service, dry_run, counts)
+                self._timings['apply'] += time.perf_counter() - started
+
+        if budget.waited_seconds:
+            self._timings['rate_wait'] += budget.waited_seconds
+        return counts
+
+    def _fetch_mapping(
+        self,
+        mapping: ExternalIssueMapping,
+        github_service: GitHubService,
+        client,
+        budget: RateBudget,
+    ) -> FetchedMapping:
+        """Gather everything a mapping needs from GitHub and Weaviate (runs in a pool thread)."""
+        fetched = FetchedMapping(mapping=mapping)
+        try:
+            owner, repo = github_service._get_repo_info(mapping.item)
+            if not budget.acquire():
+                fetched.deferred = True
+                return fetched
+            fetched.issue_data = client.get_issue(owner, repo, mapping.number)
+            budget.refresh()
+            fetched.new_state = github_service._map_state(fetched.issue_data, 'issue')
+
+            if budget.acquire():
+                try:
+                    timeline = client.get_issue_timeline(owner, repo, mapping.number)
+                    budget.refresh()
+                except Exception as e:
+                    logger.warning(f"Failed to fetch timeline for issue #{mapping.number}: {e}")
+                    timeline = []
+                for pr_number in sorted(self._pr_numbers_from_timeline(timeline)):
+                    if not budget.acquire():
+                        break
+                    try:
+                        fetched.pr_data[pr_number] = client.get_pr(owner, repo, pr_number)
+                        budget.refresh()
+                    except Exception as e:
+                        logger.warning(f"Failed to fetch PR #{pr_number}: {e}")
+
+            fetched.should_push = self._should_push_to_weaviate(
+                mapping, fetched.new_state != mapping.state,
+            )
+        except Exception as e:
+            fetched.error = e
+        finally:
+            # Pool threads open their own DB connection (response cache, Weaviate config)
+            connection.close()
+        return fetched
+
+    def _apply_batch(
+        self,
+        fetched_batch: List[FetchedMapping],
+        github_service: GitHubService,
+        dry_run: bool,
+        counts: Counter,
+    ) -> None:
+        """Write the results of one fetched batch in a single transaction."""
+        # Activities of the whole batch are written with one INSERT; like
+        # GitHubService._log_activity, a failed write is logged, not raised
+        with transaction.atomic(), ActivityService.batch(best_effort=True):
+            for fetched in fetched_batch:
+                mapping = fetched.mapping
+                if fetched.deferred:
+                    counts['deferred'] += 1
+                    continue
+                try:
+                    if fetched.error is not None:
+                        raise fetched.error
+                    # Savepoint per mapping: one failure does not roll back the batch
+                    # (and drops the activities logged for that mapping)
+                    with transaction.atomic(), ActivityService.batch():
+                        self._apply_fetched(fetched, github_service, dry_run, counts)
+                    counts['synced'] += 1
+                except Exception as e:
+                    counts['errors'] += 1
+                    logger.error(
+                        f"Error syncing mapping {mapping.id} (Issue #{mapping.number}): {e}",
+                        exc_info=True,
+                    )
+                    self.stdout.write(
+                        self.style.ERROR(
+                            f"  ✗ Error syncing Issue #{mapping.number}: {e}"
+                        )
+                    )
+
+    def _apply_fetched(
+        self,
+        fetched: FetchedMapping,
+        github_service: GitHubService,
+        dry_run: bool,
+        counts: Counter,
+    ) -> None:
+        """Apply the prefetched GitHub state of one mapping (main thread)."""
+        mapping = fetched.mapping
+        old_mapping_state = mapping.state
+
+        if not dry_run:
+            github_service.sync_mapping(mapping, github_data=fetched.issue_data)
+
+        self.stdout.write(
+            f"  Issue #{mapping.number}: {old_mapping_state} → {fetched.new_state}"
+        )
+
+        if self._update_item_status(mapping.item, fetched.new_state, dry_run=dry_run):
+            counts['status_updated'] += 1
+
+        for pr_number, pr_data in fetched.pr_data.items():
+            if self._link_pr(mapping, pr_number, github_service, dry_run=dry_run, github_data=pr_data):
+                counts['prs_linked'] += 1
+
+        if fetched.should_push:
+            # Push only once the batch is committed, outside its transaction;
+            # dropped if this mapping's savepoint or the batch rolls back
+            transaction.on_commit(
+                partial(self._push_fetched, fetched, github_service, dry_run, counts)
+            )
+
+    def _push_fetched(
+        self,
+        fetched: FetchedMapping,
+        github_service: GitHubService,
+        dry_run: bool,
+        counts: Counter,
+    ) -> None:
+        """Push a committed mapping to Weaviate (on_commit callback of _apply_fetched)."""
+        if self._push_or_report(fetched.mapping, github_service, dry_run=dry_run, issue_data=fetched.issue_data):
+            counts['weaviate_pushed'] += 1
+
     def _link_prs_for_issue(
         self,
         mapping: ExternalIssueMapping,
@@ -301,63 +595,13 @@ class Command(BaseCommand):
             # Get timeline events to find linked PRs
             timeline = client.get_issue_timeline(owner, repo, mapping.number)
             
-            pr_numbers = set()
-            
-            # Look for cross-referenced PRs in timeline
-            for event in timeline:
-                event_type = event.get('event')
-                
-                # Check for cross-reference events
-                if event_type == 'cross-referenced':
-                    source = event.get('source', {})
-                    if source.get('type') == 'issue':
-                        # In GitHub, PRs are also issues
-                        issue_data = source.get('issue', {})
-                        if 'pull_request' in issue_data:
-                            # This is a PR
-                            pr_number = issue_data.get('number')
-                            if pr_number:
-                                pr_numbers.add(pr_number)
-                
-                # Also check for referenced events (mentions in commits/PRs)
-                elif event_type == 'referenced':
-                    # Check if the reference comes from a commit in a PR
-                    commit_id = event.get('commit_id')
-                    if commit_id:
-                        # We could fetch the PR for this commit, but that's expensive
-                        # For now, we rely on cross-references
-                        pass
+            pr_numbers = self._pr_numbers_from_timeline(timeline)
 
             # Create mappings for each found PR
             linked_count = 0
             for pr_number in pr_numbers:
-                try:
-                    if not dry_run:
-                        # Use upsert_mapping_from_github to create/update PR mapping
-                        pr_mapping = github_service.upsert_mapping_from_github(
-                            item=mapping.item,
-                            number=pr_number,
-                            kind='pr',
-                        )
-                        self.stdout.write(
-                            self.style.SUCCESS(
-                                f"    ✓ Linked PR #{pr_number} to Item #{mapping.item.id}"
-                            )
-                        )
-                    else:
-                        self.stdout.write(
-                            self.style.WARNING(
-                                f"    [DRY RUN] Would link PR #{pr_number}"
-                            )
-                        )
+                if self._link_pr(mapping, pr_number, github_service, dry_run=dry_run):
                     linked_count += 1
-                except Exception as e:
-                    logger.warning(f"Failed to link PR #{pr_number}: {e}")
-                    self.stdout.write(
-                        self.style.WARNING(
-                            f"    ⚠ Could not link PR #{pr_number}: {e}"
-                        )
-                    )
             
             return linked_count
 
@@ -365,6 +609,81 @@ class Command(BaseCommand):
             logger.warning(f"Failed to fetch timeline for issue #{mapping.number}: {e}")
             return 0
 
+    @staticmethod
+    def _pr_numbers_from_timeline(timeline: List[Dict[str, Any]]) -> set:
+        """Extract the numbers of PRs cross-referenced in an issue timeline."""
+        pr_numbers = set()
+        
+        # Look for cross-referenced PRs in timeline
+        for event in timeline:
+            event_type = event.get('event')
+            
+            # Check for cross-reference events
+            if event_type == 'cross-referenced':
+                source = event.get('source', {})
+                if source.get('type') == 'issue':
+                    # In GitHub, PRs are also issues
+                    issue_data = source.get('issue', {})
+                    if 'pull_request' in issue_data:
+                        # This is a PR
+                        pr_number = issue_data.get('number')
+                        if pr_number:
+                            pr_numbers.add(pr_number)
+            
+            # Also check for referenced events (mentions in commits/PRs)
+            elif event_type == 'referenced':
+                # Check if the reference comes from a commit in a PR
+                commit_id = event.get('commit_id')
+                if commit_id:
+                    # We could fetch the PR for this commit, but that's expensive
+                    # For now, we rely on cross-references
+                    pass
+
+        return pr_numbers
+
+    def _link_pr(
+        self,
+        mapping: ExternalIssueMapping,
+        pr_number: int,
+        github_service: GitHubService,
+        dry_run: bool = False,
+        github_data: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """
+        Create or update the mapping of a PR referenced by an issue.
+        
+        Returns:
+            True if the PR was (or, in dry-run mode, would be) linked
+        """
+        try:
+            if not dry_run:
+                # Use upsert_mapping_from_github to create/update PR mapping
+                upsert_kwargs = {'item': mapping.item, 'number': pr_number, 'kind': 'pr'}
+                if github_data is not None:
+                    # Prefetched in concurrent mode; saves a second GitHub request
+                    upsert_kwargs['github_data'] = github_data
+                github_service.upsert_mapping_from_github(**upsert_kwargs)
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"    ✓ Linked PR #{pr_number} to Item #{mapping.item.id}"
+                    )
+                )
+            else:
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"    [DRY RUN] Would link PR #{pr_number}"
+                    )
+                )
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to link PR #{pr_number}: {e}")
+            self.stdout.write(
+                self.style.WARNING(
+                    f"    ⚠ Could not link PR #{pr_number}: {e}"
+                )
+            )
+            return False
+
     def _should_push_to_weaviate(
         self,
         mapping: ExternalIssueMapping,
@@ -400,6 +719,7 @@ class Command(BaseCommand):
         self,
         mapping: ExternalIssueMapping,
         github_service: GitHubService,
+        issue_data: Optional[Dict[str, Any]] = None,
     ) -> bool:
         """
         Push issue and linked PRs to Weaviate.
@@ -407,6 +727,7 @@ class Command(BaseCommand):
         Args:
             mapping: Issue mapping to push
             github_service: GitHub service instance
+            issue_data: Issue data fetched beforehand (concurrent mode)
             
         Returns:
             True if successfully pushed
@@ -418,9 +739,10 @@ class Command(BaseCommand):
                 return False
 
             # Get GitHub issue data for richer content
-            owner, repo = github_service._get_repo_info(mapping.item)
-            client = github_service._get_client()
-            issue_data = client.get_issue(owner, repo, mapping.number)
+            if issue_data is None:
+                owner, repo = github_service._get_repo_info(mapping.item)
+                client = github_service._get_client()
+                issue_data = client.get_issue(owner, repo, mapping.number)
             
             # Update mapping with latest data before serializing
             # The serializer will use this data
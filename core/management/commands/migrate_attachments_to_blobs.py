@@ -0,0 +1,110 @@
+"""
+Management command to move existing attachment files into the blob store.
+"""
+
+from django.core.management.base import BaseCommand
+from django.template.defaultfilters import filesizeformat
+
+from core.models import Attachment
+from core.services.storage import AttachmentStorageService
+from core.services.storage.blobs import BLOB_DIR, hash_file
+from core.services.storage.errors import AttachmentNotFound
+
+
+class Command(BaseCommand):
+    help = (
+        'Move attachment files stored per attachment into the content-addressed '
+        'blob store; duplicate files are replaced by links to one blob'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Show what would be migrated without making changes',
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options['dry_run']
+        storage = AttachmentStorageService()
+
+        attachments = Attachment.objects.exclude(storage_path='').exclude(
+            storage_path__startswith=f'{BLOB_DIR}/'
+        ).order_by('id')
+        total_count = attachments.count()
+
+        if total_count == 0:
+            self.stdout.write(self.style.SUCCESS('No attachments need to be migrated.'))
+            self._report_savings(storage)
+            return
+
+        self.stdout.write(f'Found {total_count} attachments to process...')
+
+        migrated_count = 0
+        deduplicated_count = 0
+        missing_count = 0
+        saved_bytes = 0
+        seen_hashes = set()
+
+        for attachment in attachments.iterator():
+            try:
+                file_path = storage.get_file_path(attachment)
+            except AttachmentNotFound:
+                missing_count += 1
+                self.stdout.write(self.style.WARNING(
+                    f'  Attachment {attachment.id} ({attachment.original_name}): file missing, skipped'
+                ))
+                continue
+
+            # Hash the file itself; stored hashes may be missing or outdated
+            sha256 = hash_file(file_path)
+            size = file_path.stat().st_size
+            duplicate = sha256 in seen_hashes or storage.blobs.absolute_path(sha256).exists()
+            seen_hashes.add(sha256)
+
+            if dry_run:
+                action = 'link to existing blob' if duplicate else 'move to blob store'
+                self.stdout.write(f'  Would {action}: Attachment {attachment.id} ({attachment.original_name})')
+            else:
+                relative_path, moved = storage.blobs.adopt(file_path, sha256)
+                attachment.sha256 = sha256
+                attachment.storage_path = relative_path
+                try:
+                    attachment.save(update_fields=['sha256', 'storage_path'])
+                except Exception:
+                    if moved:
+                        # Put the file back where the attachment still points
+                        storage.blobs.absolute_path(sha256).rename(file_path)
+                    raise
+                if not moved:
+                    file_path.unlink()
+
+            migrated_count += 1
+            if duplicate:
+                deduplicated_count += 1
+                saved_bytes += size
+
+            if migrated_count % 100 == 0:
+                self.stdout.write(f'  Processed {migrated_count}/{total_count}...')
+
+        summary = (
+            f'{migrated_count} attachments, {deduplicated_count} duplicates, '
+            f'{filesizeformat(saved_bytes)} freed, {missing_count} missing files'
+        )
+        if dry_run:
+            self.stdout.write(self.style.WARNING(
+                f'DRY RUN: Would have migrated {summary}. Run without --dry-run to apply changes.'
+            ))
+        else:
+            self.stdout.write(self.style.SUCCESS(f'Migrated {summary}.'))
+            self._report_savings(storage)
+
+    def _report_savings(self, storage):
+        """Print logical versus physical size of the blob store."""
+        stats = storage.blobs.stats()
+        self.stdout.write(
+            f'Blob store: {stats.attachments} attachments in {stats.blobs} blobs, '
+            f'{filesizeformat(stats.logical_bytes)} logical, '
+            f'{filesizeformat(stats.physical_bytes)} on disk, '
+            f'{filesizeformat(stats.saved_bytes)} saved by deduplication'
+        )
@@ -0,0 +1,88 @@
+"""
+Management command to rebuild the daily analytics rollups.
+
+The dashboards rebuild days marked dirty by the signal handlers on their own
+(see core.services.analytics). Changes that bypass signals, such as
+QuerySet.update() and bulk_create(), are picked up by running this command
+regularly (e.g. nightly) over a window of recent days; --all rebuilds the
+complete history and is the initial backfill after deploying the rollups.
+"""
+
+import logging
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from core.models import AnalyticsRollupDirtyDay, AnalyticsRollupKind
+from core.services.analytics import first_day, refresh_days, refresh_dirty_days
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DAYS = 7
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the daily rollups read by the analytics dashboards'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=DEFAULT_DAYS,
+            help=f'Rebuild today and this many preceding days (default: {DEFAULT_DAYS})',
+        )
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Rebuild the complete history (initial backfill after deploying)',
+        )
+        parser.add_argument(
+            '--kind',
+            choices=AnalyticsRollupKind.values,
+            help='Only rebuild this rollup (default: all)',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Show the days that would be rebuilt without changing anything',
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options['dry_run']
+        kinds = [options['kind']] if options['kind'] else AnalyticsRollupKind.values
+        today = timezone.localdate()
+
+        if dry_run:
+            self.stdout.write(self.style.WARNING('Running in DRY RUN mode - no changes will be made'))
+
+        total_rows = 0
+        for kind in kinds:
+            if options['all']:
+                start = first_day(kind)
+                if start is None:
+                    self.stdout.write(f'  {kind}: no data')
+                    continue
+            else:
+                start = today - timedelta(days=max(0, options['days']))
+            dirty = AnalyticsRollupDirtyDay.objects.filter(kind=kind).values('date').distinct().count()
+
+            if dry_run:
+                self.stdout.write(f'  Would rebuild {kind}: {start}..{today} and {dirty} dirty days')
+                continue
+
+            refreshed = refresh_dirty_days(kind)
+            rows = refresh_days(kind, start, today)
+            total_rows += rows
+            self.stdout.write(f'  {kind}: {start}..{today} rebuilt ({rows} rows), {refreshed} dirty days')
+            logger.info(f'Rebuilt {kind} rollups {start}..{today}: {rows} rows, {refreshed} dirty days')
+
+        self.stdout.write('\n' + '=' * 60)
+        if dry_run:
+            self.stdout.write(self.style.WARNING(
+                'DRY RUN: Run without --dry-run to apply changes.'
+            ))
+        else:
+            self.stdout.write(self.style.SUCCESS(
+                f'✓ Rebuilt analytics rollups ({total_rows} rows).'
+            ))
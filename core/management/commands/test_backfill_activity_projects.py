@@ -0,0 +1,59 @@
+"""
+Tests for the backfill_activity_projects management command.
+"""
+
+from io import StringIO
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import call_command
+from django.test import TestCase
+
+from core.models import Activity, Item, ItemComment, ItemStatus, ItemType, Project
+
+
+class BackfillActivityProjectsTestCase(TestCase):
+    """Test resolving Activity.project for rows logged before the column existed."""
+
+    def setUp(self):
+        self.project = Project.objects.create(name='Backfill Project')
+        item_type = ItemType.objects.create(key='task', name='Task')
+        self.item = Item.objects.create(
+            project=self.project, title='Task', type=item_type, status=ItemStatus.INBOX,
+        )
+        self.comment = ItemComment.objects.create(item=self.item, body='Hello')
+
+    def _activity(self, target_model, object_id):
+        return Activity.objects.create(
+            target_content_type=ContentType.objects.get_for_model(target_model),
+            target_object_id=str(object_id),
+            verb='legacy.event',
+            summary='',
+        )
+
+    def test_backfill_resolves_projects_from_targets(self):
+        on_project = self._activity(Project, self.project.pk)
+        on_item = self._activity(Item, self.item.pk)
+        on_comment = self._activity(ItemComment, self.comment.pk)
+        on_deleted_item = self._activity(Item, 999999)
+        global_activity = self._activity(Activity, 0)
+        out = StringIO()
+
+        call_command('backfill_activity_projects', '--batch-size', '2', stdout=out)
+
+        for activity in (on_project, on_item, on_comment):
+            activity.refresh_from_db()
+            self.assertEqual(activity.project_id, self.project.pk)
+        for activity in (on_deleted_item, global_activity):
+            activity.refresh_from_db()
+            self.assertIsNone(activity.project_id)
+        self.assertIn('Backfilled the project of 3 activities (2 without project remain)', out.getvalue())
+
+    def test_dry_run_changes_nothing(self):
+        activity = self._activity(Item, self.item.pk)
+        out = StringIO()
+
+        call_command('backfill_activity_projects', '--dry-run', stdout=out)
+
+        activity.refresh_from_db()
+        self.assertIsNone(activity.project_id)
+        self.assertIn('Would resolve core.item: 1 activities', out.getvalue())
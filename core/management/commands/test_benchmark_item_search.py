@@ -0,0 +1,29 @@
+"""
+Tests for the benchmark_item_search management command.
+"""
+
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from core.models import Item, Project
+
+
+class BenchmarkItemSearchTestCase(TestCase):
+    """Test the search benchmark on a small synthetic dataset."""
+
+    def test_reports_timings_and_rolls_back(self):
+        out = StringIO()
+
+        call_command(
+            'benchmark_item_search', '--items', '30', '--batch-size', '10', '--repeat', '1',
+            '--query', 'deploy', '--query', 'xyzzy', stdout=out,
+        )
+
+        output = out.getvalue()
+        self.assertIn('Inserted 30 synthetic items', output)
+        self.assertIn('xyzzy', output)
+        self.assertIn('✓ Benchmarked 2 queries over 30 synthetic items (rolled back).', output)
+        self.assertFalse(Item.objects.exists())
+        self.assertFalse(Project.objects.filter(name='Search Benchmark').exists())
@@ -140,6 +140,117 @@ class GitHubSyncWorkerTestCase(TestCase):
         self.assertIn('Found 1 issue mappings to sync', output)
         self.assertIn('Issue #42', output)
     
+    @patch('core.management.commands.github_sync_worker.get_conditional_stats')
+    @patch('core.management.commands.github_sync_worker.GitHubService')
+    def test_command_reports_cache_hit_ratio_and_rate_budget(self, mock_service_class, mock_stats):
+        """Test that the summary shows conditional request hits and remaining rate limit."""
+        mock_service = MagicMock()
+        mock_service.is_enabled.return_value = True
+        mock_service.is_configured.return_value = True
+        mock_service._get_repo_info.return_value = ('testowner', 'testrepo')
+        mock_service._get_client.return_value.get_issue_timeline.return_value = []
+        mock_service_class.return_value = mock_service
+        mock_stats.return_value = {
+            'hits': 3,
+            'misses': 1,
+            'hit_ratio': 0.75,
+            'rate_limit_limit': 5000,
+            'rate_limit_remaining': 4870,
+            'rate_limit_reset': None,
+        }
+        
+        out = StringIO()
+        call_command('github_sync_worker', '--dry-run', stdout=out)
+        
+        output = out.getvalue()
+        self.assertIn('3 not modified (304), 1 fetched (cache hit ratio 75.0%)', output)
+        self.assertIn('Rate limit remaining: 4870/5000', output)
+    
+    def _concurrent_service_mock(self):
+        mock_service = MagicMock()
+        mock_service.is_enabled.return_value = True
+        mock_service.is_configured.return_value = True
+        mock_service._get_repo_info.return_value = ('testowner', 'testrepo')
+        mock_service._map_state.side_effect = lambda data, kind: data['state']
+        client = mock_service._get_client.return_value
+        client.get_issue.side_effect = lambda owner, repo, number: {
+            'number': number, 'state': 'closed' if number == 42 else 'open',
+        }
+        client.get_issue_timeline.side_effect = lambda owner, repo, number: [
+            {
+                'event': 'cross-referenced',
+                'source': {'type': 'issue', 'issue': {'number': 7, 'pull_request': {}}},
+            },
+        ] if number == 42 else []
+        client.get_pr.return_value = {'number': 7, 'state': 'open'}
+        return mock_service
+    
+    @patch('core.management.commands.github_sync_worker.exists_object', return_value=True)
+    @patch('core.management.commands.github_sync_worker.GitHubService')
+    def test_command_concurrent_mode_applies_prefetched_data(self, mock_service_class, mock_exists):
+        """Test that --concurrency fetches in parallel and writes with the prefetched data."""
+        for number in (100, 101, 102):
+            item = Item.objects.create(
+                project=self.project, title=f'Item {number}', type=self.item_type, status=ItemStatus.WORKING,
+            )
+            ExternalIssueMapping.objects.create(
+                item=item, github_id=number, number=number, kind=ExternalIssueKind.ISSUE, state='open',
+            )
+        mock_service = self._concurrent_service_mock()
+        mock_service_class.return_value = mock_service
+        
+        out = StringIO()
+        call_command('github_sync_worker', '--concurrency', '3', '--batch-size', '2', stdout=out)
+        
+        output = out.getvalue()
+        self.assertIn('Total mappings processed: 4/4', output)
+        self.assertIn('Phase timings: fetch', output)
+        self.assertIn('Issue #42: open → closed', output)
+        # All writes use the data fetched by the pool threads
+        self.assertEqual(mock_service.sync_mapping.call_count, 4)
+        for call_args in mock_service.sync_mapping.call_args_list:
+            mapping = call_args[0][0]
+            self.assertEqual(call_args[1]['github_data']['number'], mapping.number)
+        mock_service.upsert_mapping_from_github.assert_called_once_with(
+            item=self.item, number=7, kind='pr', github_data={'number': 7, 'state': 'open'},
+        )
+        self.item.refresh_from_db()
+        self.assertEqual(self.item.status, ItemStatus.TESTING)
+    
+    @patch('core.management.commands.github_sync_worker.upsert_instance', return_value='uuid')
+    @patch('core.management.commands.github_sync_worker.is_available', return_value=True)
+    @patch('core.management.commands.github_sync_worker.exists_object', return_value=True)
+    @patch('core.management.commands.github_sync_worker.GitHubService')
+    def test_command_concurrent_mode_pushes_to_weaviate_after_commit(
+        self, mock_service_class, mock_exists, mock_available, mock_upsert
+    ):
+        """Test that Weaviate pushes wait for the batch transaction to commit."""
+        mock_service_class.return_value = self._concurrent_service_mock()
+        
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            call_command('github_sync_worker', '--concurrency', '2', stdout=StringIO())
+        
+        mock_upsert.assert_not_called()
+        
+        for callback in callbacks:
+            callback()
+        
+        mock_upsert.assert_any_call(self.mapping)
+    
+    @patch('core.management.commands.github_sync_worker.RateBudget.acquire', return_value=False)
+    @patch('core.management.commands.github_sync_worker.GitHubService')
+    def test_command_concurrent_mode_defers_when_budget_exhausted(self, mock_service_class, mock_acquire):
+        """Test that mappings are deferred instead of fetched once the rate budget is spent."""
+        mock_service = self._concurrent_service_mock()
+        mock_service_class.return_value = mock_service
+        
+        out = StringIO()
+        call_command('github_sync_worker', '--concurrency', '2', stdout=out)
+        
+        mock_service._get_client.return_value.get_issue.assert_not_called()
+        mock_service.sync_mapping.assert_not_called()
+        self.assertIn('Deferred (rate budget exhausted): 1', out.getvalue())
+    
     @patch('core.management.commands.github_sync_worker.GitHubService')
     def test_command_updates_item_status_when_issue_closed(self, mock_service_class):
         """Test that command updates Item status when issue is closed."""
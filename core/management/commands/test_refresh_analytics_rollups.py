@@ -0,0 +1,46 @@
+"""
+Tests for the refresh_analytics_rollups management command.
+"""
+
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from core.models import AIJobDailyRollup, AIJobsHistory, AnalyticsRollupDirtyDay
+
+
+class RefreshAnalyticsRollupsTestCase(TestCase):
+    """Test rebuilding rollups for changes that bypassed the signals."""
+
+    def setUp(self):
+        self.job = AIJobsHistory.objects.create(agent='agent.test', costs=Decimal('0.5'))
+        AnalyticsRollupDirtyDay.objects.all().delete()
+        # QuerySet.update() sends no signal, so the old day is not marked
+        AIJobsHistory.objects.filter(pk=self.job.pk).update(timestamp=timezone.now() - timedelta(days=20))
+
+    def test_all_rebuilds_complete_history(self):
+        out = StringIO()
+
+        call_command('refresh_analytics_rollups', '--all', '--kind', 'ai_jobs', stdout=out)
+
+        row = AIJobDailyRollup.objects.get()
+        self.assertEqual(row.date, timezone.localdate() - timedelta(days=20))
+        self.assertEqual(row.requests, 1)
+        self.assertIn('✓ Rebuilt analytics rollups (1 rows)', out.getvalue())
+
+    def test_days_window_leaves_older_days_alone(self):
+        call_command('refresh_analytics_rollups', '--days', '7', stdout=StringIO())
+
+        self.assertFalse(AIJobDailyRollup.objects.exists())
+
+    def test_dry_run_changes_nothing(self):
+        out = StringIO()
+
+        call_command('refresh_analytics_rollups', '--all', '--dry-run', stdout=out)
+
+        self.assertFalse(AIJobDailyRollup.objects.exists())
+        self.assertIn('Would rebuild ai_jobs', out.getvalue())
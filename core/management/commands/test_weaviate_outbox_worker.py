@@ -0,0 +1,75 @@
+"""
+Tests for the weaviate_outbox_worker management command.
+"""
+
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from core.models import Project, WeaviateSyncEvent
+
+
+@patch('core.management.commands.weaviate_outbox_worker.is_available', return_value=True)
+class WeaviateOutboxWorkerCommandTest(TestCase):
+    """Test cases for weaviate_outbox_worker."""
+
+    def setUp(self):
+        self.project = Project.objects.create(name='Outbox Worker Project')
+        WeaviateSyncEvent.objects.all().delete()
+
+    def _event(self, object_id, action='upsert'):
+        return WeaviateSyncEvent.objects.create(
+            object_type='project', object_id=str(object_id), action=action,
+        )
+
+    def test_once_drains_queue_and_reports(self, mock_available):
+        """Test that --once drains all due events and prints the summary."""
+        self._event(self.project.pk)
+        self._event(self.project.pk)
+
+        out = StringIO()
+        with patch('core.services.weaviate.outbox._write', return_value={}) as mock_write:
+            call_command('weaviate_outbox_worker', '--once', '--claim-size', '1', stdout=out)
+
+        # One event per pass: the second pass still finds the second event
+        self.assertEqual(mock_write.call_count, 2)
+        self.assertFalse(WeaviateSyncEvent.objects.exists())
+        output = out.getvalue()
+        self.assertIn('Processed 1 events as 1 objects', output)
+        self.assertIn('Outbox: 0 pending events', output)
+
+    def test_once_stops_after_failed_pass(self, mock_available):
+        """Test that failing writes are backed off instead of retried in a loop."""
+        self._event(self.project.pk)
+
+        out = StringIO()
+        with patch('core.services.weaviate.outbox._write', side_effect=RuntimeError('down')) as mock_write:
+            call_command('weaviate_outbox_worker', '--once', stdout=out)
+
+        self.assertEqual(mock_write.call_count, 1)
+        self.assertIn('1 retrying', out.getvalue())
+        self.assertEqual(WeaviateSyncEvent.objects.get().attempts, 1)
+
+    def test_unavailable_leaves_queue_untouched(self, mock_available):
+        """Test that events are kept while Weaviate is not configured."""
+        mock_available.return_value = False
+        self._event(self.project.pk)
+
+        with patch('core.services.weaviate.outbox._write') as mock_write:
+            call_command('weaviate_outbox_worker', '--once', stdout=StringIO())
+
+        mock_write.assert_not_called()
+        self.assertEqual(WeaviateSyncEvent.objects.count(), 1)
+
+    def test_stats_only(self, mock_available):
+        """Test that --stats prints depth without draining."""
+        self._event(self.project.pk)
+
+        out = StringIO()
+        with patch('core.services.weaviate.outbox._write') as mock_write:
+            call_command('weaviate_outbox_worker', '--stats', stdout=out)
+
+        mock_write.assert_not_called()
+        self.assertIn('Outbox: 1 pending events (1 objects)', out.getvalue())
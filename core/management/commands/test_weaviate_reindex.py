@@ -0,0 +1,110 @@
+"""
+Tests for the weaviate_reindex management command.
+"""
+
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase, override_settings
+
+from core.services.weaviate.bulk import BulkIndexStats
+
+
+class FakeIndexer:
+    """Stand-in for BulkIndexer that records calls and emits checkpoints."""
+
+    instances = []
+    fail_on = None
+
+    def __init__(self, batch_size, concurrent_requests, on_checkpoint=None):
+        self.batch_size = batch_size
+        self.concurrent_requests = concurrent_requests
+        self.on_checkpoint = on_checkpoint
+        self.calls = []
+        FakeIndexer.instances.append(self)
+
+    def index(self, obj_type, queryset, start_after_pk=None):
+        self.calls.append((obj_type, start_after_pk))
+        if obj_type == self.fail_on:
+            raise RuntimeError("weaviate went away")
+        if self.on_checkpoint:
+            self.on_checkpoint(obj_type, 42)
+        return BulkIndexStats(type=obj_type, indexed=10, last_pk=42, elapsed_seconds=0.5)
+
+
+@patch('core.management.commands.weaviate_reindex.BulkIndexer', FakeIndexer)
+@patch('core.management.commands.weaviate_reindex.is_available', return_value=True)
+class WeaviateReindexCommandTest(TestCase):
+    """Test cases for weaviate_reindex."""
+
+    def setUp(self):
+        FakeIndexer.instances = []
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        override = override_settings(AGIRA_DATA_DIR=Path(self.tmpdir.name))
+        override.enable()
+        self.addCleanup(override.disable)
+        self.checkpoint_file = Path(self.tmpdir.name) / 'weaviate_reindex_checkpoint.json'
+
+    def test_command_fails_when_weaviate_unavailable(self, mock_available):
+        """Test that the command refuses to run without Weaviate."""
+        mock_available.return_value = False
+        with self.assertRaises(CommandError):
+            call_command('weaviate_reindex', stdout=StringIO())
+
+    def test_reports_throughput_per_type(self, mock_available):
+        """Test options are passed through and throughput is reported."""
+        out = StringIO()
+        call_command(
+            'weaviate_reindex', '--type', 'item', '--type', 'comment',
+            '--batch-size', '250', '--concurrency', '4', stdout=out,
+        )
+
+        indexer = FakeIndexer.instances[0]
+        self.assertEqual(indexer.batch_size, 250)
+        self.assertEqual(indexer.concurrent_requests, 4)
+        self.assertEqual(indexer.calls, [('item', None), ('comment', None)])
+        output = out.getvalue()
+        self.assertIn('item: 10 indexed', output)
+        self.assertIn('20.0 obj/s', output)
+        self.assertIn('Objects indexed: 20', output)
+        # Completed runs clear their checkpoint
+        self.assertEqual(json.loads(self.checkpoint_file.read_text()), {})
+
+    def test_failure_keeps_checkpoint_and_resume_continues(self, mock_available):
+        """Test that an interrupted run can be resumed from its checkpoint."""
+        with patch.object(FakeIndexer, 'fail_on', 'comment'):
+            with self.assertRaises(CommandError) as cm:
+                call_command('weaviate_reindex', '--project', '7', stdout=StringIO())
+        self.assertIn('--resume', str(cm.exception))
+
+        saved = json.loads(self.checkpoint_file.read_text())
+        self.assertEqual(list(saved.values()), [{'item': 42}])
+
+        call_command('weaviate_reindex', '--project', '7', '--resume', stdout=StringIO())
+        resumed = FakeIndexer.instances[-1]
+        self.assertEqual(resumed.calls[0], ('item', 42))
+        self.assertEqual(resumed.calls[1], ('comment', None))
+
+    def test_resume_ignores_checkpoint_of_other_filters(self, mock_available):
+        """Test that checkpoints are only reused for identical filters."""
+        self.checkpoint_file.write_text(json.dumps({
+            'project=1|types=item|since=': {'item': 99},
+        }))
+        call_command('weaviate_reindex', '--project', '2', '--type', 'item', '--resume', stdout=StringIO())
+        self.assertEqual(FakeIndexer.instances[0].calls, [('item', None)])
+
+    def test_invalid_since_raises(self, mock_available):
+        """Test that an unparsable --since is rejected."""
+        with self.assertRaises(CommandError):
+            call_command('weaviate_reindex', '--since', 'yesterday', stdout=StringIO())
+
+    def test_since_accepts_date(self, mock_available):
+        """Test that a plain date is accepted for --since."""
+        call_command('weaviate_reindex', '--type', 'item', '--since', '2026-01-01', stdout=StringIO())
+        self.assertEqual(FakeIndexer.instances[0].calls, [('item', None)])
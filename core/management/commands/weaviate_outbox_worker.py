@@ -0,0 +1,162 @@
+"""
+Django management command: Weaviate outbox worker.
+
+Model signals record saves and deletes as ``WeaviateSyncEvent`` rows (see
+core.services.weaviate.outbox). This worker drains that table: it leases due
+events, coalesces all events of the same object into one write, pushes
+upserts through the Weaviate batch API and deletes with a single
+``delete_many``. Failed objects are retried with exponential backoff.
+
+Several workers may run side by side; on PostgreSQL rows are claimed with
+``SELECT ... FOR UPDATE SKIP LOCKED``.
+
+Run modes::
+
+    # cron: drain everything that is due, then exit
+    python manage.py weaviate_outbox_worker --once
+
+    # daemon: keep draining, poll every 2 seconds when idle
+    python manage.py weaviate_outbox_worker --interval 2
+
+    # only print queue depth and lag
+    python manage.py weaviate_outbox_worker --stats
+"""
+
+import logging
+import signal
+import time
+
+from django.core.management.base import BaseCommand
+
+from core.services.weaviate import is_available
+from core.services.weaviate.outbox import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_CLAIM_SIZE,
+    DEFAULT_MAX_ATTEMPTS,
+    drain_once,
+    get_outbox_stats,
+)
+
+logger = logging.getLogger(__name__)
+
+# Default poll interval for daemon mode.
+DEFAULT_INTERVAL_SECONDS = 2
+
+
+class Command(BaseCommand):
+    help = 'Drain the Weaviate outbox and push queued changes to Weaviate in batches'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Drain all due events, then exit. Ideal for cron.',
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=DEFAULT_INTERVAL_SECONDS,
+            help=f'Daemon poll interval in seconds when idle (default: {DEFAULT_INTERVAL_SECONDS}).',
+        )
+        parser.add_argument(
+            '--claim-size',
+            type=int,
+            default=DEFAULT_CLAIM_SIZE,
+            help=f'Events claimed per pass (default: {DEFAULT_CLAIM_SIZE}).',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help=f'Objects per Weaviate batch request (default: {DEFAULT_BATCH_SIZE}).',
+        )
+        parser.add_argument(
+            '--max-attempts',
+            type=int,
+            default=DEFAULT_MAX_ATTEMPTS,
+            help=f'Give up on an object after this many failed attempts (default: {DEFAULT_MAX_ATTEMPTS}).',
+        )
+        parser.add_argument(
+            '--stats',
+            action='store_true',
+            help='Print queue depth and lag, then exit.',
+        )
+
+    def handle(self, *args, **options):
+        self._stop = False
+        max_attempts = options['max_attempts']
+
+        if options['stats']:
+            self._write_stats(max_attempts)
+            return
+
+        if not is_available():
+            # Events stay queued and are written once Weaviate is configured
+            self.stdout.write(self.style.WARNING(
+                "Weaviate is not configured or not enabled; leaving outbox untouched."
+            ))
+            return
+
+        drain_kwargs = {
+            'claim_size': max(1, options['claim_size']),
+            'batch_size': max(1, options['batch_size']),
+            'max_attempts': max_attempts,
+        }
+
+        if options['once']:
+            while self._drain(drain_kwargs):
+                pass
+            self._write_stats(max_attempts)
+            return
+
+        # Daemon mode: loop until a termination signal arrives.
+        self._install_signal_handlers()
+        self.stdout.write(
+            f"Entering daemon loop (poll interval {options['interval']}s). Ctrl-C to stop."
+        )
+        while not self._stop:
+            if not self._drain(drain_kwargs):
+                self._interruptible_sleep(options['interval'])
+        self.stdout.write(self.style.SUCCESS("Weaviate outbox worker stopped."))
+
+    def _drain(self, drain_kwargs) -> bool:
+        """Run one drain pass; return True if events were claimed."""
+        try:
+            result = drain_once(**drain_kwargs)
+        except Exception as e:
+            logger.error(f"Weaviate outbox drain failed: {e}", exc_info=True)
+            self.stdout.write(self.style.ERROR(f"✗ Drain failed: {e}"))
+            return False
+
+        if result.claimed_events:
+            self.stdout.write(
+                f"Processed {result.claimed_events} events as {result.objects} objects "
+                f"(coalesced {result.coalesced}): {result.upserted} upserted, "
+                f"{result.deleted} deleted, {result.skipped} skipped, {result.retried} retried"
+            )
+            for error in result.errors[:10]:
+                self.stdout.write(self.style.ERROR(f"  ✗ {error}"))
+        # A pass that only hit failures would spin on the same rows otherwise;
+        # they are backed off, so stop once nothing new was written.
+        return result.claimed_events > 0 and result.retried < result.objects
+
+    def _write_stats(self, max_attempts):
+        stats = get_outbox_stats(max_attempts=max_attempts)
+        self.stdout.write(
+            f"Outbox: {stats['pending']} pending events ({stats['pending_objects']} objects), "
+            f"{stats['retrying']} retrying, {stats['dead']} dead, lag {stats['lag_seconds']}s"
+        )
+
+    def _install_signal_handlers(self):
+        def _handler(signum, _frame):
+            self.stdout.write(f"\nReceived signal {signum}, finishing up...")
+            self._stop = True
+
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(sig, _handler)
+
+    def _interruptible_sleep(self, seconds):
+        """Sleep in short slices so a stop signal is honored promptly."""
+        deadline = time.monotonic() + seconds
+        while not self._stop and time.monotonic() < deadline:
+            time.sleep(min(0.5, max(0.0, deadline - time.monotonic())))
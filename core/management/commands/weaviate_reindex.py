@@ -0,0 +1,186 @@
+"""
+Django management command to bulk (re)index Agira objects into Weaviate.
+
+Objects are streamed from the database and written through the Weaviate
+batch API (see core.services.weaviate.bulk). Progress is checkpointed per
+object type, so an interrupted run can be continued with --resume.
+"""
+
+import json
+import logging
+import time
+from datetime import datetime
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from core.services.exceptions import ServiceDisabled, ServiceNotConfigured
+from core.services.weaviate import is_available
+from core.services.weaviate.bulk import (
+    BULK_INDEX_TYPES,
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_CONCURRENT_REQUESTS,
+    BulkIndexer,
+    build_queryset,
+)
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_FILENAME = 'weaviate_reindex_checkpoint.json'
+
+
+class Command(BaseCommand):
+    help = 'Bulk (re)index Agira objects into Weaviate using the batch API'
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            '--project',
+            type=int,
+            help='Only reindex objects of this project ID',
+        )
+        parser.add_argument(
+            '--type',
+            action='append',
+            choices=BULK_INDEX_TYPES,
+            dest='types',
+            help='Object type to reindex (repeatable, default: all types)',
+        )
+        parser.add_argument(
+            '--since',
+            help='Only reindex objects changed at or after this date/datetime (ISO 8601)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help=f'Objects per batch request (default: {DEFAULT_BATCH_SIZE})',
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=DEFAULT_CONCURRENT_REQUESTS,
+            help=f'Concurrent batch requests (default: {DEFAULT_CONCURRENT_REQUESTS})',
+        )
+        parser.add_argument(
+            '--resume',
+            action='store_true',
+            help='Continue from the checkpoint of a previous interrupted run with the same filters',
+        )
+
+    def handle(self, *args, **options):
+        """Execute the command."""
+        if not is_available():
+            raise CommandError(
+                "Weaviate is not configured or not enabled. "
+                "Please configure Weaviate in Django admin first."
+            )
+
+        project_id = options.get('project')
+        types = options.get('types') or list(BULK_INDEX_TYPES)
+        since = self._parse_since(options.get('since'))
+
+        run_key = self._run_key(project_id, types, options.get('since'))
+        checkpoints = self._load_checkpoints()
+        resume_from = checkpoints.get(run_key, {}) if options['resume'] else {}
+        if options['resume'] and resume_from:
+            self.stdout.write(f"Resuming from checkpoint: {resume_from}")
+
+        def save_checkpoint(obj_type, last_pk):
+            checkpoints.setdefault(run_key, {})[obj_type] = last_pk
+            self._save_checkpoints(checkpoints)
+
+        indexer = BulkIndexer(
+            batch_size=options['batch_size'],
+            concurrent_requests=options['concurrency'],
+            on_checkpoint=save_checkpoint,
+        )
+
+        scope = f"project {project_id}" if project_id else "all projects"
+        self.stdout.write(f"Reindexing {', '.join(types)} for {scope}...")
+
+        total_indexed = 0
+        total_failed = 0
+        started = time.perf_counter()
+
+        for obj_type in types:
+            queryset = build_queryset(obj_type, project_id=project_id, since=since)
+            try:
+                stats = indexer.index(obj_type, queryset, start_after_pk=resume_from.get(obj_type))
+            except (ServiceDisabled, ServiceNotConfigured) as e:
+                raise CommandError(f"Weaviate service is not available: {e}")
+            except Exception as e:
+                logger.error(f"Reindex of {obj_type} failed: {e}", exc_info=True)
+                raise CommandError(
+                    f"Reindex of {obj_type} failed: {e}. "
+                    f"Re-run with --resume to continue from the last checkpoint."
+                )
+
+            total_indexed += stats.indexed
+            total_failed += stats.failed
+            self.stdout.write(
+                f"  {obj_type}: {stats.indexed} indexed, {stats.skipped} skipped, "
+                f"{stats.failed} failed in {stats.elapsed_seconds:.1f}s "
+                f"({stats.objects_per_second:.1f} obj/s)"
+            )
+            for error in stats.errors:
+                self.stdout.write(self.style.ERROR(f"    ✗ {error}"))
+
+        elapsed = time.perf_counter() - started
+        throughput = total_indexed / elapsed if elapsed > 0 else 0.0
+
+        # Run completed: drop its checkpoint so the next run starts fresh
+        if checkpoints.pop(run_key, None) is not None:
+            self._save_checkpoints(checkpoints)
+
+        self.stdout.write("\n" + "=" * 60)
+        self.stdout.write(self.style.SUCCESS("Reindex Summary:"))
+        self.stdout.write(f"  Objects indexed: {total_indexed}")
+        if total_failed:
+            self.stdout.write(self.style.ERROR(f"  Objects failed: {total_failed}"))
+        self.stdout.write(f"  Duration: {elapsed:.1f}s")
+        self.stdout.write(f"  Throughput: {throughput:.1f} obj/s")
+        self.stdout.write("=" * 60)
+
+    def _parse_since(self, value):
+        """Parse --since as ISO datetime or date (interpreted as midnight)."""
+        if not value:
+            return None
+        parsed = parse_datetime(value)
+        if parsed is None:
+            parsed_date = parse_date(value)
+            if parsed_date is None:
+                raise CommandError(f"Invalid --since value: {value!r} (expected ISO date or datetime)")
+            parsed = datetime.combine(parsed_date, datetime.min.time())
+        if timezone.is_naive(parsed):
+            parsed = timezone.make_aware(parsed)
+        return parsed
+
+    @staticmethod
+    def _run_key(project_id, types, since):
+        """Identify a run by its filters so --resume only picks up matching checkpoints."""
+        return f"project={project_id or '*'}|types={','.join(sorted(types))}|since={since or ''}"
+
+    @staticmethod
+    def _checkpoint_path() -> Path:
+        return Path(settings.AGIRA_DATA_DIR) / CHECKPOINT_FILENAME
+
+    def _load_checkpoints(self) -> dict:
+        path = self._checkpoint_path()
+        if not path.exists():
+            return {}
+        try:
+            return json.loads(path.read_text())
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable reindex checkpoint {path}: {e}")
+            return {}
+
+    def _save_checkpoints(self, checkpoints: dict) -> None:
+        path = self._checkpoint_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp')
+        tmp_path.write_text(json.dumps(checkpoints, indent=2))
+        tmp_path.replace(path)
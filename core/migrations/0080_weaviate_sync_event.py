@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-16 18:23
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0079_user_mcp_token_rotation'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WeaviateSyncEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('object_type', models.CharField(help_text='Weaviate type (e.g. item, comment)', max_length=30)),
+                ('object_id', models.CharField(max_length=64)),
+                ('action', models.CharField(choices=[('upsert', 'Upsert'), ('delete', 'Delete')], default='upsert', max_length=10)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('next_attempt_at', models.DateTimeField(default=django.utils.timezone.now, help_text='Not picked up by the worker before this time')),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('last_error', models.TextField(blank=True)),
+            ],
+            options={
+                'verbose_name': 'Weaviate Sync Event',
+                'verbose_name_plural': 'Weaviate Sync Events',
+                'ordering': ['id'],
+                'indexes': [models.Index(fields=['next_attempt_at', 'id'], name='core_weavia_next_at_1747ab_idx'), models.Index(fields=['object_type', 'object_id'], name='core_weavia_object__5eb5eb_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-16 18:40
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0080_weaviate_sync_event'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GitHubResponseCache',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('cache_key', models.CharField(max_length=64, unique=True)),
+                ('path', models.CharField(help_text='API path, for inspection only', max_length=500)),
+                ('etag', models.CharField(blank=True, max_length=255)),
+                ('last_modified', models.CharField(blank=True, max_length=64)),
+                ('payload', models.JSONField()),
+                ('fetched_at', models.DateTimeField(default=django.utils.timezone.now, help_text='Last full (200) response')),
+                ('last_used_at', models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+            ],
+            options={
+                'verbose_name': 'GitHub Response Cache Entry',
+                'verbose_name_plural': 'GitHub Response Cache',
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-16 18:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0081_github_response_cache'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='aijobshistory',
+            name='provider_latency_ms',
+            field=models.IntegerField(blank=True, help_text='Time waiting for the provider API', null=True),
+        ),
+        migrations.AddField(
+            model_name='aijobshistory',
+            name='router_overhead_ms',
+            field=models.IntegerField(blank=True, help_text='Time in the AI router before the provider call (model selection, job logging, client lookup)', null=True),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-16 19:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0082_aijobshistory_timing'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AIAgentDedupStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('agent', models.CharField(max_length=255)),
+                ('deduplicated_calls', models.PositiveIntegerField(default=0, help_text='Calls that received the result of an identical call already in flight')),
+                ('fallback_calls', models.PositiveIntegerField(default=0, help_text='Calls that stopped waiting for an identical call and ran on their own')),
+            ],
+            options={
+                'verbose_name': 'AI Agent Dedup Stats',
+                'verbose_name_plural': 'AI Agent Dedup Stats',
+                'ordering': ['-date', 'agent'],
+                'constraints': [models.UniqueConstraint(fields=('date', 'agent'), name='unique_agent_dedup_stats_per_day')],
+            },
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-16 19:18
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0083_aiagentdedupstats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AttachmentTextExtract',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sha256', models.CharField(max_length=64, unique=True)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('done', 'Done'), ('failed', 'Failed')], default='pending', max_length=10)),
+                ('extractor', models.CharField(help_text='Parser used (pdf, docx)', max_length=10)),
+                ('text', models.TextField(blank=True)),
+                ('page_count', models.PositiveIntegerField(blank=True, null=True)),
+                ('extraction_ms', models.PositiveIntegerField(blank=True, help_text='Time spent parsing the file', null=True)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('next_attempt_at', models.DateTimeField(default=django.utils.timezone.now, help_text='Not picked up by the worker before this time')),
+                ('last_error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Attachment Text Extract',
+                'verbose_name_plural': 'Attachment Text Extracts',
+                'ordering': ['id'],
+                'indexes': [models.Index(fields=['status', 'next_attempt_at'], name='core_attach_status_d82fb9_idx')],
+            },
+        ),
+    ]
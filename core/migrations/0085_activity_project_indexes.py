@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-16 19:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('core', '0084_attachmenttextextract'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='activity',
+            name='project',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='activities', to='core.project'),
+        ),
+        migrations.AddIndex(
+            model_name='activity',
+            index=models.Index(fields=['target_content_type', 'target_object_id', '-created_at'], name='core_activi_target__0aab19_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='activity',
+            index=models.Index(fields=['project', '-created_at'], name='core_activi_project_bfc493_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='activity',
+            index=models.Index(fields=['-created_at'], name='core_activi_created_347311_idx'),
+        ),
+    ]
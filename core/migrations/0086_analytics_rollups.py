@@ -0,0 +1,121 @@
+"""Daily analytics rollups for the analytics dashboards.
+
+Creates the rollup tables. Existing history is backfilled after deploying
+with ``refresh_analytics_rollups --all`` (see docs/services/analytics.md).
+"""
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0085_activity_project_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AnalyticsRollupDirtyDay',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('ai_jobs', 'AI Jobs'), ('claude_queue', 'Claude Queue'), ('items', 'Items')], max_length=20)),
+                ('date', models.DateField()),
+                ('marked_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Analytics Rollup Dirty Day',
+                'verbose_name_plural': 'Analytics Rollup Dirty Days',
+                'ordering': ['kind', 'date'],
+                'constraints': [models.UniqueConstraint(fields=('kind', 'date'), name='unique_analytics_rollup_dirty_day')],
+            },
+        ),
+        migrations.CreateModel(
+            name='AIJobDailyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('agent', models.CharField(max_length=255)),
+                ('requests', models.PositiveIntegerField(default=0)),
+                ('errors', models.PositiveIntegerField(default=0)),
+                ('total_costs', models.DecimalField(decimal_places=6, default=0, max_digits=14)),
+                ('duration_count', models.PositiveIntegerField(default=0, help_text='Jobs with a known duration')),
+                ('duration_total_ms', models.BigIntegerField(default=0)),
+                ('duration_p50_ms', models.FloatField(blank=True, null=True)),
+                ('duration_p90_ms', models.FloatField(blank=True, null=True)),
+                ('model', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='core.aimodel')),
+                ('user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'AI Job Daily Rollup',
+                'verbose_name_plural': 'AI Job Daily Rollups',
+                'ordering': ['-date', 'agent'],
+                'indexes': [models.Index(fields=['date', 'agent'], name='core_aijobd_date_6f1f72_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='ClaudeQueueDailyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('model', models.CharField(blank=True, max_length=20)),
+                ('billed', models.BooleanField(default=False, help_text='Last attempt ran with an API key (pay-per-use)')),
+                ('jobs', models.PositiveIntegerField(default=0)),
+                ('total_cost', models.DecimalField(decimal_places=6, default=0, max_digits=14)),
+                ('cost_jobs', models.PositiveIntegerField(default=0, help_text='Jobs with a known cost')),
+                ('run_jobs', models.PositiveIntegerField(default=0)),
+                ('done_ok', models.PositiveIntegerField(default=0)),
+                ('done_uncertain', models.PositiveIntegerField(default=0)),
+                ('failed', models.PositiveIntegerField(default=0)),
+                ('cancelled', models.PositiveIntegerField(default=0)),
+                ('in_flight', models.PositiveIntegerField(default=0)),
+                ('turns_jobs', models.PositiveIntegerField(default=0, help_text='Jobs with a known number of turns')),
+                ('turns_total', models.PositiveIntegerField(default=0)),
+                ('turns_p50', models.FloatField(blank=True, null=True)),
+                ('turns_p90', models.FloatField(blank=True, null=True)),
+                ('turns_1_10', models.PositiveIntegerField(default=0)),
+                ('turns_11_25', models.PositiveIntegerField(default=0)),
+                ('turns_26_50', models.PositiveIntegerField(default=0)),
+                ('turns_51_100', models.PositiveIntegerField(default=0)),
+                ('turns_over_100', models.PositiveIntegerField(default=0)),
+                ('duration_jobs', models.PositiveIntegerField(default=0, help_text='Jobs with started_at and finished_at')),
+                ('duration_total_seconds', models.FloatField(default=0)),
+                ('duration_p50_seconds', models.FloatField(blank=True, null=True)),
+                ('duration_p90_seconds', models.FloatField(blank=True, null=True)),
+                ('auth_user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='core.project')),
+            ],
+            options={
+                'verbose_name': 'Claude Queue Daily Rollup',
+                'verbose_name_plural': 'Claude Queue Daily Rollups',
+                'ordering': ['-date', 'project'],
+                'indexes': [models.Index(fields=['date', 'project'], name='core_claude_date_355916_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='ItemDailyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('created', models.PositiveIntegerField(default=0)),
+                ('closed', models.PositiveIntegerField(default=0)),
+                ('cycle_total_days', models.FloatField(default=0)),
+                ('cycle_p50_days', models.FloatField(blank=True, null=True)),
+                ('cycle_p90_days', models.FloatField(blank=True, null=True)),
+                ('longest_cycle_items', models.JSONField(blank=True, default=list, help_text="[item_id, cycle_days] pairs of the day's longest cycle times")),
+                ('deployed', models.PositiveIntegerField(default=0)),
+                ('lead_total_days', models.FloatField(default=0)),
+                ('lead_p50_days', models.FloatField(blank=True, null=True)),
+                ('lead_p90_days', models.FloatField(blank=True, null=True)),
+                ('fastest_lead_item', models.JSONField(blank=True, help_text="[item_id, lead_days] of the day's fastest deployment", null=True)),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='core.project')),
+            ],
+            options={
+                'verbose_name': 'Item Daily Rollup',
+                'verbose_name_plural': 'Item Daily Rollups',
+                'ordering': ['-date', 'project'],
+                'indexes': [models.Index(fields=['date', 'project'], name='core_itemda_date_84b2b7_idx')],
+            },
+        ),
+    ]
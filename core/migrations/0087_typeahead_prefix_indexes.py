@@ -0,0 +1,48 @@
+"""Prefix indexes for the typeahead pickers.
+
+``istartswith`` compiles to ``UPPER("col"::text) LIKE UPPER('q%')`` on
+PostgreSQL. A btree expression index with ``text_pattern_ops`` serves exactly
+that, so user_search, organisation_search and item_search stay index scans
+however many users, organisations and items there are.
+
+The indexes are PostgreSQL specific; other databases (SQLite in the tests)
+skip this migration.
+"""
+
+from django.db import migrations
+
+INDEXES = [
+    ('core_user_name_prefix_idx', 'core_user', 'name'),
+    ('core_user_username_prefix_idx', 'core_user', 'username'),
+    ('core_user_email_prefix_idx', 'core_user', 'email'),
+    ('core_organisation_name_prefix_idx', 'core_organisation', 'name'),
+    ('core_organisation_short_prefix_idx', 'core_organisation', 'short'),
+    ('core_item_title_prefix_idx', 'core_item', 'title'),
+]
+
+
+def create_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, table, column in INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON {table} (UPPER({column}::text) text_pattern_ops)'
+        )
+
+
+def drop_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, _table, _column in INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0086_analytics_rollups'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_indexes, drop_indexes),
+    ]
@@ -0,0 +1,54 @@
+"""Full-text and trigram search indexes for items.
+
+Adds ``core_item.search_vector``, a generated tsvector column (title weighted
+A, short_description B, description C) with a GIN index, and a pg_trgm GIN
+index on ``UPPER(title)`` for ``title__icontains``. See
+core.services.search.
+
+The column is maintained by PostgreSQL and is not a model field. Other
+databases (SQLite in the tests) skip this migration and fall back to
+icontains. ``CREATE EXTENSION pg_trgm`` needs a role that may create
+extensions; otherwise create it once as a superuser before migrating.
+"""
+
+from django.db import migrations
+
+SEARCH_VECTOR = """
+    setweight(to_tsvector('simple'::regconfig, coalesce(title, '')), 'A')
+    || setweight(to_tsvector('simple'::regconfig, coalesce(short_description, '')), 'B')
+    || setweight(to_tsvector('simple'::regconfig, coalesce(description, '')), 'C')
+"""
+
+
+def create_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(
+        f'ALTER TABLE core_item ADD COLUMN IF NOT EXISTS search_vector tsvector '
+        f'GENERATED ALWAYS AS ({SEARCH_VECTOR}) STORED'
+    )
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS core_item_search_vector_idx ON core_item USING gin (search_vector)'
+    )
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS core_item_title_trgm_idx ON core_item USING gin (UPPER(title::text) gin_trgm_ops)'
+    )
+
+
+def drop_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS core_item_title_trgm_idx')
+    schema_editor.execute('ALTER TABLE core_item DROP COLUMN IF EXISTS search_vector')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0087_typeahead_prefix_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
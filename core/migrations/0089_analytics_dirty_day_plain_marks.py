@@ -0,0 +1,26 @@
+"""Let analytics rollup dirty-day marks be plain inserts.
+
+A unique (kind, date) mark was one hot row per day: every writer upserting
+it waited for the transaction holding it. Marks are now appended without a
+constraint; refresh_dirty_days() deletes the rows it read.
+"""
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0088_item_search_vector'),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='analyticsrollupdirtyday',
+            name='unique_analytics_rollup_dirty_day',
+        ),
+        migrations.AddIndex(
+            model_name='analyticsrollupdirtyday',
+            index=models.Index(fields=['kind', 'date'], name='core_analyt_kind_9d0d8f_idx'),
+        ),
+    ]
@@ -1253,18 +1253,67 @@ class AttachmentLink(models.Model):
         return f"{self.attachment.original_name} -> {self.target} ({self.role})"
 
 
+class AttachmentTextExtractStatus(models.TextChoices):
+    PENDING = 'pending', 'Pending'
+    DONE = 'done', 'Done'
+    FAILED = 'failed', 'Failed'
+
+
+class AttachmentTextExtract(models.Model):
+    """Text extracted from a PDF or DOCX file, shared by all attachments with the same content.
+
+    Rows are keyed by the file's SHA256, so a document is parsed once no
+    matter how often it is uploaded, re-indexed or summarized. Small files
+    are extracted inline on first use; large ones are left ``pending`` for
+    the ``attachment_text_worker``. ``next_attempt_at`` doubles as a claim
+    lease and as retry backoff.
+    """
+    sha256 = models.CharField(max_length=64, unique=True)
+    status = models.CharField(max_length=10, choices=AttachmentTextExtractStatus.choices, default=AttachmentTextExtractStatus.PENDING)
+    extractor = models.CharField(max_length=10, help_text="Parser used (pdf, docx)")
+    text = models.TextField(blank=True)
+    page_count = models.PositiveIntegerField(null=True, blank=True)
+    extraction_ms = models.PositiveIntegerField(null=True, blank=True, help_text="Time spent parsing the file")
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now, help_text="Not picked up by the worker before this time")
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['id']
+        verbose_name = 'Attachment Text Extract'
+        verbose_name_plural = 'Attachment Text Extracts'
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.extractor} {self.sha256[:12]} ({self.status})"
+
+
 class Activity(models.Model):
     target_content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
     target_object_id = models.CharField(max_length=255)
     target = GenericForeignKey('target_content_type', 'target_object_id')
     verb = models.CharField(max_length=255)
     actor = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='activities')
+    # Denormalized from the target at log time (backfill_activity_projects) so
+    # the project stream is one index range instead of a huge IN list
+    project = models.ForeignKey(
+        Project, on_delete=models.SET_NULL, null=True, blank=True, related_name='activities'
+    )
     summary = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         ordering = ['-created_at']
         verbose_name_plural = 'Activities'
+        indexes = [
+            models.Index(fields=['target_content_type', 'target_object_id', '-created_at']),
+            models.Index(fields=['project', '-created_at']),
+            models.Index(fields=['-created_at']),
+        ]
 
     def __str__(self):
         actor_name = self.actor.username if self.actor else 'System'
@@ -1318,6 +1367,30 @@ class GitHubConfiguration(SingletonModel):
         return "GitHub Configuration"
 
 
+class GitHubResponseCache(models.Model):
+    """Last validated GitHub API response for conditional requests.
+
+    ``GitHubClient`` sends the stored ETag/Last-Modified with repeated GETs;
+    a 304 answer is served from ``payload`` and does not count against the
+    GitHub rate limit. ``cache_key`` hashes token fingerprint, path, query
+    and Accept header, so responses of different tokens never mix.
+    """
+    cache_key = models.CharField(max_length=64, unique=True)
+    path = models.CharField(max_length=500, help_text="API path, for inspection only")
+    etag = models.CharField(max_length=255, blank=True)
+    last_modified = models.CharField(max_length=64, blank=True)
+    payload = models.JSONField()
+    fetched_at = models.DateTimeField(default=timezone.now, help_text="Last full (200) response")
+    last_used_at = models.DateTimeField(default=timezone.now, db_index=True)
+
+    class Meta:
+        verbose_name = 'GitHub Response Cache Entry'
+        verbose_name_plural = 'GitHub Response Cache'
+
+    def __str__(self):
+        return self.path
+
+
 class WeaviateConfiguration(SingletonModel):
     url = models.URLField(blank=True, help_text="Weaviate instance URL (e.g., http://localhost or http://192.168.1.100)")
     http_port = models.IntegerField(
@@ -1341,6 +1414,41 @@ class WeaviateConfiguration(SingletonModel):
         return "Weaviate Configuration"
 
 
+class WeaviateSyncAction(models.TextChoices):
+    UPSERT = 'upsert', 'Upsert'
+    DELETE = 'delete', 'Delete'
+
+
+class WeaviateSyncEvent(models.Model):
+    """Outbox entry for a pending Weaviate write.
+
+    Rows are written by the post_save/post_delete signals inside the caller's
+    transaction, so a rolled-back save never reaches Weaviate and a committed
+    one is never lost on a worker restart. The ``weaviate_outbox_worker``
+    drains the table, coalescing all pending rows of one object into a single
+    write. ``next_attempt_at`` doubles as a claim lease and as retry backoff.
+    """
+    object_type = models.CharField(max_length=30, help_text="Weaviate type (e.g. item, comment)")
+    object_id = models.CharField(max_length=64)
+    action = models.CharField(max_length=10, choices=WeaviateSyncAction.choices, default=WeaviateSyncAction.UPSERT)
+    created_at = models.DateTimeField(default=timezone.now)
+    next_attempt_at = models.DateTimeField(default=timezone.now, help_text="Not picked up by the worker before this time")
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+
+    class Meta:
+        ordering = ['id']
+        verbose_name = 'Weaviate Sync Event'
+        verbose_name_plural = 'Weaviate Sync Events'
+        indexes = [
+            models.Index(fields=['next_attempt_at', 'id']),
+            models.Index(fields=['object_type', 'object_id']),
+        ]
+
+    def __str__(self):
+        return f"{self.action} {self.object_type}:{self.object_id}"
+
+
 class GooglePSEConfiguration(SingletonModel):
     api_key = EncryptedCharField(max_length=500, blank=True)
     search_engine_id = models.CharField(max_length=255, blank=True)
@@ -1465,6 +1573,14 @@ class AIJobsHistory(models.Model):
     
     timestamp = models.DateTimeField(auto_now_add=True)
     duration_ms = models.IntegerField(null=True, blank=True, help_text="Duration in milliseconds")
+    router_overhead_ms = models.IntegerField(
+        null=True, blank=True,
+        help_text="Time in the AI router before the provider call (model selection, job logging, client lookup)"
+    )
+    provider_latency_ms = models.IntegerField(
+        null=True, blank=True,
+        help_text="Time waiting for the provider API"
+    )
     error_message = models.TextField(blank=True)
 
     class Meta:
@@ -1483,6 +1599,178 @@ class AIJobsHistory(models.Model):
         return f"{self.agent} - {model_name} ({self.status}) @ {self.timestamp}"
 
 
+class AIAgentDedupStats(models.Model):
+    """Daily per-agent counters of agent calls answered by single-flight deduplication"""
+    date = models.DateField()
+    agent = models.CharField(max_length=255)
+    deduplicated_calls = models.PositiveIntegerField(
+        default=0,
+        help_text="Calls that received the result of an identical call already in flight"
+    )
+    fallback_calls = models.PositiveIntegerField(
+        default=0,
+        help_text="Calls that stopped waiting for an identical call and ran on their own"
+    )
+
+    class Meta:
+        ordering = ['-date', 'agent']
+        verbose_name = 'AI Agent Dedup Stats'
+        verbose_name_plural = 'AI Agent Dedup Stats'
+        constraints = [
+            models.UniqueConstraint(fields=['date', 'agent'], name='unique_agent_dedup_stats_per_day'),
+        ]
+
+    def __str__(self):
+        return f"{self.agent} @ {self.date}: {self.deduplicated_calls} deduplicated"
+
+
+class AnalyticsRollupKind(models.TextChoices):
+    """Source of a daily analytics rollup (see core.services.analytics)"""
+    AI_JOBS = 'ai_jobs', _('AI Jobs')
+    CLAUDE_QUEUE = 'claude_queue', _('Claude Queue')
+    ITEMS = 'items', _('Items')
+
+
+class AnalyticsRollupDirtyDay(models.Model):
+    """
+    A day whose rollup rows are out of date.
+
+    Written by signal handlers in the same transaction as the change to the
+    source row; the dashboards rebuild the marked days before they read.
+    A day can be marked by several rows: marks are plain inserts, so writers
+    never wait on each other's mark.
+    """
+    kind = models.CharField(max_length=20, choices=AnalyticsRollupKind.choices)
+    date = models.DateField()
+    marked_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['kind', 'date']
+        verbose_name = 'Analytics Rollup Dirty Day'
+        verbose_name_plural = 'Analytics Rollup Dirty Days'
+        indexes = [
+            models.Index(fields=['kind', 'date']),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} @ {self.date}"
+
+
+class AIJobDailyRollup(models.Model):
+    """Daily AIJobsHistory totals per agent, model and user"""
+    date = models.DateField()
+    agent = models.CharField(max_length=255)
+    model = models.ForeignKey(AIModel, on_delete=models.SET_NULL, null=True, blank=True, related_name='+')
+    user = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='+')
+    requests = models.PositiveIntegerField(default=0)
+    errors = models.PositiveIntegerField(default=0)
+    total_costs = models.DecimalField(max_digits=14, decimal_places=6, default=0)
+    duration_count = models.PositiveIntegerField(default=0, help_text="Jobs with a known duration")
+    duration_total_ms = models.BigIntegerField(default=0)
+    duration_p50_ms = models.FloatField(null=True, blank=True)
+    duration_p90_ms = models.FloatField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['-date', 'agent']
+        verbose_name = 'AI Job Daily Rollup'
+        verbose_name_plural = 'AI Job Daily Rollups'
+        indexes = [
+            models.Index(fields=['date', 'agent']),
+        ]
+
+    def __str__(self):
+        return f"{self.agent} @ {self.date}: {self.requests} requests"
+
+
+class ClaudeQueueDailyRollup(models.Model):
+    """
+    Daily ClaudeQueueJob totals per project, model and auth user, bucketed by
+    the day the job was created.
+
+    The run counters (``run_jobs`` and the status counters) only count issue
+    runs; epic nodes never invoke Claude (#1079).
+    """
+    date = models.DateField()
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name='+')
+    model = models.CharField(max_length=20, blank=True)
+    auth_user = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='+')
+    billed = models.BooleanField(default=False, help_text="Last attempt ran with an API key (pay-per-use)")
+    jobs = models.PositiveIntegerField(default=0)
+    total_cost = models.DecimalField(max_digits=14, decimal_places=6, default=0)
+    cost_jobs = models.PositiveIntegerField(default=0, help_text="Jobs with a known cost")
+    run_jobs = models.PositiveIntegerField(default=0)
+    done_ok = models.PositiveIntegerField(default=0)
+    done_uncertain = models.PositiveIntegerField(default=0)
+    failed = models.PositiveIntegerField(default=0)
+    cancelled = models.PositiveIntegerField(default=0)
+    in_flight = models.PositiveIntegerField(default=0)
+    turns_jobs = models.PositiveIntegerField(default=0, help_text="Jobs with a known number of turns")
+    turns_total = models.PositiveIntegerField(default=0)
+    turns_p50 = models.FloatField(null=True, blank=True)
+    turns_p90 = models.FloatField(null=True, blank=True)
+    turns_1_10 = models.PositiveIntegerField(default=0)
+    turns_11_25 = models.PositiveIntegerField(default=0)
+    turns_26_50 = models.PositiveIntegerField(default=0)
+    turns_51_100 = models.PositiveIntegerField(default=0)
+    turns_over_100 = models.PositiveIntegerField(default=0)
+    duration_jobs = models.PositiveIntegerField(default=0, help_text="Jobs with started_at and finished_at")
+    duration_total_seconds = models.FloatField(default=0)
+    duration_p50_seconds = models.FloatField(null=True, blank=True)
+    duration_p90_seconds = models.FloatField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['-date', 'project']
+        verbose_name = 'Claude Queue Daily Rollup'
+        verbose_name_plural = 'Claude Queue Daily Rollups'
+        indexes = [
+            models.Index(fields=['date', 'project']),
+        ]
+
+    def __str__(self):
+        return f"{self.project_id} @ {self.date}: {self.jobs} jobs"
+
+
+class ItemDailyRollup(models.Model):
+    """
+    Daily item throughput per project.
+
+    ``created`` counts items by creation day, the cycle-time columns count
+    closed items by the day they were closed and the lead-time columns count
+    items by the day they were deployed (first merged PR or closed release).
+    The per-item extremes are kept so the dashboard's top lists need no scan.
+    """
+    date = models.DateField()
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name='+')
+    created = models.PositiveIntegerField(default=0)
+    closed = models.PositiveIntegerField(default=0)
+    cycle_total_days = models.FloatField(default=0)
+    cycle_p50_days = models.FloatField(null=True, blank=True)
+    cycle_p90_days = models.FloatField(null=True, blank=True)
+    longest_cycle_items = models.JSONField(
+        default=list, blank=True,
+        help_text="[item_id, cycle_days] pairs of the day's longest cycle times"
+    )
+    deployed = models.PositiveIntegerField(default=0)
+    lead_total_days = models.FloatField(default=0)
+    lead_p50_days = models.FloatField(null=True, blank=True)
+    lead_p90_days = models.FloatField(null=True, blank=True)
+    fastest_lead_item = models.JSONField(
+        null=True, blank=True,
+        help_text="[item_id, lead_days] of the day's fastest deployment"
+    )
+
+    class Meta:
+        ordering = ['-date', 'project']
+        verbose_name = 'Item Daily Rollup'
+        verbose_name_plural = 'Item Daily Rollups'
+        indexes = [
+            models.Index(fields=['date', 'project']),
+        ]
+
+    def __str__(self):
+        return f"{self.project_id} @ {self.date}: {self.created} created, {self.closed} closed"
+
+
 class MailTemplate(models.Model):
     """
     Model for managing email templates.
@@ -20,15 +20,89 @@ Verb Convention:
 """
 
 import logging
-from typing import Optional
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Iterable, Iterator, List, Optional, Tuple
+from django.db import transaction
 from django.db.models import Model, Q, QuerySet
 from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 from django.contrib.contenttypes.models import ContentType
 
 from core.models import Activity, User, Project, Item
 
 logger = logging.getLogger(__name__)
 
+# Rows per INSERT when a batch is flushed
+DEFAULT_BATCH_SIZE = 500
+
+# Title attribute and URL of targets the activity streams link to,
+# by "app_label.model"
+TARGET_LINKS = {
+    'core.item': ('title', '/items/{pk}/'),
+    'core.project': ('name', '/projects/{pk}/'),
+    'core.change': ('title', '/changes/{pk}/'),
+}
+
+# Per-thread stack of open batches (see ActivityService.batch)
+_local = threading.local()
+
+
+def _batches() -> List[List[Activity]]:
+    if not hasattr(_local, 'batches'):
+        _local.batches = []
+    return _local.batches
+
+
+def get_project_id(target: Optional[Model]) -> Optional[int]:
+    """
+    Project an activity target belongs to, for Activity.project.
+    
+    Projects are their own project; other targets use their ``project``
+    FK or, like comments and issue mappings, the project of their ``item``.
+    
+    Returns:
+        Project ID, or None for global targets
+    """
+    if target is None:
+        return None
+    if isinstance(target, Project):
+        return target.pk
+    project_id = getattr(target, 'project_id', None)
+    if project_id:
+        return project_id
+    item_id = getattr(target, 'item_id', None)
+    if item_id:
+        return Item.objects.filter(pk=item_id).values_list('project_id', flat=True).first()
+    return None
+
+
+def encode_cursor(activity: Activity) -> str:
+    """Keyset cursor pointing just after an activity in the newest-first stream."""
+    return f"{activity.created_at.isoformat()}|{activity.pk}"
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Tuple[datetime, int]]:
+    """
+    Parse a cursor from encode_cursor().
+    
+    Returns:
+        (created_at, id), or None for a missing or malformed cursor
+    """
+    if not cursor or '|' not in cursor:
+        return None
+    created_at, _, pk = cursor.rpartition('|')
+    try:
+        created_at = parse_datetime(created_at)
+        pk = int(pk)
+    except ValueError:
+        return None
+    if created_at is None:
+        return None
+    return created_at, pk
+
 
 class ActivityService:
     """
@@ -57,8 +131,80 @@ class ActivityService:
         ...     to_status='Working',
         ...     actor=current_user
         ... )
+        >>> 
+        >>> # Log many activities with one INSERT
+        >>> with ActivityService.batch():
+        ...     for item in imported_items:
+        ...         service.log_created(target=item)
     """
     
+    @staticmethod
+    @contextmanager
+    def batch(
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        best_effort: bool = False,
+    ) -> Iterator[List[Activity]]:
+        """
+        Buffer activities logged in this thread and write them with bulk_create.
+        
+        Inside the block, log() and its helpers return unsaved Activity
+        instances. They are written when the block exits normally; if the
+        block raises, they are discarded together with the work they describe,
+        so use the batch inside the transaction (or savepoint) of that work.
+        
+        Batches nest: an inner batch hands its activities to the outer one,
+        which writes them all at the end. A failing write raises like a
+        failing log() call outside a batch, so the surrounding transaction
+        still rolls back. With best_effort, the outermost batch writes in a
+        savepoint instead and a failure is only logged, for callers where
+        activities are non-critical (like GitHubService._log_activity).
+        
+        Note: created_at is set when the batch is written, so activities of
+        a long batch share its end time (their order is preserved).
+        
+        Args:
+            batch_size: Maximum rows per INSERT statement
+            best_effort: Log and drop the activities if writing them fails
+                (only used by the outermost batch)
+            
+        Yields:
+            The list of buffered Activity instances
+            
+        Example:
+            >>> with transaction.atomic(), ActivityService.batch():
+            ...     for issue in issues:
+            ...         import_issue(issue)  # logs activities
+        """
+        stack = _batches()
+        buffer: List[Activity] = []
+        stack.append(buffer)
+        try:
+            yield buffer
+        except BaseException:
+            stack.pop()
+            if buffer:
+                logger.debug(f"Discarded {len(buffer)} batched activities")
+            raise
+        stack.pop()
+        if not buffer:
+            return
+        if stack:
+            stack[-1].extend(buffer)
+            return
+        try:
+            if best_effort:
+                # Savepoint: a failed INSERT must not abort the caller's transaction
+                with transaction.atomic():
+                    Activity.objects.bulk_create(buffer, batch_size=batch_size)
+            else:
+                Activity.objects.bulk_create(buffer, batch_size=batch_size)
+            logger.debug(f"Batched activities logged: {len(buffer)}")
+        except Exception as e:
+            logger.error(f"Failed to log {len(buffer)} batched activities - {e}")
+            if not best_effort:
+                raise
+    
+    
     def log(
         self,
         verb: str,
@@ -77,7 +223,8 @@ class ActivityService:
             summary: Optional human-readable summary text
             
         Returns:
-            Created Activity instance
+            Created Activity instance (unsaved until the batch is written
+            when called inside ActivityService.batch())
             
         Example:
             >>> service.log(
@@ -98,6 +245,7 @@ class ActivityService:
             content_type = ContentType.objects.get_for_model(target)
             activity_data['target_content_type'] = content_type
             activity_data['target_object_id'] = str(target.pk)
+            activity_data['project_id'] = get_project_id(target)
         else:
             # For global activities without a target, we use a dummy ContentType
             # to satisfy the non-null FK constraint. We use the Activity model itself
@@ -107,6 +255,12 @@ class ActivityService:
             activity_data['target_content_type'] = dummy_content_type
             activity_data['target_object_id'] = '0'
         
+        batches = _batches()
+        if batches:
+            activity = Activity(**activity_data)
+            batches[-1].append(activity)
+            return activity
+        
         try:
             activity = Activity.objects.create(**activity_data)
             logger.debug(f"Activity logged: {verb} by {actor or 'System'}")
@@ -202,9 +356,13 @@ class ActivityService:
         """
         Get latest activities with optional filtering.
         
+        Both filters are served by an index ending in created_at, so the
+        newest rows are read without sorting the whole stream.
+        
         Args:
             limit: Maximum number of activities to return
-            project: Optional project filter (shows activities for project and its items)
+            project: Optional project filter (shows activities for project and its items,
+                changes and other project objects, via Activity.project)
             item: Optional item filter (shows activities for specific item)
             
         Returns:
@@ -232,27 +390,82 @@ class ActivityService:
         
         # Filter by project if provided (and no item filter)
         elif project is not None:
-            # Get activities where target is the project itself
-            project_ct = ContentType.objects.get_for_model(Project)
-            project_filter = Q(
-                target_content_type=project_ct,
-                target_object_id=str(project.pk),
-            )
-            
-            # Also get activities for items in this project
-            item_ct = ContentType.objects.get_for_model(Item)
-            item_ids = [str(item_id) for item_id in project.items.values_list('id', flat=True)]
-            if item_ids:
-                item_filter = Q(
-                    target_content_type=item_ct,
-                    target_object_id__in=item_ids,
-                )
-                queryset = queryset.filter(project_filter | item_filter)
-            else:
-                queryset = queryset.filter(project_filter)
+            queryset = queryset.filter(project=project)
         
         # Order by most recent first and apply limit
         queryset = queryset.select_related('actor', 'target_content_type')
         queryset = queryset.order_by('-created_at')[:limit]
         
         return queryset
+    
+    def page(
+        self,
+        queryset: QuerySet[Activity],
+        cursor: Optional[str] = None,
+        limit: int = 50,
+    ) -> Tuple[List[Activity], Optional[str]]:
+        """
+        One page of an activity stream, newest first, using keyset pagination.
+        
+        Unlike OFFSET, the cost of a page does not grow with its depth, and
+        activities logged while the user scrolls do not shift later pages.
+        
+        Args:
+            queryset: Filtered activities (ordering is replaced)
+            cursor: Cursor returned for the previous page, None for the first page
+            limit: Page size
+            
+        Returns:
+            Tuple of (activities, cursor of the next page or None on the last page)
+            
+        Example:
+            >>> activities, next_cursor = service.page(Activity.objects.all())
+            >>> more, _ = service.page(Activity.objects.all(), cursor=next_cursor)
+        """
+        position = decode_cursor(cursor)
+        if position is not None:
+            created_at, pk = position
+            queryset = queryset.filter(
+                Q(created_at__lt=created_at) | Q(created_at=created_at, pk__lt=pk)
+            )
+        activities = list(queryset.order_by('-created_at', '-pk')[:limit + 1])
+        if len(activities) <= limit:
+            return activities, None
+        activities = activities[:limit]
+        return activities, encode_cursor(activities[-1])
+    
+    def resolve_targets(self, activities: Iterable[Activity]) -> None:
+        """
+        Set ``target_title`` and ``target_url`` on activities for display.
+        
+        Targets are loaded with one ``in_bulk`` query per content type instead
+        of one query per activity. Only targets in TARGET_LINKS get a title and
+        URL; others, and targets that no longer exist, get None.
+        
+        Args:
+            activities: Activities with ``target_content_type`` selected
+        """
+        activities = list(activities)
+        ids_by_type = defaultdict(set)
+        for activity in activities:
+            activity.target_title = None
+            activity.target_url = None
+            content_type = activity.target_content_type
+            if f"{content_type.app_label}.{content_type.model}" in TARGET_LINKS and activity.target_object_id:
+                ids_by_type[content_type].add(activity.target_object_id)
+        
+        targets = {}
+        for content_type, ids in ids_by_type.items():
+            pks = [int(pk) for pk in ids if pk.isdigit()]
+            objects = content_type.model_class()._default_manager.in_bulk(pks)
+            for pk, obj in objects.items():
+                targets[(content_type.pk, str(pk))] = obj
+        
+        for activity in activities:
+            obj = targets.get((activity.target_content_type_id, activity.target_object_id))
+            if obj is None:
+                continue
+            content_type = activity.target_content_type
+            title_attr, url = TARGET_LINKS[f"{content_type.app_label}.{content_type.model}"]
+            activity.target_title = getattr(obj, title_attr)
+            activity.target_url = url.format(pk=obj.pk)
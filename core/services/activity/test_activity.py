@@ -2,6 +2,9 @@
 Tests for Activity Service
 """
 
+from unittest.mock import patch
+
+from django.db import DatabaseError, transaction
 from django.test import TestCase
 from django.contrib.auth import get_user_model
 from django.utils import timezone
@@ -480,6 +483,25 @@ class ActivityServiceLatestTestCase(TestCase):
         self.assertEqual(activities.count(), 1)
         self.assertEqual(activities[0].target, empty_project)
     
+    def test_log_sets_project_from_target(self):
+        """Test that log() stores the project of the target."""
+        project_activity = self.service.log(verb='project.updated', target=self.project2)
+        item_activity = self.service.log(verb='item.created', target=self.item3)
+        global_activity = self.service.log(verb='system.started')
+        
+        self.assertEqual(project_activity.project, self.project2)
+        self.assertEqual(item_activity.project, self.project2)
+        self.assertIsNone(global_activity.project)
+    
+    def test_latest_filter_by_project_uses_project_column(self):
+        """Test that the project filter is one indexed lookup, not an IN list of items."""
+        self.service.log(verb='item.created', target=self.item1)
+        
+        with self.assertNumQueries(1):
+            activities = list(self.service.latest(project=self.project1))
+        
+        self.assertEqual(len(activities), 1)
+    
     def test_latest_item_filter_takes_precedence(self):
         """Test that item filter takes precedence over project filter."""
         self.service.log(verb='item.created', target=self.item1)
@@ -510,6 +532,115 @@ class ActivityServiceLatestTestCase(TestCase):
         _ = first.target_content_type.model  # Should not trigger additional query
 
 
+class ActivityServiceBatchTestCase(TestCase):
+    """Test ActivityService.batch()."""
+    
+    def setUp(self):
+        """Set up test data."""
+        self.service = ActivityService()
+        
+        self.project = Project.objects.create(
+            name='Batch Project',
+            status=ProjectStatus.NEW,
+        )
+        
+        self.item_type = ItemType.objects.create(
+            key='bug',
+            name='Bug'
+        )
+        
+        self.items = [
+            Item.objects.create(
+                project=self.project,
+                title=f'Item {n}',
+                type=self.item_type,
+                status=ItemStatus.INBOX,
+            )
+            for n in range(5)
+        ]
+        # Warm the ContentType cache so query counts are stable
+        ContentType.objects.get_for_model(Item)
+    
+    def test_batch_writes_with_one_insert(self):
+        """Test that activities logged in a batch are written with one query."""
+        with self.assertNumQueries(1):
+            with ActivityService.batch():
+                for item in self.items:
+                    self.service.log_created(target=item)
+
+        self.assertEqual(Activity.objects.filter(verb='item.created').count(), 5)
+    
+    def test_batch_returns_unsaved_activities_until_flush(self):
+        """Test that log() returns buffered instances inside a batch."""
+        with ActivityService.batch() as buffer:
+            activity = self.service.log(verb='item.assigned', target=self.items[0])
+            self.assertIsNone(activity.pk)
+            self.assertEqual(buffer, [activity])
+            self.assertFalse(Activity.objects.exists())
+        
+        self.assertTrue(Activity.objects.filter(verb='item.assigned').exists())
+    
+    def test_batch_preserves_order(self):
+        """Test that batched activities keep the order they were logged in."""
+        with ActivityService.batch():
+            for item in self.items:
+                self.service.log(verb='item.touched', target=item)
+        
+        activities = list(Activity.objects.filter(verb='item.touched').order_by('created_at', 'id'))
+        self.assertEqual(
+            [a.target_object_id for a in activities],
+            [str(item.pk) for item in self.items],
+        )
+    
+    def test_batch_is_discarded_on_error(self):
+        """Test that activities of a failing block are not written."""
+        with self.assertRaises(ValueError):
+            with ActivityService.batch():
+                self.service.log(verb='item.touched', target=self.items[0])
+                raise ValueError('boom')
+        
+        self.assertFalse(Activity.objects.exists())
+        # Logging outside a batch writes immediately again
+        self.assertIsNotNone(self.service.log(verb='item.touched').pk)
+    
+    def test_nested_batch_hands_activities_to_outer_batch(self):
+        """Test that a failing inner batch only drops its own activities."""
+        with ActivityService.batch():
+            self.service.log(verb='item.kept', target=self.items[0])
+            with ActivityService.batch():
+                self.service.log(verb='item.kept', target=self.items[1])
+            try:
+                with ActivityService.batch():
+                    self.service.log(verb='item.dropped', target=self.items[2])
+                    raise ValueError('boom')
+            except ValueError:
+                pass
+            self.assertFalse(Activity.objects.exists())
+        
+        self.assertEqual(Activity.objects.filter(verb='item.kept').count(), 2)
+        self.assertFalse(Activity.objects.filter(verb='item.dropped').exists())
+    
+    def test_failed_write_raises(self):
+        """Test that a failing batch write raises by default."""
+        with patch.object(Activity.objects, 'bulk_create', side_effect=DatabaseError('boom')):
+            with self.assertRaises(DatabaseError):
+                with ActivityService.batch():
+                    self.service.log(verb='item.touched', target=self.items[0])
+    
+    def test_best_effort_batch_logs_failed_write(self):
+        """Test that a best-effort batch drops failed activities and keeps the transaction."""
+        with patch.object(Activity.objects, 'bulk_create', side_effect=DatabaseError('boom')):
+            with transaction.atomic(), ActivityService.batch(best_effort=True):
+                item = self.items[0]
+                item.title = 'Renamed'
+                item.save()
+                self.service.log(verb='item.touched', target=item)
+        
+        item.refresh_from_db()
+        self.assertEqual(item.title, 'Renamed')
+        self.assertFalse(Activity.objects.filter(verb='item.touched').exists())
+
+
 class ActivityServiceIntegrationTestCase(TestCase):
     """Integration tests for ActivityService."""
     
@@ -2,6 +2,6 @@
 Agent services for loading and executing AI agents.
 """
 
-from .agent_service import AgentService
+from .agent_service import AgentCall, AgentService, get_agent_service, reset_agent_service
 
-__all__ = ['AgentService']
+__all__ = ['AgentCall', 'AgentService', 'get_agent_service', 'reset_agent_service']
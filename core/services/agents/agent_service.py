@@ -1,23 +1,102 @@
 """
 Service for managing and executing AI agents from YAML configuration files.
+
+Parsed agent definitions are cached per process and reloaded when the file's
+modification time or size changes. Use get_agent_service() for the shared
+service instance instead of constructing AgentService per request.
+
+Independent agent calls can be run concurrently with execute_many(); the
+number of calls running at once is limited per AI provider.
 """
 
+import copy
+import hashlib
 import logging
 import os
+import threading
 import yaml
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Any, Union
 from pathlib import Path
 from django.conf import settings
+from django.db import connections
 
 from core.models import User
 from core.services.ai.router import AIRouter
 from core.services.exceptions import ServiceNotConfigured
 from core.services.agents.cache import AgentCacheService
+from core.services.agents.single_flight import (
+    LEADER, SingleFlight, record_dedup_outcome, single_flight_wait_seconds,
+)
 
 # Module-level logger for efficiency
 logger = logging.getLogger(__name__)
 
 
+class _AgentDefinitionCache:
+    """
+    Parsed agent YAML files keyed by path, validated by (mtime_ns, size).
+
+    Entries are handed out as deep copies, so callers may modify them.
+    """
+
+    def __init__(self):
+        self._entries: Dict[Path, Any] = {}
+        self._lock = threading.Lock()
+
+    def get(self, file_path: Path, loader) -> Optional[Dict[str, Any]]:
+        """
+        Return the parsed file, calling ``loader(file_path)`` if it changed.
+
+        Raises:
+            OSError: If the file cannot be stat'ed (e.g. it was deleted)
+        """
+        stat = file_path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            entry = self._entries.get(file_path)
+        if entry is None or entry[0] != signature:
+            data = loader(file_path)
+            entry = (signature, data)
+            with self._lock:
+                self._entries[file_path] = entry
+        return copy.deepcopy(entry[1])
+
+    def invalidate(self, file_path: Optional[Path] = None) -> None:
+        """Forget one file, or all files if no path is given."""
+        with self._lock:
+            if file_path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(file_path, None)
+
+
+_definition_cache = _AgentDefinitionCache()
+
+
+@dataclass
+class AgentCall:
+    """One agent invocation for AgentService.execute_many()."""
+    filename: str
+    input_text: str
+    parameters: Optional[Dict[str, Any]] = None
+
+
+_provider_slots: Dict[str, threading.BoundedSemaphore] = {}
+_provider_slots_lock = threading.Lock()
+
+
+def _provider_slot(provider_type: str) -> threading.BoundedSemaphore:
+    """Return the process-wide semaphore limiting concurrent calls to a provider."""
+    with _provider_slots_lock:
+        slot = _provider_slots.get(provider_type)
+        if slot is None:
+            limit = max(1, int(getattr(settings, 'AGENT_MAX_CONCURRENCY_PER_PROVIDER', 4)))
+            slot = _provider_slots[provider_type] = threading.BoundedSemaphore(limit)
+        return slot
+
+
 class AgentService:
     """
     Service for loading, managing, and executing AI agents.
@@ -28,6 +107,7 @@ class AgentService:
         self.agents_dir = Path(settings.BASE_DIR) / 'agents'
         self.ai_router = AIRouter()
         self.cache_service = AgentCacheService()
+        self.single_flight = SingleFlight(self.cache_service.get_redis_client)
     
     def list_agents(self) -> List[Dict[str, Any]]:
         """
@@ -43,14 +123,12 @@ class AgentService:
         
         for file_path in self.agents_dir.glob('*.yml'):
             try:
-                agent_data = self._load_agent_file(file_path)
+                agent_data = self._get_agent_definition(file_path)
                 if agent_data:
                     agent_data['filename'] = file_path.name
                     agents.append(agent_data)
             except Exception as e:
                 # Log error but continue processing other agents
-                import logging
-                logger = logging.getLogger(__name__)
                 logger.error(f"Error loading agent {file_path}: {e}")
                 continue
         
@@ -74,7 +152,7 @@ class AgentService:
             return None
         
         try:
-            agent_data = self._load_agent_file(file_path)
+            agent_data = self._get_agent_definition(file_path)
             if agent_data:
                 agent_data['filename'] = filename
             return agent_data
@@ -119,6 +197,8 @@ class AgentService:
             raise ValueError(f"Error serializing agent data to YAML for {filename}: {e}")
         except Exception as e:
             raise ValueError(f"Unexpected error saving agent {filename}: {e}")
+        finally:
+            _definition_cache.invalidate(file_path)
     
     def delete_agent(self, filename: str) -> bool:
         """
@@ -140,6 +220,8 @@ class AgentService:
             return True
         except Exception as e:
             raise ValueError(f"Error deleting agent {filename}: {e}")
+        finally:
+            _definition_cache.invalidate(file_path)
     
     def execute_agent(
         self,
@@ -156,6 +238,11 @@ class AgentService:
         Cache lookup is performed before AI request, and successful responses
         are cached with configured TTL.
 
+        Concurrent calls with the same agent and prompt are deduplicated
+        (single flight): the first call runs, the others wait up to
+        AGENT_SINGLE_FLIGHT_WAIT_SECONDS for its result and otherwise run on
+        their own.
+
         An optional top-level `max_tokens` key in the agent YAML overrides the
         provider's default output token limit (e.g. Claude defaults to 1024,
         which can silently truncate longer structured responses like JSON).
@@ -181,11 +268,7 @@ class AgentService:
         
         # Extract agent configuration
         agent_name = agent.get('name', filename)
-        provider = agent.get('provider', 'openai')  # Default to OpenAI
         model = agent.get('model', 'gpt-3.5-turbo')
-        role = agent.get('role', '')
-        task = agent.get('task', '')
-        agent_params = agent.get('parameters', {})
         max_tokens = agent.get('max_tokens')
         
         # Parse cache configuration from agent YAML
@@ -205,8 +288,207 @@ class AgentService:
         # Cache miss - proceed with AI request
         logger.debug(f"Cache miss for agent '{agent_name}', executing AI request")
         
+        full_prompt = self._build_prompt(agent, input_text, parameters)
+        provider_type = self._provider_type(agent)
+        
+        def generate() -> str:
+            response = self.ai_router.generate(
+                prompt=full_prompt,
+                model_id=model,
+                provider_type=provider_type,
+                user=user,
+                client_ip=client_ip,
+                agent=agent_name,
+                max_tokens=max_tokens
+            )
+            
+            # Cache the successful response
+            self.cache_service.cache_response(
+                agent_name=agent_name,
+                input_text=input_text,
+                response_text=response.text,
+                cache_config=cache_config
+            )
+            
+            return response.text
+        
+        # Execute using AI router
+        try:
+            if not getattr(settings, 'AGENT_SINGLE_FLIGHT_ENABLED', True):
+                return generate()
+            
+            # Identical calls already in flight are joined instead of repeated
+            flight_key = hashlib.sha256(
+                f"{agent_name}\0{provider_type}\0{model}\0{max_tokens}\0{full_prompt}".encode('utf-8')
+            ).hexdigest()
+            response_text, outcome = self.single_flight.run(
+                flight_key, generate, single_flight_wait_seconds()
+            )
+            if outcome != LEADER:
+                logger.info(f"Single-flight {outcome} result for agent '{agent_name}'")
+                record_dedup_outcome(agent_name, outcome)
+            return response_text
+            
+        except Exception as e:
+            raise ServiceNotConfigured(f"Error executing agent: {e}")
+    
+    def execute_many(
+        self,
+        calls: List[AgentCall],
+        user: Optional[User] = None,
+        client_ip: Optional[str] = None,
+        return_exceptions: bool = False
+    ) -> List[Union[str, Exception]]:
+        """
+        Execute independent agent calls concurrently.
+        
+        Each call behaves like execute_agent() (cache, single flight, job
+        tracking). Calls run in worker threads; at most
+        AGENT_MAX_CONCURRENCY_PER_PROVIDER calls per AI provider run at the
+        same time in this process, so the total time is roughly that of the
+        slowest call rather than the sum of all calls.
+        
+        Args:
+            calls: Agent invocations; they must not depend on each other's output
+            user: Optional user making the request
+            client_ip: Optional client IP address
+            return_exceptions: Return a failed call's exception in its place
+                instead of raising it
+            
+        Returns:
+            Responses in the order of ``calls``
+            
+        Raises:
+            ValueError: If an agent is not found (unless return_exceptions)
+            ServiceNotConfigured: If a call fails (unless return_exceptions)
+        """
+        if len(calls) <= 1:
+            results = [self._execute_call(call, user, client_ip) for call in calls]
+        else:
+            with ThreadPoolExecutor(max_workers=len(calls), thread_name_prefix='agent') as pool:
+                futures = [
+                    pool.submit(self._execute_call_in_thread, call, user, client_ip)
+                    for call in calls
+                ]
+                results = [future.result() for future in futures]
+        
+        if not return_exceptions:
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
+        return results
+    
+    def _execute_call(
+        self,
+        call: AgentCall,
+        user: Optional[User],
+        client_ip: Optional[str]
+    ) -> Union[str, Exception]:
+        """Run one call of execute_many() within its provider's concurrency limit."""
+        try:
+            agent = self.get_agent(call.filename)
+            provider_type = self._provider_type(agent) if agent else None
+            with _provider_slot(provider_type or 'unknown'):
+                return self.execute_agent(
+                    filename=call.filename,
+                    input_text=call.input_text,
+                    user=user,
+                    client_ip=client_ip,
+                    parameters=call.parameters
+                )
+        except Exception as e:
+            logger.warning(f"Agent call '{call.filename}' failed: {e}")
+            return e
+    
+    def _execute_call_in_thread(
+        self,
+        call: AgentCall,
+        user: Optional[User],
+        client_ip: Optional[str]
+    ) -> Union[str, Exception]:
+        """Worker thread entry point; closes the thread's database connections."""
+        try:
+            return self._execute_call(call, user, client_ip)
+        finally:
+            connections.close_all()
+    
+    def execute_agent_stream(
+        self,
+        filename: str,
+        input_text: str,
+        user: Optional[User] = None,
+        client_ip: Optional[str] = None,
+        parameters: Optional[Dict[str, Any]] = None
+    ) -> Iterator[str]:
+        """
+        Execute an agent and yield its answer as it is generated.
+        
+        Uses the same prompt, model and cache configuration as
+        execute_agent(). A cached response is yielded as a single piece; a
+        freshly generated response is cached once the stream completed.
+        
+        Args:
+            Same as execute_agent()
+            
+        Yields:
+            Text deltas of the response
+            
+        Raises:
+            ValueError: If agent not found or misconfigured
+            ServiceNotConfigured: If AI provider not available or the stream fails
+        """
+        agent = self.get_agent(filename)
+        if not agent:
+            raise ValueError(f"Agent '{filename}' not found")
+        
+        agent_name = agent.get('name', filename)
+        cache_config = self.cache_service.parse_cache_config(agent)
+        
+        cached_response = self.cache_service.get_cached_response(
+            agent_name=agent_name,
+            input_text=input_text,
+            cache_config=cache_config
+        )
+        if cached_response is not None:
+            logger.info(f"Returning cached response for agent '{agent_name}'")
+            yield cached_response
+            return
+        
+        parts = []
+        try:
+            for chunk in self.ai_router.generate_stream(
+                prompt=self._build_prompt(agent, input_text, parameters),
+                model_id=agent.get('model', 'gpt-3.5-turbo'),
+                provider_type=self._provider_type(agent),
+                user=user,
+                client_ip=client_ip,
+                agent=agent_name,
+                max_tokens=agent.get('max_tokens')
+            ):
+                if chunk.text:
+                    parts.append(chunk.text)
+                    yield chunk.text
+        except Exception as e:
+            raise ServiceNotConfigured(f"Error executing agent: {e}")
+        
+        self.cache_service.cache_response(
+            agent_name=agent_name,
+            input_text=input_text,
+            response_text=''.join(parts),
+            cache_config=cache_config
+        )
+    
+    def _build_prompt(
+        self,
+        agent: Dict[str, Any],
+        input_text: str,
+        parameters: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Build the prompt from the agent's role and task, parameters and input."""
         # Build the prompt from role and task
         prompt_parts = []
+        role = agent.get('role', '')
+        task = agent.get('task', '')
         if role:
             prompt_parts.append(f"Role: {role}")
         if task:
@@ -221,42 +503,30 @@ class AgentService:
         # Add input text
         prompt_parts.append(f"\nInput:\n{input_text}")
         
-        full_prompt = "\n".join(prompt_parts)
-        
-        # Map provider name to provider type
+        return "\n".join(prompt_parts)
+    
+    @staticmethod
+    def _provider_type(agent: Dict[str, Any]) -> str:
+        """Map the agent's provider name to an AIProvider type (default: OpenAI)."""
+        provider = agent.get('provider', 'openai')
         provider_type_map = {
             'openai': 'OpenAI',
             'gemini': 'Gemini',
             'claude': 'Claude',
         }
-        provider_type = provider_type_map.get(provider.lower(), 'OpenAI')
+        return provider_type_map.get(provider.lower(), 'OpenAI')
+    
+    def _get_agent_definition(self, file_path: Path) -> Optional[Dict[str, Any]]:
+        """
+        Return the parsed agent file, from the process-wide cache if unchanged.
         
-        # Execute using AI router
-        try:
-            response = self.ai_router.generate(
-                prompt=full_prompt,
-                model_id=model,
-                provider_type=provider_type,
-                user=user,
-                client_ip=client_ip,
-                agent=agent_name,
-                max_tokens=max_tokens
-            )
-            
-            response_text = response.text
-            
-            # Cache the successful response
-            self.cache_service.cache_response(
-                agent_name=agent_name,
-                input_text=input_text,
-                response_text=response_text,
-                cache_config=cache_config
-            )
-            
-            return response_text
+        Args:
+            file_path: Path to the YAML file
             
-        except Exception as e:
-            raise ServiceNotConfigured(f"Error executing agent: {e}")
+        Returns:
+            Parsed agent configuration (a copy) or None
+        """
+        return _definition_cache.get(file_path, self._load_agent_file)
     
     def _load_agent_file(self, file_path: Path) -> Optional[Dict[str, Any]]:
         """
@@ -278,7 +548,35 @@ class AgentService:
                 
                 return data
         except Exception as e:
-            import logging
-            logger = logging.getLogger(__name__)
             logger.error(f"Error parsing {file_path}: {e}")
             return None
+
+
+_agent_service: Optional[AgentService] = None
+_agent_service_lock = threading.Lock()
+
+
+def get_agent_service() -> AgentService:
+    """
+    Return the process-wide AgentService.
+
+    The instance keeps its AI router and Redis cache client for the lifetime
+    of the process; agent definitions are still reloaded when their files
+    change.
+    """
+    global _agent_service
+    if _agent_service is None:
+        with _agent_service_lock:
+            if _agent_service is None:
+                _agent_service = AgentService()
+    return _agent_service
+
+
+def reset_agent_service() -> None:
+    """Forget the shared service and cached agent definitions (e.g. in tests)."""
+    global _agent_service
+    with _agent_service_lock:
+        _agent_service = None
+    _definition_cache.invalidate()
+    with _provider_slots_lock:
+        _provider_slots.clear()
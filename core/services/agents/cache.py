@@ -3,11 +3,17 @@ Redis-based cache service for AI Agent responses.
 
 Provides caching functionality for AI agents to reduce costs and latency.
 Includes resilient error handling to ensure Redis failures don't break agent execution.
+
+All Redis clients of the process share one connection pool (see
+get_redis_connection_pool), so creating a cache service does not open a new
+connection.
 """
 
 import logging
 import hashlib
 import json
+import threading
+import time
 from typing import Optional, Dict, Any
 from django.conf import settings
 
@@ -17,6 +23,64 @@ logger = logging.getLogger(__name__)
 # Default cache TTL (90 days in seconds)
 DEFAULT_TTL_SECONDS = 7776000
 
+# Seconds to wait before a long-lived cache service retries a failed connection
+RECONNECT_INTERVAL_SECONDS = 60
+
+_pool = None
+_pool_settings = None
+_pool_lock = threading.Lock()
+
+
+def _redis_settings():
+    return (
+        settings.REDIS_CACHE_HOST,
+        settings.REDIS_CACHE_PORT,
+        settings.REDIS_CACHE_DB,
+        settings.REDIS_CACHE_PASSWORD,
+        settings.REDIS_CACHE_SOCKET_TIMEOUT,
+        settings.REDIS_CACHE_SOCKET_CONNECT_TIMEOUT,
+    )
+
+
+def get_redis_connection_pool():
+    """
+    Return the process-wide Redis connection pool for the REDIS_CACHE_* settings.
+
+    The pool is created on first use and replaced when the settings change.
+    Connections are opened lazily by the pool, so this never blocks.
+    """
+    global _pool, _pool_settings
+    import redis
+
+    current = _redis_settings()
+    with _pool_lock:
+        if _pool is None or _pool_settings != current:
+            host, port, db, password, socket_timeout, connect_timeout = current
+            _pool = redis.ConnectionPool(
+                host=host,
+                port=port,
+                db=db,
+                password=password,
+                socket_timeout=socket_timeout,
+                socket_connect_timeout=connect_timeout,
+                decode_responses=True  # Automatically decode responses to strings
+            )
+            _pool_settings = current
+        return _pool
+
+
+def reset_redis_connection_pool() -> None:
+    """Disconnect and forget the shared pool (e.g. after a fork or in tests)."""
+    global _pool, _pool_settings
+    with _pool_lock:
+        if _pool is not None:
+            try:
+                _pool.disconnect()
+            except Exception as e:
+                logger.debug(f"Error disconnecting Redis pool: {e}")
+        _pool = None
+        _pool_settings = None
+
 
 class AgentCacheService:
     """
@@ -33,26 +97,35 @@ class AgentCacheService:
         """Initialize the cache service with Redis connection."""
         self._redis_client = None
         self._cache_enabled = settings.REDIS_CACHE_ENABLED
+        self._reconnect_at = None
         
         if self._cache_enabled:
-            try:
-                import redis
-                self._redis_client = redis.Redis(
-                    host=settings.REDIS_CACHE_HOST,
-                    port=settings.REDIS_CACHE_PORT,
-                    db=settings.REDIS_CACHE_DB,
-                    password=settings.REDIS_CACHE_PASSWORD,
-                    socket_timeout=settings.REDIS_CACHE_SOCKET_TIMEOUT,
-                    socket_connect_timeout=settings.REDIS_CACHE_SOCKET_CONNECT_TIMEOUT,
-                    decode_responses=True  # Automatically decode responses to strings
-                )
-                # Test connection
-                self._redis_client.ping()
-                logger.info("Redis cache connection established successfully")
-            except Exception as e:
-                logger.warning(f"Failed to connect to Redis cache: {e}. Cache will be disabled.")
-                self._redis_client = None
-                self._cache_enabled = False
+            self._connect()
+    
+    def _connect(self) -> None:
+        """Create a client on the shared pool and test the connection."""
+        try:
+            import redis
+            self._redis_client = redis.Redis(connection_pool=get_redis_connection_pool())
+            # Test connection
+            self._redis_client.ping()
+            self._cache_enabled = True
+            self._reconnect_at = None
+            logger.info("Redis cache connection established successfully")
+        except Exception as e:
+            logger.warning(f"Failed to connect to Redis cache: {e}. Cache will be disabled.")
+            self._redis_client = None
+            self._cache_enabled = False
+            self._reconnect_at = time.monotonic() + RECONNECT_INTERVAL_SECONDS
+    
+    def _maybe_reconnect(self) -> None:
+        """Retry a failed connection once the reconnect interval has passed."""
+        if (
+            self._reconnect_at is not None
+            and time.monotonic() >= self._reconnect_at
+            and settings.REDIS_CACHE_ENABLED
+        ):
+            self._connect()
     
     def is_cache_enabled(self, agent_cache_config: Optional[Dict[str, Any]] = None) -> bool:
         """
@@ -64,6 +137,8 @@ class AgentCacheService:
         Returns:
             True if cache is enabled and operational, False otherwise
         """
+        self._maybe_reconnect()
+        
         # Global cache must be enabled
         if not self._cache_enabled or not self._redis_client:
             return False
@@ -75,6 +150,18 @@ class AgentCacheService:
         # Check if agent has cache enabled
         return agent_cache_config.get('enabled', False)
     
+    def get_redis_client(self):
+        """
+        Return the Redis client if the global cache is enabled and connected.
+        
+        Used by features that need Redis independent of an agent's cache
+        configuration (e.g. single-flight locks).
+        """
+        self._maybe_reconnect()
+        if not self._cache_enabled:
+            return None
+        return self._redis_client
+    
     def build_cache_key(
         self,
         agent_name: str,
@@ -0,0 +1,200 @@
+"""
+Single-flight execution of identical agent calls.
+
+When the same agent is called with the same prompt while an identical call is
+still running, the later callers wait for the running call and share its
+result instead of paying for another LLM request.
+
+Two layers are used:
+
+- Within a process, callers wait on a threading.Event of the running call.
+- Across processes, the first caller takes a Redis lock
+  (``SET NX PX``) and publishes its result under a key derived from the lock
+  token; callers in other processes poll for that result. Without Redis only
+  the in-process layer is active.
+
+Waiting is bounded by AGENT_SINGLE_FLIGHT_WAIT_SECONDS. A caller whose wait
+times out, or whose leader failed, runs the call itself.
+
+Deduplicated and fallback calls are counted per day and agent in
+AIAgentDedupStats.
+"""
+
+import logging
+import threading
+import time
+import uuid
+from typing import Callable, Dict, Optional, Tuple
+
+from django.conf import settings
+from django.db.models import F
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+# Outcomes of SingleFlight.run()
+LEADER = 'leader'
+SHARED = 'shared'
+FALLBACK = 'fallback'
+
+# Seconds a published result stays readable for waiting callers
+RESULT_TTL_SECONDS = 60
+
+# Seconds between result checks of a caller waiting on another process
+POLL_INTERVAL_SECONDS = 0.2
+
+LOCK_PREFIX = 'aiagent:inflight'
+RESULT_PREFIX = 'aiagent:inflight-result'
+
+
+class _Call:
+    """An in-flight call in this process."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[str] = None
+        self.failed = False
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time; concurrent callers share its result."""
+
+    def __init__(self, redis_client_getter: Callable[[], object] = lambda: None):
+        """
+        Initialize the single-flight group.
+
+        Args:
+            redis_client_getter: Returns a Redis client for cross-process
+                deduplication, or None to deduplicate within the process only
+        """
+        self._get_redis = redis_client_getter
+        self._calls: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+
+    def run(self, key: str, fn: Callable[[], str], wait_timeout: float) -> Tuple[str, str]:
+        """
+        Run ``fn`` unless an identical call is already in flight.
+
+        Args:
+            key: Identity of the call (e.g. a hash of agent and prompt)
+            fn: Function producing the result
+            wait_timeout: Longest time to wait for a running identical call
+
+        Returns:
+            Tuple of (result, outcome); outcome is LEADER if ``fn`` ran here
+            as the first caller, SHARED if the result of another call was
+            used and FALLBACK if ``fn`` ran after waiting did not yield one
+
+        Raises:
+            Whatever ``fn`` raises
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            if call.done.wait(wait_timeout) and not call.failed:
+                return call.result, SHARED
+            return fn(), FALLBACK
+
+        try:
+            call.result, outcome = self._run_across_processes(key, fn, wait_timeout)
+            return call.result, outcome
+        except BaseException:
+            call.failed = True
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+    def _run_across_processes(self, key: str, fn: Callable[[], str], wait_timeout: float) -> Tuple[str, str]:
+        """Deduplicate against other processes through a Redis lock."""
+        client = self._get_redis()
+        if client is None:
+            return fn(), LEADER
+
+        lock_key = f"{LOCK_PREFIX}:{key}"
+        token = uuid.uuid4().hex
+        # The lock outlives the longest wait so a crashed leader blocks nobody for long
+        lock_ms = int(max(wait_timeout, 1) * 2000)
+        try:
+            acquired = client.set(lock_key, token, nx=True, px=lock_ms)
+            leader_token = None if acquired else client.get(lock_key)
+        except Exception as e:
+            logger.warning(f"Single-flight lock unavailable for {key}: {e}")
+            return fn(), LEADER
+
+        if acquired or leader_token is None:
+            return self._lead(client, lock_key, token if acquired else None, fn), LEADER
+
+        result = self._wait_for_result(client, lock_key, leader_token, wait_timeout)
+        if result is not None:
+            return result, SHARED
+        return fn(), FALLBACK
+
+    def _lead(self, client, lock_key: str, token: Optional[str], fn: Callable[[], str]) -> str:
+        """Compute the result and publish it for callers in other processes."""
+        try:
+            result = fn()
+            if token:
+                try:
+                    client.set(f"{RESULT_PREFIX}:{token}", result, ex=RESULT_TTL_SECONDS)
+                except Exception as e:
+                    logger.warning(f"Could not publish single-flight result: {e}")
+            return result
+        finally:
+            if token:
+                try:
+                    if client.get(lock_key) == token:
+                        client.delete(lock_key)
+                except Exception as e:
+                    logger.debug(f"Could not release single-flight lock {lock_key}: {e}")
+
+    def _wait_for_result(self, client, lock_key: str, leader_token: str, wait_timeout: float) -> Optional[str]:
+        """Poll for the leader's result until it appears, the leader gives up, or the wait times out."""
+        result_key = f"{RESULT_PREFIX}:{leader_token}"
+        deadline = time.monotonic() + wait_timeout
+        try:
+            while True:
+                result = client.get(result_key)
+                if result is not None:
+                    return result
+                if client.get(lock_key) != leader_token:
+                    # Leader finished or lost the lock; one last look for its result
+                    return client.get(result_key)
+                if time.monotonic() >= deadline:
+                    return None
+                time.sleep(POLL_INTERVAL_SECONDS)
+        except Exception as e:
+            logger.warning(f"Single-flight wait failed: {e}")
+            return None
+
+
+def record_dedup_outcome(agent_name: str, outcome: str) -> None:
+    """
+    Count a deduplicated or fallback call in AIAgentDedupStats.
+
+    Leader calls are already visible in AIJobsHistory and are not counted.
+    Failures are logged; statistics never break an agent call.
+    """
+    field = {SHARED: 'deduplicated_calls', FALLBACK: 'fallback_calls'}.get(outcome)
+    if field is None:
+        return
+
+    from core.models import AIAgentDedupStats
+
+    try:
+        stats, _ = AIAgentDedupStats.objects.get_or_create(
+            date=timezone.localdate(), agent=agent_name[:255]
+        )
+        AIAgentDedupStats.objects.filter(pk=stats.pk).update(**{field: F(field) + 1})
+    except Exception as e:
+        logger.warning(f"Could not record single-flight outcome for agent '{agent_name}': {e}")
+
+
+def single_flight_wait_seconds() -> float:
+    """Configured wait timeout (AGENT_SINGLE_FLIGHT_WAIT_SECONDS)."""
+    return float(getattr(settings, 'AGENT_SINGLE_FLIGHT_WAIT_SECONDS', 60))
@@ -5,13 +5,15 @@ Tests for the AgentService class.
 import os
 import tempfile
 import shutil
+import threading
 import yaml
 from pathlib import Path
 from unittest.mock import Mock, patch
 from django.test import TestCase, override_settings
 from django.conf import settings
 
-from core.services.agents.agent_service import AgentService
+from core.services.agents.agent_service import AgentCall, AgentService, get_agent_service, reset_agent_service
+from core.services.exceptions import ServiceNotConfigured
 
 
 class AgentServiceTestCase(TestCase):
@@ -353,6 +355,65 @@ class AgentServiceRealAgentsDirTestCase(TestCase):
         )
 
 
+class AgentDefinitionCacheTestCase(TestCase):
+    """Test the process-wide agent definition cache and shared service."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        reset_agent_service()
+        self.addCleanup(reset_agent_service)
+        self.test_agents_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.test_agents_dir, True)
+        self.agent_service = AgentService()
+        self.agent_service.agents_dir = self.test_agents_dir
+        self.agent_service.save_agent('cached.yml', {'name': 'Cached', 'role': 'Role', 'task': 'Task'})
+
+    def test_definition_parsed_once(self):
+        """Repeated lookups of an unchanged file do not parse the YAML again."""
+        with patch.object(AgentService, '_load_agent_file', wraps=self.agent_service._load_agent_file) as load:
+            for _ in range(3):
+                self.assertEqual(self.agent_service.get_agent('cached.yml')['name'], 'Cached')
+            other = AgentService()
+            other.agents_dir = self.test_agents_dir
+            other.get_agent('cached.yml')
+
+        self.assertEqual(load.call_count, 1)
+
+    def test_definition_reloaded_when_file_changes(self):
+        """Editing the file on disk (new mtime) is picked up on the next lookup."""
+        self.agent_service.get_agent('cached.yml')
+        file_path = self.test_agents_dir / 'cached.yml'
+        file_path.write_text('name: Edited\nrole: Role\ntask: Task\n', encoding='utf-8')
+        stat = file_path.stat()
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        self.assertEqual(self.agent_service.get_agent('cached.yml')['name'], 'Edited')
+
+    def test_save_and_delete_invalidate(self):
+        """save_agent and delete_agent are visible immediately."""
+        self.agent_service.get_agent('cached.yml')
+        self.agent_service.save_agent('cached.yml', {'name': 'Saved', 'role': 'Role', 'task': 'Task'})
+        self.assertEqual(self.agent_service.get_agent('cached.yml')['name'], 'Saved')
+
+        self.agent_service.delete_agent('cached.yml')
+        self.assertIsNone(self.agent_service.get_agent('cached.yml'))
+
+    def test_callers_get_independent_copies(self):
+        """Modifying a returned definition does not change the cached one."""
+        agent = self.agent_service.get_agent('cached.yml')
+        agent['name'] = 'Mutated'
+
+        self.assertEqual(self.agent_service.get_agent('cached.yml')['name'], 'Cached')
+
+    def test_get_agent_service_is_shared(self):
+        """get_agent_service returns one instance until it is reset."""
+        service = get_agent_service()
+        self.assertIs(service, get_agent_service())
+
+        reset_agent_service()
+        self.assertIsNot(service, get_agent_service())
+
+
 class AgentServiceCacheIntegrationTestCase(TestCase):
     """Integration tests for AgentService with cache functionality."""
 
@@ -674,3 +735,125 @@ class AgentServiceCacheIntegrationTestCase(TestCase):
         # AI should have been called as fallback
         mock_generate.assert_called_once()
 
+
+class AgentServiceExecuteManyTestCase(TestCase):
+    """Test cases for concurrent execution of independent agent calls."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        reset_agent_service()
+        self.test_agents_dir = Path(tempfile.mkdtemp())
+        self.agent_service = AgentService()
+        self.agent_service.agents_dir = self.test_agents_dir
+        for name, provider in [('openai', 'openai'), ('openai-2', 'openai'), ('claude', 'claude')]:
+            self.agent_service.save_agent(f'{name}.yml', {
+                'name': f'{name} agent',
+                'provider': provider,
+                'model': 'test-model',
+                'task': 'Test task',
+            })
+    
+    def tearDown(self):
+        """Clean up after each test."""
+        shutil.rmtree(self.test_agents_dir, ignore_errors=True)
+        reset_agent_service()
+    
+    def test_results_are_returned_in_call_order(self):
+        """Test that results match the order of the calls."""
+        with patch.object(AgentService, 'execute_agent', side_effect=lambda filename, input_text, **kw: f'{filename}:{input_text}'):
+            results = self.agent_service.execute_many([
+                AgentCall('openai.yml', 'a'),
+                AgentCall('claude.yml', 'b'),
+                AgentCall('openai-2.yml', 'c'),
+            ])
+        
+        self.assertEqual(results, ['openai.yml:a', 'claude.yml:b', 'openai-2.yml:c'])
+    
+    def test_calls_run_concurrently(self):
+        """Test that calls overlap instead of running one after another."""
+        barrier = threading.Barrier(3, timeout=5)
+        
+        def execute(filename, input_text, **kwargs):
+            # Only passes if all three calls are running at the same time
+            barrier.wait()
+            return input_text
+        
+        with patch.object(AgentService, 'execute_agent', side_effect=execute):
+            results = self.agent_service.execute_many([
+                AgentCall('openai.yml', 'a'),
+                AgentCall('openai-2.yml', 'b'),
+                AgentCall('claude.yml', 'c'),
+            ])
+        
+        self.assertEqual(results, ['a', 'b', 'c'])
+    
+    @override_settings(AGENT_MAX_CONCURRENCY_PER_PROVIDER=1)
+    def test_concurrency_is_limited_per_provider(self):
+        """Test that calls to one provider wait for a free slot while others run."""
+        lock = threading.Lock()
+        running = {'OpenAI': 0, 'Claude': 0}
+        peak = {'OpenAI': 0, 'Claude': 0}
+        
+        def execute(filename, input_text, **kwargs):
+            provider = 'Claude' if filename == 'claude.yml' else 'OpenAI'
+            with lock:
+                running[provider] += 1
+                peak[provider] = max(peak[provider], running[provider])
+            threading.Event().wait(0.05)
+            with lock:
+                running[provider] -= 1
+            return input_text
+        
+        with patch.object(AgentService, 'execute_agent', side_effect=execute):
+            self.agent_service.execute_many([
+                AgentCall('openai.yml', 'a'),
+                AgentCall('openai-2.yml', 'b'),
+                AgentCall('openai.yml', 'c'),
+                AgentCall('claude.yml', 'd'),
+            ])
+        
+        self.assertEqual(peak, {'OpenAI': 1, 'Claude': 1})
+    
+    def test_failed_call_is_raised(self):
+        """Test that a failing call raises after all calls finished."""
+        def execute(filename, input_text, **kwargs):
+            if input_text == 'bad':
+                raise ServiceNotConfigured('provider down')
+            return input_text
+        
+        with patch.object(AgentService, 'execute_agent', side_effect=execute) as mock_execute:
+            with self.assertRaises(ServiceNotConfigured):
+                self.agent_service.execute_many([
+                    AgentCall('openai.yml', 'bad'),
+                    AgentCall('claude.yml', 'good'),
+                ])
+        
+        self.assertEqual(mock_execute.call_count, 2)
+    
+    @patch('core.services.ai.router.AIRouter.generate')
+    def test_return_exceptions_keeps_successful_results(self, mock_generate):
+        """Test that return_exceptions puts the error in place of the result."""
+        mock_generate.return_value = Mock(text='ok')
+        results = self.agent_service.execute_many([
+            AgentCall('missing.yml', 'x'),
+            AgentCall('claude.yml', 'y'),
+        ], return_exceptions=True)
+        
+        self.assertIsInstance(results[0], ValueError)
+        self.assertEqual(results[1], 'ok')
+    
+    def test_user_and_parameters_are_passed_through(self):
+        """Test that each call receives the shared user/IP and its own parameters."""
+        with patch.object(AgentService, 'execute_agent', return_value='ok') as mock_execute:
+            self.agent_service.execute_many(
+                [AgentCall('claude.yml', 'y', parameters={'lang': 'de'})],
+                client_ip='127.0.0.1'
+            )
+        
+        mock_execute.assert_called_once_with(
+            filename='claude.yml',
+            input_text='y',
+            user=None,
+            client_ip='127.0.0.1',
+            parameters={'lang': 'de'}
+        )
@@ -6,7 +6,12 @@ import hashlib
 from unittest.mock import Mock, patch, MagicMock
 from django.test import TestCase, override_settings
 
-from core.services.agents.cache import AgentCacheService, DEFAULT_TTL_SECONDS
+from core.services.agents.cache import (
+    AgentCacheService,
+    DEFAULT_TTL_SECONDS,
+    get_redis_connection_pool,
+    reset_redis_connection_pool,
+)
 
 
 class AgentCacheServiceTestCase(TestCase):
@@ -413,3 +418,55 @@ class AgentCacheServiceTestCase(TestCase):
         result = cache_service.cache_response("agent", "input", "response", cache_config)
         
         self.assertFalse(result)
+
+
+REDIS_TEST_SETTINGS = dict(
+    REDIS_CACHE_ENABLED=True,
+    REDIS_CACHE_HOST='localhost',
+    REDIS_CACHE_PORT=6379,
+    REDIS_CACHE_DB=0,
+    REDIS_CACHE_PASSWORD=None,
+    REDIS_CACHE_SOCKET_TIMEOUT=5,
+    REDIS_CACHE_SOCKET_CONNECT_TIMEOUT=5,
+)
+
+
+@override_settings(**REDIS_TEST_SETTINGS)
+class RedisConnectionPoolTestCase(TestCase):
+    """Test the shared Redis connection pool."""
+
+    def setUp(self):
+        reset_redis_connection_pool()
+        self.addCleanup(reset_redis_connection_pool)
+
+    @patch('redis.Redis')
+    def test_cache_services_share_one_pool(self, mock_redis):
+        """Every cache service creates its client on the same pool."""
+        AgentCacheService()
+        AgentCacheService()
+
+        pools = [call.kwargs['connection_pool'] for call in mock_redis.call_args_list]
+        self.assertEqual(len(pools), 2)
+        self.assertIs(pools[0], pools[1])
+        self.assertIs(pools[0], get_redis_connection_pool())
+
+    def test_pool_replaced_when_settings_change(self):
+        """A different Redis host gets its own pool."""
+        pool = get_redis_connection_pool()
+        with override_settings(REDIS_CACHE_HOST='other-host'):
+            self.assertIsNot(get_redis_connection_pool(), pool)
+
+    @patch('core.services.agents.cache.time.monotonic')
+    @patch('redis.Redis')
+    def test_reconnects_after_interval(self, mock_redis, mock_monotonic):
+        """A failed connection is retried once the reconnect interval has passed."""
+        mock_monotonic.return_value = 1000.0
+        mock_redis.return_value.ping.side_effect = ConnectionError('down')
+        cache_service = AgentCacheService()
+        self.assertFalse(cache_service.is_cache_enabled({'enabled': True}))
+
+        mock_redis.return_value.ping.side_effect = None
+        self.assertFalse(cache_service.is_cache_enabled({'enabled': True}))
+
+        mock_monotonic.return_value = 2000.0
+        self.assertTrue(cache_service.is_cache_enabled({'enabled': True}))
@@ -0,0 +1,247 @@
+"""
+Tests for single-flight deduplication of agent calls.
+"""
+
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+
+from core.models import AIAgentDedupStats
+from core.services.agents.agent_service import AgentService
+from core.services.agents.single_flight import (
+    FALLBACK, LEADER, LOCK_PREFIX, RESULT_PREFIX, SHARED,
+    SingleFlight, record_dedup_outcome,
+)
+
+
+class FakeRedis:
+    """Minimal thread-safe stand-in for the Redis commands used by SingleFlight."""
+
+    def __init__(self):
+        self.data = {}
+        self._lock = threading.Lock()
+
+    def set(self, key, value, nx=False, px=None, ex=None):
+        with self._lock:
+            if nx and key in self.data:
+                return None
+            self.data[key] = value
+            return True
+
+    def get(self, key):
+        with self._lock:
+            return self.data.get(key)
+
+    def delete(self, key):
+        with self._lock:
+            self.data.pop(key, None)
+
+
+def _run_concurrently(flight, fn, callers, wait_timeout=5):
+    """Call flight.run from several threads; returns their (result, outcome) pairs."""
+    results = []
+    results_lock = threading.Lock()
+
+    def call():
+        outcome = flight.run('key', fn, wait_timeout)
+        with results_lock:
+            results.append(outcome)
+
+    threads = [threading.Thread(target=call) for _ in range(callers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+    return results
+
+
+class SingleFlightTestCase(SimpleTestCase):
+    """Test the in-process and Redis single-flight layers."""
+
+    def test_concurrent_identical_calls_share_one_result(self):
+        """Only the first caller computes; the others receive its result."""
+        release = threading.Event()
+        calls = []
+
+        def fn():
+            calls.append(1)
+            release.wait(5)
+            return 'answer'
+
+        flight = SingleFlight()
+        threading.Timer(0.2, release.set).start()
+        results = _run_concurrently(flight, fn, callers=3)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(sorted(o for _, o in results), [LEADER, SHARED, SHARED])
+        self.assertEqual({r for r, _ in results}, {'answer'})
+
+    def test_wait_timeout_falls_back_to_direct_call(self):
+        """A caller that waits too long runs the call itself."""
+        release = threading.Event()
+        calls = []
+
+        def fn():
+            calls.append(1)
+            release.wait(5)
+            return 'answer'
+
+        flight = SingleFlight()
+        leader = threading.Thread(target=flight.run, args=('key', fn, 5))
+        leader.start()
+        time.sleep(0.05)
+
+        threading.Timer(0.3, release.set).start()
+        result, outcome = flight.run('key', fn, 0.05)
+        leader.join(5)
+
+        self.assertEqual(outcome, FALLBACK)
+        self.assertEqual(result, 'answer')
+        self.assertEqual(len(calls), 2)
+
+    def test_failed_leader_lets_waiters_run_themselves(self):
+        """An error of the first call is not shared with waiting callers."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def failing():
+            started.set()
+            release.wait(5)
+            raise RuntimeError('provider down')
+
+        flight = SingleFlight()
+        errors = []
+
+        def lead():
+            try:
+                flight.run('key', failing, 5)
+            except RuntimeError as e:
+                errors.append(e)
+
+        leader = threading.Thread(target=lead)
+        leader.start()
+        started.wait(5)
+        threading.Timer(0.1, release.set).start()
+
+        result, outcome = flight.run('key', lambda: 'own answer', 5)
+        leader.join(5)
+
+        self.assertEqual((result, outcome), ('own answer', FALLBACK))
+        self.assertEqual(len(errors), 1)
+
+    def test_result_of_other_process_is_shared(self):
+        """A call in flight in another process is joined through Redis."""
+        redis_client = FakeRedis()
+        redis_client.set(f'{LOCK_PREFIX}:key', 'other-token')
+
+        def other_process_finishes():
+            redis_client.set(f'{RESULT_PREFIX}:other-token', 'remote answer')
+            redis_client.delete(f'{LOCK_PREFIX}:key')
+
+        threading.Timer(0.1, other_process_finishes).start()
+        fn = Mock(return_value='local answer')
+
+        result, outcome = SingleFlight(lambda: redis_client).run('key', fn, 5)
+
+        self.assertEqual((result, outcome), ('remote answer', SHARED))
+        fn.assert_not_called()
+
+    def test_leader_publishes_result_and_releases_lock(self):
+        """The first caller stores its result for other processes and unlocks."""
+        redis_client = FakeRedis()
+
+        result, outcome = SingleFlight(lambda: redis_client).run('key', lambda: 'answer', 5)
+
+        self.assertEqual((result, outcome), ('answer', LEADER))
+        self.assertNotIn(f'{LOCK_PREFIX}:key', redis_client.data)
+        self.assertIn('answer', redis_client.data.values())
+
+    def test_redis_lock_held_too_long_falls_back(self):
+        """A lock of a stuck process only delays callers by the wait timeout."""
+        redis_client = FakeRedis()
+        redis_client.set(f'{LOCK_PREFIX}:key', 'stuck-token')
+
+        result, outcome = SingleFlight(lambda: redis_client).run('key', lambda: 'answer', 0.1)
+
+        self.assertEqual((result, outcome), ('answer', FALLBACK))
+
+    def test_redis_errors_do_not_break_calls(self):
+        """Redis failures degrade to a direct call."""
+        redis_client = Mock()
+        redis_client.set.side_effect = ConnectionError('down')
+
+        result, outcome = SingleFlight(lambda: redis_client).run('key', lambda: 'answer', 5)
+
+        self.assertEqual((result, outcome), ('answer', LEADER))
+
+
+class SingleFlightAgentServiceTestCase(TestCase):
+    """Test single-flight integration in AgentService.execute_agent."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.test_agents_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.test_agents_dir, True)
+        self.agent_service = AgentService()
+        self.agent_service.agents_dir = self.test_agents_dir
+        self.agent_service.save_agent('title-agent.yml', {
+            'name': 'Title Agent',
+            'provider': 'openai',
+            'model': 'gpt-4',
+            'task': 'Generate a title',
+        })
+
+    @patch('core.services.ai.router.AIRouter.generate')
+    def test_same_prompt_uses_same_flight_key(self, mock_generate):
+        """Identical agent calls map to one key, different inputs to different keys."""
+        mock_generate.return_value = Mock(text='Title')
+        keys = []
+        original_run = self.agent_service.single_flight.run
+
+        def spy(key, fn, wait_timeout):
+            keys.append(key)
+            return original_run(key, fn, wait_timeout)
+
+        with patch.object(self.agent_service.single_flight, 'run', side_effect=spy):
+            self.agent_service.execute_agent('title-agent.yml', 'Printer broken')
+            self.agent_service.execute_agent('title-agent.yml', 'Printer broken')
+            self.agent_service.execute_agent('title-agent.yml', 'VPN down')
+
+        self.assertEqual(keys[0], keys[1])
+        self.assertNotEqual(keys[0], keys[2])
+
+    def test_shared_result_is_counted(self):
+        """Deduplicated calls are counted per day and agent."""
+        with patch.object(self.agent_service.single_flight, 'run', return_value=('Title', SHARED)):
+            result = self.agent_service.execute_agent('title-agent.yml', 'Printer broken')
+            self.agent_service.execute_agent('title-agent.yml', 'Printer broken')
+
+        self.assertEqual(result, 'Title')
+        stats = AIAgentDedupStats.objects.get(agent='Title Agent', date=timezone.localdate())
+        self.assertEqual(stats.deduplicated_calls, 2)
+        self.assertEqual(stats.fallback_calls, 0)
+
+    @override_settings(AGENT_SINGLE_FLIGHT_ENABLED=False)
+    @patch('core.services.ai.router.AIRouter.generate')
+    def test_disabled_single_flight_calls_router_directly(self, mock_generate):
+        """AGENT_SINGLE_FLIGHT_ENABLED=False bypasses deduplication."""
+        mock_generate.return_value = Mock(text='Title')
+
+        with patch.object(self.agent_service.single_flight, 'run') as mock_run:
+            self.assertEqual(self.agent_service.execute_agent('title-agent.yml', 'x'), 'Title')
+
+        mock_run.assert_not_called()
+
+    def test_leader_calls_are_not_counted(self):
+        """Calls that ran themselves are already visible in AIJobsHistory."""
+        record_dedup_outcome('Title Agent', LEADER)
+        record_dedup_outcome('Title Agent', FALLBACK)
+
+        stats = AIAgentDedupStats.objects.get(agent='Title Agent')
+        self.assertEqual((stats.deduplicated_calls, stats.fallback_calls), (0, 1))
@@ -6,6 +6,6 @@ This package provides a unified AI service layer supporting multiple providers
 """
 
 from .router import AIRouter
-from .schemas import AIResponse
+from .schemas import AIResponse, StreamChunk
 
-__all__ = ['AIRouter', 'AIResponse']
+__all__ = ['AIRouter', 'AIResponse', 'StreamChunk']
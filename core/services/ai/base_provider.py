@@ -3,8 +3,8 @@ Base provider interface for AI providers.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
-from .schemas import ProviderResponse
+from typing import List, Dict, Any, Iterator, Optional
+from .schemas import ProviderResponse, StreamChunk
 
 
 class BaseProvider(ABC):
@@ -50,3 +50,43 @@ class BaseProvider(ABC):
             ProviderResponse with text, raw response, and token counts
         """
         pass
+    
+    def chat_stream(
+        self,
+        messages: List[Dict[str, str]],
+        model_id: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> Iterator[StreamChunk]:
+        """
+        Execute a chat completion and yield the answer incrementally.
+        
+        Providers without native streaming fall back to ``chat()`` and yield
+        the whole answer as a single delta.
+        
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+            model_id: Model identifier
+            temperature: Sampling temperature (0-1)
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional provider-specific parameters
+            
+        Yields:
+            StreamChunk text deltas, followed by one chunk with ``done=True``
+            carrying the token counts
+        """
+        response = self.chat(
+            messages=messages,
+            model_id=model_id,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **kwargs
+        )
+        if response.text:
+            yield StreamChunk(text=response.text)
+        yield StreamChunk(
+            input_tokens=response.input_tokens,
+            output_tokens=response.output_tokens,
+            done=True
+        )
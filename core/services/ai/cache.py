@@ -0,0 +1,116 @@
+"""
+Process-wide caches for the AI router.
+
+- Active AI models (with their providers) are loaded in one query and kept
+  for AI_MODEL_CACHE_TTL_SECONDS. Saving or deleting an AIModel or AIProvider
+  clears the cache immediately in this process (see core.services.ai.signals);
+  other processes pick the change up when their TTL expires.
+- Provider instances (and with them the SDK clients and their HTTP connection
+  pools) are kept per provider row and API key, so repeated calls reuse warm
+  connections. A changed key, organization or updated_at yields a new
+  instance.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from django.conf import settings
+
+from core.models import AIModel
+
+logger = logging.getLogger(__name__)
+
+
+class ActiveModelCache:
+    """Short-lived cache of active AIModel rows with active providers."""
+
+    def __init__(self):
+        self._models: Optional[List[AIModel]] = None
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    def get(self) -> List[AIModel]:
+        """
+        Return active models in default model ordering.
+
+        Returns:
+            List of AIModel instances with ``provider`` loaded
+        """
+        ttl = float(getattr(settings, 'AI_MODEL_CACHE_TTL_SECONDS', 30))
+        with self._lock:
+            if self._models is not None and time.monotonic() - self._loaded_at < ttl:
+                return self._models
+
+        models = list(
+            AIModel.objects.select_related('provider').filter(active=True, provider__active=True)
+        )
+        if ttl > 0:
+            with self._lock:
+                self._models = models
+                self._loaded_at = time.monotonic()
+        return models
+
+    def invalidate(self) -> None:
+        """Drop the cached rows."""
+        with self._lock:
+            self._models = None
+
+
+class ProviderInstanceCache:
+    """Provider instances keyed by provider class, row, API key hash and version."""
+
+    def __init__(self):
+        self._instances: Dict[Tuple, Any] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def build_key(provider_class, provider) -> Tuple:
+        """Identity of a provider instance; the API key is only stored hashed."""
+        key_hash = hashlib.sha256((provider.api_key or '').encode('utf-8')).hexdigest()[:16]
+        return (
+            provider_class,
+            provider.pk,
+            key_hash,
+            provider.organization_id or '',
+            provider.updated_at,
+        )
+
+    def get_or_create(self, key: Tuple, factory: Callable[[], Any]) -> Any:
+        """Return the instance for ``key``, creating it with ``factory`` if needed."""
+        with self._lock:
+            instance = self._instances.get(key)
+        if instance is not None:
+            return instance
+
+        instance = factory()
+        with self._lock:
+            # Replace older instances of the same provider row
+            for stale in [k for k in self._instances if k[1] == key[1] and k != key]:
+                del self._instances[stale]
+            return self._instances.setdefault(key, instance)
+
+    def invalidate(self, provider_id: Optional[int] = None) -> None:
+        """Forget the instances of one provider, or all of them."""
+        with self._lock:
+            if provider_id is None:
+                self._instances.clear()
+            else:
+                for key in [k for k in self._instances if k[1] == provider_id]:
+                    del self._instances[key]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._instances)
+
+
+active_models = ActiveModelCache()
+provider_instances = ProviderInstanceCache()
+
+
+def reset_ai_caches() -> None:
+    """Clear the model and provider instance caches (e.g. in tests)."""
+    active_models.invalidate()
+    provider_instances.invalidate()
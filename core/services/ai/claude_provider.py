@@ -2,10 +2,10 @@
 Anthropic Claude provider implementation.
 """
 
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Iterator, Optional
 import anthropic
 from .base_provider import BaseProvider
-from .schemas import ProviderResponse
+from .schemas import ProviderResponse, StreamChunk
 
 
 class ClaudeProvider(BaseProvider):
@@ -27,30 +27,15 @@ class ClaudeProvider(BaseProvider):
         """Return provider type."""
         return 'Claude'
 
-    def chat(
+    def _build_request(
         self,
         messages: List[Dict[str, str]],
         model_id: str,
-        temperature: Optional[float] = None,
-        max_tokens: Optional[int] = None,
+        temperature: Optional[float],
+        max_tokens: Optional[int],
         **kwargs
-    ) -> ProviderResponse:
-        """
-        Execute a Claude Messages API completion.
-
-        Args:
-            messages: List of message dicts with 'role' and 'content'.
-                'system' role messages are extracted into the top-level
-                `system` parameter, as required by the Messages API.
-            model_id: Claude model ID (e.g., 'claude-haiku-4-5')
-            temperature: Sampling temperature
-            max_tokens: Maximum tokens to generate (required by the API;
-                defaults to 1024 if not provided)
-            **kwargs: Additional Anthropic Messages API parameters
-
-        Returns:
-            ProviderResponse with completion text and token counts
-        """
+    ) -> Dict[str, Any]:
+        """Build the parameters of a Messages API request."""
         system_prompt = None
         claude_messages = []
         for message in messages:
@@ -75,6 +60,34 @@ class ClaudeProvider(BaseProvider):
 
         request_params.update(kwargs)
 
+        return request_params
+
+    def chat(
+        self,
+        messages: List[Dict[str, str]],
+        model_id: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> ProviderResponse:
+        """
+        Execute a Claude Messages API completion.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'.
+                'system' role messages are extracted into the top-level
+                `system` parameter, as required by the Messages API.
+            model_id: Claude model ID (e.g., 'claude-haiku-4-5')
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate (required by the API;
+                defaults to 1024 if not provided)
+            **kwargs: Additional Anthropic Messages API parameters
+
+        Returns:
+            ProviderResponse with completion text and token counts
+        """
+        request_params = self._build_request(messages, model_id, temperature, max_tokens, **kwargs)
+
         response = self.client.messages.create(**request_params)
 
         text = next((block.text for block in response.content if block.type == 'text'), '')
@@ -87,3 +100,44 @@ class ClaudeProvider(BaseProvider):
             input_tokens=input_tokens,
             output_tokens=output_tokens
         )
+
+    def chat_stream(
+        self,
+        messages: List[Dict[str, str]],
+        model_id: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> Iterator[StreamChunk]:
+        """
+        Execute a streamed Claude Messages API completion.
+
+        Input tokens are reported by the ``message_start`` event, output
+        tokens by the closing ``message_delta`` event.
+
+        Yields:
+            StreamChunk text deltas, then a final chunk with token counts
+        """
+        request_params = self._build_request(messages, model_id, temperature, max_tokens, **kwargs)
+        request_params['stream'] = True
+
+        input_tokens = None
+        output_tokens = None
+        stream = self.client.messages.create(**request_params)
+        try:
+            for event in stream:
+                if event.type == 'message_start':
+                    usage = event.message.usage
+                    if usage:
+                        input_tokens = usage.input_tokens
+                        output_tokens = usage.output_tokens
+                elif event.type == 'content_block_delta':
+                    if event.delta.type == 'text_delta' and event.delta.text:
+                        yield StreamChunk(text=event.delta.text)
+                elif event.type == 'message_delta':
+                    if event.usage:
+                        output_tokens = event.usage.output_tokens
+        finally:
+            stream.close()
+
+        yield StreamChunk(input_tokens=input_tokens, output_tokens=output_tokens, done=True)
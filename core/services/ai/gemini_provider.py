@@ -2,11 +2,11 @@
 Google Gemini provider implementation.
 """
 
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Iterator, Optional, Tuple
 from google import genai
 from google.genai.types import GenerateContentConfig, Content, Part
 from .base_provider import BaseProvider
-from .schemas import ProviderResponse
+from .schemas import ProviderResponse, StreamChunk
 
 
 class GeminiProvider(BaseProvider):
@@ -71,6 +71,42 @@ class GeminiProvider(BaseProvider):
         
         return system_instruction, contents
     
+    def _build_request(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float],
+        max_tokens: Optional[int]
+    ) -> Tuple[List[Any], Optional[GenerateContentConfig]]:
+        """Build the contents and generation config of a request."""
+        # Convert messages to Gemini format
+        system_instruction, contents = self._convert_messages_to_gemini(messages)
+        
+        # Build generation config
+        config_kwargs = {}
+        if temperature is not None:
+            config_kwargs['temperature'] = temperature
+        if max_tokens is not None:
+            config_kwargs['max_output_tokens'] = max_tokens
+        
+        config = GenerateContentConfig(**config_kwargs) if config_kwargs else None
+        
+        return contents, config
+    
+    @staticmethod
+    def _extract_usage(response) -> Tuple[Optional[int], Optional[int]]:
+        """Return (input_tokens, output_tokens) from a response, if reported."""
+        input_tokens = None
+        output_tokens = None
+        
+        if hasattr(response, 'usage_metadata') and response.usage_metadata:
+            usage = response.usage_metadata
+            if hasattr(usage, 'prompt_token_count'):
+                input_tokens = usage.prompt_token_count
+            if hasattr(usage, 'candidates_token_count'):
+                output_tokens = usage.candidates_token_count
+        
+        return input_tokens, output_tokens
+    
     def chat(
         self,
         messages: List[Dict[str, str]],
@@ -92,17 +128,7 @@ class GeminiProvider(BaseProvider):
         Returns:
             ProviderResponse with completion text and token counts (if available)
         """
-        # Convert messages to Gemini format
-        system_instruction, contents = self._convert_messages_to_gemini(messages)
-        
-        # Build generation config
-        config_kwargs = {}
-        if temperature is not None:
-            config_kwargs['temperature'] = temperature
-        if max_tokens is not None:
-            config_kwargs['max_output_tokens'] = max_tokens
-        
-        config = GenerateContentConfig(**config_kwargs) if config_kwargs else None
+        contents, config = self._build_request(messages, temperature, max_tokens)
         
         # Make API call
         response = self.client.models.generate_content(
@@ -115,15 +141,7 @@ class GeminiProvider(BaseProvider):
         text = response.text if hasattr(response, 'text') and response.text else ""
         
         # Try to extract token counts (may not be available in all cases)
-        input_tokens = None
-        output_tokens = None
-        
-        if hasattr(response, 'usage_metadata') and response.usage_metadata:
-            usage = response.usage_metadata
-            if hasattr(usage, 'prompt_token_count'):
-                input_tokens = usage.prompt_token_count
-            if hasattr(usage, 'candidates_token_count'):
-                output_tokens = usage.candidates_token_count
+        input_tokens, output_tokens = self._extract_usage(response)
         
         return ProviderResponse(
             text=text,
@@ -131,3 +149,38 @@ class GeminiProvider(BaseProvider):
             input_tokens=input_tokens,
             output_tokens=output_tokens
         )
+    
+    def chat_stream(
+        self,
+        messages: List[Dict[str, str]],
+        model_id: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> Iterator[StreamChunk]:
+        """
+        Execute a streamed Gemini completion.
+        
+        Usage metadata is cumulative; the last reported values are used.
+        
+        Yields:
+            StreamChunk text deltas, then a final chunk with token counts
+        """
+        contents, config = self._build_request(messages, temperature, max_tokens)
+        
+        input_tokens = None
+        output_tokens = None
+        for response in self.client.models.generate_content_stream(
+            model=model_id,
+            contents=contents,
+            config=config
+        ):
+            chunk_input, chunk_output = self._extract_usage(response)
+            input_tokens = chunk_input if chunk_input is not None else input_tokens
+            output_tokens = chunk_output if chunk_output is not None else output_tokens
+            
+            text = response.text if hasattr(response, 'text') and response.text else ""
+            if text:
+                yield StreamChunk(text=text)
+        
+        yield StreamChunk(input_tokens=input_tokens, output_tokens=output_tokens, done=True)
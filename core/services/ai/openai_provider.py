@@ -2,10 +2,10 @@
 OpenAI provider implementation.
 """
 
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Iterator, Optional
 import openai
 from .base_provider import BaseProvider
-from .schemas import ProviderResponse
+from .schemas import ProviderResponse, StreamChunk
 
 
 class OpenAIProvider(BaseProvider):
@@ -40,6 +40,32 @@ class OpenAIProvider(BaseProvider):
         """Return provider type."""
         return 'OpenAI'
     
+    def _build_request(
+        self,
+        messages: List[Dict[str, str]],
+        model_id: str,
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Build the parameters of a chat completions request."""
+        # Build request parameters
+        request_params = {
+            'model': model_id,
+            'messages': messages,
+        }
+        
+        if temperature is not None:
+            request_params['temperature'] = temperature
+        
+        if max_tokens is not None:
+            request_params['max_tokens'] = max_tokens
+        
+        # Add any additional kwargs
+        request_params.update(kwargs)
+        
+        return request_params
+    
     def chat(
         self,
         messages: List[Dict[str, str]],
@@ -61,20 +87,7 @@ class OpenAIProvider(BaseProvider):
         Returns:
             ProviderResponse with completion text and token counts
         """
-        # Build request parameters
-        request_params = {
-            'model': model_id,
-            'messages': messages,
-        }
-        
-        if temperature is not None:
-            request_params['temperature'] = temperature
-        
-        if max_tokens is not None:
-            request_params['max_tokens'] = max_tokens
-        
-        # Add any additional kwargs
-        request_params.update(kwargs)
+        request_params = self._build_request(messages, model_id, temperature, max_tokens, **kwargs)
         
         # Make API call
         response = self.client.chat.completions.create(**request_params)
@@ -90,3 +103,41 @@ class OpenAIProvider(BaseProvider):
             input_tokens=input_tokens,
             output_tokens=output_tokens
         )
+    
+    def chat_stream(
+        self,
+        messages: List[Dict[str, str]],
+        model_id: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> Iterator[StreamChunk]:
+        """
+        Execute a streamed OpenAI chat completion.
+        
+        Token usage is requested via ``stream_options`` and arrives in the
+        last chunk of the stream.
+        
+        Yields:
+            StreamChunk text deltas, then a final chunk with token counts
+        """
+        request_params = self._build_request(messages, model_id, temperature, max_tokens, **kwargs)
+        request_params['stream'] = True
+        request_params['stream_options'] = {'include_usage': True}
+        
+        input_tokens = None
+        output_tokens = None
+        stream = self.client.chat.completions.create(**request_params)
+        try:
+            for chunk in stream:
+                if chunk.usage:
+                    input_tokens = chunk.usage.prompt_tokens
+                    output_tokens = chunk.usage.completion_tokens
+                if chunk.choices:
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        yield StreamChunk(text=delta)
+        finally:
+            stream.close()
+        
+        yield StreamChunk(input_tokens=input_tokens, output_tokens=output_tokens, done=True)
@@ -3,7 +3,7 @@ AI Router - Main entry point for AI services in Agira.
 """
 
 import time
-from typing import List, Dict, Optional, Tuple
+from typing import Iterator, List, Dict, Optional, Tuple
 from django.utils import timezone
 
 from core.models import AIProvider, AIModel, AIJobsHistory, User
@@ -12,8 +12,9 @@ from .base_provider import BaseProvider
 from .openai_provider import OpenAIProvider
 from .gemini_provider import GeminiProvider
 from .claude_provider import ClaudeProvider
-from .schemas import AIResponse
+from .schemas import AIResponse, StreamChunk
 from .pricing import calculate_cost
+from .cache import active_models, provider_instances
 
 
 class AIRouter:
@@ -37,7 +38,10 @@ class AIRouter:
     
     def _get_provider_instance(self, provider: AIProvider) -> BaseProvider:
         """
-        Create a provider instance from database configuration.
+        Get the provider instance for a database configuration.
+        
+        Instances are shared per provider row and API key, so the SDK
+        client's connection pool is reused across calls.
         
         Args:
             provider: AIProvider model instance
@@ -60,7 +64,10 @@ class AIRouter:
         if provider.organization_id:
             kwargs['organization_id'] = provider.organization_id
         
-        return provider_class(api_key=provider.api_key, **kwargs)
+        return provider_instances.get_or_create(
+            provider_instances.build_key(provider_class, provider),
+            lambda: provider_class(api_key=provider.api_key, **kwargs),
+        )
     
     def _select_model(
         self,
@@ -75,6 +82,9 @@ class AIRouter:
         2. If only provider_type specified: use first active model or default
         3. If nothing specified: use default (prioritize OpenAI, then Gemini)
         
+        Models are looked up in the cached list of active models
+        (core.services.ai.cache) instead of querying the database per call.
+        
         Args:
             provider_type: Optional provider type filter
             model_id: Optional model ID filter
@@ -85,38 +95,26 @@ class AIRouter:
         Raises:
             ServiceNotConfigured: If no active model is found
         """
+        # Active models (ordered like AIModel.objects) from the router cache
+        models = active_models.get()
+        first = self._first_model
+        
         # Case 1: Both provider_type and model_id specified
         if provider_type and model_id:
-            try:
-                model = AIModel.objects.select_related('provider').get(
-                    provider__provider_type=provider_type,
-                    model_id=model_id,
-                    active=True,
-                    provider__active=True
-                )
-                return model.provider, model
-            except AIModel.DoesNotExist:
+            model = first(models, provider_type, model_id=model_id)
+            if not model:
                 raise ServiceNotConfigured(
                     f"No active model found for provider '{provider_type}' with model_id '{model_id}'"
                 )
+            return model.provider, model
         
         # Case 2: Only provider_type specified
         if provider_type:
-            # Try to get default model for this provider
-            model = AIModel.objects.select_related('provider').filter(
-                provider__provider_type=provider_type,
-                active=True,
-                provider__active=True,
-                is_default=True
-            ).first()
-            
-            if not model:
-                # No default, get first active model
-                model = AIModel.objects.select_related('provider').filter(
-                    provider__provider_type=provider_type,
-                    active=True,
-                    provider__active=True
-                ).first()
+            # Try to get default model for this provider, else first active model
+            model = (
+                first(models, provider_type, default_only=True)
+                or first(models, provider_type)
+            )
             
             if not model:
                 raise ServiceNotConfigured(
@@ -128,30 +126,37 @@ class AIRouter:
         # Case 3: Nothing specified - use default
         # Priority: OpenAI default, then Gemini default, then any active
         for ptype in ['OpenAI', 'Gemini']:
-            model = AIModel.objects.select_related('provider').filter(
-                provider__provider_type=ptype,
-                active=True,
-                provider__active=True,
-                is_default=True
-            ).first()
-            
+            model = first(models, ptype, default_only=True)
             if model:
                 return model.provider, model
         
         # No default found, try any active model (OpenAI first, then Gemini)
         for ptype in ['OpenAI', 'Gemini']:
-            model = AIModel.objects.select_related('provider').filter(
-                provider__provider_type=ptype,
-                active=True,
-                provider__active=True
-            ).first()
-            
+            model = first(models, ptype)
             if model:
                 return model.provider, model
         
         # No active models at all
         raise ServiceNotConfigured("No active AI model configured")
     
+    @staticmethod
+    def _first_model(
+        models: List[AIModel],
+        provider_type: str,
+        model_id: Optional[str] = None,
+        default_only: bool = False
+    ) -> Optional[AIModel]:
+        """Return the first model of a provider type matching the filters."""
+        for model in models:
+            if model.provider.provider_type != provider_type:
+                continue
+            if model_id is not None and model.model_id != model_id:
+                continue
+            if default_only and not model.is_default:
+                continue
+            return model
+        return None
+    
     def _create_job(
         self,
         provider: AIProvider,
@@ -190,7 +195,9 @@ class AIRouter:
         input_tokens: Optional[int],
         output_tokens: Optional[int],
         duration_ms: int,
-        error_message: Optional[str] = None
+        error_message: Optional[str] = None,
+        router_overhead_ms: Optional[int] = None,
+        provider_latency_ms: Optional[int] = None
     ) -> None:
         """
         Update job with completion data.
@@ -201,10 +208,14 @@ class AIRouter:
             output_tokens: Number of output tokens
             duration_ms: Duration in milliseconds
             error_message: Optional error message
+            router_overhead_ms: Router time before the provider call
+            provider_latency_ms: Time spent in the provider call
         """
         job.input_tokens = input_tokens
         job.output_tokens = output_tokens
         job.duration_ms = duration_ms
+        job.router_overhead_ms = router_overhead_ms
+        job.provider_latency_ms = provider_latency_ms
         
         if error_message:
             job.status = 'Error'
@@ -256,6 +267,10 @@ class AIRouter:
         Raises:
             ServiceNotConfigured: If no active model is available
         """
+        # Router overhead is measured from here up to the provider call
+        router_start = time.perf_counter()
+        call_start = None
+        
         # Select provider and model
         provider, model = self._select_model(provider_type, model_id)
         
@@ -270,6 +285,7 @@ class AIRouter:
             provider_instance = self._get_provider_instance(provider)
             
             # Execute chat
+            call_start = time.perf_counter()
             response = provider_instance.chat(
                 messages=messages,
                 model_id=model.model_id,
@@ -277,6 +293,7 @@ class AIRouter:
                 max_tokens=max_tokens,
                 **kwargs
             )
+            provider_latency_ms = int((time.perf_counter() - call_start) * 1000)
             
             # Calculate duration
             duration_ms = int((time.time() - start_time) * 1000)
@@ -286,7 +303,9 @@ class AIRouter:
                 job,
                 input_tokens=response.input_tokens,
                 output_tokens=response.output_tokens,
-                duration_ms=duration_ms
+                duration_ms=duration_ms,
+                router_overhead_ms=int((call_start - router_start) * 1000),
+                provider_latency_ms=provider_latency_ms
             )
             
             # Build and return response
@@ -314,12 +333,84 @@ class AIRouter:
                 input_tokens=None,
                 output_tokens=None,
                 duration_ms=duration_ms,
-                error_message=str(e)
+                error_message=str(e),
+                router_overhead_ms=int((call_start - router_start) * 1000) if call_start else None,
+                provider_latency_ms=int((time.perf_counter() - call_start) * 1000) if call_start else None
             )
             
             # Re-raise exception
             raise
     
+    def chat_stream(
+        self,
+        messages: List[Dict[str, str]],
+        model_id: Optional[str] = None,
+        provider_type: Optional[str] = None,
+        user: Optional[User] = None,
+        client_ip: Optional[str] = None,
+        agent: str = "core.ai",
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> Iterator[StreamChunk]:
+        """
+        Execute a chat completion and yield the answer as it is generated.
+        
+        The AIJobsHistory entry is created before the first chunk and
+        completed when the stream ends: with token counts after the final
+        chunk, or as 'Error' if the provider fails or the consumer stops
+        iterating early (e.g. a closed HTTP connection).
+        
+        Args:
+            Same as chat()
+            
+        Yields:
+            StreamChunk text deltas, followed by one chunk with ``done=True``
+            carrying the token counts
+            
+        Raises:
+            ServiceNotConfigured: If no active model is available
+        """
+        router_start = time.perf_counter()
+        call_start = None
+        
+        provider, model = self._select_model(provider_type, model_id)
+        job = self._create_job(provider, model, user, client_ip, agent)
+        start_time = time.time()
+        
+        input_tokens = None
+        output_tokens = None
+        error_message = 'Stream closed before completion'
+        try:
+            provider_instance = self._get_provider_instance(provider)
+            
+            call_start = time.perf_counter()
+            for chunk in provider_instance.chat_stream(
+                messages=messages,
+                model_id=model.model_id,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                **kwargs
+            ):
+                if chunk.done:
+                    input_tokens = chunk.input_tokens
+                    output_tokens = chunk.output_tokens
+                    error_message = None
+                yield chunk
+        except Exception as e:
+            error_message = str(e)
+            raise
+        finally:
+            self._complete_job(
+                job,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                duration_ms=int((time.time() - start_time) * 1000),
+                error_message=error_message,
+                router_overhead_ms=int((call_start - router_start) * 1000) if call_start else None,
+                provider_latency_ms=int((time.perf_counter() - call_start) * 1000) if call_start else None
+            )
+    
     def generate(
         self,
         prompt: str,
@@ -362,3 +453,35 @@ class AIRouter:
             max_tokens=max_tokens,
             **kwargs
         )
+    
+    def generate_stream(
+        self,
+        prompt: str,
+        model_id: Optional[str] = None,
+        provider_type: Optional[str] = None,
+        user: Optional[User] = None,
+        client_ip: Optional[str] = None,
+        agent: str = "core.ai",
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> Iterator[StreamChunk]:
+        """
+        Streaming variant of generate() (shortcut for single-prompt chat_stream).
+        
+        Yields:
+            StreamChunk text deltas, then a final chunk with token counts
+        """
+        messages = [{'role': 'user', 'content': prompt}]
+        
+        return self.chat_stream(
+            messages=messages,
+            model_id=model_id,
+            provider_type=provider_type,
+            user=user,
+            client_ip=client_ip,
+            agent=agent,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **kwargs
+        )
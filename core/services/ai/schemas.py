@@ -24,3 +24,12 @@ class ProviderResponse:
     raw: Any
     input_tokens: Optional[int]
     output_tokens: Optional[int]
+
+
+@dataclass
+class StreamChunk:
+    """Piece of a streamed completion: a text delta, or the final usage."""
+    text: str = ''
+    input_tokens: Optional[int] = None
+    output_tokens: Optional[int] = None
+    done: bool = False
@@ -0,0 +1,27 @@
+"""
+Django signals that keep the AI router caches in sync with the database.
+
+Saving or deleting an AIProvider or AIModel clears the cached model list and
+the provider instances of the affected provider in this process.
+"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from core.models import AIModel, AIProvider
+from core.services.ai.cache import active_models, provider_instances
+
+
+@receiver(post_save, sender=AIProvider)
+@receiver(post_delete, sender=AIProvider)
+def invalidate_provider(sender, instance, **kwargs):
+    """Drop cached models and SDK clients of a changed provider."""
+    active_models.invalidate()
+    provider_instances.invalidate(instance.pk)
+
+
+@receiver(post_save, sender=AIModel)
+@receiver(post_delete, sender=AIModel)
+def invalidate_model(sender, instance, **kwargs):
+    """Drop cached models after a model changed."""
+    active_models.invalidate()
@@ -4,7 +4,7 @@ Tests for the AI Core Service.
 
 from decimal import Decimal
 from unittest.mock import Mock, patch, MagicMock
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.contrib.auth import get_user_model
 import openai
 
@@ -12,6 +12,7 @@ from core.models import AIProvider, AIModel, AIJobsHistory
 from core.services.ai import AIRouter, AIResponse
 from core.services.ai.schemas import ProviderResponse
 from core.services.ai.pricing import calculate_cost
+from core.services.ai.cache import provider_instances, reset_ai_caches
 from core.services.exceptions import ServiceNotConfigured
 
 User = get_user_model()
@@ -74,6 +75,10 @@ class AIRouterTestCase(TestCase):
     
     def setUp(self):
         """Set up test fixtures."""
+        # Rolled-back rows of earlier tests send no signals; start with empty caches
+        reset_ai_caches()
+        self.addCleanup(reset_ai_caches)
+        
         # Create test user
         self.user = User.objects.create_user(
             username='testuser',
@@ -378,6 +383,104 @@ class AIRouterTestCase(TestCase):
         self.assertIn('not supported', str(cm.exception))
 
 
+def _openai_response(text='Cached client response'):
+    response = Mock()
+    response.choices = [Mock()]
+    response.choices[0].message.content = text
+    response.usage = Mock(prompt_tokens=10, completion_tokens=5)
+    return response
+
+
+@override_settings(AI_MODEL_CACHE_TTL_SECONDS=30)
+class AIRouterCacheTestCase(TestCase):
+    """Test model and provider instance caching in the AI Router."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        reset_ai_caches()
+        self.addCleanup(reset_ai_caches)
+        self.provider = AIProvider.objects.create(
+            name='Cached OpenAI', provider_type='OpenAI', api_key='key-1', active=True
+        )
+        self.model = AIModel.objects.create(
+            provider=self.provider, name='GPT Cached', model_id='gpt-cached', active=True, is_default=True
+        )
+
+    def test_select_model_served_from_cache(self):
+        """After the first lookup, model selection needs no queries."""
+        router = AIRouter()
+        router._select_model()
+
+        with self.assertNumQueries(0):
+            provider, model = router._select_model(provider_type='OpenAI', model_id='gpt-cached')
+            router._select_model(provider_type='OpenAI')
+
+        self.assertEqual(model.id, self.model.id)
+
+    def test_saving_model_invalidates_cache(self):
+        """A model saved in this process is visible to the next selection."""
+        router = AIRouter()
+        router._select_model()
+
+        AIModel.objects.create(provider=self.provider, name='GPT New', model_id='gpt-new', active=True)
+        provider, model = router._select_model(provider_type='OpenAI', model_id='gpt-new')
+        self.assertEqual(model.model_id, 'gpt-new')
+
+        self.model.active = False
+        self.model.save()
+        with self.assertRaises(ServiceNotConfigured):
+            router._select_model(provider_type='OpenAI', model_id='gpt-cached')
+
+    @patch('core.services.ai.openai_provider.openai.OpenAI')
+    def test_sdk_client_reused_across_calls(self, mock_openai_class):
+        """Repeated calls through new routers share one SDK client."""
+        mock_openai_class.return_value.chat.completions.create.return_value = _openai_response()
+
+        for _ in range(3):
+            AIRouter().generate(prompt='Hello')
+
+        self.assertEqual(mock_openai_class.call_count, 1)
+        self.assertEqual(len(provider_instances), 1)
+
+    @patch('core.services.ai.openai_provider.openai.OpenAI')
+    def test_changed_api_key_creates_new_client(self, mock_openai_class):
+        """Saving a new API key replaces the cached client."""
+        mock_openai_class.return_value.chat.completions.create.return_value = _openai_response()
+        AIRouter().generate(prompt='Hello')
+
+        self.provider.api_key = 'key-2'
+        self.provider.save()
+        AIRouter().generate(prompt='Hello')
+
+        self.assertEqual(mock_openai_class.call_count, 2)
+        self.assertEqual(mock_openai_class.call_args.kwargs['api_key'], 'key-2')
+        self.assertEqual(len(provider_instances), 1)
+
+    @patch('core.services.ai.openai_provider.openai.OpenAI')
+    def test_job_records_router_and_provider_timing(self, mock_openai_class):
+        """Jobs separate router overhead from provider latency."""
+        mock_openai_class.return_value.chat.completions.create.return_value = _openai_response()
+
+        AIRouter().generate(prompt='Hello')
+
+        job = AIJobsHistory.objects.get()
+        self.assertIsNotNone(job.router_overhead_ms)
+        self.assertIsNotNone(job.provider_latency_ms)
+        self.assertLessEqual(job.provider_latency_ms, job.duration_ms)
+
+    @patch('core.services.ai.openai_provider.openai.OpenAI')
+    def test_failed_job_records_provider_timing(self, mock_openai_class):
+        """Provider latency is also recorded when the provider call fails."""
+        mock_openai_class.return_value.chat.completions.create.side_effect = Exception('API Error')
+
+        with self.assertRaises(Exception):
+            AIRouter().generate(prompt='Hello')
+
+        job = AIJobsHistory.objects.get()
+        self.assertEqual(job.status, 'Error')
+        self.assertIsNotNone(job.provider_latency_ms)
+
+
 class OpenAIProviderTestCase(TestCase):
     """Test OpenAI provider implementation."""
     
@@ -493,3 +596,132 @@ class ClaudeProviderTestCase(TestCase):
         self.assertEqual(call_kwargs['system'], 'You are a triage assistant.')
         self.assertEqual(call_kwargs['messages'], [{'role': 'user', 'content': 'Classify this item.'}])
         self.assertEqual(call_kwargs['max_tokens'], 64)
+
+
+def _openai_stream(deltas, usage=(12, 3)):
+    """Mock OpenAI stream: one chunk per delta, then a usage-only chunk."""
+    chunks = []
+    for text in deltas:
+        chunk = Mock(usage=None)
+        chunk.choices = [Mock()]
+        chunk.choices[0].delta.content = text
+        chunks.append(chunk)
+    chunks.append(Mock(usage=Mock(prompt_tokens=usage[0], completion_tokens=usage[1]), choices=[]))
+    stream = MagicMock()
+    stream.__iter__.return_value = iter(chunks)
+    return stream
+
+
+class AIRouterStreamTestCase(TestCase):
+    """Test streamed completions through the AI Router."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        reset_ai_caches()
+        self.addCleanup(reset_ai_caches)
+        self.provider = AIProvider.objects.create(
+            name='Stream OpenAI', provider_type='OpenAI', api_key='key', active=True
+        )
+        self.model = AIModel.objects.create(
+            provider=self.provider, name='GPT Stream', model_id='gpt-stream', active=True,
+            is_default=True, input_price_per_1m_tokens=Decimal('1.00'),
+            output_price_per_1m_tokens=Decimal('2.00')
+        )
+
+    @patch('core.services.ai.openai_provider.openai.OpenAI')
+    def test_chat_stream_yields_deltas_and_completes_job(self, mock_openai_class):
+        """Deltas arrive in order; the job gets the final token usage and costs."""
+        create = mock_openai_class.return_value.chat.completions.create
+        create.return_value = _openai_stream(['Hel', 'lo'])
+
+        chunks = list(AIRouter().generate_stream(prompt='Hi', agent='test.stream'))
+
+        self.assertEqual(''.join(c.text for c in chunks), 'Hello')
+        self.assertTrue(chunks[-1].done)
+        self.assertEqual((chunks[-1].input_tokens, chunks[-1].output_tokens), (12, 3))
+        self.assertTrue(create.call_args.kwargs['stream'])
+        self.assertEqual(create.call_args.kwargs['stream_options'], {'include_usage': True})
+
+        job = AIJobsHistory.objects.get()
+        self.assertEqual(job.status, 'Completed')
+        self.assertEqual(job.agent, 'test.stream')
+        self.assertEqual((job.input_tokens, job.output_tokens), (12, 3))
+        self.assertIsNotNone(job.costs)
+        self.assertIsNotNone(job.provider_latency_ms)
+
+    @patch('core.services.ai.openai_provider.openai.OpenAI')
+    def test_chat_stream_job_pending_until_stream_ends(self, mock_openai_class):
+        """The job is created with the first chunk and completed with the last."""
+        mock_openai_class.return_value.chat.completions.create.return_value = _openai_stream(['a', 'b'])
+
+        stream = AIRouter().chat_stream(messages=[{'role': 'user', 'content': 'Hi'}])
+        next(stream)
+        self.assertEqual(AIJobsHistory.objects.get().status, 'Pending')
+
+        list(stream)
+        self.assertEqual(AIJobsHistory.objects.get().status, 'Completed')
+
+    @patch('core.services.ai.openai_provider.openai.OpenAI')
+    def test_chat_stream_closed_early_marks_job_error(self, mock_openai_class):
+        """A consumer that stops reading (client disconnect) leaves no pending job."""
+        stream_mock = _openai_stream(['a', 'b', 'c'])
+        mock_openai_class.return_value.chat.completions.create.return_value = stream_mock
+
+        stream = AIRouter().generate_stream(prompt='Hi')
+        next(stream)
+        stream.close()
+
+        job = AIJobsHistory.objects.get()
+        self.assertEqual(job.status, 'Error')
+        self.assertIn('closed', job.error_message)
+        stream_mock.close.assert_called_once()
+
+    @patch('core.services.ai.openai_provider.openai.OpenAI')
+    def test_chat_stream_provider_error_marks_job_error(self, mock_openai_class):
+        """Provider errors propagate and are recorded on the job."""
+        mock_openai_class.return_value.chat.completions.create.side_effect = Exception('API Error')
+
+        with self.assertRaises(Exception):
+            list(AIRouter().generate_stream(prompt='Hi'))
+
+        job = AIJobsHistory.objects.get()
+        self.assertEqual(job.status, 'Error')
+        self.assertEqual(job.error_message, 'API Error')
+
+    def test_base_provider_falls_back_to_chat(self):
+        """Providers without native streaming yield the whole answer once."""
+        from core.services.ai.base_provider import BaseProvider
+
+        class BlockingProvider(BaseProvider):
+            provider_type = 'Blocking'
+
+            def chat(self, messages, model_id, temperature=None, max_tokens=None, **kwargs):
+                return ProviderResponse(text='All at once', raw=None, input_tokens=4, output_tokens=2)
+
+        chunks = list(BlockingProvider(api_key='x').chat_stream(messages=[], model_id='m'))
+
+        self.assertEqual([c.text for c in chunks], ['All at once', ''])
+        self.assertTrue(chunks[-1].done)
+        self.assertEqual(chunks[-1].output_tokens, 2)
+
+    @patch('core.services.ai.claude_provider.anthropic.Anthropic')
+    def test_claude_stream_collects_usage_from_events(self, mock_anthropic_class):
+        """Claude input tokens come from message_start, output tokens from message_delta."""
+        from core.services.ai.claude_provider import ClaudeProvider
+
+        start = Mock(type='message_start')
+        start.message.usage = Mock(input_tokens=30, output_tokens=1)
+        delta = Mock(type='content_block_delta')
+        delta.delta = Mock(type='text_delta', text='Hi there')
+        end = Mock(type='message_delta', usage=Mock(output_tokens=7))
+        stream = MagicMock()
+        stream.__iter__.return_value = iter([start, delta, end])
+        mock_anthropic_class.return_value.messages.create.return_value = stream
+
+        chunks = list(ClaudeProvider(api_key='k').chat_stream(
+            messages=[{'role': 'user', 'content': 'Hi'}], model_id='claude-haiku-4-5'
+        ))
+
+        self.assertEqual(chunks[0].text, 'Hi there')
+        self.assertEqual((chunks[-1].input_tokens, chunks[-1].output_tokens), (30, 7))
+        self.assertTrue(mock_anthropic_class.return_value.messages.create.call_args.kwargs['stream'])
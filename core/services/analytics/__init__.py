@@ -0,0 +1,27 @@
+"""
+Analytics Service
+
+Maintains the daily rollups the analytics dashboards read from.
+"""
+
+from .rollups import (
+    DASHBOARD_MAX_DIRTY_DAYS,
+    TURNS_BUCKETS,
+    combine_percentiles,
+    first_day,
+    mark_dirty,
+    percentile,
+    refresh_days,
+    refresh_dirty_days,
+)
+
+__all__ = [
+    'DASHBOARD_MAX_DIRTY_DAYS',
+    'TURNS_BUCKETS',
+    'combine_percentiles',
+    'first_day',
+    'mark_dirty',
+    'percentile',
+    'refresh_days',
+    'refresh_dirty_days',
+]
@@ -0,0 +1,449 @@
+"""
+Daily rollups for the analytics dashboards.
+
+system_analytics, ai_job_statistics and the Claude queue dashboard read
+pre-aggregated rows per day (AIJobDailyRollup, ClaudeQueueDailyRollup,
+ItemDailyRollup) instead of scanning the source tables on every view, so a
+page view costs the same no matter how much history has accumulated.
+
+A day is always rebuilt from its source rows as a whole, which keeps the
+rollups idempotent and lets each row carry exact p50/p90 values for its day.
+Two paths keep them current:
+
+- Signal handlers (core.services.analytics.signals) mark the days a change
+  touches in AnalyticsRollupDirtyDay, in the same transaction as the change.
+  The dashboards call refresh_dirty_days() before they read, which rebuilds
+  only the marked days, at most DASHBOARD_MAX_DIRTY_DAYS per request.
+- The refresh_analytics_rollups command rebuilds a window of recent days (or
+  all history, the initial backfill after deploying) for changes that bypass
+  signals, such as QuerySet.update() and bulk_create().
+"""
+
+import logging
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from django.db import transaction
+from django.db.models import Max, Min
+from django.utils import timezone
+
+from core.models import (
+    Activity,
+    AIJobDailyRollup,
+    AIJobsHistory,
+    AIJobStatus,
+    AnalyticsRollupDirtyDay,
+    AnalyticsRollupKind,
+    ClaudeQueueDailyRollup,
+    ClaudeQueueJob,
+    ClaudeQueueJobAuthMode,
+    ClaudeQueueJobKind,
+    ClaudeQueueJobStatus,
+    ExternalIssueKind,
+    ExternalIssueMapping,
+    Item,
+    ItemDailyRollup,
+    ItemStatus,
+)
+
+logger = logging.getLogger(__name__)
+
+# Days rebuilt per pass; bounds memory and the size of the IN lists
+CHUNK_DAYS = 31
+
+# Dirty days a dashboard request rebuilds at most; older marks wait for the
+# next request or the refresh_analytics_rollups command
+DASHBOARD_MAX_DIRTY_DAYS = 31
+
+# Longest cycle times kept per day and project for the dashboard's top list
+LONGEST_CYCLE_ITEMS = 10
+
+# (label, ClaudeQueueDailyRollup field, lowest, highest) of the num_turns histogram
+TURNS_BUCKETS = [
+    ('1-10', 'turns_1_10', 0, 10),
+    ('11-25', 'turns_11_25', 11, 25),
+    ('26-50', 'turns_26_50', 26, 50),
+    ('51-100', 'turns_51_100', 51, 100),
+    ('100+', 'turns_over_100', 101, None),
+]
+
+# Claude queue statuses counted as "in flight": queued work, claimable or not
+IN_FLIGHT_STATUSES = (
+    ClaudeQueueJobStatus.BLOCKED,
+    ClaudeQueueJobStatus.QUEUED,
+    ClaudeQueueJobStatus.RUNNING,
+)
+
+
+def percentile(values: Sequence[float], fraction: float) -> Optional[float]:
+    """
+    Percentile of ``values`` with linear interpolation between the closest
+    ranks (``fraction`` 0.5 is the median as statistics.median computes it).
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def combine_percentiles(pairs: Iterable[Tuple[Optional[float], int]]) -> Optional[float]:
+    """
+    Combine per-row percentiles into one value for a longer period.
+
+    ``pairs`` are (percentile, sample size) of rollup rows. Percentiles can't
+    be merged exactly without the samples, so this returns the median of the
+    row values weighted by their sample size. It is exact for a single row
+    and close for rows with similar distributions.
+    """
+    weighted = sorted((value, weight) for value, weight in pairs if value is not None and weight)
+    total = sum(weight for _value, weight in weighted)
+    if not total:
+        return None
+    seen = 0
+    for value, weight in weighted:
+        seen += weight
+        if seen * 2 >= total:
+            return value
+    return weighted[-1][0]
+
+
+def _day_start(day: date) -> datetime:
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def _day_bounds(start: date, end: date) -> Tuple[datetime, datetime]:
+    return _day_start(start), _day_start(end + timedelta(days=1))
+
+
+def _local_date(value) -> date:
+    return timezone.localdate(value) if isinstance(value, datetime) else value
+
+
+# ---------------------------------------------------------------------------
+# Builders: source rows of start..end -> unsaved rollup rows
+# ---------------------------------------------------------------------------
+
+def _build_ai_jobs(start: date, end: date) -> List[AIJobDailyRollup]:
+    low, high = _day_bounds(start, end)
+    groups = defaultdict(lambda: {'requests': 0, 'errors': 0, 'total_costs': Decimal('0'), 'durations': []})
+    rows = AIJobsHistory.objects.filter(timestamp__gte=low, timestamp__lt=high).values_list(
+        'timestamp', 'agent', 'model_id', 'user_id', 'status', 'costs', 'duration_ms',
+    )
+    for timestamp, agent, model_id, user_id, status, costs, duration_ms in rows.iterator():
+        group = groups[(_local_date(timestamp), agent, model_id, user_id)]
+        group['requests'] += 1
+        if status == AIJobStatus.ERROR:
+            group['errors'] += 1
+        if costs is not None:
+            group['total_costs'] += costs
+        if duration_ms is not None:
+            group['durations'].append(duration_ms)
+
+    return [
+        AIJobDailyRollup(
+            date=day,
+            agent=agent,
+            model_id=model_id,
+            user_id=user_id,
+            requests=group['requests'],
+            errors=group['errors'],
+            total_costs=group['total_costs'],
+            duration_count=len(group['durations']),
+            duration_total_ms=sum(group['durations']),
+            duration_p50_ms=percentile(group['durations'], 0.5),
+            duration_p90_ms=percentile(group['durations'], 0.9),
+        )
+        for (day, agent, model_id, user_id), group in groups.items()
+    ]
+
+
+def _build_claude_queue(start: date, end: date) -> List[ClaudeQueueDailyRollup]:
+    low, high = _day_bounds(start, end)
+
+    def new_group():
+        group = {
+            'jobs': 0, 'total_cost': Decimal('0'), 'cost_jobs': 0,
+            'run_jobs': 0, 'done_ok': 0, 'done_uncertain': 0, 'failed': 0, 'cancelled': 0, 'in_flight': 0,
+            'turns': [], 'durations': [],
+        }
+        group.update({field: 0 for _label, field, _low, _high in TURNS_BUCKETS})
+        return group
+
+    groups = defaultdict(new_group)
+    rows = ClaudeQueueJob.objects.filter(created_at__gte=low, created_at__lt=high).values_list(
+        'created_at', 'project_id', 'model', 'auth_user_id', 'auth_mode', 'kind', 'status',
+        'completion_uncertain', 'total_cost_usd', 'num_turns', 'started_at', 'finished_at',
+    )
+    for (created_at, project_id, model, auth_user_id, auth_mode, kind, status,
+         completion_uncertain, cost, num_turns, started_at, finished_at) in rows.iterator():
+        billed = auth_mode == ClaudeQueueJobAuthMode.API_KEY
+        group = groups[(_local_date(created_at), project_id, model, auth_user_id, billed)]
+        group['jobs'] += 1
+        if cost is not None:
+            group['total_cost'] += cost
+            group['cost_jobs'] += 1
+        if kind == ClaudeQueueJobKind.ISSUE:
+            group['run_jobs'] += 1
+            if status == ClaudeQueueJobStatus.DONE:
+                group['done_uncertain' if completion_uncertain else 'done_ok'] += 1
+            elif status == ClaudeQueueJobStatus.FAILED:
+                group['failed'] += 1
+            elif status == ClaudeQueueJobStatus.CANCELLED:
+                group['cancelled'] += 1
+            elif status in IN_FLIGHT_STATUSES:
+                group['in_flight'] += 1
+        if num_turns is not None:
+            group['turns'].append(num_turns)
+            for _label, field, lowest, highest in TURNS_BUCKETS:
+                if num_turns >= lowest and (highest is None or num_turns <= highest):
+                    group[field] += 1
+                    break
+        if started_at and finished_at:
+            group['durations'].append((finished_at - started_at).total_seconds())
+
+    result = []
+    for (day, project_id, model, auth_user_id, billed), group in groups.items():
+        turns = group.pop('turns')
+        durations = group.pop('durations')
+        result.append(ClaudeQueueDailyRollup(
+            date=day,
+            project_id=project_id,
+            model=model,
+            auth_user_id=auth_user_id,
+            billed=billed,
+            turns_jobs=len(turns),
+            turns_total=sum(turns),
+            turns_p50=percentile(turns, 0.5),
+            turns_p90=percentile(turns, 0.9),
+            duration_jobs=len(durations),
+            duration_total_seconds=sum(durations),
+            duration_p50_seconds=percentile(durations, 0.5),
+            duration_p90_seconds=percentile(durations, 0.9),
+            **group,
+        ))
+    return result
+
+
+def closed_activities():
+    """Status change activities that closed an item."""
+    return Activity.objects.filter(verb='item.status_changed', summary__endswith=f'→ {ItemStatus.CLOSED}')
+
+
+def _closed_items(low: datetime, high: datetime):
+    """
+    Yield (item_id, project_id, created_at, closed_at) of closed items whose
+    closed time falls in [low, high).
+
+    The closed time is the latest "→ Closed" activity of the item, or
+    updated_at for items closed without an activity. Only items with such an
+    activity or an update in the range can qualify, so the rest is never read.
+    """
+    activity_ids = closed_activities().filter(
+        created_at__gte=low, created_at__lt=high,
+    ).values_list('target_object_id', flat=True)
+    candidate_ids = {int(object_id) for object_id in activity_ids if object_id.isdigit()}
+    candidate_ids.update(
+        Item.objects.filter(status=ItemStatus.CLOSED, updated_at__gte=low, updated_at__lt=high)
+        .values_list('id', flat=True)
+    )
+    if not candidate_ids:
+        return
+
+    closed_at_by_item = {
+        int(object_id): closed_at
+        for object_id, closed_at in closed_activities()
+        .filter(target_object_id__in=[str(pk) for pk in candidate_ids])
+        .values('target_object_id').annotate(closed_at=Max('created_at'))
+        .values_list('target_object_id', 'closed_at')
+    }
+    rows = Item.objects.filter(pk__in=candidate_ids, status=ItemStatus.CLOSED).values_list(
+        'id', 'project_id', 'created_at', 'updated_at',
+    )
+    for item_id, project_id, created_at, updated_at in rows:
+        closed_at = closed_at_by_item.get(item_id, updated_at)
+        if closed_at and low <= closed_at < high and closed_at >= created_at:
+            yield item_id, project_id, created_at, closed_at
+
+
+def _deployed_items(low: datetime, high: datetime):
+    """
+    Yield (item_id, project_id, created_at, deployed_at) of items deployed in
+    [low, high). Deployed is the earlier of the first merged PR and the close
+    of the item's solution release.
+    """
+    candidate_ids = set(
+        ExternalIssueMapping.objects.filter(
+            kind=ExternalIssueKind.PR, merged_at__gte=low, merged_at__lt=high, item__isnull=False,
+        ).values_list('item_id', flat=True)
+    )
+    candidate_ids.update(
+        Item.objects.filter(solution_release__closed_at__gte=low, solution_release__closed_at__lt=high)
+        .values_list('id', flat=True)
+    )
+    if not candidate_ids:
+        return
+
+    first_merge_by_item = dict(
+        ExternalIssueMapping.objects.filter(
+            kind=ExternalIssueKind.PR, merged_at__isnull=False, item_id__in=candidate_ids,
+        ).values('item_id').annotate(first_merge=Min('merged_at')).values_list('item_id', 'first_merge')
+    )
+    rows = Item.objects.filter(pk__in=candidate_ids).values_list(
+        'id', 'project_id', 'created_at', 'solution_release__closed_at',
+    )
+    for item_id, project_id, created_at, release_closed_at in rows:
+        candidates = [d for d in (first_merge_by_item.get(item_id), release_closed_at) if d]
+        if not candidates:
+            continue
+        deployed_at = min(candidates)
+        if low <= deployed_at < high and deployed_at >= created_at:
+            yield item_id, project_id, created_at, deployed_at
+
+
+def _build_items(start: date, end: date) -> List[ItemDailyRollup]:
+    low, high = _day_bounds(start, end)
+    groups = defaultdict(lambda: {'created': 0, 'cycle': [], 'lead': []})
+
+    rows = Item.objects.filter(created_at__gte=low, created_at__lt=high).values_list('created_at', 'project_id')
+    for created_at, project_id in rows.iterator():
+        groups[(_local_date(created_at), project_id)]['created'] += 1
+
+    for item_id, project_id, created_at, closed_at in _closed_items(low, high):
+        days = (closed_at - created_at).total_seconds() / 86400
+        groups[(_local_date(closed_at), project_id)]['cycle'].append((days, item_id))
+
+    for item_id, project_id, created_at, deployed_at in _deployed_items(low, high):
+        days = (deployed_at - created_at).total_seconds() / 86400
+        groups[(_local_date(deployed_at), project_id)]['lead'].append((days, item_id))
+
+    result = []
+    for (day, project_id), group in groups.items():
+        cycle_days = [days for days, _item_id in group['cycle']]
+        lead_days = [days for days, _item_id in group['lead']]
+        longest = sorted(group['cycle'], reverse=True)[:LONGEST_CYCLE_ITEMS]
+        fastest = min(group['lead']) if group['lead'] else None
+        result.append(ItemDailyRollup(
+            date=day,
+            project_id=project_id,
+            created=group['created'],
+            closed=len(cycle_days),
+            cycle_total_days=sum(cycle_days),
+            cycle_p50_days=percentile(cycle_days, 0.5),
+            cycle_p90_days=percentile(cycle_days, 0.9),
+            longest_cycle_items=[[item_id, days] for days, item_id in longest],
+            deployed=len(lead_days),
+            lead_total_days=sum(lead_days),
+            lead_p50_days=percentile(lead_days, 0.5),
+            lead_p90_days=percentile(lead_days, 0.9),
+            fastest_lead_item=[fastest[1], fastest[0]] if fastest else None,
+        ))
+    return result
+
+
+_ROLLUPS = {
+    AnalyticsRollupKind.AI_JOBS: (AIJobDailyRollup, _build_ai_jobs),
+    AnalyticsRollupKind.CLAUDE_QUEUE: (ClaudeQueueDailyRollup, _build_claude_queue),
+    AnalyticsRollupKind.ITEMS: (ItemDailyRollup, _build_items),
+}
+
+
+# ---------------------------------------------------------------------------
+# Refresh
+# ---------------------------------------------------------------------------
+
+def first_day(kind: str) -> Optional[date]:
+    """Earliest day with source rows for ``kind``, or None without any."""
+    if kind == AnalyticsRollupKind.AI_JOBS:
+        first = AIJobsHistory.objects.aggregate(first=Min('timestamp'))['first']
+    elif kind == AnalyticsRollupKind.CLAUDE_QUEUE:
+        first = ClaudeQueueJob.objects.aggregate(first=Min('created_at'))['first']
+    else:
+        # Items are closed and deployed after they were created
+        first = Item.objects.aggregate(first=Min('created_at'))['first']
+    return _local_date(first) if first else None
+
+
+def refresh_days(kind: str, start: date, end: date) -> int:
+    """
+    Rebuild the rollup rows of ``kind`` for the days ``start`` to ``end``
+    (inclusive). Returns the number of rows written.
+    """
+    model, build = _ROLLUPS[kind]
+    written = 0
+    chunk_start = start
+    while chunk_start <= end:
+        chunk_end = min(chunk_start + timedelta(days=CHUNK_DAYS - 1), end)
+        rows = build(chunk_start, chunk_end)
+        with transaction.atomic():
+            model.objects.filter(date__gte=chunk_start, date__lte=chunk_end).delete()
+            model.objects.bulk_create(rows, batch_size=500)
+        written += len(rows)
+        chunk_start = chunk_end + timedelta(days=1)
+    logger.debug(f"Rebuilt {kind} rollups {start}..{end}: {written} rows")
+    return written
+
+
+def _ranges(days: Sequence[date]):
+    """Split sorted days into (start, end) runs of consecutive days."""
+    start = previous = None
+    for day in days:
+        if previous is not None and day != previous + timedelta(days=1):
+            yield start, previous
+            start = None
+        if start is None:
+            start = day
+        previous = day
+    if start is not None:
+        yield start, previous
+
+
+def refresh_dirty_days(kind: str, max_days: Optional[int] = None) -> int:
+    """
+    Rebuild the days of ``kind`` marked dirty, at most ``max_days`` of them
+    (the most recent first; the rest stay marked for the next call).
+
+    The marks are claimed (locked and deleted) before the source rows are
+    read, and only the mark rows read here are deleted. A change that is
+    not committed yet when the marks are read leaves its own mark row, which
+    survives for the next call, so no change is lost between reading and
+    clearing. Returns the number of days rebuilt.
+    """
+    marked = AnalyticsRollupDirtyDay.objects.filter(kind=kind)
+    with transaction.atomic():
+        if max_days is not None:
+            newest = list(
+                marked.order_by('-date').values_list('date', flat=True).distinct()[:max_days]
+            )
+            marked = marked.filter(date__in=newest)
+        marks = list(marked.select_for_update(skip_locked=True).values_list('pk', 'date'))
+        if not marks:
+            return 0
+        AnalyticsRollupDirtyDay.objects.filter(pk__in=[pk for pk, _day in marks]).delete()
+        days = sorted({day for _pk, day in marks})
+        for start, end in _ranges(days):
+            refresh_days(kind, start, end)
+    return len(days)
+
+
+def mark_dirty(kind: str, *moments) -> None:
+    """
+    Mark the days of ``moments`` (datetimes or dates, None is ignored) as
+    dirty for ``kind``. Runs in the caller's transaction, so a rolled back
+    change leaves no mark.
+
+    Marks are plain inserts without a unique key, so concurrent writers
+    never wait for each other's mark. The insert runs in a savepoint: a
+    failed mark must not abort the caller's transaction.
+    """
+    days = {_local_date(moment) for moment in moments if moment is not None}
+    if not days:
+        return
+    with transaction.atomic():
+        AnalyticsRollupDirtyDay.objects.bulk_create(
+            [AnalyticsRollupDirtyDay(kind=kind, date=day) for day in sorted(days)]
+        )
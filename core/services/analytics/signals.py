@@ -0,0 +1,178 @@
+"""
+Django signals that mark analytics rollup days as dirty.
+
+Each handler marks the days whose rollup rows a saved or deleted row
+contributes to (see core.services.analytics.rollups). The mark is written in
+the same transaction as the change; the dashboards rebuild marked days
+before they read.
+"""
+
+import logging
+
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from core.models import AnalyticsRollupKind, ExternalIssueKind, ExternalIssueMapping
+from core.services.analytics.rollups import closed_activities, mark_dirty
+
+logger = logging.getLogger(__name__)
+
+
+def _safe_mark(kind, *moments):
+    """
+    Mark rollup days as dirty.
+
+    Catches all exceptions to prevent the signal from breaking the save; a
+    missed mark is repaired by the refresh_analytics_rollups command.
+    """
+    try:
+        mark_dirty(kind, *moments)
+    except Exception as e:
+        logger.error(f"Failed to mark {kind} rollup days as dirty: {e}", exc_info=True)
+
+
+@receiver(post_save, sender='core.AIJobsHistory')
+@receiver(post_delete, sender='core.AIJobsHistory')
+def mark_ai_job_day(sender, instance, **kwargs):
+    """AI job rollups are bucketed by the job's timestamp."""
+    if kwargs.get('raw'):
+        return
+    _safe_mark(AnalyticsRollupKind.AI_JOBS, instance.timestamp)
+
+
+@receiver(post_save, sender='core.ClaudeQueueJob')
+@receiver(post_delete, sender='core.ClaudeQueueJob')
+def mark_claude_queue_job_day(sender, instance, **kwargs):
+    """Queue rollups are bucketed by the day the job was created."""
+    if kwargs.get('raw'):
+        return
+    _safe_mark(AnalyticsRollupKind.CLAUDE_QUEUE, instance.created_at)
+
+
+# Item fields whose change moves the item between rollup rows
+_ITEM_ROLLUP_FIELDS = {'status', 'project', 'project_id', 'solution_release', 'solution_release_id'}
+
+
+def _previous_item_values(instance, update_fields):
+    """Database values an item save may move away from, or None for new items."""
+    if not instance.pk:
+        return None
+    if update_fields is not None and not _ITEM_ROLLUP_FIELDS & set(update_fields):
+        return None
+    return type(instance).objects.filter(pk=instance.pk).values(
+        'status', 'project_id', 'updated_at', 'solution_release_id', 'solution_release__closed_at',
+    ).first()
+
+
+def _item_closed_at(item_id):
+    """Time of the item's latest "→ Closed" activity, its closing time in the rollups."""
+    return (
+        closed_activities().filter(target_object_id=str(item_id))
+        .order_by('-created_at').values_list('created_at', flat=True).first()
+    )
+
+
+def _item_first_merge(item_id):
+    """Time of the item's first merged PR, a candidate for its deployment day."""
+    return (
+        ExternalIssueMapping.objects.filter(item_id=item_id, kind=ExternalIssueKind.PR, merged_at__isnull=False)
+        .order_by('merged_at').values_list('merged_at', flat=True).first()
+    )
+
+
+@receiver(pre_save, sender='core.Item')
+def remember_item_rollup_values(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Keep status, project and release before the save for mark_item_days."""
+    if raw:
+        return
+    try:
+        instance._analytics_previous = _previous_item_values(instance, update_fields)
+    except Exception as e:
+        instance._analytics_previous = None
+        logger.error(f"Failed to read previous item values for rollups: {e}", exc_info=True)
+
+
+@receiver(post_save, sender='core.Item')
+def mark_item_days(sender, instance, **kwargs):
+    """
+    An item counts on its creation day and, once closed or deployed, on its
+    closing and deployment days. Besides the days of the new values, a
+    change of status, project or solution release marks the days the item
+    counted on before, so it leaves the rows it no longer belongs to.
+    """
+    if kwargs.get('raw'):
+        return
+    moments = [instance.created_at, instance.updated_at]
+    previous = instance.__dict__.pop('_analytics_previous', None)
+    if previous:
+        status_changed = previous['status'] != instance.status
+        project_changed = previous['project_id'] != instance.project_id
+        release_changed = previous['solution_release_id'] != instance.solution_release_id
+        try:
+            if status_changed or project_changed:
+                moments += [_item_closed_at(instance.pk), previous['updated_at']]
+            if project_changed or release_changed:
+                moments += [previous['solution_release__closed_at'], _item_first_merge(instance.pk)]
+                if instance.solution_release_id:
+                    moments.append(instance.solution_release.closed_at)
+        except Exception as e:
+            logger.error(f"Failed to find previous rollup days of item {instance.pk}: {e}", exc_info=True)
+    _safe_mark(AnalyticsRollupKind.ITEMS, *moments)
+
+
+@receiver(pre_delete, sender='core.Item')
+def mark_deleted_item_days(sender, instance, **kwargs):
+    """A deleted item leaves the rows of its creation, closing and deployment days."""
+    try:
+        moments = [
+            instance.created_at,
+            instance.updated_at,
+            _item_closed_at(instance.pk),
+            _item_first_merge(instance.pk),
+            instance.solution_release.closed_at if instance.solution_release_id else None,
+        ]
+    except Exception as e:
+        logger.error(f"Failed to find rollup days of deleted item {instance.pk}: {e}", exc_info=True)
+        moments = [instance.created_at, instance.updated_at]
+    _safe_mark(AnalyticsRollupKind.ITEMS, *moments)
+
+
+@receiver(post_save, sender='core.Activity')
+def mark_item_closed_day(sender, instance, created, **kwargs):
+    """A "→ Closed" activity sets the closing day of its item."""
+    if kwargs.get('raw') or instance.verb != 'item.status_changed':
+        return
+    _safe_mark(AnalyticsRollupKind.ITEMS, instance.created_at)
+
+
+@receiver(post_save, sender='core.ExternalIssueMapping')
+@receiver(post_delete, sender='core.ExternalIssueMapping')
+def mark_pr_merged_day(sender, instance, **kwargs):
+    """A merged PR can set the deployment day of its item."""
+    if kwargs.get('raw'):
+        return
+    _safe_mark(AnalyticsRollupKind.ITEMS, instance.merged_at)
+
+
+@receiver(pre_save, sender='core.Release')
+def remember_release_closed_at(sender, instance, raw=False, **kwargs):
+    """Keep closed_at before the save for mark_release_closed_day."""
+    if raw or not instance.pk:
+        instance._analytics_previous_closed_at = None
+        return
+    try:
+        instance._analytics_previous_closed_at = (
+            type(instance).objects.filter(pk=instance.pk).values_list('closed_at', flat=True).first()
+        )
+    except Exception as e:
+        instance._analytics_previous_closed_at = None
+        logger.error(f"Failed to read previous release closed_at for rollups: {e}", exc_info=True)
+
+
+@receiver(post_save, sender='core.Release')
+def mark_release_closed_day(sender, instance, **kwargs):
+    """A closed release can set the deployment day of its items, before and after the change."""
+    if kwargs.get('raw'):
+        return
+    previous = instance.__dict__.pop('_analytics_previous_closed_at', None)
+    _safe_mark(AnalyticsRollupKind.ITEMS, instance.closed_at, previous)
@@ -0,0 +1,245 @@
+"""
+Tests for the daily analytics rollups
+"""
+
+from datetime import timedelta
+from decimal import Decimal
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from core.models import (
+    Activity, AIJobDailyRollup, AIJobsHistory, AIJobStatus, AnalyticsRollupDirtyDay, AnalyticsRollupKind,
+    ClaudeQueueDailyRollup, ClaudeQueueJob, ClaudeQueueJobAuthMode, ClaudeQueueJobKind, ClaudeQueueJobStatus,
+    ExternalIssueKind, ExternalIssueMapping, Item, ItemDailyRollup, ItemStatus, ItemType, Project, User,
+)
+from core.services.activity import ActivityService
+from core.services.analytics import combine_percentiles, percentile, refresh_days, refresh_dirty_days
+
+
+class PercentileTestCase(TestCase):
+    """Test the percentile helpers."""
+
+    def test_percentile_interpolates(self):
+        self.assertIsNone(percentile([], 0.5))
+        self.assertEqual(percentile([7], 0.9), 7)
+        self.assertEqual(percentile([4, 1, 3, 2], 0.5), 2.5)
+        self.assertAlmostEqual(percentile(list(range(1, 11)), 0.9), 9.1)
+
+    def test_combine_percentiles_weights_by_sample_size(self):
+        self.assertIsNone(combine_percentiles([]))
+        self.assertIsNone(combine_percentiles([(None, 3), (5.0, 0)]))
+        self.assertEqual(combine_percentiles([(10.0, 1), (2.0, 5)]), 2.0)
+        self.assertEqual(combine_percentiles([(10.0, 5), (2.0, 1)]), 10.0)
+
+
+class AIJobRollupTestCase(TestCase):
+    """Test the AI job rollups and their dirty-day marks."""
+
+    def _job(self, agent='agent.test', status=AIJobStatus.COMPLETED, costs='0.001', duration_ms=100):
+        return AIJobsHistory.objects.create(
+            agent=agent, status=status, costs=Decimal(costs), duration_ms=duration_ms,
+        )
+
+    def test_save_marks_day_and_refresh_builds_rows(self):
+        for duration_ms in (100, 200, 300, 400):
+            self._job(duration_ms=duration_ms)
+        self._job(status=AIJobStatus.ERROR, duration_ms=None)
+
+        self.assertTrue(AnalyticsRollupDirtyDay.objects.filter(
+            kind=AnalyticsRollupKind.AI_JOBS, date=timezone.localdate(),
+        ).exists())
+
+        self.assertEqual(refresh_dirty_days(AnalyticsRollupKind.AI_JOBS), 1)
+
+        row = AIJobDailyRollup.objects.get()
+        self.assertEqual(row.requests, 5)
+        self.assertEqual(row.errors, 1)
+        self.assertEqual(row.total_costs, Decimal('0.005'))
+        self.assertEqual(row.duration_count, 4)
+        self.assertEqual(row.duration_total_ms, 1000)
+        self.assertEqual(row.duration_p50_ms, 250)
+        self.assertAlmostEqual(row.duration_p90_ms, 370)
+        self.assertFalse(AnalyticsRollupDirtyDay.objects.exists())
+
+    def test_refresh_replaces_rows_of_the_day(self):
+        job = self._job()
+        refresh_dirty_days(AnalyticsRollupKind.AI_JOBS)
+        job.delete()
+
+        refresh_dirty_days(AnalyticsRollupKind.AI_JOBS)
+
+        self.assertFalse(AIJobDailyRollup.objects.exists())
+
+    def test_statistics_view_reads_rollups(self):
+        user = User.objects.create_user(username='stats', email='stats@example.com', password='pass')
+        today = timezone.localdate()
+        AIJobDailyRollup.objects.create(
+            date=today, agent='agent.rollup', requests=3, errors=2, total_costs=Decimal('1.5'),
+            duration_count=3, duration_total_ms=600, duration_p50_ms=150, duration_p90_ms=380,
+        )
+        AIJobDailyRollup.objects.create(
+            date=today - timedelta(days=30), agent='agent.rollup', requests=1, errors=1,
+        )
+        self.client.force_login(user)
+
+        response = self.client.get(reverse('ai-job-statistics'))
+
+        self.assertEqual(response.context['costs_today'], Decimal('1.5'))
+        self.assertEqual(response.context['errors_7d'], 2)
+        [row] = response.context['by_agent']
+        self.assertEqual(row['requests'], 4)
+        self.assertEqual(row['p50_duration_ms'], 150)
+        self.assertEqual(row['p90_duration_ms'], 380)
+
+
+class ClaudeQueueRollupTestCase(TestCase):
+    """Test the Claude queue rollups."""
+
+    def setUp(self):
+        self.project = Project.objects.create(name='Rollup Project')
+        self.item_type = ItemType.objects.create(key='task', name='Task')
+        self.item = Item.objects.create(project=self.project, title='Task', type=self.item_type)
+        self.user = User.objects.create_user(username='alice', email='alice@example.com', password='pw')
+
+    def _job(self, status=ClaudeQueueJobStatus.DONE, **kwargs):
+        return ClaudeQueueJob.objects.create(item=self.item, project=self.project, status=status, **kwargs)
+
+    def test_rollup_counts_statuses_costs_and_turns(self):
+        now = timezone.now()
+        self._job(total_cost_usd=Decimal('1.00'), num_turns=5, started_at=now - timedelta(seconds=60), finished_at=now)
+        self._job(completion_uncertain=True, num_turns=30)
+        self._job(status=ClaudeQueueJobStatus.FAILED, total_cost_usd=Decimal('2.00'), num_turns=150)
+        self._job(status=ClaudeQueueJobStatus.QUEUED)
+        self._job(status=ClaudeQueueJobStatus.ORCHESTRATING, kind=ClaudeQueueJobKind.EPIC)
+
+        refresh_dirty_days(AnalyticsRollupKind.CLAUDE_QUEUE)
+
+        row = ClaudeQueueDailyRollup.objects.get()
+        self.assertEqual(row.jobs, 5)
+        self.assertEqual(row.run_jobs, 4)
+        self.assertEqual((row.done_ok, row.done_uncertain, row.failed, row.in_flight), (1, 1, 1, 1))
+        self.assertEqual(row.total_cost, Decimal('3.00'))
+        self.assertEqual(row.cost_jobs, 2)
+        self.assertEqual((row.turns_jobs, row.turns_total, row.turns_p50), (3, 185, 30))
+        self.assertEqual((row.turns_1_10, row.turns_26_50, row.turns_over_100), (1, 1, 1))
+        self.assertEqual(row.duration_jobs, 1)
+        self.assertEqual(row.duration_p50_seconds, 60)
+
+    def test_rows_are_split_by_auth_user_and_billing(self):
+        self._job(auth_user=self.user, auth_mode=ClaudeQueueJobAuthMode.API_KEY, total_cost_usd=Decimal('4'))
+        self._job(auth_user=self.user, auth_mode=ClaudeQueueJobAuthMode.OAUTH, total_cost_usd=Decimal('1'))
+
+        refresh_dirty_days(AnalyticsRollupKind.CLAUDE_QUEUE)
+
+        rows = {row.billed: row for row in ClaudeQueueDailyRollup.objects.filter(auth_user=self.user)}
+        self.assertEqual(rows[True].total_cost, Decimal('4'))
+        self.assertEqual(rows[False].total_cost, Decimal('1'))
+
+
+class ItemRollupTestCase(TestCase):
+    """Test the item throughput rollups."""
+
+    def setUp(self):
+        self.project = Project.objects.create(name='Rollup Project')
+        self.item_type = ItemType.objects.create(key='task', name='Task')
+        self.today = timezone.localdate()
+
+    def _item(self, created_days_ago, status=ItemStatus.WORKING):
+        item = Item.objects.create(project=self.project, title='Task', type=self.item_type, status=status)
+        Item.objects.filter(pk=item.pk).update(created_at=timezone.now() - timedelta(days=created_days_ago))
+        return Item.objects.get(pk=item.pk)
+
+    def _close(self, item, days_ago):
+        Item.objects.filter(pk=item.pk).update(status=ItemStatus.CLOSED)
+        activity = ActivityService().log_status_change(
+            item=item, from_status=ItemStatus.TESTING, to_status=ItemStatus.CLOSED,
+        )
+        Activity.objects.filter(pk=activity.pk).update(created_at=timezone.now() - timedelta(days=days_ago))
+
+    def test_closed_items_count_on_their_closing_day(self):
+        for created_days_ago in (10, 6):
+            self._close(self._item(created_days_ago), days_ago=2)
+        self._item(1)
+
+        refresh_days(AnalyticsRollupKind.ITEMS, self.today - timedelta(days=14), self.today)
+
+        closing_day = ItemDailyRollup.objects.get(date=self.today - timedelta(days=2))
+        self.assertEqual(closing_day.closed, 2)
+        self.assertAlmostEqual(closing_day.cycle_p50_days, 6, places=2)
+        self.assertAlmostEqual(closing_day.cycle_total_days, 12, places=2)
+        self.assertEqual([round(days) for _item_id, days in closing_day.longest_cycle_items], [8, 4])
+        self.assertEqual(sum(ItemDailyRollup.objects.values_list('created', flat=True)), 3)
+
+    def test_reclosed_item_counts_once_on_its_latest_closing_day(self):
+        item = self._item(10)
+        self._close(item, days_ago=5)
+        self._close(item, days_ago=1)
+
+        refresh_days(AnalyticsRollupKind.ITEMS, self.today - timedelta(days=14), self.today)
+
+        self.assertEqual(
+            list(ItemDailyRollup.objects.filter(closed__gt=0).values_list('date', 'closed')),
+            [(self.today - timedelta(days=1), 1)],
+        )
+
+    def test_lead_time_uses_first_merged_pr(self):
+        item = self._item(4)
+        for number, days_ago in ((1, 3), (2, 1)):
+            ExternalIssueMapping.objects.create(
+                item=item, github_id=number, number=number, kind=ExternalIssueKind.PR, state='closed',
+                html_url=f'https://example.com/pr/{number}', merged_at=timezone.now() - timedelta(days=days_ago),
+            )
+
+        refresh_days(AnalyticsRollupKind.ITEMS, self.today - timedelta(days=14), self.today)
+
+        deploy_day = ItemDailyRollup.objects.get(deployed__gt=0)
+        self.assertEqual(deploy_day.date, self.today - timedelta(days=3))
+        self.assertAlmostEqual(deploy_day.lead_p50_days, 1, places=2)
+        self.assertEqual(deploy_day.fastest_lead_item[0], item.pk)
+
+    def _closed_rows(self):
+        return list(ItemDailyRollup.objects.filter(closed__gt=0).values_list('date', 'project_id', 'closed'))
+
+    def test_reopened_item_leaves_its_old_closing_day(self):
+        item = self._item(10)
+        self._close(item, days_ago=5)
+        refresh_days(AnalyticsRollupKind.ITEMS, self.today - timedelta(days=14), self.today)
+        AnalyticsRollupDirtyDay.objects.all().delete()
+
+        item = Item.objects.get(pk=item.pk)
+        item.status = ItemStatus.WORKING
+        item.save()
+
+        self.assertTrue(AnalyticsRollupDirtyDay.objects.filter(date=self.today - timedelta(days=5)).exists())
+        refresh_dirty_days(AnalyticsRollupKind.ITEMS)
+        self.assertEqual(self._closed_rows(), [])
+
+    def test_moved_item_leaves_the_rows_of_its_old_project(self):
+        other = Project.objects.create(name='Other Project')
+        item = self._item(10)
+        self._close(item, days_ago=3)
+        refresh_days(AnalyticsRollupKind.ITEMS, self.today - timedelta(days=14), self.today)
+        AnalyticsRollupDirtyDay.objects.all().delete()
+
+        item = Item.objects.get(pk=item.pk)
+        item.project = other
+        item.save()
+        refresh_dirty_days(AnalyticsRollupKind.ITEMS)
+
+        self.assertEqual(self._closed_rows(), [(self.today - timedelta(days=3), other.pk, 1)])
+        self.assertFalse(ItemDailyRollup.objects.filter(project=self.project, created__gt=0).exists())
+
+    def test_refresh_dirty_days_is_capped_newest_first(self):
+        for days_ago in (1, 2, 3):
+            AnalyticsRollupDirtyDay.objects.create(
+                kind=AnalyticsRollupKind.ITEMS, date=self.today - timedelta(days=days_ago),
+            )
+
+        self.assertEqual(refresh_dirty_days(AnalyticsRollupKind.ITEMS, max_days=2), 2)
+
+        self.assertEqual(
+            list(AnalyticsRollupDirtyDay.objects.values_list('date', flat=True)),
+            [self.today - timedelta(days=3)],
+        )
@@ -11,7 +11,7 @@ import re
 from typing import Optional
 
 from core.models import ClaudeQueueJobModel
-from core.services.agents.agent_service import AgentService
+from core.services.agents.agent_service import AgentService, get_agent_service
 
 logger = logging.getLogger(__name__)
 
@@ -91,7 +91,7 @@ class ModelClassifierService:
     HAIKU_AGENT_FILENAME = 'model-classifier-agent.yml'
 
     def __init__(self, agent_service: Optional[AgentService] = None):
-        self.agent_service = agent_service or AgentService()
+        self.agent_service = agent_service or get_agent_service()
 
     def classify(self, item) -> str:
         """Return the suggested Claude model for item.
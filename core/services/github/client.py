@@ -10,6 +10,7 @@ from typing import Optional, Dict, Any, List, Union
 
 from core.services.integrations.http import HTTPClient
 from core.services.integrations.base import IntegrationError
+from core.services.github.response_cache import GitHubResponseCacheStore
 
 logger = logging.getLogger(__name__)
 
@@ -18,16 +19,20 @@ class GitHubClient:
     """
     GitHub REST API v3 client.
     
-    Handles authentication and API requests to GitHub.
+    Handles authentication and API requests to GitHub. GET requests are
+    sent as conditional requests against a persistent ETag/Last-Modified
+    cache; unchanged resources come back as 304 and do not count against
+    the rate limit.
     """
     
-    def __init__(self, token: str, base_url: str = 'https://api.github.com'):
+    def __init__(self, token: str, base_url: str = 'https://api.github.com', use_response_cache: bool = True):
         """
         Initialize GitHub client.
         
         Args:
             token: GitHub Personal Access Token or App token
             base_url: GitHub API base URL (default: https://api.github.com)
+            use_response_cache: Send conditional GETs backed by GitHubResponseCache
         """
         headers = {
             'Authorization': f'Bearer {token}',
@@ -40,6 +45,7 @@ class GitHubClient:
             headers=headers,
             timeout=30.0,
             max_retries=3,
+            response_cache=GitHubResponseCacheStore(token) if use_response_cache else None,
         )
     
     # Issue methods
@@ -346,6 +352,50 @@ class GitHubClient:
         
         return self.http.get(api_path, params=params)
     
+    def get_git_tree(
+        self,
+        owner: str,
+        repo: str,
+        ref: Optional[str] = None,
+        recursive: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Get a Git tree, by default with all nested entries.
+        
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            ref: Branch, tag or tree/commit SHA. Defaults to HEAD (default branch).
+            recursive: Include all subtrees in one response
+            
+        Returns:
+            Tree data with 'sha', 'tree' (entries with path, type, sha, size)
+            and 'truncated' (True if GitHub cut off a too large tree)
+        """
+        api_path = f'/repos/{owner}/{repo}/git/trees/{ref or "HEAD"}'
+        params = {'recursive': '1'} if recursive else None
+        return self.http.get(api_path, params=params)
+    
+    def get_blob(self, owner: str, repo: str, sha: str) -> bytes:
+        """
+        Get the raw content of a Git blob.
+        
+        Blobs are content-addressed and never change, so the request is not
+        sent through the conditional response cache.
+        
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            sha: Blob SHA
+            
+        Returns:
+            Blob content as bytes
+        """
+        blob = self.http.get(f'/repos/{owner}/{repo}/git/blobs/{sha}', conditional=False)
+        if blob.get('encoding') == 'base64':
+            return base64.b64decode(blob.get('content', '').replace('\n', ''))
+        return (blob.get('content') or '').encode('utf-8')
+    
     def get_file_content(
         self,
         owner: str,
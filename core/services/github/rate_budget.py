@@ -0,0 +1,97 @@
+"""
+Shared GitHub rate limit budget for concurrent API access.
+
+``RateBudget`` is a token bucket that is filled from GitHub's own rate limit
+headers instead of a fixed refill rate: its level is the last seen
+``X-RateLimit-Remaining`` minus a reserve kept for interactive use, and it
+is refilled when ``X-RateLimit-Reset`` has passed. Conditional requests
+answered with 304 are not counted by GitHub, so resynchronising from the
+headers returns their tokens to the bucket.
+"""
+
+import logging
+import threading
+import time
+from typing import Optional
+
+from core.services.github.response_cache import get_conditional_stats
+
+logger = logging.getLogger(__name__)
+
+# Requests left untouched for the web UI and webhooks
+DEFAULT_RESERVE = 100
+
+# Longest time acquire() waits for the rate limit window to reset
+DEFAULT_MAX_WAIT_SECONDS = 60.0
+
+
+class RateBudget:
+    """Token bucket for GitHub API requests, shared by worker threads."""
+
+    def __init__(self, reserve: int = DEFAULT_RESERVE, max_wait: float = DEFAULT_MAX_WAIT_SECONDS):
+        """
+        Initialize the budget.
+
+        Args:
+            reserve: Requests to leave unused in every rate limit window
+            max_wait: Longest time to block for a reset before giving up
+        """
+        self.reserve = reserve
+        self.max_wait = max_wait
+        self.tokens: Optional[int] = None  # unknown until GitHub reported a limit
+        self.reset_at: Optional[float] = None
+        self.waited_seconds = 0.0
+        self.exhausted = False
+        self._seen_responses = 0
+        self._cond = threading.Condition()
+
+    def update(self, remaining: Optional[int], reset_at: Optional[float]) -> None:
+        """Set the bucket level from GitHub's rate limit headers."""
+        if remaining is None:
+            return
+        with self._cond:
+            self.tokens = max(0, remaining - self.reserve)
+            self.reset_at = reset_at
+            self._cond.notify_all()
+
+    def refresh(self) -> None:
+        """Resynchronise from the headers of responses received since the last refresh."""
+        stats = get_conditional_stats()
+        seen = stats['hits'] + stats['misses']
+        with self._cond:
+            if seen == self._seen_responses:
+                return
+            self._seen_responses = seen
+        self.update(stats['rate_limit_remaining'], stats['rate_limit_reset'])
+
+    def acquire(self) -> bool:
+        """
+        Take a token for one request.
+
+        Blocks until the rate limit window resets if the bucket is empty and
+        the reset is at most ``max_wait`` seconds away.
+
+        Returns:
+            True if the request may be sent, False if the budget is exhausted
+        """
+        with self._cond:
+            while True:
+                if self.tokens is None or self.tokens > 0:
+                    if self.tokens is not None:
+                        self.tokens -= 1
+                    return True
+
+                now = time.time()
+                if self.reset_at is not None and now >= self.reset_at:
+                    # New window: proceed until GitHub reports the new limit
+                    self.tokens = None
+                    continue
+                if self.reset_at is None or self.reset_at - now > self.max_wait:
+                    if not self.exhausted:
+                        logger.warning("GitHub rate budget exhausted; deferring remaining requests")
+                    self.exhausted = True
+                    return False
+
+                wait = self.reset_at - now + 1
+                self._cond.wait(wait)
+                self.waited_seconds += time.time() - now
@@ -0,0 +1,175 @@
+"""
+Conditional request cache for the GitHub API.
+
+GitHub answers a GET carrying a matching ``If-None-Match`` or
+``If-Modified-Since`` header with ``304 Not Modified``, and such answers do
+not count against the 5000 requests/hour rate limit. ``GitHubResponseCache``
+stores the validators and the last payload per token, path, query and Accept
+header in the database, so the cache survives between ``github_sync_worker``
+runs and is shared by all processes.
+
+The module also keeps process-wide counters (cache hits and misses, last seen
+rate limit headers) for the worker summary.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from datetime import timedelta
+from typing import Any, Dict, Optional
+
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from core.models import GitHubResponseCache
+
+logger = logging.getLogger(__name__)
+
+# Entries not used for this long are removed by prune()
+DEFAULT_MAX_AGE_DAYS = 7
+
+
+class _Stats:
+    """Thread-safe counters for conditional GitHub requests."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._clear()
+
+    def _clear(self):
+        self.hits = 0
+        self.misses = 0
+        self.rate_limit: Dict[str, Optional[int]] = {'limit': None, 'remaining': None, 'reset': None}
+
+    def reset(self):
+        with self._lock:
+            self._clear()
+
+    def record(self, hit: bool, response) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+            for field in ('limit', 'remaining', 'reset'):
+                value = response.headers.get(f'x-ratelimit-{field}')
+                if value is not None and str(value).isdigit():
+                    self.rate_limit[field] = int(value)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': round(self.hits / total, 3) if total else None,
+                'rate_limit_limit': self.rate_limit['limit'],
+                'rate_limit_remaining': self.rate_limit['remaining'],
+                'rate_limit_reset': self.rate_limit['reset'],
+            }
+
+
+_stats = _Stats()
+
+
+def get_conditional_stats() -> Dict[str, Any]:
+    """
+    Conditional request counters of this process.
+
+    Returns:
+        Dictionary with hits (304 answers), misses (full responses),
+        hit_ratio (None before the first request) and the last seen
+        rate_limit_limit, rate_limit_remaining and rate_limit_reset (epoch
+        seconds)
+    """
+    return _stats.snapshot()
+
+
+def reset_conditional_stats() -> None:
+    """Reset the process-wide counters (e.g. at the start of a worker run)."""
+    _stats.reset()
+
+
+def prune(max_age_days: int = DEFAULT_MAX_AGE_DAYS) -> int:
+    """
+    Delete cache entries that were not used for ``max_age_days``.
+
+    Returns:
+        Number of deleted entries
+    """
+    cutoff = timezone.now() - timedelta(days=max_age_days)
+    deleted, _ = GitHubResponseCache.objects.filter(last_used_at__lt=cutoff).delete()
+    return deleted
+
+
+class GitHubResponseCacheStore:
+    """
+    Database-backed response cache for HTTPClient conditional GETs.
+
+    Failures are logged and treated as cache misses; the cache never breaks
+    an API call.
+    """
+
+    def __init__(self, token: str):
+        """
+        Initialize the store.
+
+        Args:
+            token: GitHub token; only a hash is used, to separate entries of
+                different tokens (private repositories differ per token)
+        """
+        self._namespace = hashlib.sha256(token.encode('utf-8')).hexdigest()[:16]
+
+    def _key(self, path: str, params: Optional[Dict[str, Any]], headers: Dict[str, str]) -> str:
+        accept = next((v for k, v in headers.items() if k.lower() == 'accept'), '')
+        fingerprint = json.dumps(
+            [self._namespace, path, sorted((params or {}).items()), accept],
+            default=str,
+        )
+        return hashlib.sha256(fingerprint.encode('utf-8')).hexdigest()
+
+    def lookup(self, path: str, params: Optional[Dict[str, Any]], headers: Dict[str, str]):
+        """Return the stored entry for a request, or None."""
+        try:
+            return GitHubResponseCache.objects.filter(cache_key=self._key(path, params, headers)).first()
+        except Exception as e:
+            logger.warning(f"GitHub response cache lookup failed for {path}: {e}")
+            return None
+
+    def hit(self, entry: GitHubResponseCache, response) -> None:
+        """Record a 304 answer served from ``entry``."""
+        _stats.record(True, response)
+        try:
+            with transaction.atomic():
+                GitHubResponseCache.objects.filter(pk=entry.pk).update(last_used_at=timezone.now())
+        except Exception as e:
+            logger.debug(f"Could not touch GitHub response cache entry {entry.pk}: {e}")
+
+    def store(self, path: str, params: Optional[Dict[str, Any]], headers: Dict[str, str], response, payload) -> None:
+        """Record a full response and keep its validators for the next request."""
+        _stats.record(False, response)
+        etag = response.headers.get('etag', '')
+        last_modified = response.headers.get('last-modified', '')
+        if not (etag or last_modified):
+            return
+        now = timezone.now()
+        # Savepoint: a failed write must not break a caller's transaction
+        try:
+            with transaction.atomic():
+                GitHubResponseCache.objects.update_or_create(
+                    cache_key=self._key(path, params, headers),
+                    defaults={
+                        'path': path[:500],
+                        'etag': etag[:255],
+                        'last_modified': last_modified[:64],
+                        'payload': payload,
+                        'fetched_at': now,
+                        'last_used_at': now,
+                    },
+                )
+        except IntegrityError:
+            # Stored concurrently by another worker for the same request
+            pass
+        except Exception as e:
+            logger.warning(f"GitHub response cache store failed for {path}: {e}")
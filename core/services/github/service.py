@@ -17,7 +17,6 @@ from core.models import (
     ExternalIssueMapping,
     ExternalIssueKind,
     ClaudeQueueJob,
-    Activity,
     User,
 )
 from core.services.claude_queue.branch import DEFAULT_BASE_BRANCH
@@ -186,13 +185,13 @@ class GitHubService(IntegrationBase):
             actor: User performing the action (optional)
         """
         try:
-            from django.contrib.contenttypes.models import ContentType
             from django.core.exceptions import ObjectDoesNotExist
+            from core.services.activity import ActivityService
             
-            Activity.objects.create(
-                target_content_type=ContentType.objects.get_for_model(Item),
-                target_object_id=item.id,
+            # Goes through ActivityService so bulk paths can batch the INSERTs
+            ActivityService().log(
                 verb=verb,
+                target=item,
                 actor=actor,
                 summary=summary,
             )
@@ -545,7 +544,11 @@ class GitHubService(IntegrationBase):
 
         logger.info(f"Updated PR #{number} body for item {item.id}")
 
-    def sync_mapping(self, mapping: ExternalIssueMapping) -> ExternalIssueMapping:
+    def sync_mapping(
+        self,
+        mapping: ExternalIssueMapping,
+        github_data: Optional[dict] = None,
+    ) -> ExternalIssueMapping:
         """
         Synchronize an ExternalIssueMapping with GitHub.
         
@@ -553,6 +556,8 @@ class GitHubService(IntegrationBase):
         
         Args:
             mapping: ExternalIssueMapping to sync
+            github_data: Issue/PR data fetched beforehand (e.g. by the
+                concurrent sync worker); fetched from GitHub if omitted
             
         Returns:
             Updated mapping
@@ -561,14 +566,15 @@ class GitHubService(IntegrationBase):
             IntegrationDisabled: If GitHub is disabled
             IntegrationNotConfigured: If GitHub is not configured
         """
-        client = self._get_client()
-        owner, repo = self._get_repo_info(mapping.item)
-        
-        # Fetch from GitHub
-        if mapping.kind == ExternalIssueKind.ISSUE:
-            github_data = client.get_issue(owner, repo, mapping.number)
-        else:  # PR
-            github_data = client.get_pr(owner, repo, mapping.number)
+        if github_data is None:
+            client = self._get_client()
+            owner, repo = self._get_repo_info(mapping.item)
+            
+            # Fetch from GitHub
+            if mapping.kind == ExternalIssueKind.ISSUE:
+                github_data = client.get_issue(owner, repo, mapping.number)
+            else:  # PR
+                github_data = client.get_pr(owner, repo, mapping.number)
         
         # Update mapping
         old_state = mapping.state
@@ -807,6 +813,7 @@ class GitHubService(IntegrationBase):
         *,
         number: int,
         kind: str,
+        github_data: Optional[dict] = None,
     ) -> ExternalIssueMapping:
         """
         Create or update mapping from existing GitHub issue/PR.
@@ -818,6 +825,8 @@ class GitHubService(IntegrationBase):
             item: Agira item to map to
             number: GitHub issue/PR number
             kind: 'issue' or 'pr'
+            github_data: Issue/PR data fetched beforehand; fetched from
+                GitHub if omitted
             
         Returns:
             Created or updated ExternalIssueMapping
@@ -827,20 +836,19 @@ class GitHubService(IntegrationBase):
             IntegrationNotConfigured: If GitHub is not configured
             ValueError: If project doesn't have GitHub repo or invalid kind
         """
-        client = self._get_client()
-        owner, repo = self._get_repo_info(item)
-        
         # Validate kind
         if kind not in ['issue', 'pr']:
             raise ValueError(f"Invalid kind: {kind}. Must be 'issue' or 'pr'")
+        mapping_kind = ExternalIssueKind.ISSUE if kind == 'issue' else ExternalIssueKind.PR
         
         # Fetch from GitHub
-        if kind == 'issue':
-            github_data = client.get_issue(owner, repo, number)
-            mapping_kind = ExternalIssueKind.ISSUE
-        else:
-            github_data = client.get_pr(owner, repo, number)
-            mapping_kind = ExternalIssueKind.PR
+        if github_data is None:
+            client = self._get_client()
+            owner, repo = self._get_repo_info(item)
+            if kind == 'issue':
+                github_data = client.get_issue(owner, repo, number)
+            else:
+                github_data = client.get_pr(owner, repo, number)
         
         github_id = github_data['id']
         state = self._map_state(github_data, kind)
@@ -22,6 +22,7 @@ from core.services.integrations.base import (
     IntegrationAuthError,
     IntegrationRateLimitError,
 )
+from core.services.integrations.http import reset_http_clients
 
 User = get_user_model()
 
@@ -739,6 +740,11 @@ class GitHubImportClosedIssuesTestCase(TestCase):
 class GitHubClientTestCase(TestCase):
     """Test GitHub client HTTP interactions."""
     
+    def setUp(self):
+        # Pooled clients are process-wide; start each test with a fresh (mocked) one
+        reset_http_clients()
+        self.addCleanup(reset_http_clients)
+    
     @patch('core.services.integrations.http.httpx.Client')
     def test_client_sets_auth_headers(self, mock_client_class):
         """Test that client sets proper authentication headers."""
@@ -792,6 +798,183 @@ class GitHubClientTestCase(TestCase):
         self.assertEqual(call_kwargs['json'], {'body': 'new body'})
 
 
+
+class GitHubConditionalRequestTestCase(TestCase):
+    """Test ETag/Last-Modified conditional requests of the GitHub client."""
+    
+    def setUp(self):
+        import respx
+        from core.services.github.response_cache import reset_conditional_stats
+        
+        reset_http_clients()
+        reset_conditional_stats()
+        self.addCleanup(reset_http_clients)
+        self.router = respx.mock(base_url='https://api.github.com', assert_all_called=False)
+        self.router.start()
+        self.addCleanup(self.router.stop)
+    
+    def _client(self, token='token_a'):
+        from core.services.github.client import GitHubClient
+        return GitHubClient(token=token)
+    
+    def test_unchanged_issue_served_from_304(self):
+        """The second fetch sends If-None-Match and a 304 returns the cached payload."""
+        import httpx
+        from core.services.github.response_cache import get_conditional_stats
+        
+        route = self.router.get('/repos/o/r/issues/1')
+        route.side_effect = [
+            httpx.Response(200, json={'number': 1, 'title': 'Bug'}, headers={'ETag': '"v1"'}),
+            httpx.Response(304, headers={'x-ratelimit-remaining': '4990', 'x-ratelimit-limit': '5000'}),
+        ]
+        
+        first = self._client().get_issue('o', 'r', 1)
+        second = self._client().get_issue('o', 'r', 1)
+        
+        self.assertEqual(first, second)
+        self.assertNotIn('if-none-match', route.calls[0].request.headers)
+        self.assertEqual(route.calls[1].request.headers['if-none-match'], '"v1"')
+        stats = get_conditional_stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['hit_ratio']), (1, 1, 0.5))
+        self.assertEqual(stats['rate_limit_remaining'], 4990)
+    
+    def test_changed_resource_replaces_entry(self):
+        """A 200 answer to a conditional request updates the cached payload and ETag."""
+        import httpx
+        from core.models import GitHubResponseCache
+        
+        route = self.router.get('/repos/o/r/pulls/2')
+        route.side_effect = [
+            httpx.Response(200, json={'state': 'open'}, headers={'ETag': '"v1"'}),
+            httpx.Response(200, json={'state': 'closed'}, headers={'ETag': '"v2"'}),
+        ]
+        
+        self._client().get_pr('o', 'r', 2)
+        result = self._client().get_pr('o', 'r', 2)
+        
+        self.assertEqual(result, {'state': 'closed'})
+        entry = GitHubResponseCache.objects.get()
+        self.assertEqual(entry.etag, '"v2"')
+        self.assertEqual(entry.payload, {'state': 'closed'})
+    
+    def test_entries_are_separated_by_token_and_accept(self):
+        """Other tokens and Accept headers (timeline preview) never reuse an entry."""
+        import httpx
+        
+        issue = self.router.get('/repos/o/r/issues/3').mock(
+            return_value=httpx.Response(200, json={}, headers={'ETag': '"i"'})
+        )
+        
+        self._client('token_a').get_issue('o', 'r', 3)
+        self._client('token_b').get_issue('o', 'r', 3)
+        
+        self.assertNotIn('if-none-match', issue.calls[1].request.headers)
+    
+    def test_last_modified_validator(self):
+        """Responses without ETag are revalidated with If-Modified-Since."""
+        import httpx
+        
+        stamp = 'Wed, 21 Oct 2026 07:28:00 GMT'
+        route = self.router.get('/repos/o/r/contents/README.md')
+        route.side_effect = [
+            httpx.Response(200, json={'name': 'README.md'}, headers={'Last-Modified': stamp}),
+            httpx.Response(304),
+        ]
+        
+        self._client().get_repository_contents('o', 'r', 'README.md')
+        result = self._client().get_repository_contents('o', 'r', 'README.md')
+        
+        self.assertEqual(result, {'name': 'README.md'})
+        self.assertEqual(route.calls[1].request.headers['if-modified-since'], stamp)
+    
+    def test_cache_can_be_disabled(self):
+        """use_response_cache=False sends plain GETs and stores nothing."""
+        import httpx
+        from core.models import GitHubResponseCache
+        from core.services.github.client import GitHubClient
+        
+        self.router.get('/repos/o/r/issues/4').mock(
+            return_value=httpx.Response(200, json={}, headers={'ETag': '"x"'})
+        )
+        
+        GitHubClient(token='t', use_response_cache=False).get_issue('o', 'r', 4)
+        
+        self.assertFalse(GitHubResponseCache.objects.exists())
+    
+    def test_failed_store_keeps_caller_transaction_usable(self):
+        """A conflicting cache write inside the caller's atomic block is rolled back to a savepoint."""
+        import httpx
+        from unittest.mock import patch
+        from django.db import transaction
+        from core.models import GitHubResponseCache
+        
+        self.router.get('/repos/o/r/issues/5').mock(
+            return_value=httpx.Response(200, json={'number': 5}, headers={'ETag': '"x"'})
+        )
+        GitHubResponseCache.objects.create(cache_key='k' * 64, path='/other', payload={})
+        
+        def insert_duplicate(**kwargs):
+            # Another worker stored the same key between lookup and insert
+            return GitHubResponseCache.objects.create(cache_key='k' * 64, path='/dup', payload={}), True
+        
+        with transaction.atomic():
+            with patch.object(GitHubResponseCache.objects, 'update_or_create', side_effect=insert_duplicate):
+                result = self._client().get_issue('o', 'r', 5)
+            self.assertEqual(GitHubResponseCache.objects.count(), 1)
+        
+        self.assertEqual(result, {'number': 5})
+
+
+
+class RateBudgetTestCase(TestCase):
+    """Test the shared GitHub rate budget token bucket."""
+    
+    def test_unknown_limit_allows_requests(self):
+        """Before GitHub reported a limit, requests are not throttled."""
+        from core.services.github.rate_budget import RateBudget
+        
+        budget = RateBudget(reserve=10)
+        self.assertTrue(all(budget.acquire() for _ in range(50)))
+    
+    def test_reserve_is_kept(self):
+        """Only remaining minus reserve tokens are handed out."""
+        import time
+        from core.services.github.rate_budget import RateBudget
+        
+        budget = RateBudget(reserve=10, max_wait=0)
+        budget.update(remaining=13, reset_at=time.time() + 3600)
+        
+        self.assertEqual([budget.acquire() for _ in range(4)], [True, True, True, False])
+        self.assertTrue(budget.exhausted)
+    
+    def test_waits_for_imminent_reset(self):
+        """An empty bucket waits for a reset within max_wait, then continues."""
+        import time
+        from core.services.github.rate_budget import RateBudget
+        
+        budget = RateBudget(reserve=0, max_wait=5)
+        budget.update(remaining=0, reset_at=time.time() - 1)
+        
+        self.assertTrue(budget.acquire())
+        self.assertFalse(budget.exhausted)
+    
+    @patch('core.services.github.rate_budget.get_conditional_stats')
+    def test_refresh_applies_new_headers_once(self, mock_stats):
+        """Headers are only applied when new responses arrived since the last refresh."""
+        import time
+        from core.services.github.rate_budget import RateBudget
+        
+        mock_stats.return_value = {
+            'hits': 1, 'misses': 0, 'rate_limit_remaining': 3, 'rate_limit_reset': time.time() + 3600,
+        }
+        budget = RateBudget(reserve=0, max_wait=0)
+        budget.refresh()
+        budget.acquire()
+        budget.refresh()
+        
+        self.assertEqual(budget.tokens, 2)
+
+
 if __name__ == '__main__':
     import django
     django.setup()
@@ -4,9 +4,10 @@ Markdown Sync Service
 Synchronizes markdown files from GitHub repositories to Agira project attachments.
 """
 
-import hashlib
 import io
 import logging
+import posixpath
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional, Tuple
 from django.contrib.contenttypes.models import ContentType
 from django.db import transaction
@@ -20,14 +21,19 @@ from core.services.weaviate.service import upsert_instance
 
 logger = logging.getLogger(__name__)
 
+# Parallel downloads of changed markdown blobs per project
+BLOB_FETCH_WORKERS = 8
+
 
 class MarkdownSyncService:
     """
     Service for syncing markdown files from GitHub repositories to Agira.
     
     Handles:
-    - Finding all .md files in a repository
-    - Creating/updating attachments for markdown files
+    - Finding all .md files in a repository (one recursive Git tree request,
+      contents walk as fallback for truncated trees)
+    - Creating/updating attachments for markdown files (only changed blobs
+      are downloaded, in parallel)
     - Tracking versions via GitHub SHA
     - Indexing content in Weaviate
     """
@@ -60,6 +66,9 @@ class MarkdownSyncService:
                 - files_created: Number of new attachments created
                 - files_updated: Number of existing attachments updated
                 - files_skipped: Number of files skipped (no changes)
+                - requests: GitHub requests made
+                - requests_saved: Requests saved compared to a contents walk
+                  (one request per directory)
                 - errors: List of error messages
         """
         stats = {
@@ -67,6 +76,8 @@ class MarkdownSyncService:
             'files_created': 0,
             'files_updated': 0,
             'files_skipped': 0,
+            'requests': 0,
+            'requests_saved': 0,
             'errors': [],
         }
         
@@ -84,20 +95,40 @@ class MarkdownSyncService:
         
         try:
             # Find all markdown files in the repository
-            md_files = self._find_markdown_files(owner, repo, ref=ref)
+            md_files, discovery_requests, directories, from_tree = self._discover_markdown_files(
+                owner, repo, ref=ref,
+            )
             stats['files_found'] = len(md_files)
+            stats['requests'] = discovery_requests
+            stats['requests_saved'] = max(0, directories + 1 - discovery_requests)
             
             logger.info(f"Found {len(md_files)} markdown files in {owner}/{repo}")
             
+            # One query for all attachments of this repository, then download
+            # only new or changed blobs
+            existing = self._load_existing_attachments(project, f"{owner}/{repo}")
+            changed = [
+                file_info for file_info in md_files
+                if file_info['path'] not in existing
+                or existing[file_info['path']].github_sha != file_info['sha']
+            ]
+            contents = self._fetch_contents(owner, repo, changed, ref=ref, use_blobs=from_tree)
+            stats['requests'] += len(changed)
+            
             # Sync each file
             for file_info in md_files:
                 try:
+                    content = contents.get(file_info['path'])
+                    if isinstance(content, Exception):
+                        raise content
                     result = self._sync_markdown_file(
                         project=project,
                         owner=owner,
                         repo=repo,
                         file_info=file_info,
                         ref=ref,
+                        existing_attachments=existing,
+                        content=content,
                     )
                     
                     if result == 'created':
@@ -122,7 +153,8 @@ class MarkdownSyncService:
                 f"{stats['files_created']} created, "
                 f"{stats['files_updated']} updated, "
                 f"{stats['files_skipped']} skipped, "
-                f"{len(stats['errors'])} errors"
+                f"{len(stats['errors'])} errors, "
+                f"{stats['requests']} GitHub requests ({stats['requests_saved']} saved)"
             )
             
         except IntegrationRateLimited:
@@ -135,16 +167,132 @@ class MarkdownSyncService:
 
         return stats
     
+    def _discover_markdown_files(
+        self,
+        owner: str,
+        repo: str,
+        ref: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], int, int, bool]:
+        """
+        Find all .md files with a single recursive Git tree request.
+        
+        Falls back to the contents walk (_find_markdown_files) if GitHub
+        truncated the tree or the tree API is not usable.
+        
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            ref: Git reference
+            
+        Returns:
+            Tuple of (file info list, GitHub requests made, directories in
+            the repository, True if the files came from the Git tree)
+        """
+        try:
+            tree = self.github_client.get_git_tree(owner, repo, ref=ref, recursive=True)
+        except IntegrationRateLimited:
+            raise
+        except Exception as e:
+            logger.warning(f"Git tree request for {owner}/{repo} failed, walking contents instead: {e}")
+            tree = None
+        
+        entries = tree.get('tree') if isinstance(tree, dict) else None
+        if not isinstance(entries, list) or tree.get('truncated'):
+            if isinstance(entries, list):
+                logger.info(f"Git tree of {owner}/{repo} is truncated, walking contents instead")
+            calls = [0]
+            files = self._find_markdown_files(owner, repo, ref=ref, _calls=calls)
+            # Every contents request lists one directory
+            return files, calls[0] + 1, calls[0] - 1, False
+        
+        markdown_files = []
+        directories = 0
+        for entry in entries:
+            entry_path = entry.get('path', '')
+            if entry.get('type') == 'tree':
+                directories += 1
+            elif entry.get('type') == 'blob' and entry_path.lower().endswith('.md'):
+                markdown_files.append({
+                    'path': entry_path,
+                    'sha': entry.get('sha', ''),
+                    'size': entry.get('size', 0),
+                    'name': posixpath.basename(entry_path),
+                })
+        return markdown_files, 1, directories, True
+    
+    def _load_existing_attachments(self, project: Project, repo_identifier: str) -> Dict[str, Attachment]:
+        """
+        Load all attachments of a repository linked to the project in one query.
+        
+        Returns:
+            Mapping of file path in the repository to Attachment
+        """
+        project_ct = ContentType.objects.get_for_model(Project)
+        prefix = f"{repo_identifier}:"
+        attachments = Attachment.objects.filter(
+            links__target_content_type=project_ct,
+            links__target_object_id=project.id,
+            links__role=AttachmentRole.PROJECT_FILE,
+            github_repo_path__startswith=prefix,
+        ).distinct()
+        return {attachment.github_repo_path[len(prefix):]: attachment for attachment in attachments}
+    
+    def _fetch_contents(
+        self,
+        owner: str,
+        repo: str,
+        files: List[Dict[str, Any]],
+        ref: Optional[str] = None,
+        use_blobs: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Download the given files in parallel.
+        
+        With ``use_blobs`` the content is fetched by blob SHA, which pins it
+        to the discovered tree; otherwise through the contents API.
+        
+        Returns:
+            Mapping of path to content bytes, or to the exception raised for it
+            
+        Raises:
+            IntegrationRateLimited: If any download hit the rate limit
+        """
+        def fetch(file_info):
+            if use_blobs and file_info.get('sha'):
+                return self.github_client.get_blob(owner, repo, file_info['sha'])
+            return self.github_client.get_file_content(owner, repo, file_info['path'], ref)
+        
+        if not files:
+            return {}
+        
+        results = {}
+        with ThreadPoolExecutor(max_workers=min(BLOB_FETCH_WORKERS, len(files))) as executor:
+            futures = {file_info['path']: executor.submit(fetch, file_info) for file_info in files}
+            for path, future in futures.items():
+                try:
+                    results[path] = future.result()
+                except Exception as e:
+                    results[path] = e
+        
+        for result in results.values():
+            if isinstance(result, IntegrationRateLimited):
+                raise result
+        return results
+    
     def _find_markdown_files(
         self,
         owner: str,
         repo: str,
         path: str = '',
         ref: Optional[str] = None,
+        _calls: Optional[List[int]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Recursively find all .md files in a GitHub repository.
         
+        Makes one contents request per directory; used as fallback when the
+        recursive Git tree is truncated.
+        
         Args:
             owner: Repository owner
             repo: Repository name
@@ -158,6 +306,8 @@ class MarkdownSyncService:
         
         try:
             # Get contents at current path
+            if _calls is not None:
+                _calls[0] += 1
             contents = self.github_client.get_repository_contents(
                 owner, repo, path, ref
             )
@@ -183,7 +333,7 @@ class MarkdownSyncService:
                     # Recursively search subdirectories
                     try:
                         subdir_files = self._find_markdown_files(
-                            owner, repo, item_path, ref
+                            owner, repo, item_path, ref, _calls=_calls
                         )
                         markdown_files.extend(subdir_files)
                     except IntegrationRateLimited:
@@ -209,6 +359,8 @@ class MarkdownSyncService:
         repo: str,
         file_info: Dict[str, Any],
         ref: Optional[str] = None,
+        existing_attachments: Optional[Dict[str, Attachment]] = None,
+        content: Optional[bytes] = None,
     ) -> str:
         """
         Sync a single markdown file to project attachments.
@@ -219,6 +371,9 @@ class MarkdownSyncService:
             repo: Repository name
             file_info: File metadata from GitHub (path, sha, size, name)
             ref: Git reference
+            existing_attachments: Preloaded {path: Attachment} map of the
+                repository; looked up per file if omitted
+            content: Prefetched file content; downloaded if omitted
             
         Returns:
             'created', 'updated', or 'skipped'
@@ -231,9 +386,12 @@ class MarkdownSyncService:
         repo_identifier = f"{owner}/{repo}"
         
         # Check if attachment already exists
-        existing_attachment = self._find_existing_attachment(
-            project, repo_identifier, file_path
-        )
+        if existing_attachments is not None:
+            existing_attachment = existing_attachments.get(file_path)
+        else:
+            existing_attachment = self._find_existing_attachment(
+                project, repo_identifier, file_path
+            )
         
         if existing_attachment:
             # Check if file has changed
@@ -244,14 +402,14 @@ class MarkdownSyncService:
             # File has changed, update it
             logger.info(f"Updating changed file: {file_path}")
             self._update_attachment(
-                existing_attachment, owner, repo, file_path, github_sha, ref
+                existing_attachment, owner, repo, file_path, github_sha, ref, content=content
             )
             return 'updated'
         else:
             # New file, create attachment
             logger.info(f"Creating new attachment for: {file_path}")
             self._create_attachment(
-                project, owner, repo, file_path, github_sha, file_name, ref
+                project, owner, repo, file_path, github_sha, file_name, ref, content=content
             )
             return 'created'
     
@@ -302,6 +460,7 @@ class MarkdownSyncService:
         github_sha: str,
         file_name: str,
         ref: Optional[str] = None,
+        content: Optional[bytes] = None,
     ) -> Attachment:
         """
         Create new attachment for a GitHub markdown file.
@@ -314,12 +473,14 @@ class MarkdownSyncService:
             github_sha: GitHub blob SHA
             file_name: File name
             ref: Git reference
+            content: Prefetched file content; downloaded if omitted
             
         Returns:
             Created Attachment instance
         """
         # Download file content
-        content = self.github_client.get_file_content(owner, repo, file_path, ref)
+        if content is None:
+            content = self.github_client.get_file_content(owner, repo, file_path, ref)
         
         # Create a file-like object
         file_obj = io.BytesIO(content)
@@ -363,6 +524,7 @@ class MarkdownSyncService:
         file_path: str,
         github_sha: str,
         ref: Optional[str] = None,
+        content: Optional[bytes] = None,
     ) -> None:
         """
         Update existing attachment with new content from GitHub.
@@ -374,29 +536,19 @@ class MarkdownSyncService:
             file_path: File path in repository
             github_sha: New GitHub blob SHA
             ref: Git reference
+            content: Prefetched file content; downloaded if omitted
         """
         # Download new content
-        content = self.github_client.get_file_content(owner, repo, file_path, ref)
-        
-        # Get absolute path to existing file
-        file_path_abs = self.storage_service.get_file_path(attachment)
+        if content is None:
+            content = self.github_client.get_file_content(owner, repo, file_path, ref)
         
-        # Write new content
-        with open(file_path_abs, 'wb') as f:
-            f.write(content)
+        # Store new content (as a new blob; the file may be shared with other attachments)
+        self.storage_service.replace_content(attachment, content)
         
         # Update metadata
-        attachment.size_bytes = len(content)
         attachment.github_sha = github_sha
         attachment.github_last_synced = timezone.now()
-        
-        # Recompute hash
-        sha256_hash = hashlib.sha256(content).hexdigest()
-        attachment.sha256 = sha256_hash
-        
-        attachment.save(update_fields=[
-            'size_bytes', 'github_sha', 'github_last_synced', 'sha256'
-        ])
+        attachment.save(update_fields=['github_sha', 'github_last_synced'])
         
         logger.info(f"Updated attachment {attachment.id} for {file_path}")
         
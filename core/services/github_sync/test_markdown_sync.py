@@ -79,6 +79,24 @@ class GitHubClientRepoContentTestCase(TestCase):
         
         self.assertEqual(result, content)
         mock_get.assert_called_once()
+    
+    @patch('core.services.github.client.HTTPClient.get')
+    def test_get_git_tree_recursive(self, mock_get):
+        """Test that the tree of the default branch is requested recursively."""
+        mock_get.return_value = {'sha': 't1', 'tree': [], 'truncated': False}
+        
+        self.client.get_git_tree('owner', 'repo')
+        
+        mock_get.assert_called_once_with('/repos/owner/repo/git/trees/HEAD', params={'recursive': '1'})
+    
+    @patch('core.services.github.client.HTTPClient.get')
+    def test_get_blob_decodes_base64(self, mock_get):
+        """Test that blob content is decoded and fetched without the conditional cache."""
+        content = b"# Blob\n"
+        mock_get.return_value = {'content': base64.b64encode(content).decode(), 'encoding': 'base64'}
+        
+        self.assertEqual(self.client.get_blob('owner', 'repo', 'abc'), content)
+        mock_get.assert_called_once_with('/repos/owner/repo/git/blobs/abc', conditional=False)
 
 
 class MarkdownSyncServiceTestCase(TestCase):
@@ -303,3 +321,96 @@ class MarkdownSyncServiceTestCase(TestCase):
 
         with self.assertRaises(IntegrationRateLimited):
             self.service.sync_project_markdown_files(self.project)
+
+
+class MarkdownTreeDiscoveryTestCase(TestCase):
+    """Test Git tree based markdown discovery and selective blob downloads."""
+    
+    def setUp(self):
+        self.project = Project.objects.create(
+            name='Tree Project',
+            github_owner='testowner',
+            github_repo='testrepo',
+        )
+        self.mock_client = MagicMock(spec=GitHubClient)
+        self.service = MarkdownSyncService(github_client=self.mock_client)
+        self.mock_client.get_git_tree.return_value = {
+            'sha': 'root',
+            'truncated': False,
+            'tree': [
+                {'path': 'README.md', 'type': 'blob', 'sha': 'sha-readme', 'size': 10},
+                {'path': 'docs', 'type': 'tree', 'sha': 'sha-docs'},
+                {'path': 'docs/api', 'type': 'tree', 'sha': 'sha-api'},
+                {'path': 'docs/api/guide.MD', 'type': 'blob', 'sha': 'sha-guide', 'size': 20},
+                {'path': 'setup.py', 'type': 'blob', 'sha': 'sha-setup', 'size': 30},
+            ],
+        }
+        self.mock_client.get_blob.side_effect = lambda owner, repo, sha: f"# {sha}".encode()
+    
+    def _existing(self, path, sha):
+        from core.services.storage.service import AttachmentStorageService
+        file_obj = io.BytesIO(b"# old")
+        file_obj.name = path.rsplit('/', 1)[-1]
+        attachment = AttachmentStorageService().store_attachment(file=file_obj, target=self.project, created_by=None)
+        attachment.github_repo_path = f'testowner/testrepo:{path}'
+        attachment.github_sha = sha
+        attachment.save()
+        return attachment
+    
+    @patch('core.services.github_sync.markdown_sync.upsert_instance')
+    def test_single_tree_request_and_only_changed_blobs(self, mock_upsert):
+        """One tree request replaces the contents walk; unchanged files are not downloaded."""
+        self._existing('README.md', 'sha-readme')
+        
+        with patch.object(MarkdownSyncService, '_find_existing_attachment') as mock_lookup:
+            stats = self.service.sync_project_markdown_files(self.project)
+        
+        mock_lookup.assert_not_called()
+        self.mock_client.get_repository_contents.assert_not_called()
+        self.mock_client.get_blob.assert_called_once_with('testowner', 'testrepo', 'sha-guide')
+        self.assertEqual(stats['files_found'], 2)
+        self.assertEqual(stats['files_created'], 1)
+        self.assertEqual(stats['files_skipped'], 1)
+        # 1 tree + 1 blob; a contents walk would have needed 3 listings
+        self.assertEqual(stats['requests'], 2)
+        self.assertEqual(stats['requests_saved'], 2)
+        created = Attachment.objects.get(github_repo_path='testowner/testrepo:docs/api/guide.MD')
+        self.assertEqual(created.original_name, 'guide.MD')
+        self.assertEqual(created.github_sha, 'sha-guide')
+    
+    @patch('core.services.github_sync.markdown_sync.upsert_instance')
+    def test_changed_file_updated_from_blob(self, mock_upsert):
+        """Changed files are updated with the content of their new blob."""
+        attachment = self._existing('README.md', 'sha-old')
+        
+        stats = self.service.sync_project_markdown_files(self.project)
+        
+        self.assertEqual(stats['files_updated'], 1)
+        attachment.refresh_from_db()
+        self.assertEqual(attachment.github_sha, 'sha-readme')
+        self.assertEqual(attachment.size_bytes, len(b"# sha-readme"))
+    
+    @patch('core.services.github_sync.markdown_sync.upsert_instance')
+    def test_truncated_tree_falls_back_to_contents_walk(self, mock_upsert):
+        """A truncated tree is discarded in favour of the per-directory contents walk."""
+        self.mock_client.get_git_tree.return_value['truncated'] = True
+        self.mock_client.get_repository_contents.return_value = [
+            {'type': 'file', 'name': 'README.md', 'path': 'README.md', 'sha': 'sha-readme', 'size': 10},
+        ]
+        self.mock_client.get_file_content.return_value = b"# readme"
+        
+        stats = self.service.sync_project_markdown_files(self.project)
+        
+        self.mock_client.get_repository_contents.assert_called_once()
+        self.mock_client.get_blob.assert_not_called()
+        self.assertEqual(stats['files_created'], 1)
+        self.assertEqual(stats['requests_saved'], 0)
+    
+    def test_rate_limit_during_blob_download_propagates(self):
+        """A rate limit while downloading blobs aborts the project."""
+        from core.services.integrations.errors import IntegrationRateLimited
+        
+        self.mock_client.get_blob.side_effect = IntegrationRateLimited("Rate limit exceeded")
+        
+        with self.assertRaises(IntegrationRateLimited):
+            self.service.sync_project_markdown_files(self.project)
@@ -34,7 +34,7 @@ from core.models import (
 from core.services.config import get_graph_config
 from core.services.exceptions import ServiceNotConfigured, ServiceDisabled, ServiceError
 from core.services.graph.client import get_client
-from core.services.agents.agent_service import AgentService
+from core.services.agents.agent_service import get_agent_service
 from core.services.storage import AttachmentStorageService
 
 logger = logging.getLogger(__name__)
@@ -98,7 +98,7 @@ class EmailIngestionService:
             )
         
         self.client = get_client()
-        self.agent_service = AgentService()
+        self.agent_service = get_agent_service()
         self.mailbox = self.config.default_mail_sender
         self.storage_service = AttachmentStorageService()
     
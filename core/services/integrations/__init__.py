@@ -23,7 +23,7 @@ from .errors import (
     IntegrationPermanentError,
 )
 from .base import BaseIntegration, IntegrationBase
-from .http import HTTPClient
+from .http import HTTPClient, get_http_metrics, reset_http_clients
 
 __all__ = [
     # Exceptions
@@ -39,4 +39,6 @@ __all__ = [
     'BaseIntegration',
     'IntegrationBase',  # Backward compatibility
     'HTTPClient',
+    'get_http_metrics',
+    'reset_http_clients',
 ]
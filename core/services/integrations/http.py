@@ -13,14 +13,26 @@ Retry Strategy:
 - Exponential backoff: 0.5s, 1s, 2s
 - Retries on: timeouts, connection errors, 429, 5xx
 - No retry on: 4xx (except 429), validation errors
+
+Connection Pooling:
+- One long-lived httpx.Client per origin (scheme + host + port), shared by
+  all HTTPClient instances and threads of the process
+- Keep-alive and pool limits from INTEGRATION_HTTP_* settings, optional
+  HTTP/2 when the ``h2`` package is installed
+- Per-host metrics (connection reuse, latency histogram, retries) via
+  get_http_metrics()
 """
 
 import logging
+import os
+import threading
 import time
-from typing import Optional, Dict, Any, Union
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Any, List, Tuple, Union
 from urllib.parse import urljoin, urlparse
 
 import httpx
+from django.conf import settings
 
 from .errors import (
     IntegrationError,
@@ -35,6 +47,133 @@ logger = logging.getLogger(__name__)
 # Maximum response text length to include in error messages
 MAX_ERROR_RESPONSE_LENGTH = 500
 
+# Upper bounds (ms) of the request latency histogram buckets; the last bucket is open
+LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000)
+
+
+@dataclass
+class HostMetrics:
+    """Request metrics for one origin."""
+    requests: int = 0
+    new_connections: int = 0
+    retries: int = 0
+    errors: int = 0
+    total_ms: float = 0.0
+    latency_buckets: List[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1))
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def observe(self, elapsed_ms: float, new_connection: bool) -> None:
+        """Record one completed request."""
+        with self._lock:
+            self.requests += 1
+            self.total_ms += elapsed_ms
+            if new_connection:
+                self.new_connections += 1
+            for index, bound in enumerate(LATENCY_BUCKETS_MS):
+                if elapsed_ms <= bound:
+                    self.latency_buckets[index] += 1
+                    break
+            else:
+                self.latency_buckets[-1] += 1
+
+    def count(self, counter: str) -> None:
+        """Increment the retries or errors counter."""
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def as_dict(self) -> Dict[str, Any]:
+        reused = self.requests - self.new_connections
+        labels = [f"<={bound}ms" for bound in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}ms"]
+        return {
+            'requests': self.requests,
+            'new_connections': self.new_connections,
+            'reuse_ratio': round(reused / self.requests, 3) if self.requests else 0.0,
+            'retries': self.retries,
+            'errors': self.errors,
+            'avg_ms': round(self.total_ms / self.requests, 1) if self.requests else 0.0,
+            'latency_histogram': dict(zip(labels, self.latency_buckets)),
+        }
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class _ClientRegistry:
+    """Process-wide httpx.Client instances and metrics, keyed by origin."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._clients: Dict[Tuple[str, bool], httpx.Client] = {}
+        self._metrics: Dict[str, HostMetrics] = {}
+        self._pid = os.getpid()
+
+    def _check_fork(self) -> None:
+        # Sockets must not be shared with a forked child (e.g. gunicorn workers)
+        if self._pid != os.getpid():
+            self._clients = {}
+            self._metrics = {}
+            self._pid = os.getpid()
+
+    def get_client(self, origin: str, http2: bool) -> httpx.Client:
+        with self._lock:
+            self._check_fork()
+            key = (origin, http2)
+            client = self._clients.get(key)
+            if client is None:
+                limits = httpx.Limits(
+                    max_connections=getattr(settings, 'INTEGRATION_HTTP_MAX_CONNECTIONS', 20),
+                    max_keepalive_connections=getattr(settings, 'INTEGRATION_HTTP_MAX_KEEPALIVE_CONNECTIONS', 10),
+                    keepalive_expiry=getattr(settings, 'INTEGRATION_HTTP_KEEPALIVE_EXPIRY', 30.0),
+                )
+                client = httpx.Client(limits=limits, http2=http2)
+                self._clients[key] = client
+                logger.debug(f"Opened pooled HTTP client for {origin} (http2={http2})")
+            return client
+
+    def metrics_for(self, origin: str) -> HostMetrics:
+        with self._lock:
+            self._check_fork()
+            return self._metrics.setdefault(origin, HostMetrics())
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {origin: metrics.as_dict() for origin, metrics in self._metrics.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            clients, self._clients = self._clients, {}
+            self._metrics = {}
+        for client in clients.values():
+            try:
+                client.close()
+            except Exception as e:
+                logger.debug(f"Error closing pooled HTTP client: {e}")
+
+
+_registry = _ClientRegistry()
+
+
+def get_http_metrics() -> Dict[str, Dict[str, Any]]:
+    """
+    Per-origin metrics of the pooled integration HTTP clients.
+
+    Returns:
+        Mapping of origin (e.g. "https://api.github.com") to a dict with
+        requests, new_connections, reuse_ratio, retries, errors, avg_ms and
+        latency_histogram
+    """
+    return _registry.snapshot()
+
+
+def reset_http_clients() -> None:
+    """Close all pooled integration HTTP clients and clear their metrics."""
+    _registry.reset()
+
 
 class HTTPClient:
     """
@@ -53,6 +192,8 @@ class HTTPClient:
         headers: Optional[Dict[str, str]] = None,
         timeout: float = 30.0,
         max_retries: int = 3,
+        http2: Optional[bool] = None,
+        response_cache=None,
     ):
         """
         Initialize HTTP client.
@@ -62,11 +203,22 @@ class HTTPClient:
             headers: Default headers to include in all requests
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts
+            http2: Use HTTP/2 (default: INTEGRATION_HTTP2 setting). Ignored
+                   when the h2 package is not installed.
+            response_cache: Optional validator cache for conditional GETs.
+                   Must provide ``lookup(path, params, headers)`` returning an
+                   entry with ``etag``, ``last_modified`` and ``payload`` (or
+                   None), ``hit(entry, response)`` and
+                   ``store(path, params, headers, response, payload)``.
         """
         self.base_url = base_url
         self.default_headers = headers or {}
         self.timeout = timeout
         self.max_retries = max_retries
+        if http2 is None:
+            http2 = getattr(settings, 'INTEGRATION_HTTP2', False)
+        self.http2 = bool(http2) and _http2_available()
+        self.response_cache = response_cache
     
     def _sanitize_headers(self, headers: Dict[str, str]) -> Dict[str, str]:
         """
@@ -299,31 +451,48 @@ class HTTPClient:
             f"{method} {parsed.scheme}://{parsed.netloc}{parsed.path}"
         )
         
+        origin = f"{parsed.scheme}://{parsed.netloc}"
+        client = _registry.get_client(origin, self.http2)
+        metrics = _registry.metrics_for(origin)
+        
         # Retry logic
         last_exception = None
         for attempt in range(self.max_retries):
+            connected = []
+            
+            def trace(event_name, info):
+                # httpcore reports a TCP connect only for connections it had to open
+                if event_name == 'connection.connect_tcp.complete':
+                    connected.append(True)
+            
+            started = time.perf_counter()
             try:
-                with httpx.Client(timeout=self.timeout) as client:
-                    response = client.request(
-                        method=method,
-                        url=url,
-                        headers=request_headers,
-                        params=params,
-                        json=json,
-                        data=data,
-                    )
-                    
-                    # Check for HTTP errors
-                    if response.status_code >= 400:
-                        self._handle_response_error(response)
-                    
-                    return response
+                response = client.request(
+                    method=method,
+                    url=url,
+                    headers=request_headers,
+                    params=params,
+                    json=json,
+                    data=data,
+                    timeout=self.timeout,
+                    extensions={'trace': trace},
+                )
+                metrics.observe((time.perf_counter() - started) * 1000, bool(connected))
+                
+                # Check for HTTP errors
+                if response.status_code >= 400:
+                    self._handle_response_error(response)
+                
+                return response
                     
             except Exception as e:
                 last_exception = e
+                if not isinstance(e, IntegrationError):
+                    metrics.count('errors')
                 
                 # Check if we should retry
                 if self._should_retry(e, attempt):
+                    metrics.count('retries')
                     # Get backoff time
                     retry_after = None
                     if isinstance(e, IntegrationRateLimited):
@@ -429,10 +598,38 @@ class HTTPClient:
         path: str,
         headers: Optional[Dict[str, str]] = None,
         params: Optional[Dict[str, Any]] = None,
+        conditional: bool = True,
     ) -> Dict[str, Any]:
-        """Make GET request and return JSON response."""
-        response = self._request('GET', path, headers=headers, params=params)
-        return response.json()
+        """
+        Make GET request and return JSON response.
+        
+        With a response_cache, the request carries If-None-Match /
+        If-Modified-Since from the last response and a 304 answer is served
+        from the cached payload. Pass ``conditional=False`` for immutable
+        resources that are not worth caching.
+        """
+        cache = self.response_cache if conditional else None
+        if cache is None:
+            response = self._request('GET', path, headers=headers, params=params)
+            return response.json()
+        
+        cache_headers = {**self.default_headers, **(headers or {})}
+        entry = cache.lookup(path, params, cache_headers)
+        request_headers = dict(headers or {})
+        if entry is not None:
+            if entry.etag:
+                request_headers['If-None-Match'] = entry.etag
+            if entry.last_modified:
+                request_headers['If-Modified-Since'] = entry.last_modified
+        
+        response = self._request('GET', path, headers=request_headers, params=params)
+        if response.status_code == 304 and entry is not None:
+            cache.hit(entry, response)
+            return entry.payload
+        
+        payload = response.json()
+        cache.store(path, params, cache_headers, response, payload)
+        return payload
     
     def post(
         self,
@@ -19,6 +19,8 @@ from core.services.integrations import (
     # Classes
     BaseIntegration,
     HTTPClient,
+    get_http_metrics,
+    reset_http_clients,
 )
 from core.models import GitHubConfiguration
 
@@ -472,3 +474,75 @@ class HTTPClientTestCase(TestCase):
         self.assertGreater(elapsed, 1.4)
         self.assertLess(elapsed, 2.0)
         self.assertEqual(result, {"status": "ok"})
+
+
+class HTTPClientPoolTestCase(TestCase):
+    """Test cases for the shared connection pool of HTTPClient."""
+    
+    def setUp(self):
+        self.base_url = "https://api.example.com"
+        reset_http_clients()
+        self.addCleanup(reset_http_clients)
+        # respx stands in for the remote hosts; started here because the
+        # class decorator form does not keep TestCase subclasses intact
+        respx.start()
+        self.addCleanup(respx.stop)
+        self.addCleanup(respx.clear)
+    
+    def test_clients_share_one_pooled_client_per_origin(self):
+        """Requests to the same origin reuse one httpx.Client across HTTPClient instances."""
+        respx.get(f"{self.base_url}/test").mock(return_value=httpx.Response(200, json={}))
+        respx.get("https://other.example.com/test").mock(return_value=httpx.Response(200, json={}))
+        
+        with patch('core.services.integrations.http.httpx.Client', wraps=httpx.Client) as client_class:
+            for _ in range(5):
+                HTTPClient(base_url=self.base_url, timeout=5.0).get("/test")
+            HTTPClient(base_url=f"{self.base_url}/v2").get("/test")
+            HTTPClient(base_url="https://other.example.com").get("/test")
+        
+        self.assertEqual(client_class.call_count, 2)
+    
+    def test_per_request_timeout(self):
+        """The instance timeout is applied per request on the shared client."""
+        route = respx.get(f"{self.base_url}/test").mock(return_value=httpx.Response(200, json={}))
+        
+        HTTPClient(base_url=self.base_url, timeout=7.0).get("/test")
+        
+        self.assertEqual(route.calls.last.request.extensions['timeout']['read'], 7.0)
+    
+    def test_limits_from_settings(self):
+        """Pool limits are read from the INTEGRATION_HTTP_* settings."""
+        respx.get(f"{self.base_url}/test").mock(return_value=httpx.Response(200, json={}))
+        
+        with self.settings(INTEGRATION_HTTP_MAX_CONNECTIONS=3, INTEGRATION_HTTP_MAX_KEEPALIVE_CONNECTIONS=2):
+            with patch('core.services.integrations.http.httpx.Client', wraps=httpx.Client) as client_class:
+                HTTPClient(base_url=self.base_url).get("/test")
+        
+        limits = client_class.call_args.kwargs['limits']
+        self.assertEqual(limits.max_connections, 3)
+        self.assertEqual(limits.max_keepalive_connections, 2)
+    
+    @patch('core.services.integrations.http.time.sleep')
+    def test_metrics_count_requests_retries_and_latency(self, mock_sleep):
+        """Per-host metrics record requests, retries and the latency histogram."""
+        route = respx.get(f"{self.base_url}/test")
+        route.side_effect = [
+            httpx.Response(503, text="Unavailable"),
+            httpx.Response(200, json={"status": "ok"}),
+        ]
+        
+        HTTPClient(base_url=self.base_url).get("/test")
+        
+        metrics = get_http_metrics()[self.base_url]
+        self.assertEqual(metrics['requests'], 2)
+        self.assertEqual(metrics['retries'], 1)
+        self.assertEqual(sum(metrics['latency_histogram'].values()), 2)
+        # The respx stand-in never opens sockets, so every request counts as reused
+        self.assertEqual(metrics['reuse_ratio'], 1.0)
+    
+    def test_http2_ignored_without_h2(self):
+        """HTTP/2 is only enabled when the h2 package is installed."""
+        with patch('core.services.integrations.http._http2_available', return_value=False):
+            self.assertFalse(HTTPClient(base_url=self.base_url, http2=True).http2)
+        with patch('core.services.integrations.http._http2_available', return_value=True):
+            self.assertTrue(HTTPClient(base_url=self.base_url, http2=True).http2)
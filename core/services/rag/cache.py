@@ -0,0 +1,224 @@
+"""
+Redis-backed result cache for the extended RAG pipeline.
+
+Building an ExtendedRAGContext costs one question-optimization agent call and
+two Weaviate searches. FirstAID chats, the item RAG button, the CustomGPT
+context API and the open-question answerer ask for the same contexts over and
+over, so finished contexts are cached here.
+
+Cache keys contain the normalized query, the filters, the content length and
+index generation counters:
+
+- ``ragctx:gen:<project_id>`` is incremented whenever an object of that
+  project is written to Weaviate.
+- ``ragctx:gen:all`` is incremented on every write and versions queries
+  without a project filter.
+- ``ragctx:gen:epoch`` is incremented on deletes, whose project is no longer
+  known, and versions every key.
+
+Bumping a counter makes all older entries unreachable; they expire via TTL.
+Like AgentCacheService, every Redis failure is treated as a cache miss.
+"""
+
+import hashlib
+import json
+import logging
+import re
+from typing import Any, Dict, Iterable, List, Optional
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = 'ragctx'
+GENERATION_ALL = 'all'
+GENERATION_EPOCH = 'epoch'
+STATS_KEY = f'{KEY_PREFIX}:stats'
+
+# Bump to drop all entries when the cached structure changes
+CACHE_FORMAT_VERSION = 1
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a query for cache keys (case and whitespace insensitive)."""
+    return _WHITESPACE_RE.sub(' ', (query or '').strip()).lower()
+
+
+class RAGResultCache:
+    """
+    Cache for ExtendedRAGContext results in Redis.
+
+    Uses the shared Redis connection pool of the agent response cache and
+    is additionally controlled by RAG_CACHE_ENABLED and RAG_CACHE_TTL_SECONDS.
+    """
+
+    def __init__(self):
+        """Initialize the cache with a Redis connection."""
+        self._redis_client = None
+        self._cache_enabled = settings.REDIS_CACHE_ENABLED and getattr(settings, 'RAG_CACHE_ENABLED', True)
+        self.ttl_seconds = int(getattr(settings, 'RAG_CACHE_TTL_SECONDS', 3600))
+
+        if self._cache_enabled:
+            try:
+                import redis
+                from core.services.agents.cache import get_redis_connection_pool
+                self._redis_client = redis.Redis(connection_pool=get_redis_connection_pool())
+                self._redis_client.ping()
+            except Exception as e:
+                logger.warning(f"Failed to connect to Redis for RAG cache: {e}. RAG cache will be disabled.")
+                self._redis_client = None
+                self._cache_enabled = False
+
+    @property
+    def enabled(self) -> bool:
+        """True if the cache is enabled and connected."""
+        return self._cache_enabled and self._redis_client is not None
+
+    def _generation_keys(self, project_id: Optional[str]) -> List[str]:
+        scope = str(project_id) if project_id else GENERATION_ALL
+        return [f'{KEY_PREFIX}:gen:{scope}', f'{KEY_PREFIX}:gen:{GENERATION_EPOCH}']
+
+    def build_key(
+        self,
+        *,
+        query: str,
+        project_id: Optional[str] = None,
+        current_item_id: Optional[str] = None,
+        object_types: Optional[List[str]] = None,
+        content_length: Optional[int] = None,
+        skip_optimization: bool = False,
+        include_debug: bool = False,
+    ) -> Optional[str]:
+        """
+        Build the cache key for a pipeline call.
+
+        Returns:
+            Cache key, or None if the cache is unavailable
+        """
+        if not self.enabled:
+            return None
+        try:
+            generations = self._redis_client.mget(self._generation_keys(project_id))
+        except Exception as e:
+            logger.warning(f"Redis MGET error for RAG cache generations: {e}. Treating as cache miss.")
+            return None
+
+        fingerprint = json.dumps({
+            'query': normalize_query(query),
+            'current_item_id': str(current_item_id) if current_item_id else None,
+            'object_types': sorted(object_types) if object_types else None,
+            'content_length': content_length,
+            'skip_optimization': bool(skip_optimization),
+            'include_debug': bool(include_debug),
+        }, sort_keys=True)
+        digest = hashlib.sha256(fingerprint.encode('utf-8')).hexdigest()
+        gen = '.'.join(str(g or 0) for g in generations)
+        return f"{KEY_PREFIX}:v{CACHE_FORMAT_VERSION}:{project_id or '*'}:g{gen}:{digest}"
+
+    def get(self, cache_key: Optional[str]) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached context and count the hit or miss.
+
+        Returns:
+            Cached ExtendedRAGContext.to_dict() payload, or None
+        """
+        if not cache_key or not self.enabled:
+            return None
+        try:
+            cached_value = self._redis_client.get(cache_key)
+            self._redis_client.hincrby(STATS_KEY, 'hits' if cached_value else 'misses', 1)
+        except Exception as e:
+            logger.warning(f"Redis GET error for RAG cache key {cache_key}: {e}. Treating as cache miss.")
+            return None
+        if not cached_value:
+            return None
+        try:
+            return json.loads(cached_value)
+        except ValueError:
+            return None
+
+    def set(self, cache_key: Optional[str], payload: Dict[str, Any]) -> bool:
+        """Store a context payload with the configured TTL."""
+        if not cache_key or not self.enabled:
+            return False
+        try:
+            self._redis_client.setex(cache_key, self.ttl_seconds, json.dumps(payload, default=str))
+            return True
+        except Exception as e:
+            logger.warning(f"Redis SET error for RAG cache key {cache_key}: {e}")
+            return False
+
+    def bump_generation(self, project_ids: Optional[Iterable] = None) -> None:
+        """
+        Invalidate cached contexts after Weaviate writes.
+
+        Args:
+            project_ids: Projects whose objects changed. None means the
+                projects are unknown (e.g. deletes) and invalidates everything.
+        """
+        if not self.enabled:
+            return
+        try:
+            pipe = self._redis_client.pipeline(transaction=False)
+            if project_ids is None:
+                pipe.incr(f'{KEY_PREFIX}:gen:{GENERATION_EPOCH}')
+            else:
+                for project_id in {str(p) for p in project_ids if p}:
+                    pipe.incr(f'{KEY_PREFIX}:gen:{project_id}')
+                pipe.incr(f'{KEY_PREFIX}:gen:{GENERATION_ALL}')
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Redis error while bumping RAG cache generation: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Hit/miss counters since the counters were last reset.
+
+        Returns:
+            Dictionary with enabled, hits, misses and hit_rate (percent or None)
+        """
+        stats = {'enabled': self.enabled, 'hits': 0, 'misses': 0, 'hit_rate': None}
+        if not self.enabled:
+            return stats
+        try:
+            raw = self._redis_client.hgetall(STATS_KEY) or {}
+        except Exception as e:
+            logger.warning(f"Redis error while reading RAG cache stats: {e}")
+            return stats
+        stats['hits'] = int(raw.get('hits', 0))
+        stats['misses'] = int(raw.get('misses', 0))
+        total = stats['hits'] + stats['misses']
+        if total:
+            stats['hit_rate'] = round(100.0 * stats['hits'] / total, 1)
+        return stats
+
+
+_rag_cache: Optional[RAGResultCache] = None
+
+
+def get_rag_cache() -> RAGResultCache:
+    """Return the process-wide RAG result cache (connects on first use)."""
+    global _rag_cache
+    if _rag_cache is None:
+        _rag_cache = RAGResultCache()
+    return _rag_cache
+
+
+def reset_rag_cache() -> None:
+    """Forget the process-wide cache instance (e.g. after settings changed)."""
+    global _rag_cache
+    _rag_cache = None
+
+
+def bump_index_generation(project_ids: Optional[Iterable] = None) -> None:
+    """
+    Invalidate cached RAG contexts after objects were written to Weaviate.
+
+    Never raises, so callers on the indexing path can call it unguarded.
+    """
+    try:
+        get_rag_cache().bump_generation(project_ids)
+    except Exception as e:
+        logger.warning(f"Could not bump RAG cache generation: {e}")
@@ -12,15 +12,19 @@ import json
 import logging
 import os
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List, Dict, Any, Tuple
 from dataclasses import dataclass, field
 
-from core.services.agents.agent_service import AgentService
-from core.services.weaviate.client import get_client, is_available
+from core.services.agents.agent_service import get_agent_service
+from core.services.weaviate.chunking import result_type, with_chunk_types
+from core.services.weaviate.client import pooled_client, is_available
 from core.services.weaviate.schema import COLLECTION_NAME
 from core.services.exceptions import ServiceDisabled
 from weaviate.classes.query import Filter, HybridFusion, MetadataQuery
 
+from .cache import get_rag_cache
 from .models import RAGContextObject
 from .config import (
     FIELD_MAPPING, MAX_CONTENT_LENGTH, TYPE_PRIORITY, ALLOWED_OBJECT_TYPES,
@@ -61,6 +65,15 @@ if not rag_logger.handlers:
     file_handler.setFormatter(formatter)
     rag_logger.addHandler(file_handler)
 
+# Worker threads for running the semantic and keyword searches of one request
+# side by side. The searches are I/O-bound, so a few threads serve many requests.
+_search_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="rag-search")
+
+
+def _elapsed_ms(started: float) -> float:
+    """Milliseconds since a time.perf_counter() reading, rounded for stats."""
+    return round((time.perf_counter() - started) * 1000, 1)
+
 
 @dataclass
 class OptimizedQuery:
@@ -106,6 +119,11 @@ class OptimizedQuery:
             'followup_questions': self.followup_questions,
             'raw_response': self.raw_response,
         }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'OptimizedQuery':
+        """Rebuild an optimized query from to_dict() output."""
+        return cls(**data)
 
 
 @dataclass
@@ -153,6 +171,25 @@ class ExtendedRAGContext:
             'debug': self.debug,
         }
     
+    @classmethod
+    def from_dict(cls, data: dict) -> 'ExtendedRAGContext':
+        """Rebuild a context from to_dict() output (e.g. from the RAG cache)."""
+        def objects(key):
+            return [RAGContextObject.from_dict(obj) for obj in data.get(key) or []]
+        
+        optimized = data.get('optimized_query')
+        return cls(
+            query=data['query'],
+            optimized_query=OptimizedQuery.from_dict(optimized) if optimized else None,
+            layer_a=objects('layer_a'),
+            layer_b=objects('layer_b'),
+            layer_c=objects('layer_c'),
+            all_items=objects('all_items'),
+            summary=data.get('summary', ''),
+            stats=data.get('stats') or {},
+            debug=data.get('debug'),
+        )
+    
     def to_context_text(self) -> str:
         """
         Generate LLM-friendly context text with A/B/C layer markers.
@@ -532,7 +569,7 @@ class ExtendedRAGPipelineService:
         """
         rag_logger.info(f"Starting question optimization for query: {query[:100]}...")
         try:
-            agent_service = AgentService()
+            agent_service = get_agent_service()
             response = agent_service.execute_agent(
                 filename='question-optimization-agent.yml',
                 input_text=query,
@@ -645,7 +682,8 @@ class ExtendedRAGPipelineService:
         item_id: Optional[str] = None,
         current_item_id: Optional[str] = None,
         object_types: Optional[List[str]] = None,
-        limit: int = 24
+        limit: int = 24,
+        client=None,
     ) -> List[Dict[str, Any]]:
         """
         Perform a single Weaviate hybrid search.
@@ -661,6 +699,9 @@ class ExtendedRAGPipelineService:
             object_types: Optional type filter (e.g., ["item", "github_issue", "github_pr", "file"]).
                          If None, defaults to ALLOWED_OBJECT_TYPES (item, github_issue, github_pr, file)
             limit: Maximum results
+            client: Optional connected Weaviate client to run the query on. Lets
+                    concurrent searches of one request share a pooled connection;
+                    availability is assumed to be checked by the caller.
             
         Returns:
             List of result dictionaries
@@ -674,122 +715,180 @@ class ExtendedRAGPipelineService:
         
         rag_logger.info(f"Starting search: query='{query_text[:50]}...', alpha={alpha}, project_id={project_id}, current_item_id={current_item_id}, limit={limit}")
         
-        if not is_available():
-            logger.warning("Weaviate is not available")
-            rag_logger.warning("Search aborted: Weaviate not available")
-            return []
-        
         try:
-            client = get_client()
-            try:
-                collection = client.collections.get(COLLECTION_NAME)
-                
-                # Build filters
-                where_filter = None
-                filter_details = []
-                
-                # Default to ALLOWED_OBJECT_TYPES if not specified (Issue #392)
-                if object_types is None:
-                    object_types = ALLOWED_OBJECT_TYPES
-                
-                if project_id:
-                    where_filter = Filter.by_property(
-                        FIELD_MAPPING['project_id']
-                    ).equal(str(project_id))
-                    filter_details.append(f"project_id={project_id}")
-                
-                # NOTE: item_id filter REMOVED in Issue #395
-                # Previously this was filtering by item_id, which conflicted with current_item_id exclusion
-                # Now we search across ALL items in the project, excluding only current_item_id
-                
-                # Exclude current item from results (Issue #395)
-                # This prevents the item itself from appearing in its own RAG context
-                if current_item_id:
-                    current_item_filter = Filter.by_property(
-                        FIELD_MAPPING['object_id']
-                    ).not_equal(str(current_item_id))
-                    
-                    where_filter = (
-                        where_filter & current_item_filter
-                        if where_filter
-                        else current_item_filter
-                    )
-                    filter_details.append(f"exclude_object_id={current_item_id}")
-                
-                if object_types:
-                    type_filters = [
-                        Filter.by_property(FIELD_MAPPING['object_type']).equal(obj_type)
-                        for obj_type in object_types
-                    ]
-                    if len(type_filters) == 1:
-                        type_filter = type_filters[0]
-                    else:
-                        type_filter = type_filters[0]
-                        for tf in type_filters[1:]:
-                            type_filter = type_filter | tf
-                    where_filter = (
-                        where_filter & type_filter
-                        if where_filter
-                        else type_filter
-                    )
-                    filter_details.append(f"object_types={object_types}")
-                
-                # Note: is_none filter removed (Issue #398)
-                # Filter for empty content is now done in Python after query
-                # to avoid Weaviate schema requirement for indexNullState.
-                # Trade-off: This may retrieve some items that will be filtered out,
-                # but in practice most items have content and this ensures the query works.
-                
-                rag_logger.debug(f"Applied filters: {', '.join(filter_details)}")
-                
-                # Perform search
-                rag_logger.debug(f"Executing Weaviate hybrid search...")
-                response = collection.query.hybrid(
-                    query=query_text,
-                    limit=limit,
-                    alpha=alpha,
-                    filters=where_filter,
-                    fusion_type=HybridFusion.RELATIVE_SCORE,
-                    return_metadata=MetadataQuery(score=True),
+            if client is not None:
+                return ExtendedRAGPipelineService._run_hybrid_search(
+                    client, query_text, alpha, project_id, current_item_id, object_types, limit
+                )
+            if not is_available():
+                logger.warning("Weaviate is not available")
+                rag_logger.warning("Search aborted: Weaviate not available")
+                return []
+            with pooled_client() as pooled:
+                return ExtendedRAGPipelineService._run_hybrid_search(
+                    pooled, query_text, alpha, project_id, current_item_id, object_types, limit
                 )
-                
-                # Extract results and filter empty content (Issue #398)
-                results = []
-                for obj in response.objects:
-                    props = obj.properties
-                    
-                    # Exclude files without text content (Issue #392, #398)
-                    # Filter in Python to avoid Weaviate schema requirement
-                    text = (props.get(FIELD_MAPPING['content']) or '').strip()
-                    if not text:
-                        continue
-                    
-                    result = {
-                        'object_id': props.get(FIELD_MAPPING['object_id']),
-                        'object_type': props.get(FIELD_MAPPING['object_type']),
-                        'title': props.get(FIELD_MAPPING['title']),
-                        'content': props.get(FIELD_MAPPING['content'], ''),
-                        'link': props.get(FIELD_MAPPING['link']),
-                        'source': props.get(FIELD_MAPPING['source']),
-                        'updated_at': props.get(FIELD_MAPPING['updated_at']),
-                        'status': props.get(FIELD_MAPPING['status']),
-                        'score': getattr(obj.metadata, 'score', None),
-                        'search_type': 'semantic' if alpha >= 0.5 else 'keyword'
-                    }
-                    results.append(result)
-                
-                rag_logger.info(f"Search completed: {len(results)} results found")
-                rag_logger.debug(f"Top 3 results: {[r['object_id'] + ' (' + r['object_type'] + ')' for r in results[:3]]}")
-                return results
-                
-            finally:
-                client.close()
-                
         except Exception as e:
             logger.error(f"Error performing Weaviate search: {e}", exc_info=True)
             rag_logger.error(f"Search failed with error: {e}", exc_info=True)
             return []
     
+    @staticmethod
+    def _run_hybrid_search(
+        client,
+        query_text: str,
+        alpha: float,
+        project_id: Optional[str],
+        current_item_id: Optional[str],
+        object_types: Optional[List[str]],
+        limit: int,
+    ) -> List[Dict[str, Any]]:
+        """Run the hybrid query of _perform_search on a connected client (raises on errors)."""
+        collection = client.collections.get(COLLECTION_NAME)
+        
+        # Build filters
+        where_filter = None
+        filter_details = []
+        
+        # Default to ALLOWED_OBJECT_TYPES if not specified (Issue #392)
+        if object_types is None:
+            object_types = ALLOWED_OBJECT_TYPES
+        # Long attachments are indexed as chunks; search those too
+        object_types = with_chunk_types(object_types)
+        
+        if project_id:
+            where_filter = Filter.by_property(
+                FIELD_MAPPING['project_id']
+            ).equal(str(project_id))
+            filter_details.append(f"project_id={project_id}")
+        
+        # NOTE: item_id filter REMOVED in Issue #395
+        # Previously this was filtering by item_id, which conflicted with current_item_id exclusion
+        # Now we search across ALL items in the project, excluding only current_item_id
+        
+        # Exclude current item from results (Issue #395)
+        # This prevents the item itself from appearing in its own RAG context
+        if current_item_id:
+            current_item_filter = Filter.by_property(
+                FIELD_MAPPING['object_id']
+            ).not_equal(str(current_item_id))
+            
+            where_filter = (
+                where_filter & current_item_filter
+                if where_filter
+                else current_item_filter
+            )
+            filter_details.append(f"exclude_object_id={current_item_id}")
+        
+        if object_types:
+            type_filters = [
+                Filter.by_property(FIELD_MAPPING['object_type']).equal(obj_type)
+                for obj_type in object_types
+            ]
+            if len(type_filters) == 1:
+                type_filter = type_filters[0]
+            else:
+                type_filter = type_filters[0]
+                for tf in type_filters[1:]:
+                    type_filter = type_filter | tf
+            where_filter = (
+                where_filter & type_filter
+                if where_filter
+                else type_filter
+            )
+            filter_details.append(f"object_types={object_types}")
+        
+        # Note: is_none filter removed (Issue #398)
+        # Filter for empty content is now done in Python after query
+        # to avoid Weaviate schema requirement for indexNullState.
+        # Trade-off: This may retrieve some items that will be filtered out,
+        # but in practice most items have content and this ensures the query works.
+        
+        rag_logger.debug(f"Applied filters: {', '.join(filter_details)}")
+        
+        # Perform search
+        rag_logger.debug(f"Executing Weaviate hybrid search...")
+        response = collection.query.hybrid(
+            query=query_text,
+            limit=limit,
+            alpha=alpha,
+            filters=where_filter,
+            fusion_type=HybridFusion.RELATIVE_SCORE,
+            return_metadata=MetadataQuery(score=True),
+        )
+        
+        # Extract results and filter empty content (Issue #398)
+        results = []
+        for obj in response.objects:
+            props = obj.properties
+            
+            # Exclude files without text content (Issue #392, #398)
+            # Filter in Python to avoid Weaviate schema requirement
+            text = (props.get(FIELD_MAPPING['content']) or '').strip()
+            if not text:
+                continue
+            
+            result = {
+                'object_id': props.get(FIELD_MAPPING['object_id']),
+                'object_type': result_type(props.get(FIELD_MAPPING['object_type'])),
+                'title': props.get(FIELD_MAPPING['title']),
+                'content': props.get(FIELD_MAPPING['content'], ''),
+                'link': props.get(FIELD_MAPPING['link']),
+                'source': props.get(FIELD_MAPPING['source']),
+                'updated_at': props.get(FIELD_MAPPING['updated_at']),
+                'status': props.get(FIELD_MAPPING['status']),
+                'score': getattr(obj.metadata, 'score', None),
+                'search_type': 'semantic' if alpha >= 0.5 else 'keyword'
+            }
+            results.append(result)
+        
+        rag_logger.info(f"Search completed: {len(results)} results found")
+        rag_logger.debug(f"Top 3 results: {[r['object_id'] + ' (' + r['object_type'] + ')' for r in results[:3]]}")
+        return results
+    
+    @staticmethod
+    def _perform_parallel_searches(
+        searches: Dict[str, Dict[str, Any]],
+        **filters,
+    ) -> Tuple[Dict[str, List[Dict[str, Any]]], Dict[str, float]]:
+        """
+        Run several hybrid searches concurrently over one pooled connection.
+        
+        Args:
+            searches: Mapping of name -> {'query_text': ..., 'alpha': ..., 'limit': ...}
+            **filters: Filter arguments shared by all searches (see _perform_search)
+            
+        Returns:
+            Tuple of (name -> results, name -> duration in ms)
+        """
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        timings: Dict[str, float] = {}
+        
+        def run(name, client):
+            started = time.perf_counter()
+            try:
+                return ExtendedRAGPipelineService._perform_search(client=client, **searches[name], **filters)
+            finally:
+                timings[name] = _elapsed_ms(started)
+        
+        if not is_available():
+            # _perform_search reports the unavailability itself; no client to share
+            for name in searches:
+                results[name] = run(name, None)
+            return results, timings
+        
+        try:
+            with pooled_client() as client:
+                futures = {name: _search_executor.submit(run, name, client) for name in searches}
+                for name, future in futures.items():
+                    results[name] = future.result()
+        except Exception as e:
+            logger.error(f"Error performing parallel Weaviate searches: {e}", exc_info=True)
+            rag_logger.error(f"Parallel searches failed with error: {e}", exc_info=True)
+            for name in searches:
+                results.setdefault(name, [])
+        return results, timings
+    
     @staticmethod
     def _fuse_and_rerank(
         sem_results: List[Dict[str, Any]],
@@ -1014,6 +1113,7 @@ class ExtendedRAGPipelineService:
         max_content_length: Optional[int] = None,
         query: Optional[str] = None,
         optimized: Optional[OptimizedQuery] = None,
+        timings: Optional[Dict[str, float]] = None,
     ) -> Tuple[List[RAGContextObject], List[RAGContextObject], List[RAGContextObject]]:
         """
         Separate results into A/B/C layers (Issue #407, #416).
@@ -1033,10 +1133,14 @@ class ExtendedRAGPipelineService:
             max_content_length: Maximum content length for truncation. If None, uses MAX_CONTENT_LENGTH from config
             query: Original query (used for primary attachment selection and smart trimming)
             optimized: Optimized query (used for primary attachment selection and smart trimming)
+            timings: Optional stage timings dict; the time spent trimming content is
+                     added to its 'trim' entry (ms)
             
         Returns:
             Tuple of (layer_a, layer_b, layer_c)
         """
+        trim_ms = 0.0
+        
         # Use provided max_content_length or default from config
         content_length = max_content_length if max_content_length is not None else MAX_CONTENT_LENGTH
         
@@ -1078,6 +1182,7 @@ class ExtendedRAGPipelineService:
             # Truncate content with smart trimming for primary attachments (Issue #416)
             content = result.get('content', '')
             original_length = len(content)
+            trim_started = time.perf_counter()
             
             if is_primary and original_length > SMALL_DOC_THRESHOLD:
                 # Use section-aware smart trimming for large primary attachments
@@ -1095,6 +1200,7 @@ class ExtendedRAGPipelineService:
             elif is_primary:
                 # Small doc, included in full
                 rag_logger.debug(f"Primary attachment {obj_id} included in full: {original_length} chars (< {SMALL_DOC_THRESHOLD})")
+            trim_ms += (time.perf_counter() - trim_started) * 1000
             
             # Create RAGContextObject
             item = RAGContextObject(
@@ -1127,6 +1233,8 @@ class ExtendedRAGPipelineService:
             elif len(layer_c) < 2:
                 layer_c.append(item)
         
+        if timings is not None:
+            timings['trim'] = round(timings.get('trim', 0.0) + trim_ms, 1)
         rag_logger.info(f"Layer separation complete: A={len(layer_a)}, B={len(layer_b)}, C={len(layer_c)}")
         return layer_a, layer_b, layer_c
     
@@ -1149,7 +1257,8 @@ class ExtendedRAGPipelineService:
         
         This is the main entry point for the extended RAG pipeline. It:
         1. Optimizes the question using AI agent
-        2. Performs parallel semantic and keyword searches
+        2. Performs parallel semantic and keyword searches (concurrently, on one
+           pooled Weaviate connection)
         3. Fuses and reranks results
         4. Separates into A/B/C layers
         
@@ -1167,7 +1276,9 @@ class ExtendedRAGPipelineService:
             max_content_length: Optional max content length for truncation. If None, uses MAX_CONTENT_LENGTH from config
             
         Returns:
-            ExtendedRAGContext with layered results
+            ExtendedRAGContext with layered results. stats['timings_ms'] holds
+            per-stage durations (optimize, semantic, keyword, search, fuse,
+            layer, trim, total).
         """
         rag_logger.info("="*80)
         rag_logger.info(f"BUILD EXTENDED RAG CONTEXT - START")
@@ -1179,6 +1290,31 @@ class ExtendedRAGPipelineService:
         content_length = max_content_length if max_content_length is not None else MAX_CONTENT_LENGTH
         rag_logger.info(f"Using content_length={content_length}")
         
+        # Per-stage durations in ms; 'layer' includes 'trim', 'search' is the
+        # wall time of the concurrent 'semantic' and 'keyword' searches.
+        timings = {}
+        pipeline_started = time.perf_counter()
+        
+        # Step 0: Result cache (keyed by normalized query, filters and index generation)
+        rag_cache = get_rag_cache()
+        cache_key = rag_cache.build_key(
+            query=query,
+            project_id=project_id,
+            current_item_id=current_item_id,
+            object_types=object_types,
+            content_length=content_length,
+            skip_optimization=skip_optimization,
+            include_debug=include_debug,
+        )
+        cached = rag_cache.get(cache_key)
+        if cached is not None:
+            context = ExtendedRAGContext.from_dict(cached)
+            context.stats['cache_hit'] = True
+            context.stats['timings_ms'] = {'cache': _elapsed_ms(pipeline_started), 'total': _elapsed_ms(pipeline_started)}
+            rag_logger.info(f"RAG cache hit: {cache_key}")
+            rag_logger.info("="*80)
+            return context
+        
         stats = {
             'optimization_success': False,
             'sem_results': 0,
@@ -1187,6 +1323,8 @@ class ExtendedRAGPipelineService:
             'layer_a_count': 0,
             'layer_b_count': 0,
             'layer_c_count': 0,
+            'cache_hit': False,
+            'timings_ms': timings,
         }
         
         debug_info = {} if include_debug else None
@@ -1195,9 +1333,11 @@ class ExtendedRAGPipelineService:
         rag_logger.info("STEP 1: Question Optimization")
         optimized = None
         if not skip_optimization:
+            started = time.perf_counter()
             optimized = ExtendedRAGPipelineService._optimize_question(
                 query, user=user, client_ip=client_ip
             )
+            timings['optimize'] = _elapsed_ms(started)
             if optimized:
                 stats['optimization_success'] = True
                 if include_debug:
@@ -1242,51 +1382,51 @@ class ExtendedRAGPipelineService:
         
         # Step 3: Parallel searches
         rag_logger.info("STEP 3: Parallel Searches")
-        # Semantic/Hybrid search (alpha ≈ 0.6)
-        rag_logger.info("Running semantic/hybrid search (alpha=0.6)...")
-        sem_results = ExtendedRAGPipelineService._perform_search(
-            query_text=sem_query,
-            alpha=0.6,
+        # Semantic/Hybrid search (alpha ≈ 0.6) and keyword/tag search
+        # (alpha = 0.3, lower alpha = more BM25/keyword weight) run concurrently
+        rag_logger.info("Running semantic/hybrid (alpha=0.6) and keyword/tag (alpha=0.3) searches...")
+        started = time.perf_counter()
+        search_results, search_timings = ExtendedRAGPipelineService._perform_parallel_searches(
+            {
+                'semantic': {'query_text': sem_query, 'alpha': 0.6, 'limit': 24},
+                'keyword': {'query_text': kw_query, 'alpha': 0.3, 'limit': 24},
+            },
             project_id=project_id,
             item_id=item_id,  # Deprecated but kept for backward compatibility
             current_item_id=current_item_id,
             object_types=object_types,
-            limit=24,
         )
+        timings['search'] = _elapsed_ms(started)
+        timings.update(search_timings)
+        sem_results = search_results['semantic']
+        kw_results = search_results['keyword']
         stats['sem_results'] = len(sem_results)
-        
-        # Keyword/Tag search (alpha = 0.3 for more BM25/keyword weight)
-        rag_logger.info("Running keyword/tag search (alpha=0.3)...")
-        kw_results = ExtendedRAGPipelineService._perform_search(
-            query_text=kw_query,
-            alpha=0.3,  # Lower alpha = more BM25/keyword weight
-            project_id=project_id,
-            item_id=item_id,  # Deprecated but kept for backward compatibility
-            current_item_id=current_item_id,
-            object_types=object_types,
-            limit=24,
-        )
         stats['kw_results'] = len(kw_results)
         
         # Step 4: Fusion and reranking
         rag_logger.info("STEP 4: Fusion and Reranking")
+        started = time.perf_counter()
         fused_results = ExtendedRAGPipelineService._fuse_and_rerank(
             sem_results=sem_results,
             kw_results=kw_results,
             item_id=item_id,  # Deprecated but kept for backward compatibility
             limit=6,
         )
+        timings['fuse'] = _elapsed_ms(started)
         stats['fused_results'] = len(fused_results)
         
         # Step 5: Separate into A/B/C layers
         rag_logger.info("STEP 5: Layer Separation")
+        started = time.perf_counter()
         layer_a, layer_b, layer_c = ExtendedRAGPipelineService._separate_into_layers(
             fused_results,
             item_id=item_id,  # Deprecated but kept for backward compatibility
             max_content_length=content_length,
             query=query,  # For primary attachment selection (Issue #416)
             optimized=optimized,  # For primary attachment selection (Issue #416)
+            timings=timings,
         )
+        timings['layer'] = _elapsed_ms(started)
         
         stats['layer_a_count'] = len(layer_a)
         stats['layer_b_count'] = len(layer_b)
@@ -1299,13 +1439,15 @@ class ExtendedRAGPipelineService:
         total_items = len(all_items)
         summary = f"Retrieved {total_items} relevant items across {stats['layer_a_count']} thread-related, {stats['layer_b_count']} item-context, and {stats['layer_c_count']} background snippets."
         
+        timings['total'] = _elapsed_ms(pipeline_started)
+        
         rag_logger.info("="*80)
         rag_logger.info(f"BUILD EXTENDED RAG CONTEXT - COMPLETE")
         rag_logger.info(f"Summary: {summary}")
         rag_logger.info(f"Stats: {stats}")
         rag_logger.info("="*80)
         
-        return ExtendedRAGContext(
+        context = ExtendedRAGContext(
             query=query,
             optimized_query=optimized if stats['optimization_success'] else None,
             layer_a=layer_a,
@@ -1316,6 +1458,10 @@ class ExtendedRAGPipelineService:
             stats=stats,
             debug=debug_info,
         )
+        # Empty results may come from a failed search; don't pin them in the cache
+        if fused_results:
+            rag_cache.set(cache_key, context.to_dict())
+        return context
 
 
 # Parameters that are not supported by ExtendedRAGPipelineService.build_extended_context()
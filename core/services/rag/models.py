@@ -51,6 +51,11 @@ class RAGContextObject:
             'status': self.status,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> 'RAGContextObject':
+        """Rebuild an object from to_dict() output (e.g. from the RAG cache)."""
+        return cls(**data)
+
 
 @dataclass
 class RAGContext:
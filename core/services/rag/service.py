@@ -9,7 +9,8 @@ from datetime import datetime
 
 from weaviate.classes.query import Filter, HybridFusion
 
-from core.services.weaviate.client import get_client, is_available
+from core.services.weaviate.chunking import result_type, with_chunk_types
+from core.services.weaviate.client import pooled_client, is_available
 from core.services.weaviate.schema import COLLECTION_NAME
 from core.services.exceptions import ServiceDisabled
 
@@ -265,8 +266,7 @@ class RAGPipelineService:
                 )
             
             # Get Weaviate client
-            client = get_client()
-            try:
+            with pooled_client() as client:
                 # Get collection
                 collection = client.collections.get(COLLECTION_NAME)
                 
@@ -276,6 +276,8 @@ class RAGPipelineService:
                 # Default to ALLOWED_OBJECT_TYPES if not specified (Issue #392)
                 if object_types is None:
                     object_types = ALLOWED_OBJECT_TYPES
+                # Long attachments are indexed as chunks; search those too
+                object_types = with_chunk_types(object_types)
                 
                 if project_id:
                     where_filter = Filter.by_property(
@@ -355,7 +357,7 @@ class RAGPipelineService:
                     # Map fields using FIELD_MAPPING
                     result = {
                         'object_id': props.get(FIELD_MAPPING['object_id']),
-                        'object_type': props.get(FIELD_MAPPING['object_type']),
+                        'object_type': result_type(props.get(FIELD_MAPPING['object_type'])),
                         'title': props.get(FIELD_MAPPING['title']),
                         'content': props.get(FIELD_MAPPING['content'], ''),
                         'link': props.get(FIELD_MAPPING['link']),
@@ -399,10 +401,7 @@ class RAGPipelineService:
                         link=result.get('link'),
                         updated_at=updated_at,
                     ))
-                
-            finally:
-                client.close()
-        
+    
         except ServiceDisabled as e:
             logger.warning(f"Weaviate service disabled: {e}")
             stats['error'] = str(e)
@@ -18,7 +18,7 @@ from core.services.rag.models import RAGContextObject
 class QuestionOptimizationTestCase(TestCase):
     """Test question optimization via AI agent."""
     
-    @patch('core.services.rag.extended_service.AgentService')
+    @patch('core.services.rag.extended_service.get_agent_service')
     def test_optimization_returns_valid_json(self, mock_agent_service_class):
         """Question optimization should return valid JSON with all required fields."""
         # Mock agent response
@@ -45,7 +45,7 @@ class QuestionOptimizationTestCase(TestCase):
         self.assertEqual(len(optimized.tags), 3)
         self.assertIn("login", optimized.tags)
     
-    @patch('core.services.rag.extended_service.AgentService')
+    @patch('core.services.rag.extended_service.get_agent_service')
     def test_optimization_handles_code_fences(self, mock_agent_service_class):
         """Question optimization should handle markdown code fences."""
         mock_service = mock_agent_service_class.return_value
@@ -67,7 +67,7 @@ class QuestionOptimizationTestCase(TestCase):
         self.assertIsNotNone(optimized)
         self.assertEqual(optimized.core, "test query")
     
-    @patch('core.services.rag.extended_service.AgentService')
+    @patch('core.services.rag.extended_service.get_agent_service')
     def test_optimization_handles_invalid_json(self, mock_agent_service_class):
         """Question optimization should handle invalid JSON gracefully."""
         mock_service = mock_agent_service_class.return_value
@@ -77,7 +77,7 @@ class QuestionOptimizationTestCase(TestCase):
         
         self.assertIsNone(optimized)
     
-    @patch('core.services.rag.extended_service.AgentService')
+    @patch('core.services.rag.extended_service.get_agent_service')
     def test_optimization_handles_missing_fields(self, mock_agent_service_class):
         """Question optimization should handle missing required fields."""
         mock_service = mock_agent_service_class.return_value
@@ -168,9 +168,9 @@ class SearchTestCase(TestCase):
         
         self.assertEqual(results, [])
     
-    @patch('core.services.rag.extended_service.get_client')
+    @patch('core.services.rag.extended_service.pooled_client')
     @patch('core.services.rag.extended_service.is_available')
-    def test_search_returns_results(self, mock_is_available, mock_get_client):
+    def test_search_returns_results(self, mock_is_available, mock_pooled_client):
         """Search should return formatted results from Weaviate."""
         mock_is_available.return_value = True
         
@@ -196,7 +196,7 @@ class SearchTestCase(TestCase):
 
         mock_client = Mock()
         mock_client.collections.get.return_value = mock_collection
-        mock_get_client.return_value = mock_client
+        mock_pooled_client.return_value.__enter__.return_value = mock_client
 
         results = ExtendedRAGPipelineService._perform_search(
             query_text="test",
@@ -211,9 +211,9 @@ class SearchTestCase(TestCase):
         self.assertEqual(results[0]['score'], 0.85)
         self.assertEqual(results[0]['status'], 'Working')
     
-    @patch('core.services.rag.extended_service.get_client')
+    @patch('core.services.rag.extended_service.pooled_client')
     @patch('core.services.rag.extended_service.is_available')
-    def test_search_returns_non_null_scores(self, mock_is_available, mock_get_client):
+    def test_search_returns_non_null_scores(self, mock_is_available, mock_pooled_client):
         """Search should return non-null scores from Weaviate metadata (Issue #401)."""
         mock_is_available.return_value = True
         
@@ -262,7 +262,7 @@ class SearchTestCase(TestCase):
         
         mock_client = Mock()
         mock_client.collections.get.return_value = mock_collection
-        mock_get_client.return_value = mock_client
+        mock_pooled_client.return_value.__enter__.return_value = mock_client
         
         results = ExtendedRAGPipelineService._perform_search(
             query_text="test query",
@@ -671,6 +671,83 @@ class BuildExtendedContextTestCase(TestCase):
         self.assertEqual(context.query, "test")
 
 
+class ParallelSearchTestCase(TestCase):
+    """Test that the semantic and keyword searches run concurrently."""
+    
+    @patch('core.services.rag.extended_service.pooled_client')
+    @patch('core.services.rag.extended_service.is_available', return_value=True)
+    def test_searches_run_concurrently_on_one_client(self, mock_is_available, mock_pooled_client):
+        """Both searches should overlap in time and share one pooled connection."""
+        import threading
+        
+        mock_client = Mock()
+        mock_pooled_client.return_value.__enter__.return_value = mock_client
+        # Each search waits until the other one has started, so a sequential
+        # implementation would time out here
+        barrier = threading.Barrier(2, timeout=5)
+        seen_clients = []
+        
+        def fake_hybrid(client, query_text, alpha, *args):
+            seen_clients.append(client)
+            barrier.wait()
+            return [{'object_id': query_text, 'object_type': 'item'}]
+        
+        with patch.object(ExtendedRAGPipelineService, '_run_hybrid_search', side_effect=fake_hybrid):
+            results, timings = ExtendedRAGPipelineService._perform_parallel_searches(
+                {
+                    'semantic': {'query_text': 'sem', 'alpha': 0.6, 'limit': 24},
+                    'keyword': {'query_text': 'kw', 'alpha': 0.3, 'limit': 24},
+                },
+                project_id='1',
+            )
+        
+        self.assertEqual(results['semantic'][0]['object_id'], 'sem')
+        self.assertEqual(results['keyword'][0]['object_id'], 'kw')
+        self.assertEqual(seen_clients, [mock_client, mock_client])
+        mock_pooled_client.assert_called_once()
+        self.assertEqual(set(timings), {'semantic', 'keyword'})
+    
+    @patch('core.services.rag.extended_service.pooled_client')
+    @patch('core.services.rag.extended_service.is_available', return_value=True)
+    def test_failing_search_does_not_break_the_other(self, mock_is_available, mock_pooled_client):
+        """A failing search should yield no results without losing the other one."""
+        mock_pooled_client.return_value.__enter__.return_value = Mock()
+        
+        def fake_hybrid(client, query_text, alpha, *args):
+            if alpha < 0.5:
+                raise RuntimeError('keyword search failed')
+            return [{'object_id': '1', 'object_type': 'item'}]
+        
+        with patch.object(ExtendedRAGPipelineService, '_run_hybrid_search', side_effect=fake_hybrid):
+            results, _timings = ExtendedRAGPipelineService._perform_parallel_searches(
+                {
+                    'semantic': {'query_text': 'sem', 'alpha': 0.6, 'limit': 24},
+                    'keyword': {'query_text': 'kw', 'alpha': 0.3, 'limit': 24},
+                },
+            )
+        
+        self.assertEqual(len(results['semantic']), 1)
+        self.assertEqual(results['keyword'], [])
+    
+    @patch('core.services.rag.extended_service.ExtendedRAGPipelineService._perform_search')
+    @patch('core.services.rag.extended_service.ExtendedRAGPipelineService._optimize_question')
+    def test_build_extended_context_records_stage_timings(self, mock_optimize, mock_search):
+        """stats should contain per-stage timings for latency tracking."""
+        mock_optimize.return_value = None
+        mock_search.return_value = [
+            {'object_id': '1', 'object_type': 'item', 'score': 0.8, 'content': 'Test', 'title': 'Item 1'},
+        ]
+        
+        context = build_extended_context(query="test query")
+        
+        timings = context.stats['timings_ms']
+        for stage in ('optimize', 'semantic', 'keyword', 'search', 'fuse', 'layer', 'trim', 'total'):
+            self.assertIn(stage, timings)
+            self.assertGreaterEqual(timings[stage], 0)
+        # The stats are returned as JSON by the context APIs
+        json.dumps(context.to_dict())
+
+
 class JSONSerializationTestCase(TestCase):
     """Test JSON serialization for RAG data structures."""
     
@@ -256,14 +256,14 @@ class BuildContextTestCase(TestCase):
         self.assertIsNotNone(context.stats.get('error'))
     
     @patch('core.services.rag.service.is_available')
-    @patch('core.services.rag.service.get_client')
-    def test_successful_search(self, mock_get_client, mock_is_available):
+    @patch('core.services.rag.service.pooled_client')
+    def test_successful_search(self, mock_pooled_client, mock_is_available):
         """Should return context with results on successful search."""
         mock_is_available.return_value = True
         
         # Mock Weaviate client
         mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
+        mock_pooled_client.return_value.__enter__.return_value = mock_client
         
         # Mock collection
         mock_collection = MagicMock()
@@ -302,16 +302,17 @@ class BuildContextTestCase(TestCase):
         self.assertEqual(context.items[0].title, "Test Item")
         self.assertIn("Test content", context.items[0].content)
         
-        # Verify client was closed
-        mock_client.close.assert_called_once()
+        # Verify client was returned to the pool, not closed
+        mock_pooled_client.return_value.__exit__.assert_called_once()
+        mock_client.close.assert_not_called()
     
     @patch('core.services.rag.service.is_available')
-    @patch('core.services.rag.service.get_client')
-    def test_project_filter(self, mock_get_client, mock_is_available):
+    @patch('core.services.rag.service.pooled_client')
+    def test_project_filter(self, mock_pooled_client, mock_is_available):
         """Should apply project_id filter."""
         mock_is_available.return_value = True
         mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
+        mock_pooled_client.return_value.__enter__.return_value = mock_client
         
         mock_collection = MagicMock()
         mock_client.collections.get.return_value = mock_collection
@@ -331,12 +332,12 @@ class BuildContextTestCase(TestCase):
         self.assertIsNotNone(call_args.kwargs.get('filters'))
     
     @patch('core.services.rag.service.is_available')
-    @patch('core.services.rag.service.get_client')
-    def test_object_types_filter(self, mock_get_client, mock_is_available):
+    @patch('core.services.rag.service.pooled_client')
+    def test_object_types_filter(self, mock_pooled_client, mock_is_available):
         """Should apply object_types filter."""
         mock_is_available.return_value = True
         mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
+        mock_pooled_client.return_value.__enter__.return_value = mock_client
         
         mock_collection = MagicMock()
         mock_client.collections.get.return_value = mock_collection
@@ -356,12 +357,12 @@ class BuildContextTestCase(TestCase):
         self.assertIsNotNone(call_args.kwargs.get('filters'))
     
     @patch('core.services.rag.service.is_available')
-    @patch('core.services.rag.service.get_client')
-    def test_alpha_parameter(self, mock_get_client, mock_is_available):
+    @patch('core.services.rag.service.pooled_client')
+    def test_alpha_parameter(self, mock_pooled_client, mock_is_available):
         """Should use provided alpha value."""
         mock_is_available.return_value = True
         mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
+        mock_pooled_client.return_value.__enter__.return_value = mock_client
         
         mock_collection = MagicMock()
         mock_client.collections.get.return_value = mock_collection
@@ -382,12 +383,12 @@ class BuildContextTestCase(TestCase):
         self.assertEqual(call_args.kwargs.get('alpha'), 0.3)
     
     @patch('core.services.rag.service.is_available')
-    @patch('core.services.rag.service.get_client')
-    def test_alpha_heuristic_applied(self, mock_get_client, mock_is_available):
+    @patch('core.services.rag.service.pooled_client')
+    def test_alpha_heuristic_applied(self, mock_pooled_client, mock_is_available):
         """Should apply alpha heuristic when alpha not provided."""
         mock_is_available.return_value = True
         mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
+        mock_pooled_client.return_value.__enter__.return_value = mock_client
         
         mock_collection = MagicMock()
         mock_client.collections.get.return_value = mock_collection
@@ -403,12 +404,12 @@ class BuildContextTestCase(TestCase):
         self.assertEqual(context.alpha, DEFAULT_ALPHA_KEYWORD)
     
     @patch('core.services.rag.service.is_available')
-    @patch('core.services.rag.service.get_client')
-    def test_error_handling(self, mock_get_client, mock_is_available):
+    @patch('core.services.rag.service.pooled_client')
+    def test_error_handling(self, mock_pooled_client, mock_is_available):
         """Should handle errors gracefully."""
         mock_is_available.return_value = True
         mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
+        mock_pooled_client.return_value.__enter__.return_value = mock_client
         
         # Simulate error
         mock_client.collections.get.side_effect = Exception("Connection failed")
@@ -420,8 +421,9 @@ class BuildContextTestCase(TestCase):
         self.assertEqual(len(context.items), 0)
         self.assertIsNotNone(context.stats.get('error'))
         
-        # Client should still be closed
-        mock_client.close.assert_called_once()
+        # Client should still be returned to the pool
+        mock_pooled_client.return_value.__exit__.assert_called_once()
+        mock_client.close.assert_not_called()
     
     def test_include_debug(self):
         """Should include debug info when requested."""
@@ -0,0 +1,165 @@
+"""
+Tests for the extended RAG result cache.
+"""
+
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+
+from core.services.rag.cache import (
+    RAGResultCache,
+    bump_index_generation,
+    get_rag_cache,
+    normalize_query,
+    reset_rag_cache,
+)
+from core.services.rag.extended_service import build_extended_context
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the redis.Redis calls the cache uses."""
+
+    def __init__(self, *args, **kwargs):
+        self.data = {}
+        self.hashes = {}
+
+    def ping(self):
+        return True
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def mget(self, keys):
+        return [self.data.get(key) for key in keys]
+
+    def setex(self, key, ttl, value):
+        self.data[key] = value
+
+    def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, 0)) + 1)
+        return int(self.data[key])
+
+    def hincrby(self, name, field, amount):
+        bucket = self.hashes.setdefault(name, {})
+        bucket[field] = str(int(bucket.get(field, 0)) + amount)
+
+    def hgetall(self, name):
+        return dict(self.hashes.get(name, {}))
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.calls = []
+
+    def incr(self, key):
+        self.calls.append(key)
+
+    def execute(self):
+        return [self.redis.incr(key) for key in self.calls]
+
+
+SEARCH_RESULTS = [
+    {'object_id': '1', 'object_type': 'item', 'score': 0.8, 'content': 'Login bug', 'title': 'Item 1'},
+]
+
+
+@override_settings(REDIS_CACHE_ENABLED=True, RAG_CACHE_ENABLED=True)
+@patch('redis.Redis', FakeRedis)
+class RAGResultCacheTestCase(TestCase):
+    """Test cases for RAGResultCache."""
+
+    def setUp(self):
+        reset_rag_cache()
+        self.addCleanup(reset_rag_cache)
+
+    def test_normalize_query(self):
+        """Case and whitespace differences map to the same query."""
+        self.assertEqual(normalize_query('  Login   BUG\n'), 'login bug')
+
+    def test_key_depends_on_filters(self):
+        """Different filters produce different keys, equivalent queries the same."""
+        cache = RAGResultCache()
+        key = cache.build_key(query='Login bug', project_id='1')
+        self.assertEqual(key, cache.build_key(query=' login  bug ', project_id='1'))
+        self.assertNotEqual(key, cache.build_key(query='Login bug', project_id='2'))
+        self.assertNotEqual(key, cache.build_key(query='Login bug', project_id='1', content_length=5000))
+        self.assertNotEqual(key, cache.build_key(query='Login bug', project_id='1', current_item_id='7'))
+
+    def test_generation_bump_invalidates_only_that_project(self):
+        """A write to one project changes its keys but not other projects'."""
+        cache = RAGResultCache()
+        key_1 = cache.build_key(query='q', project_id='1')
+        key_2 = cache.build_key(query='q', project_id='2')
+
+        cache.bump_generation(['1'])
+
+        self.assertNotEqual(key_1, cache.build_key(query='q', project_id='1'))
+        self.assertEqual(key_2, cache.build_key(query='q', project_id='2'))
+
+    def test_delete_bump_invalidates_everything(self):
+        """Deletes of unknown project invalidate all keys."""
+        cache = RAGResultCache()
+        key = cache.build_key(query='q', project_id='2')
+
+        cache.bump_generation(None)
+
+        self.assertNotEqual(key, cache.build_key(query='q', project_id='2'))
+
+    def test_disabled_without_redis(self):
+        """The cache is a no-op when Redis caching is off."""
+        with override_settings(REDIS_CACHE_ENABLED=False):
+            cache = RAGResultCache()
+        self.assertIsNone(cache.build_key(query='q'))
+        self.assertFalse(cache.set(None, {}))
+        self.assertFalse(cache.get_stats()['enabled'])
+
+    @patch('core.services.rag.extended_service.ExtendedRAGPipelineService._perform_search')
+    @patch('core.services.rag.extended_service.ExtendedRAGPipelineService._optimize_question')
+    def test_pipeline_served_from_cache(self, mock_optimize, mock_search):
+        """A second identical request is answered without optimizer or searches."""
+        mock_optimize.return_value = None
+        mock_search.return_value = SEARCH_RESULTS
+
+        first = build_extended_context(query='Login bug', project_id='1')
+        self.assertFalse(first.stats['cache_hit'])
+        calls = mock_search.call_count
+
+        second = build_extended_context(query='login   bug', project_id='1')
+        self.assertTrue(second.stats['cache_hit'])
+        self.assertEqual(mock_search.call_count, calls)
+        self.assertEqual(mock_optimize.call_count, 1)
+        self.assertEqual(second.to_context_text(), first.to_context_text())
+
+        stats = get_rag_cache().get_stats()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['hit_rate'], 50.0)
+
+    @patch('core.services.rag.extended_service.ExtendedRAGPipelineService._perform_search')
+    @patch('core.services.rag.extended_service.ExtendedRAGPipelineService._optimize_question')
+    def test_index_write_invalidates_cached_context(self, mock_optimize, mock_search):
+        """After a Weaviate write to the project the context is rebuilt."""
+        mock_optimize.return_value = None
+        mock_search.return_value = SEARCH_RESULTS
+
+        build_extended_context(query='Login bug', project_id='1')
+        bump_index_generation(['1'])
+        again = build_extended_context(query='Login bug', project_id='1')
+
+        self.assertFalse(again.stats['cache_hit'])
+
+    @patch('core.services.rag.extended_service.ExtendedRAGPipelineService._perform_search')
+    @patch('core.services.rag.extended_service.ExtendedRAGPipelineService._optimize_question')
+    def test_empty_results_not_cached(self, mock_optimize, mock_search):
+        """Empty contexts (possibly failed searches) are not cached."""
+        mock_optimize.return_value = None
+        mock_search.return_value = []
+
+        build_extended_context(query='nothing', project_id='1')
+        again = build_extended_context(query='nothing', project_id='1')
+
+        self.assertFalse(again.stats['cache_hit'])
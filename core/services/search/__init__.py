@@ -0,0 +1,14 @@
+"""
+Search Service
+
+Indexed item search for the item list, Kanban, embed and release filters.
+"""
+
+from .items import SEARCH_CONFIG, ItemSearchVector, prefix_query, search_items
+
+__all__ = [
+    'SEARCH_CONFIG',
+    'ItemSearchVector',
+    'prefix_query',
+    'search_items',
+]
@@ -0,0 +1,81 @@
+"""
+Full-text and trigram search over items.
+
+The filters in core.filters used to search with
+``Q(title__icontains=...) | Q(description__icontains=...)``, a sequential scan
+over large text columns on every keystroke-driven HTMX request. On PostgreSQL,
+migration 0088 adds:
+
+- ``core_item.search_vector``: a generated tsvector column (title weighted A,
+  short_description B, description C) with a GIN index
+- a pg_trgm GIN index on ``UPPER(title)``, which serves ``title__icontains``
+
+search_items() matches every word of the query as a prefix against the
+vector, or the whole query as a substring of the title (so partial words keep
+working while typing), and orders the hits by ts_rank. The column is not a
+model field; ItemSearchVector refers to it in queries. Other databases
+(SQLite in the tests) fall back to the icontains lookups.
+"""
+
+import re
+from typing import Optional
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVectorField
+from django.db import connections
+from django.db.models import Expression, Q, QuerySet
+
+# No stemming: item texts mix German and English, and prefix matching on
+# unstemmed words behaves the same for both.
+SEARCH_CONFIG = 'simple'
+
+WORD_RE = re.compile(r'\w+')
+
+SEARCH_FIELDS = ('title', 'short_description', 'description')
+
+
+class ItemSearchVector(Expression):
+    """The generated ``core_item.search_vector`` column (PostgreSQL only)."""
+
+    output_field = SearchVectorField()
+
+    def as_sql(self, compiler, connection):
+        alias = compiler.query.get_initial_alias()
+        return f'{compiler.quote_name_unless_alias(alias)}.{connection.ops.quote_name("search_vector")}', []
+
+
+def prefix_query(value: str) -> Optional[SearchQuery]:
+    """A tsquery matching every word of ``value`` as a prefix, or None without words."""
+    words = WORD_RE.findall(value.lower())
+    if not words:
+        return None
+    return SearchQuery(' & '.join(f'{word}:*' for word in words), config=SEARCH_CONFIG, search_type='raw')
+
+
+def search_items(queryset: QuerySet, value: str) -> QuerySet:
+    """
+    Filter items by a search query.
+
+    On PostgreSQL the search uses the indexed search vector (title,
+    short_description and description) plus title substrings, and orders the
+    hits by rank ahead of the queryset's own ordering. Other databases search
+    the same fields with icontains.
+    """
+    value = value.strip()
+    if not value:
+        return queryset
+
+    query = prefix_query(value)
+    if connections[queryset.db].vendor != 'postgresql' or query is None:
+        match = Q()
+        for field in SEARCH_FIELDS:
+            match |= Q(**{f'{field}__icontains': value})
+        return queryset.filter(match)
+
+    ordering = queryset.query.order_by or queryset.model._meta.ordering
+    return queryset.alias(
+        search_vector=ItemSearchVector(),
+    ).annotate(
+        search_rank=SearchRank(ItemSearchVector(), query),
+    ).filter(
+        Q(search_vector=query) | Q(title__icontains=value)
+    ).order_by('-search_rank', *ordering)
@@ -0,0 +1,66 @@
+"""
+Tests for the item search
+"""
+
+from django.test import TestCase
+from django.urls import reverse
+
+from core.filters import ItemFilter
+from core.models import Item, ItemStatus, ItemType, Project, User
+from core.services.search import prefix_query, search_items
+
+
+def _tsquery(query):
+    return query.get_source_expressions()[-1].value
+
+
+class PrefixQueryTestCase(TestCase):
+    """Test building the prefix tsquery."""
+
+    def test_every_word_becomes_a_prefix_term(self):
+        query = prefix_query('  Deploy fail-over ')
+
+        self.assertEqual(_tsquery(query), 'deploy:* & fail:* & over:*')
+        self.assertEqual(query.function, 'to_tsquery')
+        self.assertEqual(query.config.config.value, 'simple')
+
+    def test_tsquery_syntax_is_dropped(self):
+        self.assertEqual(_tsquery(prefix_query("a|b & !c:*'")), 'a:* & b:* & c:*')
+        self.assertIsNone(prefix_query('&!:*'))
+
+
+class SearchItemsTestCase(TestCase):
+    """Test search_items (icontains fallback on SQLite) and the filters using it."""
+
+    def setUp(self):
+        self.project = Project.objects.create(name='Search Project')
+        self.item_type = ItemType.objects.create(key='task', name='Task')
+        self.by_title = self._item(title='Deployment fails')
+        self.by_short = self._item(title='Other', short_description='The deployment hangs')
+        self.by_description = self._item(title='Third', description='Fails after deployment')
+        self.unrelated = self._item(title='Unrelated')
+
+    def _item(self, **kwargs):
+        return Item.objects.create(project=self.project, type=self.item_type, status=ItemStatus.BACKLOG, **kwargs)
+
+    def test_searches_title_short_description_and_description(self):
+        items = search_items(Item.objects.all(), ' deploy ')
+
+        self.assertEqual(set(items), {self.by_title, self.by_short, self.by_description})
+
+    def test_blank_query_returns_queryset_unchanged(self):
+        self.assertEqual(search_items(Item.objects.all(), '   ').count(), 4)
+
+    def test_item_filter_uses_search(self):
+        filterset = ItemFilter({'q': 'hangs'}, queryset=Item.objects.all())
+
+        self.assertEqual(list(filterset.qs), [self.by_short])
+
+    def test_backlog_list_search(self):
+        user = User.objects.create_user(username='searcher', email='searcher@example.com', password='pass')
+        self.client.force_login(user)
+
+        response = self.client.get(reverse('items-backlog'), {'q': 'deploy'})
+
+        self.assertContains(response, 'Deployment fails')
+        self.assertNotContains(response, 'Unrelated')
@@ -5,6 +5,7 @@ Provides local filesystem storage for attachments linked to Projects, Items, and
 """
 
 from .service import AttachmentStorageService
+from .download import attachment_response
 from .errors import (
     StorageError,
     AttachmentTooLarge,
@@ -14,6 +15,7 @@ from .errors import (
 
 __all__ = [
     'AttachmentStorageService',
+    'attachment_response',
     'StorageError',
     'AttachmentTooLarge',
     'AttachmentNotFound',
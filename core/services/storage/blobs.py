@@ -0,0 +1,244 @@
+"""
+Content-addressed blob store for attachment files.
+
+Files are stored once per SHA256 under AGIRA_DATA_DIR:
+
+    blobs/{sha[0:2]}/{sha[2:4]}/{sha}
+
+Attachment rows whose ``storage_path`` points to the same blob share the
+file; the number of such rows is the blob's reference count. A blob is
+deleted once its last attachment's hard delete commits, unless it was
+modified within the garbage collection grace period; collect_garbage()
+removes blobs that are no longer referenced at all (e.g. after an aborted
+upload or such a recent delete).
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Iterator, Tuple, Union
+
+from .paths import get_absolute_path
+
+logger = logging.getLogger(__name__)
+
+BLOB_DIR = 'blobs'
+
+# Size in bytes for reading/writing file chunks
+BLOB_CHUNK_SIZE = 64 * 1024
+
+# Blobs younger than this are never collected: a concurrent upload may have
+# written or reused the blob but not yet saved its Attachment row
+DEFAULT_GC_GRACE_SECONDS = 3600
+
+
+def blob_path(sha256: str) -> str:
+    """Relative storage path of the blob with the given hash."""
+    return f"{BLOB_DIR}/{sha256[:2]}/{sha256[2:4]}/{sha256}"
+
+
+def is_blob_path(relative_path: str) -> bool:
+    """Whether a storage path points into the blob store."""
+    return bool(relative_path) and relative_path.startswith(f"{BLOB_DIR}/")
+
+
+@dataclass
+class GarbageCollectionResult:
+    """Outcome of BlobStore.collect_garbage()."""
+    scanned: int = 0
+    deleted: int = 0
+    freed_bytes: int = 0
+
+
+@dataclass
+class StorageStats:
+    """Disk usage of attachments stored as blobs."""
+    attachments: int = 0
+    blobs: int = 0
+    logical_bytes: int = 0
+    physical_bytes: int = 0
+
+    @property
+    def saved_bytes(self) -> int:
+        """Bytes not written to disk thanks to deduplication."""
+        return max(self.logical_bytes - self.physical_bytes, 0)
+
+
+class BlobStore:
+    """Content-addressed file store below a data directory."""
+
+    def __init__(self, data_dir: Union[str, Path]):
+        self.data_dir = Path(data_dir)
+
+    def absolute_path(self, sha256: str) -> Path:
+        """Absolute filesystem path of a blob."""
+        return get_absolute_path(self.data_dir, blob_path(sha256))
+
+    def put(self, file_obj: BinaryIO, sha256: str) -> Tuple[str, bool]:
+        """
+        Store file content under its hash unless the blob already exists.
+
+        The file is written to a temporary file next to the blob and renamed
+        into place, so readers never see a partially written blob.
+
+        Args:
+            file_obj: File-like object with the content
+            sha256: SHA256 of the content
+
+        Returns:
+            Tuple of (relative storage path, whether a new file was written)
+        """
+        target = self.absolute_path(sha256)
+        if target.exists():
+            # Zero-copy: refresh mtime so the garbage collector's grace
+            # period covers the attachment row about to reference it
+            os.utime(target)
+            return blob_path(sha256), False
+
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix='.upload-')
+        try:
+            with os.fdopen(fd, 'wb') as dest:
+                file_obj.seek(0)
+                while chunk := file_obj.read(BLOB_CHUNK_SIZE):
+                    dest.write(chunk)
+            os.replace(tmp_name, target)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+        return blob_path(sha256), True
+
+    def adopt(self, path: Path, sha256: str) -> Tuple[str, bool]:
+        """
+        Move an existing file into the blob store.
+
+        The file is renamed (no copy) if the blob does not exist yet. If it
+        does, the file is left in place for the caller to delete once the
+        attachment points to the blob.
+
+        Returns:
+            Tuple of (relative storage path, whether the file was moved)
+        """
+        target = self.absolute_path(sha256)
+        if target.exists():
+            os.utime(target)
+            return blob_path(sha256), False
+        target.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(path, target)
+        return blob_path(sha256), True
+
+    def ref_count(self, relative_path: str) -> int:
+        """Number of Attachment rows (including soft-deleted ones) using a blob."""
+        from core.models import Attachment
+
+        sha256 = relative_path.rsplit('/', 1)[-1]
+        return Attachment.objects.filter(sha256=sha256, storage_path=relative_path).count()
+
+    def release(self, relative_path: str, grace_seconds: int = DEFAULT_GC_GRACE_SECONDS) -> bool:
+        """
+        Delete a blob if no attachment references it any more.
+
+        Blobs modified within the grace period are left to collect_garbage():
+        put() refreshes the mtime when it reuses a blob, so a concurrent
+        upload of the same content may be about to save a row pointing here.
+
+        Returns:
+            True if the file was deleted
+        """
+        if not is_blob_path(relative_path) or self.ref_count(relative_path) > 0:
+            return False
+        path = get_absolute_path(self.data_dir, relative_path)
+        try:
+            if path.stat().st_mtime > time.time() - grace_seconds:
+                return False
+            path.unlink()
+            return True
+        except FileNotFoundError:
+            return False
+
+    def iter_blobs(self) -> Iterator[Path]:
+        """All blob files on disk."""
+        root = self.data_dir / BLOB_DIR
+        if not root.exists():
+            return
+        for path in root.glob('*/*/*'):
+            if path.is_file() and not path.name.startswith('.'):
+                yield path
+
+    def collect_garbage(
+        self,
+        grace_seconds: int = DEFAULT_GC_GRACE_SECONDS,
+        dry_run: bool = False
+    ) -> GarbageCollectionResult:
+        """
+        Delete blobs that no Attachment row references.
+
+        Args:
+            grace_seconds: Keep blobs modified more recently than this
+            dry_run: Only count what would be deleted
+
+        Returns:
+            GarbageCollectionResult with scanned/deleted blobs and freed bytes
+        """
+        from core.models import Attachment
+
+        referenced = set(
+            Attachment.objects.filter(storage_path__startswith=f"{BLOB_DIR}/")
+            .values_list('storage_path', flat=True)
+        )
+        cutoff = time.time() - grace_seconds
+        result = GarbageCollectionResult()
+
+        for path in self.iter_blobs():
+            result.scanned += 1
+            relative = path.relative_to(self.data_dir).as_posix()
+            if relative in referenced:
+                continue
+            stat = path.stat()
+            if stat.st_mtime > cutoff:
+                continue
+            result.deleted += 1
+            result.freed_bytes += stat.st_size
+            if not dry_run:
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+                logger.info(f"Deleted unreferenced blob {relative}")
+
+        # Leftovers of uploads interrupted before the rename
+        for path in (self.data_dir / BLOB_DIR).glob('*/*/.upload-*'):
+            stat = path.stat()
+            if stat.st_mtime <= cutoff:
+                result.freed_bytes += stat.st_size
+                if not dry_run:
+                    path.unlink(missing_ok=True)
+
+        return result
+
+    def stats(self) -> StorageStats:
+        """Logical size of blob-backed attachments versus bytes on disk."""
+        from django.db.models import Count, Sum
+        from core.models import Attachment
+
+        blob_rows = Attachment.objects.filter(storage_path__startswith=f"{BLOB_DIR}/")
+        totals = blob_rows.aggregate(count=Count('id'), size=Sum('size_bytes'))
+        stats = StorageStats(attachments=totals['count'] or 0, logical_bytes=totals['size'] or 0)
+        for path in self.iter_blobs():
+            stats.blobs += 1
+            stats.physical_bytes += path.stat().st_size
+        return stats
+
+
+def hash_file(path: Path) -> str:
+    """SHA256 of a file on disk, read in chunks."""
+    file_hash = hashlib.sha256()
+    with open(path, 'rb') as f:
+        while chunk := f.read(BLOB_CHUNK_SIZE):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
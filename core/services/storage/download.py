@@ -0,0 +1,191 @@
+"""
+HTTP responses for attachment downloads.
+
+Files are streamed from disk in chunks instead of being read into memory.
+Responses carry a strong ETag derived from the stored SHA256 (plus
+Last-Modified), answer conditional requests with 304, support single byte
+ranges (PDF viewers, resumed downloads) and can hand the transfer off to the
+web server:
+
+- ``ATTACHMENT_SENDFILE = 'x-accel-redirect'``: nginx serves the file from an
+  internal location mapped to AGIRA_DATA_DIR (ATTACHMENT_SENDFILE_URL_PREFIX)
+- ``ATTACHMENT_SENDFILE = 'x-sendfile'``: Apache mod_xsendfile / lighttpd
+  serve the absolute file path
+"""
+
+import os
+import re
+from typing import Iterator, Optional, Tuple
+from urllib.parse import quote
+
+from django.conf import settings
+from django.http import FileResponse, HttpResponse, HttpResponseBase, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+from core.models import Attachment
+from .service import AttachmentStorageService
+
+# Size in bytes of the chunks sent for a byte range
+RANGE_CHUNK_SIZE = 64 * 1024
+
+SENDFILE_X_ACCEL_REDIRECT = 'x-accel-redirect'
+SENDFILE_X_SENDFILE = 'x-sendfile'
+
+_RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+def attachment_etag(attachment: Attachment) -> Optional[str]:
+    """Strong ETag for an attachment, or None if no hash was stored."""
+    if not attachment.sha256:
+        return None
+    return f'"{attachment.sha256}"'
+
+
+def parse_range_header(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single-range ``Range`` header.
+
+    Args:
+        header: Value of the Range header, e.g. ``bytes=0-1023`` or ``bytes=-500``
+        size: Size of the file in bytes
+
+    Returns:
+        Tuple of (first byte, last byte), both inclusive; None if the header is
+        malformed or asks for several ranges (the full file is served then)
+
+    Raises:
+        ValueError: If the range cannot be satisfied (answered with 416)
+    """
+    match = _RANGE_RE.match(header.strip())
+    if not match:
+        return None
+
+    start, end = match.groups()
+    if not start and not end:
+        return None
+
+    if not start:
+        # Suffix range: the last N bytes
+        length = int(end)
+        if length == 0 or size == 0:
+            raise ValueError(f"Unsatisfiable range: {header}")
+        return max(size - length, 0), size - 1
+
+    first = int(start)
+    if first >= size:
+        raise ValueError(f"Unsatisfiable range: {header}")
+    last = int(end) if end else size - 1
+    if last < first:
+        return None
+    return first, min(last, size - 1)
+
+
+def _iter_file_range(path, first: int, length: int) -> Iterator[bytes]:
+    """Yield ``length`` bytes of the file starting at ``first``."""
+    with open(path, 'rb') as f:
+        f.seek(first)
+        remaining = length
+        while remaining > 0:
+            chunk = f.read(min(RANGE_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def _content_disposition(disposition: str, filename: str) -> str:
+    """Content-Disposition header value with an RFC 5987 encoded filename."""
+    try:
+        filename.encode('ascii')
+        return f'{disposition}; filename="{filename.replace(chr(34), "")}"'
+    except UnicodeEncodeError:
+        return f"{disposition}; filename*=utf-8''{quote(filename)}"
+
+
+def _sendfile_response(path, storage: AttachmentStorageService) -> Optional[HttpResponse]:
+    """Empty response telling the web server to send the file, if configured."""
+    mode = (getattr(settings, 'ATTACHMENT_SENDFILE', '') or '').lower()
+    if mode == SENDFILE_X_ACCEL_REDIRECT:
+        prefix = getattr(settings, 'ATTACHMENT_SENDFILE_URL_PREFIX', '/protected-attachments/')
+        relative = path.relative_to(storage.data_dir.resolve()).as_posix()
+        response = HttpResponse()
+        response['X-Accel-Redirect'] = prefix.rstrip('/') + '/' + quote(relative)
+        return response
+    if mode == SENDFILE_X_SENDFILE:
+        response = HttpResponse()
+        response['X-Sendfile'] = str(path)
+        return response
+    return None
+
+
+def attachment_response(
+    request,
+    attachment: Attachment,
+    disposition: str = 'attachment',
+    content_type: Optional[str] = None,
+    storage: Optional[AttachmentStorageService] = None,
+) -> HttpResponseBase:
+    """
+    Serve an attachment file.
+
+    Args:
+        request: Current request (conditional and Range headers are honoured)
+        attachment: Attachment to serve
+        disposition: ``attachment`` (download) or ``inline`` (display in browser)
+        content_type: MIME type; defaults to the stored content type
+        storage: Storage service (a new one by default)
+
+    Returns:
+        304/412 for matching conditional requests, 416 for unsatisfiable
+        ranges, 206 for a byte range, otherwise 200 with the file streamed
+        from disk (or handed to the web server in sendfile mode)
+
+    Raises:
+        AttachmentNotFound: If the file does not exist
+    """
+    storage = storage or AttachmentStorageService()
+    path = storage.get_file_path(attachment).resolve()
+    stat = os.stat(path)
+    size = stat.st_size
+    etag = attachment_etag(attachment)
+
+    conditional = get_conditional_response(request, etag=etag, last_modified=int(stat.st_mtime))
+    if conditional is not None:
+        return conditional
+
+    content_type = content_type or attachment.content_type or 'application/octet-stream'
+
+    response = _sendfile_response(path, storage)
+    if response is None:
+        byte_range = None
+        range_header = request.headers.get('Range')
+        if_range = request.headers.get('If-Range')
+        if range_header and (not if_range or (etag and if_range == etag)):
+            try:
+                byte_range = parse_range_header(range_header, size)
+            except ValueError:
+                response = HttpResponse(status=416)
+                response['Content-Range'] = f'bytes */{size}'
+                return response
+
+        if byte_range:
+            first, last = byte_range
+            response = StreamingHttpResponse(
+                _iter_file_range(path, first, last - first + 1), status=206
+            )
+            response['Content-Range'] = f'bytes {first}-{last}/{size}'
+            response['Content-Length'] = str(last - first + 1)
+        else:
+            response = FileResponse(open(path, 'rb'))
+            response['Content-Length'] = str(size)
+
+    response['Content-Type'] = content_type
+    response['Content-Disposition'] = _content_disposition(disposition, attachment.original_name)
+    response['Accept-Ranges'] = 'bytes'
+    response['Last-Modified'] = http_date(stat.st_mtime)
+    # Attachments are private; browsers revalidate with the ETag on each use
+    response['Cache-Control'] = 'private, no-cache'
+    if etag:
+        response['ETag'] = etag
+    return response
@@ -1,13 +1,16 @@
 """
 Attachment Storage Service
 
-Provides local filesystem storage for attachments.
+Provides local filesystem storage for attachments. Hashed uploads are stored
+once per content in the blob store (see blobs.py); identical uploads only
+create new Attachment rows pointing to the existing file.
 """
 
 import hashlib
 import os
+from io import BytesIO
 from pathlib import Path
-from typing import Optional, Union, BinaryIO
+from typing import Optional, Tuple, Union, BinaryIO
 from django.conf import settings
 from django.core.files.uploadedfile import UploadedFile
 from django.db import transaction
@@ -15,6 +18,7 @@ from django.contrib.contenttypes.models import ContentType
 
 from core.models import Attachment, AttachmentLink, Change, Project, Item, ItemComment, User, AttachmentRole
 from .errors import AttachmentTooLarge, AttachmentNotFound, AttachmentWriteError
+from .blobs import BlobStore, is_blob_path
 from .paths import build_attachment_path, get_absolute_path, sanitize_filename
 
 
@@ -40,6 +44,7 @@ class AttachmentStorageService:
         
         # Ensure data directory exists
         self.data_dir.mkdir(parents=True, exist_ok=True)
+        self.blobs = BlobStore(self.data_dir)
     
     def _compute_hash(self, file_obj: BinaryIO) -> str:
         """
@@ -117,7 +122,8 @@ class AttachmentStorageService:
             target: Target object to attach to (Project, Item, or ItemComment)
             role: AttachmentRole value (auto-determined if not provided)
             created_by: User who created the attachment
-            compute_hash: Whether to compute SHA256 hash
+            compute_hash: Whether to compute SHA256 hash (hashed files are
+                stored deduplicated in the blob store)
             original_name: Original filename (extracted from file if not provided)
             content_type: MIME type (extracted from file if not provided)
             content_id: Content-ID for inline email attachments (optional)
@@ -147,22 +153,77 @@ class AttachmentStorageService:
                 f"File size ({actual_size_mb:.2f}MB) exceeds maximum allowed size ({max_size_mb:.2f}MB)"
             )
         
-        # Compute hash if requested
-        sha256 = ''
-        if compute_hash:
-            sha256 = self._compute_hash(file)
-        
         # Determine role if not provided
         if role is None:
             role = self._determine_role(target)
         
+        if compute_hash:
+            # Content-addressed: identical uploads share one blob
+            sha256, relative_path = self.store_blob(file)
+            attachment = Attachment.objects.create(
+                created_by=created_by,
+                original_name=sanitize_filename(original_name),
+                content_type=content_type,
+                size_bytes=size_bytes,
+                sha256=sha256,
+                storage_path=relative_path,
+                is_deleted=False,
+                content_id=content_id or ''
+            )
+        else:
+            attachment = self._store_unhashed(
+                file, target, original_name, content_type, size_bytes, created_by, content_id
+            )
+        
+        # Create AttachmentLink
+        content_type_obj = ContentType.objects.get_for_model(target)
+        AttachmentLink.objects.create(
+            attachment=attachment,
+            target_content_type=content_type_obj,
+            target_object_id=target.id,
+            role=role
+        )
+        
+        return attachment
+    
+    def store_blob(self, file: Union[UploadedFile, BinaryIO]) -> Tuple[str, str]:
+        """
+        Store file content in the blob store.
+        
+        Args:
+            file: File to store
+            
+        Returns:
+            Tuple of (sha256, relative storage path)
+            
+        Raises:
+            AttachmentWriteError: If the file cannot be written
+        """
+        sha256 = self._compute_hash(file)
+        try:
+            relative_path, _ = self.blobs.put(file, sha256)
+        except OSError as e:
+            raise AttachmentWriteError(f"Failed to write attachment: {str(e)}") from e
+        return sha256, relative_path
+    
+    def _store_unhashed(
+        self,
+        file: Union[UploadedFile, BinaryIO],
+        target,
+        original_name: str,
+        content_type: str,
+        size_bytes: int,
+        created_by: Optional[User],
+        content_id: Optional[str]
+    ) -> Attachment:
+        """Store a file without hash at its own per-attachment path."""
         # Create Attachment record first to get ID
         attachment = Attachment.objects.create(
             created_by=created_by,
             original_name=sanitize_filename(original_name),
             content_type=content_type,
             size_bytes=size_bytes,
-            sha256=sha256,
+            sha256='',
             storage_path='',  # Will be updated after we know the ID
             is_deleted=False,
             content_id=content_id or ''
@@ -190,18 +251,54 @@ class AttachmentStorageService:
         # Update attachment with storage path
         attachment.storage_path = relative_path
         attachment.save(update_fields=['storage_path'])
+        return attachment
+    
+    def replace_content(self, attachment: Attachment, content: bytes) -> Attachment:
+        """
+        Replace the content of an attachment.
         
-        # Create AttachmentLink
-        content_type_obj = ContentType.objects.get_for_model(target)
-        AttachmentLink.objects.create(
-            attachment=attachment,
-            target_content_type=content_type_obj,
-            target_object_id=target.id,
-            role=role
-        )
+        The new content is stored as a blob; the previous blob is deleted if no
+        other attachment uses it. Shared blobs are never modified in place.
+        
+        Args:
+            attachment: Attachment to update
+            content: New file content
+            
+        Returns:
+            The updated attachment (size_bytes, sha256 and storage_path saved)
+        """
+        old_path = attachment.storage_path
+        sha256, relative_path = self.store_blob(BytesIO(content))
+        
+        attachment.size_bytes = len(content)
+        attachment.sha256 = sha256
+        attachment.storage_path = relative_path
+        attachment.save(update_fields=['size_bytes', 'sha256', 'storage_path'])
         
+        if old_path != relative_path:
+            self._release_file(old_path)
         return attachment
     
+    def _release_file(self, relative_path: str) -> None:
+        """
+        Delete a stored file once no attachment references it.
+        
+        The delete runs after the surrounding transaction commits, so a
+        rollback that restores the Attachment row also keeps its file.
+        """
+        if not relative_path:
+            return
+        transaction.on_commit(lambda: self._delete_file(relative_path))
+    
+    def _delete_file(self, relative_path: str) -> None:
+        if is_blob_path(relative_path):
+            self.blobs.release(relative_path)
+            return
+        try:
+            get_absolute_path(self.data_dir, relative_path).unlink()
+        except (FileNotFoundError, ValueError):
+            pass
+    
     def link_attachment(
         self,
         attachment: Attachment,
@@ -283,19 +380,16 @@ class AttachmentStorageService:
         
         Args:
             attachment: Attachment to delete
-            hard: If True, delete file and DB record; if False, just mark as deleted
+            hard: If True, delete DB record and, after commit, the file (a shared
+                blob only when its last attachment is deleted); if False, just
+                mark as deleted
         """
         if hard:
-            # Delete physical file if it exists
-            try:
-                file_path = self.get_file_path(attachment)
-                if file_path.exists():
-                    file_path.unlink()
-            except AttachmentNotFound:
-                pass  # File already gone
+            storage_path = attachment.storage_path
             
-            # Delete DB record
+            # Delete DB record, then the file unless another attachment shares it
             attachment.delete()
+            self._release_file(storage_path)
         else:
             # Soft delete
             attachment.is_deleted = True
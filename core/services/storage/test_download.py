@@ -0,0 +1,127 @@
+"""
+Tests for attachment download responses
+"""
+
+import shutil
+import tempfile
+from io import BytesIO
+
+from django.test import RequestFactory, TestCase, override_settings
+
+from core.models import Project, ProjectStatus
+from core.services.storage import AttachmentStorageService, attachment_response
+from core.services.storage.download import parse_range_header
+
+
+class ParseRangeHeaderTestCase(TestCase):
+    """Test Range header parsing."""
+
+    def test_closed_range(self):
+        self.assertEqual(parse_range_header('bytes=0-99', 1000), (0, 99))
+
+    def test_open_range(self):
+        self.assertEqual(parse_range_header('bytes=900-', 1000), (900, 999))
+
+    def test_suffix_range(self):
+        self.assertEqual(parse_range_header('bytes=-100', 1000), (900, 999))
+        self.assertEqual(parse_range_header('bytes=-5000', 1000), (0, 999))
+
+    def test_range_end_is_clamped_to_size(self):
+        self.assertEqual(parse_range_header('bytes=500-5000', 1000), (500, 999))
+
+    def test_malformed_and_multiple_ranges_are_ignored(self):
+        self.assertIsNone(parse_range_header('bytes=0-10,20-30', 1000))
+        self.assertIsNone(parse_range_header('items=0-10', 1000))
+        self.assertIsNone(parse_range_header('bytes=50-10', 1000))
+
+    def test_unsatisfiable_range(self):
+        with self.assertRaises(ValueError):
+            parse_range_header('bytes=1000-', 1000)
+
+
+class AttachmentResponseTestCase(TestCase):
+    """Test streaming, conditional and range responses for attachments."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir, True)
+        self.storage = AttachmentStorageService(data_dir=self.temp_dir)
+        self.project = Project.objects.create(name='Download Project', status=ProjectStatus.WORKING)
+        self.content = bytes(range(256)) * 40
+        file_obj = BytesIO(self.content)
+        file_obj.name = 'report.pdf'
+        self.attachment = self.storage.store_attachment(
+            file=file_obj, target=self.project, content_type='application/pdf'
+        )
+        self.factory = RequestFactory()
+
+    def _get(self, **headers):
+        request = self.factory.get('/download/', headers=headers)
+        return attachment_response(request, self.attachment, storage=self.storage)
+
+    def test_full_download_is_streamed(self):
+        response = self._get()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(b''.join(response.streaming_content), self.content)
+        self.assertEqual(response['Content-Length'], str(len(self.content)))
+        self.assertEqual(response['Content-Type'], 'application/pdf')
+        self.assertEqual(response['Content-Disposition'], 'attachment; filename="report.pdf"')
+        self.assertEqual(response['Accept-Ranges'], 'bytes')
+        self.assertEqual(response['ETag'], f'"{self.attachment.sha256}"')
+
+    def test_matching_etag_returns_304(self):
+        response = self._get(if_none_match=f'"{self.attachment.sha256}"')
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+
+    def test_stale_etag_returns_file(self):
+        response = self._get(if_none_match='"outdated"')
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_byte_range_returns_206(self):
+        response = self._get(range='bytes=100-199')
+
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(b''.join(response.streaming_content), self.content[100:200])
+        self.assertEqual(response['Content-Range'], f'bytes 100-199/{len(self.content)}')
+        self.assertEqual(response['Content-Length'], '100')
+
+    def test_if_range_with_other_etag_returns_full_file(self):
+        response = self._get(range='bytes=100-199', if_range='"outdated"')
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_unsatisfiable_range_returns_416(self):
+        response = self._get(range=f'bytes={len(self.content)}-')
+
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response['Content-Range'], f'bytes */{len(self.content)}')
+
+    def test_inline_disposition_and_non_ascii_filename(self):
+        self.attachment.original_name = 'Übersicht.pdf'
+        request = self.factory.get('/download/')
+
+        response = attachment_response(request, self.attachment, disposition='inline', storage=self.storage)
+
+        self.assertEqual(response['Content-Disposition'], "inline; filename*=utf-8''%C3%9Cbersicht.pdf")
+        response.close()
+
+    @override_settings(ATTACHMENT_SENDFILE='x-accel-redirect', ATTACHMENT_SENDFILE_URL_PREFIX='/protected/')
+    def test_x_accel_redirect_mode(self):
+        response = self._get()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b'')
+        self.assertEqual(response['X-Accel-Redirect'], f'/protected/{self.attachment.storage_path}')
+        self.assertEqual(response['ETag'], f'"{self.attachment.sha256}"')
+
+    @override_settings(ATTACHMENT_SENDFILE='x-sendfile')
+    def test_x_sendfile_mode(self):
+        response = self._get()
+
+        self.assertEqual(response['X-Sendfile'], str(self.storage.get_file_path(self.attachment)))
+        self.assertEqual(response.content, b'')
@@ -4,6 +4,7 @@ Tests for Attachment Storage Service
 
 import os
 import tempfile
+import time
 from pathlib import Path
 from io import BytesIO
 from django.test import TestCase, override_settings
@@ -365,8 +366,13 @@ class AttachmentStorageServiceTestCase(TestCase):
         file_path = self.service.get_file_path(attachment)
         attachment_id = attachment.id
         
-        # Hard delete
-        self.service.delete_attachment(attachment, hard=True)
+        # Age the blob past the garbage collection grace period
+        past = time.time() - 2 * 3600
+        os.utime(file_path, (past, past))
+        
+        # Hard delete; the file is removed once the transaction commits
+        with self.captureOnCommitCallbacks(execute=True):
+            self.service.delete_attachment(attachment, hard=True)
         
         # Verify attachment is deleted from DB
         self.assertFalse(Attachment.objects.filter(id=attachment_id).exists())
@@ -465,3 +471,187 @@ class AttachmentStorageServiceTestCase(TestCase):
         # Verify
         expected = base64.b64encode(file_content).decode('utf-8')
         self.assertEqual(encoded, expected)
+
+
+class BlobStorageTestCase(TestCase):
+    """Test content-addressed (deduplicated) attachment storage."""
+    
+    def setUp(self):
+        """Set up test data and temporary storage."""
+        import shutil
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir, True)
+        self.service = AttachmentStorageService(data_dir=self.temp_dir)
+        self.project = Project.objects.create(name='Blob Project', status=ProjectStatus.NEW)
+    
+    def _store(self, content, name='logo.png'):
+        return self.service.store_attachment(
+            file=SimpleUploadedFile(name, content), target=self.project
+        )
+    
+    def _age_blobs(self, seconds=2 * 3600):
+        """Make all blobs older than the garbage collection grace period."""
+        import time
+        past = time.time() - seconds
+        for path in self.service.blobs.iter_blobs():
+            os.utime(path, (past, past))
+    
+    def test_identical_uploads_share_one_blob(self):
+        """Test that the same content is written to disk only once."""
+        first = self._store(b'signature logo')
+        second = self._store(b'signature logo', name='image001.png')
+        
+        self.assertEqual(first.storage_path, second.storage_path)
+        self.assertTrue(first.storage_path.startswith(f'blobs/{first.sha256[:2]}/{first.sha256[2:4]}/'))
+        self.assertEqual(len(list(self.service.blobs.iter_blobs())), 1)
+        self.assertEqual(self.service.read_attachment(second), b'signature logo')
+        self.assertEqual(self.service.blobs.ref_count(first.storage_path), 2)
+    
+    def test_hard_delete_keeps_blob_while_referenced(self):
+        """Test that a shared blob is deleted only with its last attachment."""
+        first = self._store(b'shared')
+        second = self._store(b'shared')
+        file_path = self.service.get_file_path(first)
+        self._age_blobs()
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            self.service.delete_attachment(first, hard=True)
+        self.assertTrue(file_path.exists())
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            self.service.delete_attachment(second, hard=True)
+        self.assertFalse(file_path.exists())
+    
+    def test_hard_delete_removes_blob_only_after_commit(self):
+        """Test that a rolled-back hard delete keeps the file of the restored row."""
+        attachment = self._store(b'rolled back')
+        file_path = self.service.get_file_path(attachment)
+        self._age_blobs()
+        
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            self.service.delete_attachment(attachment, hard=True)
+        
+        self.assertTrue(file_path.exists())
+        self.assertEqual(len(callbacks), 1)
+    
+    def test_hard_delete_leaves_recently_used_blob_to_garbage_collection(self):
+        """Test that a blob reused within the grace period is not deleted on release."""
+        attachment = self._store(b'reused by a concurrent upload')
+        file_path = self.service.get_file_path(attachment)
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            self.service.delete_attachment(attachment, hard=True)
+        
+        self.assertTrue(file_path.exists())
+        self._age_blobs()
+        self.assertEqual(self.service.blobs.collect_garbage().deleted, 1)
+    
+    def test_replace_content_does_not_modify_shared_blob(self):
+        """Test that updating one attachment leaves others with the same content intact."""
+        first = self._store(b'# Docs v1', name='README.md')
+        second = self._store(b'# Docs v1', name='README.md')
+        
+        self.service.replace_content(first, b'# Docs v2')
+        
+        first.refresh_from_db()
+        self.assertEqual(self.service.read_attachment(first), b'# Docs v2')
+        self.assertEqual(self.service.read_attachment(second), b'# Docs v1')
+        self.assertEqual(first.size_bytes, len(b'# Docs v2'))
+        self.assertNotEqual(first.sha256, second.sha256)
+    
+    def test_garbage_collection_deletes_unreferenced_blobs(self):
+        """Test that only unreferenced blobs past the grace period are removed."""
+        kept = self._store(b'kept')
+        orphan = self._store(b'orphan')
+        orphan_path = self.service.get_file_path(orphan)
+        Attachment.objects.filter(id=orphan.id).delete()  # row gone, file left behind
+        self._age_blobs()
+        
+        result = self.service.blobs.collect_garbage(dry_run=True)
+        self.assertEqual((result.deleted, result.freed_bytes), (1, len(b'orphan')))
+        self.assertTrue(orphan_path.exists())
+        
+        result = self.service.blobs.collect_garbage()
+        self.assertEqual(result.deleted, 1)
+        self.assertFalse(orphan_path.exists())
+        self.assertTrue(self.service.get_file_path(kept).exists())
+    
+    def test_garbage_collection_respects_grace_period(self):
+        """Test that freshly written blobs survive even without attachment rows."""
+        orphan = self._store(b'in flight')
+        Attachment.objects.filter(id=orphan.id).delete()
+        
+        result = self.service.blobs.collect_garbage()
+        
+        self.assertEqual(result.deleted, 0)
+    
+    def test_stats_report_saved_bytes(self):
+        """Test that deduplication savings are reported."""
+        self._store(b'x' * 100)
+        self._store(b'x' * 100)
+        self._store(b'y' * 10)
+        
+        stats = self.service.blobs.stats()
+        
+        self.assertEqual((stats.attachments, stats.blobs), (3, 2))
+        self.assertEqual((stats.logical_bytes, stats.physical_bytes, stats.saved_bytes), (210, 110, 100))
+
+
+class MigrateAttachmentsToBlobsCommandTestCase(TestCase):
+    """Test the migrate_attachments_to_blobs and gc_attachment_blobs commands."""
+    
+    def setUp(self):
+        """Store two identical attachments the pre-blob way."""
+        import shutil
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir, True)
+        self.service = AttachmentStorageService(data_dir=self.temp_dir)
+        self.project = Project.objects.create(name='Legacy Project', status=ProjectStatus.NEW)
+        self.attachments = [
+            self.service.store_attachment(
+                file=SimpleUploadedFile(f'doc{i}.txt', b'same content'),
+                target=self.project,
+                compute_hash=False,
+            )
+            for i in range(2)
+        ]
+        self.legacy_paths = [self.service.get_file_path(a) for a in self.attachments]
+    
+    def _call(self, name, *args):
+        from io import StringIO
+        from django.core.management import call_command
+        out = StringIO()
+        with override_settings(AGIRA_DATA_DIR=Path(self.temp_dir)):
+            call_command(name, *args, stdout=out)
+        return out.getvalue()
+    
+    def test_dry_run_changes_nothing(self):
+        """Test that --dry-run leaves files and rows untouched."""
+        output = self._call('migrate_attachments_to_blobs', '--dry-run')
+        
+        self.assertIn('DRY RUN', output)
+        self.assertTrue(all(path.exists() for path in self.legacy_paths))
+        self.assertFalse(Attachment.objects.filter(storage_path__startswith='blobs/').exists())
+    
+    def test_migration_deduplicates_files(self):
+        """Test that legacy files are moved into one blob and savings are reported."""
+        output = self._call('migrate_attachments_to_blobs')
+        
+        self.assertIn('1 duplicates', output)
+        self.assertIn('saved by deduplication', output)
+        self.assertFalse(any(path.exists() for path in self.legacy_paths))
+        paths = set(Attachment.objects.values_list('storage_path', flat=True))
+        self.assertEqual(len(paths), 1)
+        for attachment in Attachment.objects.all():
+            self.assertEqual(self.service.read_attachment(attachment), b'same content')
+            self.assertTrue(attachment.sha256)
+    
+    def test_gc_command_reports_result(self):
+        """Test that gc_attachment_blobs runs and reports disk usage."""
+        self._call('migrate_attachments_to_blobs')
+        Attachment.objects.all().delete()
+        
+        output = self._call('gc_attachment_blobs', '--grace-hours', '0')
+        
+        self.assertIn('Deleted 1 of 1 blobs', output)
+        self.assertEqual(list(self.service.blobs.iter_blobs()), [])
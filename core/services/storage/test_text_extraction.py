@@ -0,0 +1,130 @@
+"""
+Tests for the per-hash attachment text extraction cache
+"""
+
+import shutil
+import tempfile
+from io import BytesIO, StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from core.models import (
+    AttachmentTextExtract, AttachmentTextExtractStatus, Project, ProjectStatus,
+)
+from core.services.storage import AttachmentStorageService
+from core.services.storage import text_extraction
+from core.services.storage.text_extraction import (
+    ExtractedText, extract_pending, get_attachment_text, get_cached_text,
+)
+
+
+def _docx_bytes(*paragraphs):
+    from docx import Document
+
+    doc = Document()
+    for paragraph in paragraphs:
+        doc.add_paragraph(paragraph)
+    buffer = BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+class AttachmentTextExtractionTestCase(TestCase):
+    """Test extraction, caching and background queueing of attachment text."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir, True)
+        self.storage = AttachmentStorageService(data_dir=self.temp_dir)
+        self.project = Project.objects.create(name='Extraction Project', status=ProjectStatus.WORKING)
+
+    def _store(self, name, content):
+        file_obj = BytesIO(content)
+        file_obj.name = name
+        return self.storage.store_attachment(file=file_obj, target=self.project)
+
+    def test_docx_is_extracted_once_and_cached_by_hash(self):
+        attachment = self._store('spec.docx', _docx_bytes('Erster Absatz', 'Zweiter Absatz'))
+
+        text = get_attachment_text(attachment, storage=self.storage)
+
+        self.assertEqual(text, 'Erster Absatz\n\nZweiter Absatz')
+        extract = AttachmentTextExtract.objects.get(sha256=attachment.sha256)
+        self.assertEqual(extract.status, AttachmentTextExtractStatus.DONE)
+        self.assertEqual(extract.extractor, 'docx')
+        self.assertIsNotNone(extract.extraction_ms)
+        self.assertEqual(get_cached_text(attachment), text)
+
+        # A second upload of the same file reuses the cached text
+        duplicate = self._store('copy.docx', _docx_bytes('Erster Absatz', 'Zweiter Absatz'))
+        duplicate.sha256 = attachment.sha256  # DOCX zips embed timestamps
+        with patch.dict(text_extraction._EXTRACTORS, {'docx': self.fail}):
+            self.assertEqual(get_attachment_text(duplicate, storage=self.storage), text)
+
+    def test_pdf_page_count_is_stored(self):
+        attachment = self._store('report.pdf', b'%PDF-1.4 fake')
+
+        fake_pdf = lambda path: ExtractedText('Seite eins\n\nSeite zwei', page_count=2)
+        with patch.dict(text_extraction._EXTRACTORS, {'pdf': fake_pdf}):
+            text = get_attachment_text(attachment, storage=self.storage)
+
+        self.assertEqual(text, 'Seite eins\n\nSeite zwei')
+        self.assertEqual(AttachmentTextExtract.objects.get(sha256=attachment.sha256).page_count, 2)
+
+    def test_corrupt_file_is_marked_failed_and_not_retried(self):
+        attachment = self._store('broken.pdf', b'not a pdf')
+
+        self.assertIsNone(get_attachment_text(attachment, storage=self.storage))
+
+        extract = AttachmentTextExtract.objects.get(sha256=attachment.sha256)
+        self.assertEqual(extract.status, AttachmentTextExtractStatus.FAILED)
+        self.assertTrue(extract.last_error)
+        with patch.dict(text_extraction._EXTRACTORS, {'pdf': self.fail}):
+            self.assertIsNone(get_attachment_text(attachment, storage=self.storage))
+
+    def test_plain_text_is_read_without_caching(self):
+        attachment = self._store('notes.md', '# Überschrift'.encode('utf-8'))
+
+        self.assertEqual(get_attachment_text(attachment, storage=self.storage), '# Überschrift')
+        self.assertFalse(AttachmentTextExtract.objects.exists())
+
+    def test_unsupported_type_returns_none(self):
+        attachment = self._store('image.png', b'\x89PNG')
+
+        self.assertIsNone(get_attachment_text(attachment, storage=self.storage))
+
+    @override_settings(ATTACHMENT_TEXT_INLINE_MAX_MB=0)
+    def test_large_file_is_queued_and_extracted_by_worker(self):
+        attachment = self._store('large.docx', _docx_bytes('Großes Dokument'))
+
+        self.assertIsNone(get_attachment_text(attachment, storage=self.storage))
+        extract = AttachmentTextExtract.objects.get(sha256=attachment.sha256)
+        self.assertEqual(extract.status, AttachmentTextExtractStatus.PENDING)
+
+        with patch.object(text_extraction, '_reindex_attachments') as reindex:
+            result = extract_pending(storage=self.storage)
+
+        self.assertEqual(result.claimed, 1)
+        self.assertEqual(result.extracted, 1)
+        reindex.assert_called_once_with(attachment.sha256)
+        self.assertEqual(get_attachment_text(attachment, storage=self.storage), 'Großes Dokument')
+
+    def test_worker_gives_up_when_file_is_missing(self):
+        AttachmentTextExtract.objects.create(sha256='f' * 64, extractor='pdf')
+
+        result = extract_pending(max_attempts=1, storage=self.storage)
+
+        self.assertEqual(result.failed, 1)
+        extract = AttachmentTextExtract.objects.get(sha256='f' * 64)
+        self.assertEqual(extract.status, AttachmentTextExtractStatus.FAILED)
+        self.assertEqual(extract.attempts, 1)
+
+    def test_worker_command_once(self):
+        AttachmentTextExtract.objects.create(sha256='a' * 64, extractor='docx', status=AttachmentTextExtractStatus.DONE)
+        out = StringIO()
+
+        call_command('attachment_text_worker', '--once', stdout=out)
+
+        self.assertIn('0 pending, 1 done, 0 failed', out.getvalue())
@@ -0,0 +1,339 @@
+"""
+Text extraction for attachment files, cached per content hash.
+
+Parsing PDFs and DOCX files is expensive, and the same file is needed again
+on every Weaviate upsert, re-sync and AI summary. The extracted text, page
+count and extraction time are therefore stored once per SHA256 in
+``AttachmentTextExtract`` and reused by every attachment with that content.
+
+- Plain text files are cheap to read and are not cached.
+- PDF/DOCX files up to ``ATTACHMENT_TEXT_INLINE_MAX_MB`` are extracted inline
+  on first use.
+- Larger files are queued as ``pending`` rows; the ``attachment_text_worker``
+  command extracts them and queues a Weaviate upsert of the attachments so
+  the index picks up the text.
+"""
+
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import List, Optional
+
+from django.conf import settings
+from django.db import IntegrityError, connection, transaction
+from django.utils import timezone
+
+from .errors import AttachmentNotFound
+from .service import AttachmentStorageService
+
+logger = logging.getLogger(__name__)
+
+PLAIN_TEXT_EXTENSIONS = {'md', 'json', 'html', 'py', 'xml', 'cs', 'txt', 'yml', 'yaml'}
+
+EXTRACTOR_PLAIN = 'plain'
+EXTRACTOR_PDF = 'pdf'
+EXTRACTOR_DOCX = 'docx'
+
+DEFAULT_CLAIM_SIZE = 10
+DEFAULT_MAX_ATTEMPTS = 3
+LEASE_SECONDS = 600
+BACKOFF_BASE_SECONDS = 60
+
+
+@dataclass
+class ExtractedText:
+    """Result of parsing one file."""
+    text: str
+    page_count: Optional[int] = None
+
+
+@dataclass
+class ExtractionPassResult:
+    """Outcome of one extract_pending() pass."""
+    claimed: int = 0
+    extracted: int = 0
+    failed: int = 0
+    errors: List[str] = field(default_factory=list)
+
+
+def get_extractor(attachment) -> Optional[str]:
+    """Extractor for an attachment based on its file extension, or None if unsupported."""
+    filename = (attachment.original_name or '').lower()
+    extension = filename.rsplit('.', 1)[-1] if '.' in filename else ''
+    if extension in PLAIN_TEXT_EXTENSIONS:
+        return EXTRACTOR_PLAIN
+    if extension in (EXTRACTOR_PDF, EXTRACTOR_DOCX):
+        return extension
+    return None
+
+
+def _inline_max_bytes() -> int:
+    return int(getattr(settings, 'ATTACHMENT_TEXT_INLINE_MAX_MB', 2) * 1024 * 1024)
+
+
+def _extract_plain_text(file_path, encoding: str = 'utf-8') -> ExtractedText:
+    """Read a plain text file, falling back to latin-1 for non-UTF-8 content."""
+    try:
+        with open(file_path, 'r', encoding=encoding) as f:
+            return ExtractedText(f.read())
+    except UnicodeDecodeError:
+        with open(file_path, 'r', encoding='latin-1') as f:
+            return ExtractedText(f.read())
+
+
+def _extract_pdf_text(file_path) -> ExtractedText:
+    """Extract the text of all pages of a PDF using PyPDF2."""
+    from PyPDF2 import PdfReader
+
+    reader = PdfReader(file_path)
+    text_parts = []
+    for page in reader.pages:
+        page_text = page.extract_text()
+        if page_text:
+            text_parts.append(page_text)
+    return ExtractedText('\n\n'.join(text_parts), page_count=len(reader.pages))
+
+
+def _extract_docx_text(file_path) -> ExtractedText:
+    """Extract the non-empty paragraphs of a DOCX file using python-docx."""
+    from docx import Document
+
+    doc = Document(file_path)
+    text_parts = [p.text for p in doc.paragraphs if p.text.strip()]
+    return ExtractedText('\n\n'.join(text_parts))
+
+
+_EXTRACTORS = {
+    EXTRACTOR_PLAIN: _extract_plain_text,
+    EXTRACTOR_PDF: _extract_pdf_text,
+    EXTRACTOR_DOCX: _extract_docx_text,
+}
+
+
+def extract_file_text(file_path, extractor: str) -> ExtractedText:
+    """
+    Parse a file with the given extractor.
+
+    Raises:
+        ImportError: If the parser library is not installed
+        Exception: Any parser error for corrupt or unreadable files
+    """
+    return _EXTRACTORS[extractor](file_path)
+
+
+def get_cached_text(attachment) -> Optional[str]:
+    """
+    Extracted text of a PDF/DOCX attachment if it has already been extracted.
+
+    Never parses the file; returns None if nothing is cached yet.
+    """
+    from core.models import AttachmentTextExtract, AttachmentTextExtractStatus
+
+    if not attachment.sha256 or get_extractor(attachment) not in (EXTRACTOR_PDF, EXTRACTOR_DOCX):
+        return None
+    text = AttachmentTextExtract.objects.filter(
+        sha256=attachment.sha256, status=AttachmentTextExtractStatus.DONE,
+    ).values_list('text', flat=True).first()
+    return text or None
+
+
+def get_attachment_text(attachment, storage: Optional[AttachmentStorageService] = None) -> Optional[str]:
+    """
+    Text content of an attachment for indexing and AI features.
+
+    PDF and DOCX files are parsed at most once per content hash. Files larger
+    than ATTACHMENT_TEXT_INLINE_MAX_MB are queued for the background worker
+    and None is returned until the worker has extracted them.
+
+    Args:
+        attachment: Attachment instance
+        storage: Storage service (a new one by default)
+
+    Returns:
+        Extracted text, or None if the file type is unsupported, the file is
+        missing or empty, extraction failed or is still pending
+    """
+    from core.models import AttachmentTextExtract, AttachmentTextExtractStatus
+
+    extractor = get_extractor(attachment)
+    if extractor is None:
+        return None
+    storage = storage or AttachmentStorageService()
+
+    if extractor == EXTRACTOR_PLAIN or not attachment.sha256:
+        # Plain text is cheap to read; files stored without a hash cannot be
+        # cached (migrate_attachments_to_blobs fills in their hashes)
+        try:
+            return extract_file_text(storage.get_file_path(attachment), extractor).text or None
+        except AttachmentNotFound:
+            logger.warning(f"File not found for attachment {attachment.id} (path: {attachment.storage_path})")
+        except Exception as e:
+            logger.warning(f"Error extracting text from {attachment.original_name} (attachment {attachment.id}): {e}")
+        return None
+
+    extract = AttachmentTextExtract.objects.filter(sha256=attachment.sha256).first()
+    if extract is not None:
+        if extract.status == AttachmentTextExtractStatus.DONE:
+            return extract.text or None
+        return None
+
+    if (attachment.size_bytes or 0) > _inline_max_bytes():
+        queue_extraction(attachment.sha256, extractor)
+        return None
+
+    extract = _extract_and_store(attachment, extractor, storage)
+    return (extract.text or None) if extract else None
+
+
+def queue_extraction(sha256: str, extractor: str) -> None:
+    """Leave a pending extract for the background worker (no-op if one exists)."""
+    from core.models import AttachmentTextExtract
+
+    try:
+        with transaction.atomic():
+            AttachmentTextExtract.objects.get_or_create(sha256=sha256, defaults={'extractor': extractor})
+    except IntegrityError:
+        # Created concurrently by another request
+        pass
+    logger.info(f"Queued background text extraction for {extractor} file {sha256[:12]}")
+
+
+def _extract_and_store(attachment, extractor: str, storage: AttachmentStorageService):
+    """
+    Parse an attachment's file and store the result under its hash.
+
+    Returns:
+        The AttachmentTextExtract, or None if the file is missing
+    """
+    from core.models import AttachmentTextExtract, AttachmentTextExtractStatus
+
+    try:
+        file_path = storage.get_file_path(attachment)
+    except AttachmentNotFound:
+        logger.warning(f"File not found for attachment {attachment.id} (path: {attachment.storage_path})")
+        return None
+
+    started = time.monotonic()
+    values = {'extractor': extractor, 'attempts': 0, 'last_error': ''}
+    try:
+        result = extract_file_text(file_path, extractor)
+        values.update(
+            status=AttachmentTextExtractStatus.DONE,
+            text=result.text,
+            page_count=result.page_count,
+        )
+    except ImportError as e:
+        # Missing parser library is a deployment problem, not a bad file:
+        # keep nothing so the file is retried once the library is installed
+        logger.error(f"Text extraction library not available for {extractor}: {e}")
+        return None
+    except Exception as e:
+        logger.warning(f"Error extracting text from {attachment.original_name} (attachment {attachment.id}): {e}")
+        values.update(status=AttachmentTextExtractStatus.FAILED, text='', last_error=str(e))
+    values['extraction_ms'] = int((time.monotonic() - started) * 1000)
+
+    extract, _ = AttachmentTextExtract.objects.update_or_create(sha256=attachment.sha256, defaults=values)
+    logger.info(
+        f"Extracted {len(extract.text)} characters from {attachment.original_name} "
+        f"in {extract.extraction_ms} ms ({extract.status})"
+    )
+    return extract
+
+
+def _claim(limit: int, max_attempts: int) -> List:
+    """Lease up to ``limit`` due pending extracts to this worker."""
+    from core.models import AttachmentTextExtract, AttachmentTextExtractStatus
+
+    now = timezone.now()
+    with transaction.atomic():
+        due = AttachmentTextExtract.objects.filter(
+            status=AttachmentTextExtractStatus.PENDING,
+            next_attempt_at__lte=now,
+            attempts__lt=max_attempts,
+        ).order_by('id')
+        if connection.features.has_select_for_update:
+            lock_kwargs = {}
+            if connection.features.has_select_for_update_skip_locked:
+                lock_kwargs['skip_locked'] = True
+            due = due.select_for_update(**lock_kwargs)
+        extracts = list(due[:limit])
+        if extracts:
+            AttachmentTextExtract.objects.filter(pk__in=[e.pk for e in extracts]).update(
+                next_attempt_at=now + timedelta(seconds=LEASE_SECONDS)
+            )
+    return extracts
+
+
+def _reindex_attachments(sha256: str) -> None:
+    """Queue a Weaviate upsert of all attachments with this content."""
+    from core.models import Attachment, WeaviateSyncAction
+    from core.services.weaviate.client import is_available
+    from core.services.weaviate.outbox import enqueue
+
+    if not is_available():
+        return
+    for attachment in Attachment.objects.filter(sha256=sha256, is_deleted=False):
+        enqueue(attachment, WeaviateSyncAction.UPSERT)
+
+
+def extract_pending(
+    claim_size: int = DEFAULT_CLAIM_SIZE,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    storage: Optional[AttachmentStorageService] = None,
+) -> ExtractionPassResult:
+    """
+    Extract the text of queued large files.
+
+    Args:
+        claim_size: Maximum number of files to extract in this pass
+        max_attempts: Pending extracts that failed this often are marked failed
+        storage: Storage service (a new one by default)
+
+    Returns:
+        ExtractionPassResult with counts for this pass
+    """
+    from core.models import Attachment, AttachmentTextExtractStatus
+
+    storage = storage or AttachmentStorageService()
+    result = ExtractionPassResult()
+    extracts = _claim(claim_size, max_attempts)
+    result.claimed = len(extracts)
+
+    for pending in extracts:
+        attachment = Attachment.objects.filter(sha256=pending.sha256).exclude(storage_path='').first()
+        extract = _extract_and_store(attachment, pending.extractor, storage) if attachment else None
+
+        if extract is not None and extract.status == AttachmentTextExtractStatus.DONE:
+            result.extracted += 1
+            _reindex_attachments(pending.sha256)
+            continue
+
+        result.failed += 1
+        if extract is not None:
+            # The file itself could not be parsed; retrying will not help
+            result.errors.append(f"{pending.sha256[:12]}: {extract.last_error}")
+            continue
+
+        attempts = pending.attempts + 1
+        error = 'no attachment with this content' if attachment is None else 'file missing or parser unavailable'
+        pending.attempts = attempts
+        pending.last_error = error
+        pending.next_attempt_at = timezone.now() + timedelta(seconds=BACKOFF_BASE_SECONDS * (2 ** (attempts - 1)))
+        if attempts >= max_attempts:
+            pending.status = AttachmentTextExtractStatus.FAILED
+        pending.save(update_fields=['attempts', 'last_error', 'next_attempt_at', 'status', 'updated_at'])
+        result.errors.append(f"{pending.sha256[:12]}: {error}")
+
+    return result
+
+
+def get_extraction_stats() -> dict:
+    """Number of extracts per status."""
+    from django.db.models import Count
+    from core.models import AttachmentTextExtract, AttachmentTextExtractStatus
+
+    counts = dict(
+        AttachmentTextExtract.objects.values_list('status').annotate(n=Count('id')).values_list('status', 'n')
+    )
+    return {status: counts.get(status, 0) for status in AttachmentTextExtractStatus.values}
@@ -17,6 +17,8 @@ Public API:
 - delete_document: Remove a context document (legacy)
 - query: Search documents semantically
 - is_available: Check if Weaviate is configured and enabled
+- pooled_client: Borrow a connection from the process-wide client pool
+- get_pool_stats: Connect count/latency metrics of the client pool
 
 Example:
     >>> from core.services.weaviate import upsert_instance, query
@@ -45,8 +47,13 @@ from core.services.weaviate.service import (
     delete_document,
     query,
 )
-from core.services.weaviate.client import is_available, get_client
-from core.services.weaviate.serializers import to_agira_object
+from core.services.weaviate.client import (
+    is_available,
+    get_client,
+    pooled_client,
+    get_pool_stats,
+)
+from core.services.weaviate.serializers import to_agira_object, to_agira_objects
 
 __all__ = [
     "make_weaviate_uuid",
@@ -60,6 +67,9 @@ __all__ = [
     "query",
     "is_available",
     "get_client",
+    "pooled_client",
+    "get_pool_stats",
     "to_agira_object",
+    "to_agira_objects",
 ]
 
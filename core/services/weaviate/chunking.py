@@ -0,0 +1,241 @@
+"""
+Chunking of long attachment texts for Weaviate.
+
+An attachment whose text is longer than WEAVIATE_CHUNK_SIZE_CHARS is not
+stored as one huge ``text`` property. Its text is split into overlapping,
+section-aware chunks:
+
+- The attachment object itself keeps the first chunk (title, intro, first
+  section), so existing lookups by (attachment, id) keep working.
+- Every further chunk becomes a child object of type ``attachment_chunk``
+  with ``object_id`` ``<attachment id>:<chunk index>`` and
+  ``parent_object_id`` set to the attachment id.
+
+Chunks start at Markdown headings where possible; a section that does not
+fit into one chunk is cut at paragraph (or word) boundaries, and the next
+chunk repeats the last WEAVIATE_CHUNK_OVERLAP_CHARS characters so a passage
+spanning the cut is still found as a whole. Retrieval then returns the
+matching chunk instead of a trimmed 100 KB document.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from django.conf import settings
+
+CHUNK_TYPE = 'attachment_chunk'
+
+DEFAULT_CHUNK_SIZE_CHARS = 4000
+DEFAULT_CHUNK_OVERLAP_CHARS = 400
+DEFAULT_MAX_CHUNKS = 500
+
+# Parent properties copied to every chunk (filters and links must match)
+_INHERITED_PROPERTIES = (
+    'project_id', 'org_id', 'url', 'source_system', 'mime_type', 'sha256', 'created_at', 'updated_at',
+)
+
+_HEADING_RE = re.compile(r'^(#{1,6})\s+(.+?)\s*#*\s*$')
+_PARAGRAPH_SPLIT_RE = re.compile(r'\n\s*\n')
+
+
+@dataclass
+class TextChunk:
+    """One chunk of a document."""
+    index: int
+    text: str
+    heading: str = ''
+
+
+def get_chunk_size() -> int:
+    return int(getattr(settings, 'WEAVIATE_CHUNK_SIZE_CHARS', DEFAULT_CHUNK_SIZE_CHARS))
+
+
+def get_chunk_overlap() -> int:
+    return int(getattr(settings, 'WEAVIATE_CHUNK_OVERLAP_CHARS', DEFAULT_CHUNK_OVERLAP_CHARS))
+
+
+def get_max_chunks() -> int:
+    return int(getattr(settings, 'WEAVIATE_MAX_CHUNKS', DEFAULT_MAX_CHUNKS))
+
+
+def chunk_object_id(attachment_id, index: int) -> str:
+    """Weaviate object_id of chunk ``index`` of an attachment."""
+    return f"{attachment_id}:{index}"
+
+
+def _split_sections(text: str) -> Iterator[Tuple[str, str]]:
+    """Yield (heading, section text) pairs; the heading line stays in the text."""
+    heading = ''
+    lines: List[str] = []
+    for line in text.splitlines():
+        match = _HEADING_RE.match(line)
+        if match:
+            if any(l.strip() for l in lines):
+                yield heading, '\n'.join(lines).strip()
+            heading = match.group(2).strip()
+            lines = [line]
+        else:
+            lines.append(line)
+    if any(l.strip() for l in lines):
+        yield heading, '\n'.join(lines).strip()
+
+
+def _split_pieces(section: str, max_len: int) -> Iterator[str]:
+    """Split a section into paragraphs of at most ``max_len`` characters."""
+    pending_heading = ''
+    for paragraph in _PARAGRAPH_SPLIT_RE.split(section):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        if _HEADING_RE.match(paragraph) and '\n' not in paragraph:
+            # Keep a heading together with the paragraph that follows it
+            pending_heading = paragraph
+            continue
+        if pending_heading:
+            paragraph = f"{pending_heading}\n\n{paragraph}"
+            pending_heading = ''
+        while len(paragraph) > max_len:
+            cut = paragraph.rfind(' ', 0, max_len)
+            if cut <= 0:
+                cut = max_len
+            yield paragraph[:cut].rstrip()
+            paragraph = paragraph[cut:].lstrip()
+        if paragraph:
+            yield paragraph
+    if pending_heading:
+        yield pending_heading
+
+
+def _tail(text: str, length: int) -> str:
+    """Last ``length`` characters of a text, starting at a word boundary."""
+    if length <= 0 or not text:
+        return ''
+    tail = text[-length:]
+    if len(text) > length:
+        space = tail.find(' ')
+        if space >= 0:
+            tail = tail[space + 1:]
+    return tail.strip()
+
+
+def split_into_chunks(
+    text: str,
+    chunk_size: Optional[int] = None,
+    overlap: Optional[int] = None,
+) -> List[TextChunk]:
+    """
+    Split a document into overlapping, section-aware chunks.
+
+    Args:
+        text: Document text (Markdown headings are used as section boundaries)
+        chunk_size: Maximum characters per chunk (default: WEAVIATE_CHUNK_SIZE_CHARS)
+        overlap: Characters repeated from the previous chunk when a section
+            has to be cut (default: WEAVIATE_CHUNK_OVERLAP_CHARS, at most half
+            the chunk size)
+
+    Returns:
+        Chunks in document order, each at most ``chunk_size`` characters
+    """
+    chunk_size = max(1, chunk_size or get_chunk_size())
+    overlap = get_chunk_overlap() if overlap is None else overlap
+    overlap = max(0, min(overlap, chunk_size // 2))
+
+    chunks: List[TextChunk] = []
+    parts: List[str] = []
+    length = 0
+    chunk_heading: Optional[str] = None
+
+    def flush():
+        nonlocal parts, length, chunk_heading
+        body = '\n\n'.join(parts).strip()
+        if body and chunk_heading is not None:
+            chunks.append(TextChunk(index=len(chunks), text=body, heading=chunk_heading))
+        parts, length, chunk_heading = [], 0, None
+        return body
+
+    for heading, section in _split_sections(text):
+        pieces = list(_split_pieces(section, chunk_size - overlap))
+        # Start a new chunk at a heading unless the current one is still
+        # small and the section's first paragraph fits into it
+        if parts and (length >= chunk_size // 2 or length + len(pieces[0]) + 2 > chunk_size):
+            flush()
+
+        for piece in pieces:
+            if parts and length + len(piece) + 2 > chunk_size:
+                tail = _tail(flush(), overlap)
+                if tail:
+                    parts, length = [tail], len(tail)
+            if chunk_heading is None:
+                chunk_heading = heading
+            parts.append(piece)
+            length += len(piece) + 2
+
+    flush()
+    return chunks
+
+
+def serialize_chunks(obj_dict: Dict[str, Any]) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """
+    Split a serialized attachment into the attachment object and its chunks.
+
+    Args:
+        obj_dict: Serialized attachment (see serializers._serialize_attachment)
+
+    Returns:
+        Tuple of (attachment object, chunk objects). Texts up to one chunk
+        are returned unchanged with no chunks; otherwise the attachment
+        object carries the first chunk and the list holds the others.
+    """
+    text = obj_dict.get('text') or ''
+    if len(text) <= get_chunk_size():
+        return obj_dict, []
+
+    chunks = split_into_chunks(text)[:get_max_chunks()]
+    if len(chunks) <= 1:
+        return obj_dict, []
+
+    attachment_id = str(obj_dict['object_id'])
+    title = obj_dict.get('title') or ''
+    parent = {**obj_dict, 'text': chunks[0].text}
+    children = []
+    for chunk in chunks[1:]:
+        child = {key: obj_dict.get(key) for key in _INHERITED_PROPERTIES}
+        child.update(
+            type=CHUNK_TYPE,
+            object_id=chunk_object_id(attachment_id, chunk.index),
+            parent_object_id=attachment_id,
+            title=f"{title} › {chunk.heading}" if chunk.heading else f"{title} ({chunk.index + 1}/{len(chunks)})",
+            text=chunk.text,
+        )
+        children.append(child)
+    return parent, children
+
+
+def chunks_filter(attachment_ids: Iterable):
+    """Weaviate filter matching all chunks of the given attachments."""
+    from weaviate.classes.query import Filter
+
+    return (
+        Filter.by_property('type').equal(CHUNK_TYPE)
+        & Filter.by_property('parent_object_id').contains_any([str(i) for i in attachment_ids])
+    )
+
+
+def delete_chunks(collection, attachment_ids: Iterable) -> None:
+    """Delete all chunk objects of the given attachments."""
+    attachment_ids = list(attachment_ids)
+    if attachment_ids:
+        collection.data.delete_many(where=chunks_filter(attachment_ids))
+
+
+def with_chunk_types(object_types: Optional[List[str]]) -> Optional[List[str]]:
+    """Add the chunk type to a type filter that includes attachments."""
+    if object_types and 'attachment' in object_types and CHUNK_TYPE not in object_types:
+        return list(object_types) + [CHUNK_TYPE]
+    return object_types
+
+
+def result_type(object_type: Optional[str]) -> Optional[str]:
+    """Type under which a search hit is shown; chunks count as attachments."""
+    return 'attachment' if object_type == CHUNK_TYPE else object_type
@@ -3,11 +3,31 @@ Weaviate client management for Agira.
 
 This module provides client initialization and connection management
 for Weaviate vector database integration.
+
+Two ways of obtaining a client are available:
+
+- ``get_client()`` opens a fresh, unmanaged connection. The caller owns it
+  and must close it. Use this for one-off administrative tasks.
+- ``pooled_client()`` borrows a connection from the process-wide
+  ``WeaviateClientPool``. Connections are kept open between calls, health
+  checked before reuse, replaced when they fail and rebuilt when the
+  ``WeaviateConfiguration`` changes. All service call sites use this.
 """
 
+import atexit
 import logging
-from typing import Optional
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import httpx
 import weaviate
+import weaviate.exceptions as weaviate_exceptions
+from django.conf import settings
 from weaviate.classes.init import Auth
 
 from core.services.config import get_weaviate_config
@@ -15,25 +35,36 @@ from core.services.exceptions import ServiceNotConfigured, ServiceDisabled
 
 logger = logging.getLogger(__name__)
 
+# Pool defaults (overridable via Django settings)
+DEFAULT_POOL_MAX_SIZE = 4
+DEFAULT_HEALTH_CHECK_INTERVAL = 30.0  # seconds a connection may idle before re-checking
+DEFAULT_ACQUIRE_TIMEOUT = 10.0  # seconds to wait for a free connection
 
-def get_client() -> weaviate.WeaviateClient:
+# Exceptions that indicate the underlying connection is unusable and must be
+# replaced. Resolved by name because not every 4.x client release ships all
+# of them.
+_CONNECTION_ERRORS: Tuple[type, ...] = tuple(
+    exc for exc in (
+        getattr(weaviate_exceptions, name, None)
+        for name in (
+            "WeaviateConnectionError",
+            "WeaviateClosedClientError",
+            "WeaviateGRPCUnavailableError",
+            "WeaviateStartUpError",
+            "WeaviateTimeoutError",
+        )
+    )
+    if exc is not None
+) + (ConnectionError, TimeoutError, httpx.TransportError)
+
+
+def _get_enabled_config():
     """
-    Get a configured Weaviate client instance.
-    
-    This function loads configuration from the database singleton and
-    creates a client with appropriate authentication and settings.
+    Load the Weaviate configuration and validate that it is usable.
     
-    Returns:
-        Configured Weaviate client instance
-        
     Raises:
         ServiceDisabled: If Weaviate is explicitly disabled
         ServiceNotConfigured: If Weaviate is enabled but URL is missing
-        
-    Example:
-        >>> client = get_client()
-        >>> # Use client for operations
-        >>> client.close()
     """
     config = get_weaviate_config()
     
@@ -45,10 +76,37 @@ def get_client() -> weaviate.WeaviateClient:
     if not config.url:
         raise ServiceNotConfigured("Weaviate URL is not configured")
     
+    return config
+
+
+def _config_fingerprint(config) -> Tuple:
+    """
+    Build a hashable fingerprint of the connection-relevant configuration.
+    
+    The pool compares fingerprints on every checkout so that changes made in
+    the admin (URL, ports, API key) lead to fresh connections.
+    """
+    return (
+        config.url,
+        getattr(config, 'http_port', None),
+        getattr(config, 'grpc_port', None),
+        config.api_key or "",
+    )
+
+
+def _connect(config) -> weaviate.WeaviateClient:
+    """
+    Open a new Weaviate connection for the given configuration.
+    
+    Args:
+        config: Enabled WeaviateConfiguration instance
+        
+    Returns:
+        Connected Weaviate client instance
+    """
     logger.debug(f"Connecting to Weaviate at {config.url}")
     
     # Parse URL components
-    from urllib.parse import urlparse
     parsed = urlparse(config.url)
     
     # Extract host and determine security
@@ -100,6 +158,31 @@ def get_client() -> weaviate.WeaviateClient:
     return client
 
 
+def get_client() -> weaviate.WeaviateClient:
+    """
+    Get a configured Weaviate client instance.
+    
+    This function loads configuration from the database singleton and
+    creates a client with appropriate authentication and settings.
+    
+    The returned client is not pooled; the caller must close it. Service
+    code should use ``pooled_client()`` instead.
+    
+    Returns:
+        Configured Weaviate client instance
+        
+    Raises:
+        ServiceDisabled: If Weaviate is explicitly disabled
+        ServiceNotConfigured: If Weaviate is enabled but URL is missing
+        
+    Example:
+        >>> client = get_client()
+        >>> # Use client for operations
+        >>> client.close()
+    """
+    return _connect(_get_enabled_config())
+
+
 def is_available() -> bool:
     """
     Check if Weaviate service is available and configured.
@@ -112,11 +195,342 @@ def is_available() -> bool:
         
     Example:
         >>> if is_available():
-        ...     client = get_client()
-        ...     # Use client
+        ...     with pooled_client() as client:
+        ...         # Use client
+        ...         pass
     """
     try:
         config = get_weaviate_config()
         return config is not None and config.enabled and bool(config.url)
     except Exception:
         return False
+
+
+@dataclass
+class PoolStats:
+    """Counters describing the behaviour of a WeaviateClientPool."""
+    connects: int = 0
+    connect_failures: int = 0
+    total_connect_seconds: float = 0.0
+    max_connect_seconds: float = 0.0
+    last_connect_seconds: Optional[float] = None
+    checkouts: int = 0
+    reuses: int = 0
+    health_check_failures: int = 0
+    discarded: int = 0
+    rebuilds: int = 0
+    
+    def as_dict(self) -> Dict[str, object]:
+        """Return the counters plus derived averages as a plain dict."""
+        avg = (self.total_connect_seconds / self.connects) if self.connects else None
+        reuse_ratio = (self.reuses / self.checkouts) if self.checkouts else None
+        return {
+            'connects': self.connects,
+            'connect_failures': self.connect_failures,
+            'avg_connect_ms': round(avg * 1000, 2) if avg is not None else None,
+            'max_connect_ms': round(self.max_connect_seconds * 1000, 2),
+            'last_connect_ms': (
+                round(self.last_connect_seconds * 1000, 2)
+                if self.last_connect_seconds is not None else None
+            ),
+            'checkouts': self.checkouts,
+            'reuses': self.reuses,
+            'reuse_ratio': round(reuse_ratio, 4) if reuse_ratio is not None else None,
+            'health_check_failures': self.health_check_failures,
+            'discarded': self.discarded,
+            'rebuilds': self.rebuilds,
+        }
+
+
+@dataclass
+class _PooledConnection:
+    """A Weaviate client plus the bookkeeping the pool needs for it."""
+    client: weaviate.WeaviateClient
+    generation: int
+    last_used: float = field(default_factory=time.monotonic)
+
+
+class WeaviateClientPool:
+    """
+    Thread-safe pool of long-lived Weaviate connections.
+    
+    Connections are created lazily up to ``max_size``. A connection that has
+    been idle for longer than ``health_check_interval`` is checked with
+    ``is_ready()`` before it is handed out, and a connection whose use raised
+    a connection-level error is closed instead of being returned to the pool.
+    
+    Every checkout compares the current ``WeaviateConfiguration`` with the one
+    the pool was built for; when it differs the pool is rebuilt. After a
+    ``fork()`` (e.g. gunicorn workers) the inherited state is dropped and the
+    child process opens its own connections.
+    """
+    
+    def __init__(
+        self,
+        max_size: int = DEFAULT_POOL_MAX_SIZE,
+        health_check_interval: float = DEFAULT_HEALTH_CHECK_INTERVAL,
+        acquire_timeout: float = DEFAULT_ACQUIRE_TIMEOUT,
+    ):
+        self.max_size = max(1, int(max_size))
+        self.health_check_interval = health_check_interval
+        self.acquire_timeout = acquire_timeout
+        self.stats = PoolStats()
+        self._cond = threading.Condition()
+        self._idle: List[_PooledConnection] = []
+        self._in_use = 0
+        self._fingerprint: Optional[Tuple] = None
+        self._generation = 0
+        self._pid = os.getpid()
+    
+    @property
+    def generation(self) -> int:
+        """Counter bumped every time the pool is rebuilt."""
+        return self._generation
+    
+    @contextmanager
+    def connection(self) -> Iterator[weaviate.WeaviateClient]:
+        """
+        Borrow a connected client for the duration of the ``with`` block.
+        
+        Raises:
+            ServiceDisabled: If Weaviate is explicitly disabled
+            ServiceNotConfigured: If Weaviate is enabled but URL is missing
+            TimeoutError: If no connection became free within acquire_timeout
+        """
+        conn = self._acquire()
+        broken = False
+        try:
+            yield conn.client
+        except _CONNECTION_ERRORS:
+            broken = True
+            raise
+        finally:
+            self._release(conn, broken=broken)
+    
+    def reset(self) -> None:
+        """
+        Close all idle connections and retire those currently checked out.
+        
+        Checked-out connections are closed when they are returned.
+        """
+        with self._cond:
+            stale = self._retire_locked()
+        self._close_all(stale)
+    
+    def snapshot(self) -> Dict[str, object]:
+        """Return pool metrics plus current occupancy."""
+        with self._cond:
+            data = self.stats.as_dict()
+            data.update({
+                'max_size': self.max_size,
+                'idle': len(self._idle),
+                'in_use': self._in_use,
+                'generation': self._generation,
+            })
+        return data
+    
+    def _retire_locked(self) -> List[_PooledConnection]:
+        """Bump the generation and detach idle connections. Caller holds the lock."""
+        stale = self._idle
+        self._idle = []
+        self._generation += 1
+        self._cond.notify_all()
+        return stale
+    
+    def _check_fork_locked(self) -> None:
+        """Forget connections inherited from a parent process. Caller holds the lock."""
+        pid = os.getpid()
+        if pid != self._pid:
+            # Sockets belong to the parent; drop them without closing.
+            self._pid = pid
+            self._idle = []
+            self._in_use = 0
+            self._fingerprint = None
+            self._generation += 1
+    
+    def _acquire(self) -> _PooledConnection:
+        config = _get_enabled_config()
+        fingerprint = _config_fingerprint(config)
+        stale: List[_PooledConnection] = []
+        deadline = time.monotonic() + self.acquire_timeout
+        
+        with self._cond:
+            self._check_fork_locked()
+            if fingerprint != self._fingerprint:
+                if self._fingerprint is not None:
+                    logger.info("Weaviate configuration changed, rebuilding client pool")
+                    self.stats.rebuilds += 1
+                stale = self._retire_locked()
+                self._fingerprint = fingerprint
+            
+            conn = None
+            while True:
+                if self._idle:
+                    conn = self._idle.pop()
+                    break
+                if self._in_use < self.max_size:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(
+                        f"Timed out after {self.acquire_timeout}s waiting for a Weaviate connection"
+                    )
+                self._cond.wait(remaining)
+            
+            self._in_use += 1
+            self.stats.checkouts += 1
+            generation = self._generation
+        
+        self._close_all(stale)
+        
+        try:
+            if conn is not None and not self._is_healthy(conn):
+                self._close_all([conn])
+                conn = None
+            if conn is None:
+                conn = _PooledConnection(client=self._open(config), generation=generation)
+            else:
+                with self._cond:
+                    self.stats.reuses += 1
+        except BaseException:
+            with self._cond:
+                self._in_use -= 1
+                self._cond.notify()
+            raise
+        
+        return conn
+    
+    def _release(self, conn: _PooledConnection, broken: bool = False) -> None:
+        if not broken:
+            # Errors swallowed by the caller can still leave the client
+            # disconnected; is_connected() only inspects local state.
+            try:
+                broken = not conn.client.is_connected()
+            except Exception:
+                broken = True
+        
+        with self._cond:
+            if os.getpid() != self._pid:
+                return
+            self._in_use = max(0, self._in_use - 1)
+            keep = not broken and conn.generation == self._generation
+            if keep:
+                conn.last_used = time.monotonic()
+                self._idle.append(conn)
+            elif broken:
+                self.stats.discarded += 1
+            self._cond.notify()
+        
+        if not keep:
+            if broken:
+                logger.warning("Discarding broken Weaviate connection")
+            self._close_all([conn])
+    
+    def _is_healthy(self, conn: _PooledConnection) -> bool:
+        """Check an idle connection before reuse if it has idled long enough."""
+        if time.monotonic() - conn.last_used < self.health_check_interval:
+            return True
+        try:
+            healthy = bool(conn.client.is_ready())
+        except Exception as e:
+            logger.debug(f"Weaviate health check raised {type(e).__name__}: {e}")
+            healthy = False
+        if not healthy:
+            logger.info("Pooled Weaviate connection failed health check, reconnecting")
+            with self._cond:
+                self.stats.health_check_failures += 1
+        return healthy
+    
+    def _open(self, config) -> weaviate.WeaviateClient:
+        """Open a connection and record connect metrics."""
+        started = time.perf_counter()
+        try:
+            client = _connect(config)
+        except Exception:
+            with self._cond:
+                self.stats.connect_failures += 1
+            raise
+        elapsed = time.perf_counter() - started
+        with self._cond:
+            self.stats.connects += 1
+            self.stats.total_connect_seconds += elapsed
+            self.stats.last_connect_seconds = elapsed
+            self.stats.max_connect_seconds = max(self.stats.max_connect_seconds, elapsed)
+        logger.debug(f"Opened pooled Weaviate connection in {elapsed * 1000:.1f} ms")
+        return client
+    
+    @staticmethod
+    def _close_all(connections: List[_PooledConnection]) -> None:
+        for conn in connections:
+            try:
+                conn.client.close()
+            except Exception as e:
+                logger.debug(f"Error closing Weaviate connection: {e}")
+
+
+_pool: Optional[WeaviateClientPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_client_pool() -> WeaviateClientPool:
+    """
+    Get the process-wide Weaviate client pool, creating it on first use.
+    
+    Pool sizing is read from the ``WEAVIATE_POOL_MAX_SIZE``,
+    ``WEAVIATE_POOL_HEALTH_CHECK_INTERVAL`` and ``WEAVIATE_POOL_ACQUIRE_TIMEOUT``
+    settings.
+    """
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = WeaviateClientPool(
+                    max_size=getattr(settings, 'WEAVIATE_POOL_MAX_SIZE', DEFAULT_POOL_MAX_SIZE),
+                    health_check_interval=getattr(
+                        settings, 'WEAVIATE_POOL_HEALTH_CHECK_INTERVAL', DEFAULT_HEALTH_CHECK_INTERVAL
+                    ),
+                    acquire_timeout=getattr(
+                        settings, 'WEAVIATE_POOL_ACQUIRE_TIMEOUT', DEFAULT_ACQUIRE_TIMEOUT
+                    ),
+                )
+    return _pool
+
+
+@contextmanager
+def pooled_client() -> Iterator[weaviate.WeaviateClient]:
+    """
+    Borrow a client from the process-wide pool.
+    
+    The client must not be closed by the caller; it is returned to the pool
+    when the ``with`` block exits.
+    
+    Raises:
+        ServiceDisabled: If Weaviate is explicitly disabled
+        ServiceNotConfigured: If Weaviate is enabled but URL is missing
+        
+    Example:
+        >>> with pooled_client() as client:
+        ...     collection = client.collections.get("AgiraObject")
+    """
+    with get_client_pool().connection() as client:
+        yield client
+
+
+def reset_client_pool() -> None:
+    """Close pooled connections so the next checkout reconnects."""
+    if _pool is not None:
+        _pool.reset()
+
+
+def get_pool_stats() -> Dict[str, object]:
+    """
+    Return connect count, connect latency and occupancy of the client pool.
+    
+    Example:
+        >>> stats = get_pool_stats()
+        >>> stats['connects'], stats['avg_connect_ms']
+    """
+    return get_client_pool().snapshot()
+
+
+atexit.register(reset_client_pool)
@@ -0,0 +1,339 @@
+"""
+Durable outbox for Weaviate synchronization.
+
+Model signals do not talk to Weaviate directly. They append a
+``WeaviateSyncEvent`` row inside the caller's transaction (``enqueue``), and
+the ``weaviate_outbox_worker`` command drains the table (``drain_once``):
+
+- Pending rows are claimed with a short lease (``next_attempt_at`` is moved
+  into the future), so a crashed worker's claim simply expires.
+- All rows of the same (type, id) are coalesced; the newest action wins. A
+  burst of ten autosaves becomes one serialization and one write.
+- Upserts are pushed through the batch API, deletes with one ``delete_many``.
+- Failed objects are retried with exponential backoff until
+  ``max_attempts`` is reached; after that they stay in the table for
+  inspection and are reported as dead.
+"""
+
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Dict, List, Optional, Tuple
+
+from django.db import connection, transaction
+from django.db.models import Min
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CLAIM_SIZE = 500
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_MAX_ATTEMPTS = 10
+LEASE_SECONDS = 300
+BACKOFF_BASE_SECONDS = 30
+BACKOFF_MAX_SECONDS = 3600
+
+
+@dataclass
+class DrainResult:
+    """Outcome of one drain pass."""
+    claimed_events: int = 0
+    objects: int = 0
+    upserted: int = 0
+    deleted: int = 0
+    skipped: int = 0
+    retried: int = 0
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def coalesced(self) -> int:
+        """Events that did not cause a write of their own."""
+        return self.claimed_events - self.objects
+
+
+def enqueue(instance, action: str) -> Optional[int]:
+    """
+    Record a pending Weaviate write for a model instance.
+
+    Runs inside the caller's transaction under a savepoint: the event is
+    committed or rolled back together with the save, and a failing insert
+    never poisons the surrounding transaction.
+
+    Args:
+        instance: Django model instance that was saved or deleted
+        action: WeaviateSyncAction value
+
+    Returns:
+        ID of the created event, or None if the instance type is not indexed
+    """
+    from core.models import WeaviateSyncEvent
+    from core.services.weaviate.serializers import _get_model_type
+
+    obj_type = _get_model_type(instance)
+    if obj_type is None or instance.pk is None:
+        return None
+
+    with transaction.atomic():
+        event = WeaviateSyncEvent.objects.create(
+            object_type=obj_type,
+            object_id=str(instance.pk),
+            action=action,
+        )
+    return event.pk
+
+
+def _backoff(attempts: int) -> timedelta:
+    """Delay before retry number ``attempts`` (1-based), capped."""
+    seconds = BACKOFF_BASE_SECONDS * (2 ** max(0, attempts - 1))
+    return timedelta(seconds=min(seconds, BACKOFF_MAX_SECONDS))
+
+
+def _claim(limit: int, max_attempts: int) -> List:
+    """Lease up to ``limit`` due events to this worker."""
+    from core.models import WeaviateSyncEvent
+
+    now = timezone.now()
+    with transaction.atomic():
+        due = WeaviateSyncEvent.objects.filter(
+            next_attempt_at__lte=now, attempts__lt=max_attempts,
+        ).order_by('id')
+        if connection.features.has_select_for_update:
+            lock_kwargs = {}
+            if connection.features.has_select_for_update_skip_locked:
+                lock_kwargs['skip_locked'] = True
+            due = due.select_for_update(**lock_kwargs)
+        events = list(due[:limit])
+        if events:
+            WeaviateSyncEvent.objects.filter(pk__in=[e.pk for e in events]).update(
+                next_attempt_at=now + timedelta(seconds=LEASE_SECONDS)
+            )
+    return events
+
+
+def _coalesce(events) -> "OrderedDict[Tuple[str, str], dict]":
+    """Group events by (type, id); the newest event decides the action."""
+    groups: "OrderedDict[Tuple[str, str], dict]" = OrderedDict()
+    for event in events:
+        key = (event.object_type, event.object_id)
+        group = groups.setdefault(key, {'ids': [], 'attempts': 0})
+        group['ids'].append(event.pk)
+        group['action'] = event.action
+        group['attempts'] = max(group['attempts'], event.attempts)
+    return groups
+
+
+def _delete_uuids(obj_type: str, object_id: str) -> List:
+    """Weaviate UUIDs that may hold the object of (type, id)."""
+    from core.services.weaviate.service import _get_deterministic_uuid
+
+    uuids = [_get_deterministic_uuid(obj_type, object_id)]
+    if obj_type == 'github_issue':
+        # Mappings are stored as github_pr when they describe a PR
+        uuids.append(_get_deterministic_uuid('github_pr', object_id))
+    return uuids
+
+
+def _write(
+    upserts: Dict[Tuple[str, str], dict],
+    deletes: List[Tuple[str, str]],
+    batch_size: int,
+    chunks: Optional[Dict[Tuple[str, str], List[dict]]] = None,
+) -> Dict[Tuple[str, str], str]:
+    """
+    Push serialized objects and deletions to Weaviate.
+
+    Args:
+        upserts: (type, id) -> serialized object
+        deletes: (type, id) of objects to delete
+        batch_size: Objects per batch request
+        chunks: (type, id) -> chunk objects of an upserted attachment; the
+            attachment's previous chunks are replaced
+
+    Returns:
+        Mapping of (type, id) -> error message for objects that failed
+    """
+    from weaviate.classes.query import Filter
+
+    from core.services.weaviate.chunking import CHUNK_TYPE, delete_chunks
+    from core.services.weaviate.client import pooled_client
+    from core.services.weaviate.schema import COLLECTION_NAME
+    from core.services.weaviate.service import (
+        _bump_rag_cache, _ensure_schema_once, _get_deterministic_uuid, _prepare_properties,
+    )
+
+    chunks = chunks or {}
+    failures: Dict[Tuple[str, str], str] = {}
+    with pooled_client() as client:
+        _ensure_schema_once(client)
+        collection = client.collections.get(COLLECTION_NAME)
+
+        # Drop old chunks of re-written and deleted attachments first
+        chunked_ids = [key[1] for key in list(chunks) + deletes if key[0] == 'attachment']
+        if chunked_ids:
+            try:
+                delete_chunks(collection, chunked_ids)
+            except Exception as e:
+                logger.error(f"Deleting chunks of {len(chunked_ids)} attachments failed: {e}", exc_info=True)
+                for key in list(chunks) + deletes:
+                    if key[0] == 'attachment':
+                        failures[key] = f"delete chunks: {e}"
+
+        if upserts:
+            uuid_to_key = {}
+            with collection.batch.fixed_size(batch_size=batch_size) as batch:
+                for key, obj_dict in upserts.items():
+                    if key in failures:
+                        continue
+                    obj_uuid = _get_deterministic_uuid(obj_dict['type'], str(obj_dict['object_id']))
+                    uuid_to_key[str(obj_uuid)] = key
+                    batch.add_object(properties=_prepare_properties(obj_dict), uuid=obj_uuid)
+                    for chunk in chunks.get(key, []):
+                        chunk_uuid = _get_deterministic_uuid(CHUNK_TYPE, chunk['object_id'])
+                        uuid_to_key[str(chunk_uuid)] = key
+                        batch.add_object(properties=_prepare_properties(chunk), uuid=chunk_uuid)
+            for failed in collection.batch.failed_objects:
+                key = uuid_to_key.get(str(getattr(failed.object_, 'uuid', '')))
+                if key is not None:
+                    failures[key] = str(getattr(failed, 'message', failed))
+
+        if deletes:
+            uuids = [u for key in deletes if key not in failures for u in _delete_uuids(*key)]
+            try:
+                collection.data.delete_many(where=Filter.by_id().contains_any(uuids))
+            except Exception as e:
+                logger.error(f"Weaviate delete_many failed for {len(deletes)} objects: {e}", exc_info=True)
+                for key in deletes:
+                    failures[key] = str(e)
+
+    written = [obj_dict.get('project_id') for key, obj_dict in upserts.items() if key not in failures]
+    if written:
+        _bump_rag_cache(written)
+    if any(key not in failures for key in deletes):
+        _bump_rag_cache()
+    return failures
+
+
+def drain_once(
+    claim_size: int = DEFAULT_CLAIM_SIZE,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+) -> DrainResult:
+    """
+    Claim due outbox events, coalesce them and write them to Weaviate.
+
+    Args:
+        claim_size: Maximum number of events to claim in this pass
+        batch_size: Objects per Weaviate batch request
+        max_attempts: Events that failed this often are no longer claimed
+
+    Returns:
+        DrainResult with counts for this pass
+    """
+    from core.models import WeaviateSyncAction, WeaviateSyncEvent
+    from core.services.weaviate.serializers import to_agira_objects
+    from core.services.weaviate.service import _load_django_object
+
+    result = DrainResult()
+    events = _claim(claim_size, max_attempts)
+    result.claimed_events = len(events)
+    if not events:
+        return result
+
+    groups = _coalesce(events)
+    result.objects = len(groups)
+
+    upserts: Dict[Tuple[str, str], dict] = {}
+    chunks: Dict[Tuple[str, str], List[dict]] = {}
+    deletes: List[Tuple[str, str]] = []
+    done: List[Tuple[str, str]] = []
+    failures: Dict[Tuple[str, str], str] = {}
+
+    for key, group in groups.items():
+        obj_type, object_id = key
+        if group['action'] == WeaviateSyncAction.DELETE:
+            deletes.append(key)
+            continue
+
+        instance = _load_django_object(obj_type, object_id)
+        if instance is None:
+            # Deleted before we got to it; make sure no stale copy survives
+            deletes.append(key)
+            continue
+        try:
+            objects = to_agira_objects(instance)
+        except Exception as e:
+            logger.error(f"Could not serialize {obj_type}:{object_id} for Weaviate: {e}", exc_info=True)
+            failures[key] = f"serialize: {e}"
+            continue
+        if not objects:
+            result.skipped += 1
+            done.append(key)
+        else:
+            upserts[key] = objects[0]
+            if obj_type == 'attachment':
+                chunks[key] = objects[1:]
+
+    try:
+        write_failures = _write(upserts, deletes, batch_size, chunks=chunks)
+    except Exception as e:
+        # Weaviate unreachable: everything in this pass is retried
+        logger.error(f"Weaviate outbox write failed: {e}", exc_info=True)
+        write_failures = {key: str(e) for key in list(upserts) + deletes}
+    failures.update(write_failures)
+
+    result.upserted = len([k for k in upserts if k not in failures])
+    result.deleted = len([k for k in deletes if k not in failures])
+    done.extend(k for k in list(upserts) + deletes if k not in failures)
+
+    # Only the claimed rows are removed; events that arrived meanwhile stay
+    done_ids = [pk for key in done for pk in groups[key]['ids']]
+    if done_ids:
+        WeaviateSyncEvent.objects.filter(pk__in=done_ids).delete()
+
+    now = timezone.now()
+    for key, error in failures.items():
+        group = groups[key]
+        attempts = group['attempts'] + 1
+        WeaviateSyncEvent.objects.filter(pk__in=group['ids']).update(
+            attempts=attempts,
+            next_attempt_at=now + _backoff(attempts),
+            last_error=error[:2000],
+        )
+        result.retried += 1
+        result.errors.append(f"{key[0]}:{key[1]}: {error}")
+        if attempts >= max_attempts:
+            logger.error(f"Giving up on Weaviate sync of {key[0]}:{key[1]} after {attempts} attempts: {error}")
+
+    logger.info(
+        f"Weaviate outbox drained {result.claimed_events} events as {result.objects} objects "
+        f"(upserted={result.upserted}, deleted={result.deleted}, skipped={result.skipped}, "
+        f"retried={result.retried})"
+    )
+    return result
+
+
+def get_outbox_stats(max_attempts: int = DEFAULT_MAX_ATTEMPTS) -> Dict[str, object]:
+    """
+    Report queue depth and lag of the Weaviate outbox.
+
+    Returns:
+        Dictionary with:
+        - pending: events still to be written (including retries)
+        - pending_objects: distinct (type, id) among pending events
+        - retrying: pending events that failed at least once
+        - dead: events that exhausted max_attempts
+        - lag_seconds: age of the oldest pending event (0 when empty)
+    """
+    from core.models import WeaviateSyncEvent
+
+    pending = WeaviateSyncEvent.objects.filter(attempts__lt=max_attempts)
+    oldest = pending.aggregate(oldest=Min('created_at'))['oldest']
+    lag = (timezone.now() - oldest).total_seconds() if oldest else 0.0
+    return {
+        'pending': pending.count(),
+        'pending_objects': pending.values('object_type', 'object_id').distinct().count(),
+        'retrying': pending.filter(attempts__gt=0).count(),
+        'dead': WeaviateSyncEvent.objects.filter(attempts__gte=max_attempts).count(),
+        'lag_seconds': round(max(0.0, lag), 1),
+    }
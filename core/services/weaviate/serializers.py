@@ -6,10 +6,11 @@ into AgiraObject dictionaries for storage in Weaviate.
 """
 
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from datetime import datetime, timezone
 from django.db import models
-from core.services.storage.service import AttachmentStorageService
+from core.services.storage.text_extraction import get_attachment_text
+from core.services.weaviate.chunking import serialize_chunks
 
 logger = logging.getLogger(__name__)
 
@@ -100,6 +101,30 @@ def to_agira_object(instance: models.Model, fetch_from_github: bool = False) ->
         return None
 
 
+def to_agira_objects(instance: models.Model, fetch_from_github: bool = False) -> List[Dict[str, Any]]:
+    """
+    Convert a Django model instance to the AgiraObjects stored for it.
+    
+    Like to_agira_object(), but long attachment texts are split into chunks
+    (see core.services.weaviate.chunking): the first object is the
+    attachment itself, the others are its ``attachment_chunk`` children.
+    
+    Args:
+        instance: Django model instance to serialize
+        fetch_from_github: For ExternalIssueMapping, fetch fresh data from GitHub API
+        
+    Returns:
+        List of AgiraObject dictionaries (empty for unsupported types)
+    """
+    obj_dict = to_agira_object(instance, fetch_from_github=fetch_from_github)
+    if obj_dict is None:
+        return []
+    if obj_dict['type'] != 'attachment':
+        return [obj_dict]
+    parent, chunks = serialize_chunks(obj_dict)
+    return [parent] + chunks
+
+
 def _serialize_item(item) -> Dict[str, Any]:
     """Serialize an Item instance."""
     # Build text content
@@ -131,96 +156,6 @@ def _serialize_item(item) -> Dict[str, Any]:
     }
 
 
-def _extract_plain_text(file_path: str, encoding: str = 'utf-8') -> Optional[str]:
-    """
-    Extract text from plain text files.
-    
-    Handles: .json, .html, .py, .xml, .cs, .txt, .yml, .yaml
-    
-    Args:
-        file_path: Path to the file
-        encoding: Text encoding (default: utf-8)
-        
-    Returns:
-        Extracted text content, or None if extraction fails
-    """
-    try:
-        with open(file_path, 'r', encoding=encoding) as f:
-            return f.read()
-    except UnicodeDecodeError:
-        # Try with latin-1 as fallback
-        try:
-            with open(file_path, 'r', encoding='latin-1') as f:
-                return f.read()
-        except Exception as e:
-            logger.warning(f"Could not decode file {file_path} as UTF-8 or latin-1: {e}")
-            return None
-    except Exception as e:
-        logger.error(f"Error reading plain text file {file_path}: {e}")
-        return None
-
-
-def _extract_pdf_text(file_path: str) -> Optional[str]:
-    """
-    Extract text from PDF files using PyPDF2.
-    
-    Args:
-        file_path: Path to the PDF file
-        
-    Returns:
-        Extracted text content, or None if extraction fails
-    """
-    try:
-        from PyPDF2 import PdfReader
-        
-        reader = PdfReader(file_path)
-        text_parts = []
-        
-        for page in reader.pages:
-            page_text = page.extract_text()
-            if page_text:
-                text_parts.append(page_text)
-        
-        return '\n\n'.join(text_parts) if text_parts else None
-        
-    except ImportError:
-        logger.error("PyPDF2 library not available for PDF text extraction")
-        return None
-    except Exception as e:
-        logger.warning(f"Error extracting text from PDF {file_path}: {e}")
-        return None
-
-
-def _extract_docx_text(file_path: str) -> Optional[str]:
-    """
-    Extract text from DOCX files using python-docx.
-    
-    Args:
-        file_path: Path to the DOCX file
-        
-    Returns:
-        Extracted text content, or None if extraction fails
-    """
-    try:
-        from docx import Document
-        
-        doc = Document(file_path)
-        text_parts = []
-        
-        for paragraph in doc.paragraphs:
-            if paragraph.text.strip():
-                text_parts.append(paragraph.text)
-        
-        return '\n\n'.join(text_parts) if text_parts else None
-        
-    except ImportError:
-        logger.error("python-docx library not available for DOCX text extraction")
-        return None
-    except Exception as e:
-        logger.warning(f"Error extracting text from DOCX {file_path}: {e}")
-        return None
-
-
 def _serialize_comment(comment) -> Dict[str, Any]:
     """Serialize an ItemComment instance."""
     # Build title
@@ -255,12 +190,17 @@ def _get_attachment_text_content(attachment) -> str:
     """
     Get text content for an attachment.
     
-    Extracts and returns actual file content for supported file types:
+    Returns the actual file content for supported file types:
     - Plain text: .md, .json, .html, .py, .xml, .cs, .txt, .yml, .yaml
     - PDF: .pdf
     - DOCX: .docx
     
-    For unsupported files, returns a description with metadata.
+    PDF and DOCX text comes from the per-hash extraction cache (see
+    core.services.storage.text_extraction); large files are extracted by the
+    attachment_text_worker, which re-queues the attachment afterwards.
+    
+    For unsupported files, or until extraction is done, returns a
+    description with metadata.
     
     Args:
         attachment: Attachment instance
@@ -268,49 +208,9 @@ def _get_attachment_text_content(attachment) -> str:
     Returns:
         Text content for indexing in Weaviate
     """
-    # Determine file extension
-    filename = attachment.original_name or ''
-    file_extension = filename.lower().split('.')[-1] if '.' in filename else ''
-    
-    # Define supported plain text extensions
-    plain_text_extensions = {'md', 'json', 'html', 'py', 'xml', 'cs', 'txt', 'yml', 'yaml'}
-    
-    # Check if file type is supported for content extraction
-    is_plain_text = file_extension in plain_text_extensions
-    is_pdf = file_extension == 'pdf'
-    is_docx = file_extension == 'docx'
-    
-    # If file type supports content extraction, try to extract it
-    if is_plain_text or is_pdf or is_docx:
-        try:
-            storage_service = AttachmentStorageService()
-            file_path = storage_service.get_file_path(attachment)
-            
-            # Extract content based on file type
-            if is_plain_text:
-                content = _extract_plain_text(file_path)
-            elif is_pdf:
-                content = _extract_pdf_text(file_path)
-            else:  # is_docx
-                content = _extract_docx_text(file_path)
-            
-            # If extraction succeeded, return the content
-            if content:
-                return content
-            
-            # If extraction returned None/empty, fall back to filename
-            logger.warning(
-                f"Content extraction for {filename} (attachment {attachment.id}) "
-                f"returned empty result, using filename fallback"
-            )
-            
-        except FileNotFoundError as e:
-            logger.warning(
-                f"File not found for attachment {attachment.id} "
-                f"(path: {attachment.storage_path}): {e}"
-            )
-        except Exception as e:
-            logger.error(f"Error extracting content from {filename} (attachment {attachment.id}): {e}")
+    content = get_attachment_text(attachment)
+    if content:
+        return content
     
     # For unsupported files or when extraction fails, use filename-based text
     text = f"Attachment: {attachment.original_name}"
@@ -14,7 +14,8 @@ from dataclasses import dataclass
 import weaviate
 from weaviate.classes.query import Filter, HybridFusion, MetadataQuery
 
-from core.services.weaviate.client import get_client
+from core.services.weaviate.chunking import CHUNK_TYPE, delete_chunks, result_type
+from core.services.weaviate.client import pooled_client
 from core.services.weaviate.schema import ensure_schema as _ensure_schema_internal, COLLECTION_NAME
 
 logger = logging.getLogger(__name__)
@@ -92,38 +93,10 @@ def _get_deterministic_uuid(source_type: str, source_id: str) -> uuid.UUID:
     return uuid.uuid5(UUID_NAMESPACE, stable_key)
 
 
-def is_meeting_transcript_attachment(attachment) -> bool:
-    """
-    Check if an attachment is a meeting transcript.
-    
-    Meeting transcripts should be excluded from Weaviate sync because they are
-    too large and cause timeouts/errors. They are identified by:
-    - Having a role of 'transkript' (TRANSKRIPT in AttachmentRole)
-    - Being linked to an Item with type.key = 'meeting'
-    
-    Args:
-        attachment: Attachment model instance
-        
-    Returns:
-        True if this is a meeting transcript that should be excluded from sync
-    """
-    from core.models import AttachmentRole, Item
-    
-    # Check if any of the attachment's links have role='transkript'
-    if hasattr(attachment, 'links'):
-        for link in attachment.links.all():
-            # Check if this link has the transkript role
-            if link.role == AttachmentRole.TRANSKRIPT:
-                # Verify the target is a Meeting item
-                target = link.target
-                if isinstance(target, Item) and target.type.key.lower() == 'meeting':
-                    logger.debug(
-                        f"Attachment {attachment.id} is a meeting transcript "
-                        f"(role={link.role}, item={target.id}, type={target.type.key})"
-                    )
-                    return True
-    
-    return False
+def _bump_rag_cache(project_ids: Optional[List] = None) -> None:
+    """Invalidate cached RAG contexts of the given projects (None = all) after a write."""
+    from core.services.rag.cache import bump_index_generation
+    bump_index_generation(project_ids)
 
 
 def is_excluded_from_sync(obj_type: str, obj_id: str) -> Tuple[bool, Optional[str]]:
@@ -131,7 +104,8 @@ def is_excluded_from_sync(obj_type: str, obj_id: str) -> Tuple[bool, Optional[st
     Check if an object should be excluded from Weaviate sync.
     
     This centralizes exclusion logic for both automatic signals and manual push operations.
-    Currently excludes meeting transcript attachments.
+    Currently nothing is excluded: meeting transcripts, which used to be, are
+    split into chunks (see core.services.weaviate.chunking) like any long attachment.
     
     Args:
         obj_type: Type of object (e.g., "attachment", "item")
@@ -142,21 +116,6 @@ def is_excluded_from_sync(obj_type: str, obj_id: str) -> Tuple[bool, Optional[st
         - is_excluded: True if object should not be synced
         - reason: Human-readable reason for exclusion (for UI display)
     """
-    from core.models import Attachment
-    
-    # Check for meeting transcript attachments
-    if obj_type == 'attachment':
-        try:
-            instance = _load_django_object(obj_type, obj_id)
-            if instance and isinstance(instance, Attachment):
-                if is_meeting_transcript_attachment(instance):
-                    return (
-                        True, 
-                        "Meeting transcripts are excluded from Weaviate indexing due to their size."
-                    )
-        except Exception as e:
-            logger.warning(f"Error checking exclusion for {obj_type}:{obj_id}: {e}")
-    
     return (False, None)
 
 
@@ -231,53 +190,51 @@ def upsert_document(
         updated_at = datetime.now()
     
     # Get client and ensure schema
-    client = get_client()
-    try:
-        _ensure_schema_once(client)
-        
-        # Get collection
-        collection = client.collections.get(COLLECTION_NAME)
-        
-        # Prepare properties
-        properties = {
-            "source_type": source_type,
-            "source_id": source_id_str,
-            "project_id": project_id_str,
-            "title": title,
-            "text": text,
-            "updated_at": updated_at,
-        }
-        
-        # Add optional properties
-        if tags is not None:
-            properties["tags"] = tags
-        if url is not None:
-            properties["url"] = url
-        
-        # Upsert using deterministic UUID
-        # Weaviate v4: Use replace() to update if exists, insert if not
+    with pooled_client() as client:
         try:
-            collection.data.replace(
-                properties=properties,
-                uuid=obj_uuid,
-            )
-        except Exception:
-            # If replace fails (object doesn't exist), insert it
-            collection.data.insert(
-                properties=properties,
-                uuid=obj_uuid,
-            )
-        
-        logger.info(f"Successfully upserted document: {source_type}:{source_id_str} -> {obj_uuid}")
-        
-        return str(obj_uuid)
-    
-    except Exception as e:
-        logger.error(f"Failed to upsert document {source_type}:{source_id_str}: {type(e).__name__}: {e}", exc_info=True)
-        raise
+            _ensure_schema_once(client)
+            
+            # Get collection
+            collection = client.collections.get(COLLECTION_NAME)
+            
+            # Prepare properties
+            properties = {
+                "source_type": source_type,
+                "source_id": source_id_str,
+                "project_id": project_id_str,
+                "title": title,
+                "text": text,
+                "updated_at": updated_at,
+            }
+            
+            # Add optional properties
+            if tags is not None:
+                properties["tags"] = tags
+            if url is not None:
+                properties["url"] = url
+            
+            # Upsert using deterministic UUID
+            # Weaviate v4: Use replace() to update if exists, insert if not
+            try:
+                collection.data.replace(
+                    properties=properties,
+                    uuid=obj_uuid,
+                )
+            except Exception:
+                # If replace fails (object doesn't exist), insert it
+                collection.data.insert(
+                    properties=properties,
+                    uuid=obj_uuid,
+                )
+            
+            logger.info(f"Successfully upserted document: {source_type}:{source_id_str} -> {obj_uuid}")
+            _bump_rag_cache([project_id_str])
+            
+            return str(obj_uuid)
         
-    finally:
-        client.close()
+        except Exception as e:
+            logger.error(f"Failed to upsert document {source_type}:{source_id_str}: {type(e).__name__}: {e}", exc_info=True)
+            raise
 
 
 def delete_document(source_type: str, source_id: str | int) -> bool:
@@ -309,27 +266,25 @@ def delete_document(source_type: str, source_id: str | int) -> bool:
     obj_uuid = _get_deterministic_uuid(source_type, source_id_str)
     
     # Get client
-    client = get_client()
-    try:
-        # Get collection
-        collection = client.collections.get(COLLECTION_NAME)
-        
-        # Try to delete
+    with pooled_client() as client:
         try:
-            collection.data.delete_by_id(obj_uuid)
-            logger.info(f"Successfully deleted document: {source_type}:{source_id_str}")
-            return True
-        except Exception as e:
-            # Object might not exist
-            logger.warning(f"Could not delete {source_type}:{source_id_str} (might not exist): {e}")
-            return False
-    
-    except Exception as e:
-        logger.error(f"Error deleting document {source_type}:{source_id_str}: {type(e).__name__}: {e}", exc_info=True)
-        raise
+            # Get collection
+            collection = client.collections.get(COLLECTION_NAME)
             
-    finally:
-        client.close()
+            # Try to delete
+            try:
+                collection.data.delete_by_id(obj_uuid)
+                logger.info(f"Successfully deleted document: {source_type}:{source_id_str}")
+                _bump_rag_cache()
+                return True
+            except Exception as e:
+                # Object might not exist
+                logger.warning(f"Could not delete {source_type}:{source_id_str} (might not exist): {e}")
+                return False
+        
+        except Exception as e:
+            logger.error(f"Error deleting document {source_type}:{source_id_str}: {type(e).__name__}: {e}", exc_info=True)
+            raise
 
 
 def query(
@@ -376,60 +331,57 @@ def query(
     logger.info(f"Querying documents in project {project_id_str}: '{query_text}' (top_k={top_k})")
     
     # Get client and ensure schema
-    client = get_client()
-    try:
-        _ensure_schema_once(client)
-        
-        # Get collection
-        collection = client.collections.get(COLLECTION_NAME)
-        
-        # Build filter for project_id
-        where_filter = Filter.by_property("project_id").equal(project_id_str)
-        
-        # Add additional filters if provided
-        if filters:
-            for key, value in filters.items():
-                where_filter = where_filter & Filter.by_property(key).equal(str(value))
-        
-        # Execute semantic search
-        response = collection.query.near_text(
-            query=query_text,
-            limit=top_k,
-            where=where_filter,
-            return_metadata=VECTOR_METADATA_QUERY,
-        )
-        
-        # Format results
-        results = []
-        for obj in response.objects:
-            props = obj.properties
+    with pooled_client() as client:
+        try:
+            _ensure_schema_once(client)
             
-            # Create text preview (first 200 chars)
-            text = props.get("text", "")
-            text_preview = text[:200] + "..." if len(text) > 200 else text
+            # Get collection
+            collection = client.collections.get(COLLECTION_NAME)
             
-            result = {
-                "source_type": props.get("source_type"),
-                "source_id": props.get("source_id"),
-                "title": props.get("title"),
-                "text_preview": text_preview,
-                "url": props.get("url"),
-                # Get score from metadata (Weaviate v4 returns score or distance)
-                # Use explicit None check to handle score=0 as a valid value
-                "score": (score := getattr(obj.metadata, 'score', None)) if score is not None else getattr(obj.metadata, 'distance', None),
-            }
-            results.append(result)
-        
-        logger.info(f"Query completed: returned {len(results)} results for '{query_text}' in project {project_id_str}")
-        
-        return results
-    
-    except Exception as e:
-        logger.error(f"Query failed for '{query_text}' in project {project_id_str}: {type(e).__name__}: {e}", exc_info=True)
-        raise
+            # Build filter for project_id
+            where_filter = Filter.by_property("project_id").equal(project_id_str)
+            
+            # Add additional filters if provided
+            if filters:
+                for key, value in filters.items():
+                    where_filter = where_filter & Filter.by_property(key).equal(str(value))
+            
+            # Execute semantic search
+            response = collection.query.near_text(
+                query=query_text,
+                limit=top_k,
+                where=where_filter,
+                return_metadata=VECTOR_METADATA_QUERY,
+            )
+            
+            # Format results
+            results = []
+            for obj in response.objects:
+                props = obj.properties
+                
+                # Create text preview (first 200 chars)
+                text = props.get("text", "")
+                text_preview = text[:200] + "..." if len(text) > 200 else text
+                
+                result = {
+                    "source_type": props.get("source_type"),
+                    "source_id": props.get("source_id"),
+                    "title": props.get("title"),
+                    "text_preview": text_preview,
+                    "url": props.get("url"),
+                    # Get score from metadata (Weaviate v4 returns score or distance)
+                    # Use explicit None check to handle score=0 as a valid value
+                    "score": (score := getattr(obj.metadata, 'score', None)) if score is not None else getattr(obj.metadata, 'distance', None),
+                }
+                results.append(result)
+            
+            logger.info(f"Query completed: returned {len(results)} results for '{query_text}' in project {project_id_str}")
+            
+            return results
         
-    finally:
-        client.close()
+        except Exception as e:
+            logger.error(f"Query failed for '{query_text}' in project {project_id_str}: {type(e).__name__}: {e}", exc_info=True)
+            raise
 
 
 def global_search(
@@ -476,56 +428,80 @@ def global_search(
     logger.info(f"Global search: '{query}' (mode={mode}, limit={limit}, alpha={alpha})")
     
     # Get client and ensure schema
-    client = get_client()
-    try:
-        _ensure_schema_once(client)
-        
-        # Get collection
-        collection = client.collections.get(COLLECTION_NAME)
-        
-        # Build filter if provided
-        where_filter = None
-        if filters:
-            filter_conditions = []
-            for key, value in filters.items():
-                filter_conditions.append(Filter.by_property(key).equal(str(value)))
-            
-            # Combine filters with AND
-            if len(filter_conditions) == 1:
-                where_filter = filter_conditions[0]
-            else:
-                where_filter = filter_conditions[0]
-                for condition in filter_conditions[1:]:
-                    where_filter = where_filter & condition
-        
-        # Execute search based on mode
-        # Note: The collection is configured with vectorizer set to 'none', so:
-        # - 'hybrid' mode: Uses BM25 keyword matching (vectorizer='none' means no vector component)
-        # - 'similar' mode: Attempts near_text but falls back to BM25 if no vectorizer configured
-        # - 'keyword' mode: Pure BM25 keyword search
-        # For full semantic/vector search, configure a vectorizer (e.g., text2vec-transformers) in the schema.
-        # Using RELATIVE_SCORE fusion ensures consistent score calculation for ranking.
-        
+    with pooled_client() as client:
         try:
-            if mode == 'similar':
-                # Semantic/vector search (near_text)
-                # Note: This requires a configured vectorizer. With vectorizer='none',
-                # Weaviate may return an error or fall back to keyword search.
-                # We handle this gracefully by catching errors and falling back to hybrid search.
-                try:
-                    response = collection.query.near_text(
+            _ensure_schema_once(client)
+            
+            # Get collection
+            collection = client.collections.get(COLLECTION_NAME)
+            
+            # Build filter if provided
+            where_filter = None
+            if filters:
+                filter_conditions = []
+                for key, value in filters.items():
+                    if key == 'type' and value == 'attachment':
+                        # Match the chunks of long attachments as well
+                        filter_conditions.append(Filter.by_property(key).contains_any(['attachment', CHUNK_TYPE]))
+                    else:
+                        filter_conditions.append(Filter.by_property(key).equal(str(value)))
+                
+                # Combine filters with AND
+                if len(filter_conditions) == 1:
+                    where_filter = filter_conditions[0]
+                else:
+                    where_filter = filter_conditions[0]
+                    for condition in filter_conditions[1:]:
+                        where_filter = where_filter & condition
+            
+            # Execute search based on mode
+            # Note: The collection is configured with vectorizer set to 'none', so:
+            # - 'hybrid' mode: Uses BM25 keyword matching (vectorizer='none' means no vector component)
+            # - 'similar' mode: Attempts near_text but falls back to BM25 if no vectorizer configured
+            # - 'keyword' mode: Pure BM25 keyword search
+            # For full semantic/vector search, configure a vectorizer (e.g., text2vec-transformers) in the schema.
+            # Using RELATIVE_SCORE fusion ensures consistent score calculation for ranking.
+            
+            try:
+                if mode == 'similar':
+                    # Semantic/vector search (near_text)
+                    # Note: This requires a configured vectorizer. With vectorizer='none',
+                    # Weaviate may return an error or fall back to keyword search.
+                    # We handle this gracefully by catching errors and falling back to hybrid search.
+                    try:
+                        response = collection.query.near_text(
+                            query=query,
+                            limit=limit,
+                            where=where_filter,
+                            return_metadata=VECTOR_METADATA_QUERY,
+                        )
+                    except (AttributeError, ValueError, RuntimeError) as e:
+                        # Catch specific errors related to missing vectorizer or invalid query
+                        logger.warning(
+                            f"near_text query failed (vectorizer may not be configured), "
+                            f"falling back to hybrid search: {type(e).__name__}: {e}"
+                        )
+                        # Fall back to hybrid search if near_text fails
+                        response = collection.query.hybrid(
+                            query=query,
+                            limit=limit,
+                            alpha=alpha,
+                            filters=where_filter,
+                            fusion_type=HybridFusion.RELATIVE_SCORE,
+                            return_metadata=HYBRID_METADATA_QUERY,
+                        )
+                elif mode == 'keyword':
+                    # Pure BM25 keyword search (alpha=0 means BM25 only)
+                    response = collection.query.hybrid(
                         query=query,
                         limit=limit,
-                        where=where_filter,
-                        return_metadata=VECTOR_METADATA_QUERY,
-                    )
-                except (AttributeError, ValueError, RuntimeError) as e:
-                    # Catch specific errors related to missing vectorizer or invalid query
-                    logger.warning(
-                        f"near_text query failed (vectorizer may not be configured), "
-                        f"falling back to hybrid search: {type(e).__name__}: {e}"
+                        alpha=0.0,  # Pure BM25
+                        filters=where_filter,
+                        fusion_type=HybridFusion.RELATIVE_SCORE,
+                        return_metadata=HYBRID_METADATA_QUERY,
                     )
-                    # Fall back to hybrid search if near_text fails
+                else:
+                    # Hybrid search (default) - combines BM25 and vector
                     response = collection.query.hybrid(
                         query=query,
                         limit=limit,
@@ -534,80 +510,68 @@ def global_search(
                         fusion_type=HybridFusion.RELATIVE_SCORE,
                         return_metadata=HYBRID_METADATA_QUERY,
                     )
-            elif mode == 'keyword':
-                # Pure BM25 keyword search (alpha=0 means BM25 only)
-                response = collection.query.hybrid(
-                    query=query,
-                    limit=limit,
-                    alpha=0.0,  # Pure BM25
-                    filters=where_filter,
-                    fusion_type=HybridFusion.RELATIVE_SCORE,
-                    return_metadata=HYBRID_METADATA_QUERY,
-                )
-            else:
-                # Hybrid search (default) - combines BM25 and vector
-                response = collection.query.hybrid(
-                    query=query,
-                    limit=limit,
-                    alpha=alpha,
-                    filters=where_filter,
-                    fusion_type=HybridFusion.RELATIVE_SCORE,
-                    return_metadata=HYBRID_METADATA_QUERY,
+            except Exception as e:
+                # Log and re-raise unexpected errors
+                logger.error(f"Search query failed with unexpected error: {type(e).__name__}: {e}")
+                raise
+            
+            # Format results as AgiraSearchHit objects
+            results = []
+            seen_attachments = set()
+            for obj in response.objects:
+                props = obj.properties
+                
+                # A chunk hit stands for its attachment; list each attachment once
+                object_type = props.get("type", "unknown")
+                object_id = props.get("object_id")
+                if object_type in ('attachment', CHUNK_TYPE):
+                    if object_type == CHUNK_TYPE:
+                        object_id = props.get("parent_object_id")
+                    if object_id in seen_attachments:
+                        continue
+                    seen_attachments.add(object_id)
+                
+                # Get score from metadata (different attributes for different query types)
+                score = None
+                if hasattr(obj.metadata, 'score'):
+                    score = obj.metadata.score
+                elif hasattr(obj.metadata, 'distance'):
+                    # For near_text queries, distance is available (cosine distance)
+                    # Convert distance to normalized score (0-1 range)
+                    # Lower distance = higher similarity = higher score
+                    # Ensure distance stays within valid range even in edge cases
+                    distance = obj.metadata.distance
+                    if distance is not None:
+                        # Clamp distance to [0, MAX_DISTANCE] before conversion
+                        normalized_distance = min(distance / MAX_DISTANCE, 1.0)
+                        score = max(0.0, 1.0 - normalized_distance)
+                
+                hit = AgiraSearchHit(
+                    type=result_type(object_type),
+                    title=props.get("title", "Untitled"),
+                    url=props.get("url"),
+                    object_id=object_id,
+                    project_id=props.get("project_id"),
+                    score=score,
+                    updated_at=props.get("updated_at"),
+                    status=props.get("status"),
+                    external_key=props.get("external_key"),
                 )
-        except Exception as e:
-            # Log and re-raise unexpected errors
-            logger.error(f"Search query failed with unexpected error: {type(e).__name__}: {e}")
-            raise
-        
-        # Format results as AgiraSearchHit objects
-        results = []
-        for obj in response.objects:
-            props = obj.properties
+                results.append(hit)
             
-            # Get score from metadata (different attributes for different query types)
-            score = None
-            if hasattr(obj.metadata, 'score'):
-                score = obj.metadata.score
-            elif hasattr(obj.metadata, 'distance'):
-                # For near_text queries, distance is available (cosine distance)
-                # Convert distance to normalized score (0-1 range)
-                # Lower distance = higher similarity = higher score
-                # Ensure distance stays within valid range even in edge cases
-                distance = obj.metadata.distance
-                if distance is not None:
-                    # Clamp distance to [0, MAX_DISTANCE] before conversion
-                    normalized_distance = min(distance / MAX_DISTANCE, 1.0)
-                    score = max(0.0, 1.0 - normalized_distance)
+            # Sort results by score descending (highest relevance first)
+            # Use 0 as fallback for None scores (represents no relevance)
+            results.sort(key=lambda x: x.score if x.score is not None else 0, reverse=True)
             
-            hit = AgiraSearchHit(
-                type=props.get("type", "unknown"),
-                title=props.get("title", "Untitled"),
-                url=props.get("url"),
-                object_id=props.get("object_id"),
-                project_id=props.get("project_id"),
-                score=score,
-                updated_at=props.get("updated_at"),
-                status=props.get("status"),
-                external_key=props.get("external_key"),
-            )
-            results.append(hit)
-        
-        # Sort results by score descending (highest relevance first)
-        # Use 0 as fallback for None scores (represents no relevance)
-        results.sort(key=lambda x: x.score if x.score is not None else 0, reverse=True)
-        
-        logger.info(f"Global search completed: returned {len(results)} results for '{query}' (mode={mode})")
-        
-        return results
-    
-    except Exception as outer_e:
-        # Catch any exceptions not already logged
-        if "Search query failed with unexpected error" not in str(outer_e):
-            logger.error(f"Global search failed for '{query}': {type(outer_e).__name__}: {outer_e}", exc_info=True)
-        raise
+            logger.info(f"Global search completed: returned {len(results)} results for '{query}' (mode={mode})")
+            
+            return results
         
-    finally:
-        client.close()
+        except Exception as outer_e:
+            # Catch any exceptions not already logged
+            if "Search query failed with unexpected error" not in str(outer_e):
+                logger.error(f"Global search failed for '{query}': {type(outer_e).__name__}: {outer_e}", exc_info=True)
+            raise
 
 
 def ensure_schema() -> None:
@@ -626,15 +590,13 @@ def ensure_schema() -> None:
         >>> ensure_schema()  # Creates AgiraObject collection if needed
     """
     logger.info("Ensuring Weaviate schema exists")
-    client = get_client()
-    try:
-        _ensure_schema_internal(client)
-        logger.info("Weaviate schema verification completed")
-    except Exception as e:
-        logger.error(f"Failed to ensure schema: {type(e).__name__}: {e}", exc_info=True)
-        raise
-    finally:
-        client.close()
+    with pooled_client() as client:
+        try:
+            _ensure_schema_internal(client)
+            logger.info("Weaviate schema verification completed")
+        except Exception as e:
+            logger.error(f"Failed to ensure schema: {type(e).__name__}: {e}", exc_info=True)
+            raise
 
 
 def upsert_object(type: str, object_id: str) -> Optional[str]:
@@ -664,8 +626,7 @@ def upsert_object(type: str, object_id: str) -> Optional[str]:
         ...     print(f"Upserted with UUID: {uuid_str}")
     """
     logger.info(f"Upserting object: {type}:{object_id}")
-    from core.services.weaviate.serializers import to_agira_object
-    from core.models import Attachment
+    from core.services.weaviate.serializers import to_agira_objects
     
     # Load the Django object
     instance = _load_django_object(type, object_id)
@@ -673,25 +634,17 @@ def upsert_object(type: str, object_id: str) -> Optional[str]:
         logger.warning(f"Object not found: {type}:{object_id}")
         return None
     
-    # Skip meeting transcript attachments - they are too large and cause timeouts
-    if isinstance(instance, Attachment) and is_meeting_transcript_attachment(instance):
-        logger.info(
-            f"Skipping Weaviate sync for meeting transcript attachment {instance.id} "
-            f"(file: {instance.original_name}) - excluded from indexing"
-        )
-        return None
-    
     # For GitHub issues/PRs, fetch fresh data from GitHub API
     fetch_from_github = type in ('github_issue', 'github_pr')
     
-    # Serialize to AgiraObject dict
-    obj_dict = to_agira_object(instance, fetch_from_github=fetch_from_github)
-    if obj_dict is None:
+    # Serialize to AgiraObject dicts (long attachments are chunked)
+    objects = to_agira_objects(instance, fetch_from_github=fetch_from_github)
+    if not objects:
         logger.warning(f"Could not serialize object: {type}:{object_id}")
         return None
     
     # Upsert using the new schema
-    result = _upsert_agira_object(obj_dict)
+    result = _upsert_agira_objects(objects)
     logger.info(f"Successfully upserted object: {type}:{object_id} -> {result}")
     return result
 
@@ -723,27 +676,27 @@ def delete_object(type: str, object_id: str) -> bool:
     obj_uuid = _get_deterministic_uuid(type, object_id_str)
     
     # Get client
-    client = get_client()
-    try:
-        # Get collection
-        collection = client.collections.get(COLLECTION_NAME)
-        
-        # Try to delete
+    with pooled_client() as client:
         try:
-            collection.data.delete_by_id(obj_uuid)
-            logger.info(f"Successfully deleted object: {type}:{object_id_str}")
-            return True
-        except Exception as e:
-            # Object might not exist
-            logger.warning(f"Could not delete {type}:{object_id_str} (might not exist): {e}")
-            return False
-    
-    except Exception as e:
-        logger.error(f"Error deleting object {type}:{object_id_str}: {type(e).__name__}: {e}", exc_info=True)
-        raise
+            # Get collection
+            collection = client.collections.get(COLLECTION_NAME)
             
-    finally:
-        client.close()
+            # Try to delete
+            try:
+                collection.data.delete_by_id(obj_uuid)
+                if type == 'attachment':
+                    delete_chunks(collection, [object_id_str])
+                logger.info(f"Successfully deleted object: {type}:{object_id_str}")
+                _bump_rag_cache()
+                return True
+            except Exception as e:
+                # Object might not exist
+                logger.warning(f"Could not delete {type}:{object_id_str} (might not exist): {e}")
+                return False
+        
+        except Exception as e:
+            logger.error(f"Error deleting object {type}:{object_id_str}: {type(e).__name__}: {e}", exc_info=True)
+            raise
 
 
 def upsert_instance(instance, fetch_from_github: bool = False) -> Optional[str]:
@@ -770,36 +723,34 @@ def upsert_instance(instance, fetch_from_github: bool = False) -> Optional[str]:
         >>> uuid_str = upsert_instance(item)
     """
     logger.debug(f"Upserting instance: {instance.__class__.__name__} (pk={instance.pk})")
-    from core.services.weaviate.serializers import to_agira_object
-    from core.models import Attachment
-    
-    # Skip meeting transcript attachments - they are too large and cause timeouts
-    if isinstance(instance, Attachment) and is_meeting_transcript_attachment(instance):
-        logger.info(
-            f"Skipping Weaviate sync for meeting transcript attachment {instance.id} "
-            f"(file: {instance.original_name}) - excluded from indexing"
-        )
-        return None
+    from core.services.weaviate.serializers import to_agira_objects
     
-    # Serialize to AgiraObject dict
-    obj_dict = to_agira_object(instance, fetch_from_github=fetch_from_github)
-    if obj_dict is None:
+    # Serialize to AgiraObject dicts (long attachments are chunked)
+    objects = to_agira_objects(instance, fetch_from_github=fetch_from_github)
+    if not objects:
         logger.warning(f"Could not serialize instance: {instance.__class__.__name__} (pk={instance.pk})")
         return None
     
     # Upsert using the new schema
-    return _upsert_agira_object(obj_dict)
+    return _upsert_agira_objects(objects)
 
 
-def sync_project(project_id: str | int) -> Dict[str, int]:
+def sync_project(
+    project_id: str | int,
+    batch_size: Optional[int] = None,
+    concurrent_requests: Optional[int] = None,
+) -> Dict[str, int]:
     """
     Synchronize all objects for a project to Weaviate.
     
-    This method loads all items, comments, changes, etc. for a project
-    and upserts them into Weaviate.
+    This method streams all items, comments, changes, nodes and releases of
+    a project and writes them through the Weaviate batch API (see
+    ``core.services.weaviate.bulk``).
     
     Args:
         project_id: Project ID to sync
+        batch_size: Objects per batch request (default: bulk.DEFAULT_BATCH_SIZE)
+        concurrent_requests: Parallel batch requests (default: bulk.DEFAULT_CONCURRENT_REQUESTS)
         
     Returns:
         Dictionary with counts of synced objects by type
@@ -812,44 +763,19 @@ def sync_project(project_id: str | int) -> Dict[str, int]:
         >>> stats = sync_project("1")
         >>> print(f"Synced {stats['item']} items, {stats['comment']} comments")
     """
-    from core.models import Item, ItemComment, Change, Node, Release
-    from core.services.weaviate.serializers import to_agira_object
+    from core.services.weaviate.bulk import (
+        BulkIndexer, DEFAULT_BATCH_SIZE, DEFAULT_CONCURRENT_REQUESTS,
+    )
     
     project_id_str = str(project_id)
-    stats = {
-        'item': 0,
-        'comment': 0,
-        'change': 0,
-        'node': 0,
-        'release': 0,
-    }
-    
     logger.info(f"Starting sync for project {project_id_str}")
     
-    # Sync items
-    for item in Item.objects.filter(project_id=project_id_str):
-        if upsert_instance(item):
-            stats['item'] += 1
-    
-    # Sync comments (via items)
-    for comment in ItemComment.objects.filter(item__project_id=project_id_str):
-        if upsert_instance(comment):
-            stats['comment'] += 1
-    
-    # Sync changes
-    for change in Change.objects.filter(project_id=project_id_str):
-        if upsert_instance(change):
-            stats['change'] += 1
-    
-    # Sync nodes
-    for node in Node.objects.filter(project_id=project_id_str):
-        if upsert_instance(node):
-            stats['node'] += 1
-    
-    # Sync releases
-    for release in Release.objects.filter(project_id=project_id_str):
-        if upsert_instance(release):
-            stats['release'] += 1
+    indexer = BulkIndexer(
+        batch_size=batch_size or DEFAULT_BATCH_SIZE,
+        concurrent_requests=concurrent_requests or DEFAULT_CONCURRENT_REQUESTS,
+    )
+    results = indexer.index_project(project_id=project_id_str)
+    stats = {obj_type: result.indexed for obj_type, result in results.items()}
     
     logger.info(f"Completed sync for project {project_id_str}: {stats}")
     return stats
@@ -967,28 +893,23 @@ def exists_object(type: str, object_id: str) -> bool:
     obj_uuid = _get_deterministic_uuid(type, object_id_str)
     
     # Get client
-    client = get_client()
-    try:
-        # Get collection
-        collection = client.collections.get(COLLECTION_NAME)
-        
-        # Try to fetch object by UUID
+    with pooled_client() as client:
         try:
-            obj = collection.query.fetch_object_by_id(obj_uuid)
-            return obj is not None
-        except Exception:
-            # Object doesn't exist or other error
-            return False
+            # Get collection
+            collection = client.collections.get(COLLECTION_NAME)
             
-    except Exception as e:
-        # Weaviate might not be configured or available
-        logger.debug(f"Error checking existence of {type}:{object_id_str}: {e}")
-        return False
-    finally:
-        try:
-            client.close()
-        except Exception:
-            pass
+            # Try to fetch object by UUID
+            try:
+                obj = collection.query.fetch_object_by_id(obj_uuid)
+                return obj is not None
+            except Exception:
+                # Object doesn't exist or other error
+                return False
+                
+        except Exception as e:
+            # Weaviate might not be configured or available
+            logger.debug(f"Error checking existence of {type}:{object_id_str}: {e}")
+            return False
 
 
 def fetch_object(instance) -> Optional[Dict[str, Any]]:
@@ -1040,36 +961,65 @@ def fetch_object_by_type(type: str, object_id: str) -> Optional[Dict[str, Any]]:
     obj_uuid = _get_deterministic_uuid(type, object_id_str)
     
     # Get client
-    client = get_client()
-    try:
-        _ensure_schema_once(client)
-        
-        # Get collection
-        collection = client.collections.get(COLLECTION_NAME)
-        
-        # Try to fetch object by UUID
+    with pooled_client() as client:
         try:
-            obj = collection.query.fetch_object_by_id(obj_uuid)
-            if obj is None:
-                return None
+            _ensure_schema_once(client)
             
-            # Convert to dict with UUID
-            result = dict(obj.properties)
-            result['uuid'] = str(obj.uuid)
-            return result
+            # Get collection
+            collection = client.collections.get(COLLECTION_NAME)
             
+            # Try to fetch object by UUID
+            try:
+                obj = collection.query.fetch_object_by_id(obj_uuid)
+                if obj is None:
+                    return None
+                
+                # Convert to dict with UUID
+                result = dict(obj.properties)
+                result['uuid'] = str(obj.uuid)
+                return result
+                
+            except Exception as e:
+                logger.debug(f"Could not fetch {type}:{object_id_str}: {e}")
+                return None
+                
         except Exception as e:
-            logger.debug(f"Could not fetch {type}:{object_id_str}: {e}")
+            logger.error(f"Error fetching object {type}:{object_id_str}: {e}")
             return None
-            
-    except Exception as e:
-        logger.error(f"Error fetching object {type}:{object_id_str}: {e}")
-        return None
-    finally:
-        try:
-            client.close()
-        except Exception:
-            pass
+
+
+def _prepare_properties(obj_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build the Weaviate property dict for a serialized AgiraObject.
+    
+    Drops None values for optional fields and makes sure ``created_at`` and
+    ``updated_at`` are present and timezone-aware (UTC).
+    
+    Args:
+        obj_dict: Dictionary with AgiraObject properties
+        
+    Returns:
+        Properties ready to be written to Weaviate
+    """
+    properties = {k: v for k, v in obj_dict.items() if v is not None}
+    
+    # Ensure datetime objects are present and timezone-aware (UTC)
+    # This fixes the Con002 warning about naive datetime objects
+    if 'created_at' not in properties or properties['created_at'] is None:
+        properties['created_at'] = datetime.now(timezone.utc)
+    elif properties['created_at'].tzinfo is None:
+        # Django's USE_TZ=True means naive datetimes from models are already in UTC
+        # We just need to attach the timezone info to avoid Weaviate warnings
+        properties['created_at'] = properties['created_at'].replace(tzinfo=timezone.utc)
+    
+    if 'updated_at' not in properties or properties['updated_at'] is None:
+        properties['updated_at'] = datetime.now(timezone.utc)
+    elif properties['updated_at'].tzinfo is None:
+        # Django's USE_TZ=True means naive datetimes from models are already in UTC
+        # We just need to attach the timezone info to avoid Weaviate warnings
+        properties['updated_at'] = properties['updated_at'].replace(tzinfo=timezone.utc)
+    
+    return properties
 
 
 def _upsert_agira_object(obj_dict: Dict[str, Any]) -> str:
@@ -1100,120 +1050,150 @@ def _upsert_agira_object(obj_dict: Dict[str, Any]) -> str:
     obj_uuid = _get_deterministic_uuid(obj_type, object_id)
     
     # Get client and ensure schema
-    client = get_client()
-    try:
-        _ensure_schema_once(client)
-        
-        # Get collection
-        collection = client.collections.get(COLLECTION_NAME)
-        
-        # Prepare properties (filter out None values for optional fields)
-        properties = {k: v for k, v in obj_dict.items() if v is not None}
-        
-        # Ensure datetime objects are present and timezone-aware (UTC)
-        # This fixes the Con002 warning about naive datetime objects
-        if 'created_at' not in properties or properties['created_at'] is None:
-            properties['created_at'] = datetime.now(timezone.utc)
-        elif properties['created_at'].tzinfo is None:
-            # Django's USE_TZ=True means naive datetimes from models are already in UTC
-            # We just need to attach the timezone info to avoid Weaviate warnings
-            properties['created_at'] = properties['created_at'].replace(tzinfo=timezone.utc)
-            
-        if 'updated_at' not in properties or properties['updated_at'] is None:
-            properties['updated_at'] = datetime.now(timezone.utc)
-        elif properties['updated_at'].tzinfo is None:
-            # Django's USE_TZ=True means naive datetimes from models are already in UTC
-            # We just need to attach the timezone info to avoid Weaviate warnings
-            properties['updated_at'] = properties['updated_at'].replace(tzinfo=timezone.utc)
-        
-        # Deterministic upsert strategy:
-        # Try replace first (update if exists), then insert if not found
+    with pooled_client() as client:
         try:
-            # Weaviate write triggered during create-github-issue flow
-            collection.data.replace(
-                properties=properties,
-                uuid=obj_uuid,
-            )
-            logger.debug(
-                f"Updated existing AgiraObject: {obj_type}:{object_id} -> {obj_uuid}"
-            )
-        except Exception as replace_error:
-            # Determine error type to decide on fallback strategy
-            # NOTE: We use string matching because the Weaviate Python client v4 doesn't
-            # expose specific exception types for different HTTP status codes.
-            # This is a limitation that should be revisited if the client API changes.
-            error_message = str(replace_error).lower()
-            error_type = type(replace_error).__name__
+            _ensure_schema_once(client)
             
-            # Log the replace error with diagnostic information
-            logger.debug(
-                f"Weaviate replace failed for {obj_type}:{object_id} (UUID: {obj_uuid}): "
-                f"{error_type}: {replace_error}"
-            )
+            # Get collection
+            collection = client.collections.get(COLLECTION_NAME)
             
-            # Determine if this is a "not found" error (object doesn't exist)
-            # Check for multiple patterns to be robust against different error message formats
-            is_not_found = (
-                '404' in error_message or 
-                'not found' in error_message or 
-                'does not exist' in error_message or
-                'no object with id' in error_message
-            )
+            # Prepare properties (filter out None values, timezone-aware datetimes)
+            properties = _prepare_properties(obj_dict)
             
-            if is_not_found:
-                # Object doesn't exist, insert it
-                try:
-                    collection.data.insert(
-                        properties=properties,
-                        uuid=obj_uuid,
-                    )
-                    logger.debug(
-                        f"Inserted new AgiraObject: {obj_type}:{object_id} -> {obj_uuid}"
-                    )
-                except Exception as insert_error:
-                    # Log comprehensive error information for insert failure
+            # Deterministic upsert strategy:
+            # Try replace first (update if exists), then insert if not found
+            try:
+                # Weaviate write triggered during create-github-issue flow
+                collection.data.replace(
+                    properties=properties,
+                    uuid=obj_uuid,
+                )
+                logger.debug(
+                    f"Updated existing AgiraObject: {obj_type}:{object_id} -> {obj_uuid}"
+                )
+            except Exception as replace_error:
+                # Determine error type to decide on fallback strategy
+                # NOTE: We use string matching because the Weaviate Python client v4 doesn't
+                # expose specific exception types for different HTTP status codes.
+                # This is a limitation that should be revisited if the client API changes.
+                error_message = str(replace_error).lower()
+                error_type = type(replace_error).__name__
+                
+                # Log the replace error with diagnostic information
+                logger.debug(
+                    f"Weaviate replace failed for {obj_type}:{object_id} (UUID: {obj_uuid}): "
+                    f"{error_type}: {replace_error}"
+                )
+                
+                # Determine if this is a "not found" error (object doesn't exist)
+                # Check for multiple patterns to be robust against different error message formats
+                is_not_found = (
+                    '404' in error_message or 
+                    'not found' in error_message or 
+                    'does not exist' in error_message or
+                    'no object with id' in error_message
+                )
+                
+                if is_not_found:
+                    # Object doesn't exist, insert it
+                    try:
+                        collection.data.insert(
+                            properties=properties,
+                            uuid=obj_uuid,
+                        )
+                        logger.debug(
+                            f"Inserted new AgiraObject: {obj_type}:{object_id} -> {obj_uuid}"
+                        )
+                    except Exception as insert_error:
+                        # Log comprehensive error information for insert failure
+                        logger.error(
+                            f"Weaviate INSERT failed for {obj_type}:{object_id}:\n"
+                            f"  UUID: {obj_uuid}\n"
+                            f"  Error Type: {type(insert_error).__name__}\n"
+                            f"  Error Message: {insert_error}\n"
+                            f"  Context: Item ID in obj_dict: {obj_dict.get('object_id', 'N/A')}",
+                            exc_info=True
+                        )
+                        raise
+                else:
+                    # This is NOT a "not found" error (e.g., 500, validation error, etc.)
+                    # Log comprehensive diagnostic information and re-raise
                     logger.error(
-                        f"Weaviate INSERT failed for {obj_type}:{object_id}:\n"
+                        f"Weaviate REPLACE failed with non-404 error for {obj_type}:{object_id}:\n"
+                        f"  HTTP Method: PUT\n"
+                        f"  Endpoint: /v1/objects/{COLLECTION_NAME}/{obj_uuid}\n"
                         f"  UUID: {obj_uuid}\n"
-                        f"  Error Type: {type(insert_error).__name__}\n"
-                        f"  Error Message: {insert_error}\n"
-                        f"  Context: Item ID in obj_dict: {obj_dict.get('object_id', 'N/A')}",
+                        f"  Error Type: {type(replace_error).__name__}\n"
+                        f"  Error Message: {replace_error}\n"
+                        f"  Context: Item ID in obj_dict: {obj_dict.get('object_id', 'N/A')}\n"
+                        f"  Object Type: {obj_type}",
                         exc_info=True
                     )
+                    # Re-raise the error - don't silently ignore 500 or validation errors
                     raise
-            else:
-                # This is NOT a "not found" error (e.g., 500, validation error, etc.)
-                # Log comprehensive diagnostic information and re-raise
-                logger.error(
-                    f"Weaviate REPLACE failed with non-404 error for {obj_type}:{object_id}:\n"
-                    f"  HTTP Method: PUT\n"
-                    f"  Endpoint: /v1/objects/{COLLECTION_NAME}/{obj_uuid}\n"
-                    f"  UUID: {obj_uuid}\n"
-                    f"  Error Type: {type(replace_error).__name__}\n"
-                    f"  Error Message: {replace_error}\n"
-                    f"  Context: Item ID in obj_dict: {obj_dict.get('object_id', 'N/A')}\n"
-                    f"  Object Type: {obj_type}",
-                    exc_info=True
-                )
-                # Re-raise the error - don't silently ignore 500 or validation errors
-                raise
-        
-        logger.debug(
-            f"Successfully upserted AgiraObject: {obj_type}:{object_id} -> {obj_uuid}"
-        )
+            
+            logger.debug(
+                f"Successfully upserted AgiraObject: {obj_type}:{object_id} -> {obj_uuid}"
+            )
+            _bump_rag_cache([obj_dict.get('project_id')])
+            
+            return str(obj_uuid)
         
-        return str(obj_uuid)
+        except Exception as e:
+            # Catch-all for any unexpected errors
+            logger.error(
+                f"Failed to upsert AgiraObject {obj_type}:{object_id}:\n"
+                f"  Error Type: {type(e).__name__}\n"
+                f"  Error Message: {e}",
+                exc_info=True
+            )
+            raise
+
+
+def _upsert_agira_objects(objects: List[Dict[str, Any]]) -> str:
+    """
+    Upsert an AgiraObject and, for attachments, replace its chunk objects.
     
-    except Exception as e:
-        # Catch-all for any unexpected errors
-        logger.error(
-            f"Failed to upsert AgiraObject {obj_type}:{object_id}:\n"
-            f"  Error Type: {type(e).__name__}\n"
-            f"  Error Message: {e}",
-            exc_info=True
-        )
-        raise
+    Args:
+        objects: Output of serializers.to_agira_objects()
         
-    finally:
-        client.close()
+    Returns:
+        Weaviate UUID of the first (parent) object as string
+    """
+    parent, chunks = objects[0], objects[1:]
+    result = _upsert_agira_object(parent)
+    if parent['type'] == 'attachment':
+        _replace_attachment_chunks(str(parent['object_id']), chunks)
+    return result
+
 
+def _replace_attachment_chunks(attachment_id: str, chunks: List[Dict[str, Any]]) -> None:
+    """
+    Replace the chunk objects of an attachment.
+    
+    Existing chunks are deleted first, so a shorter new version of the file
+    leaves no stale chunks behind. New chunks are written in one batch.
+    
+    Raises:
+        RuntimeError: If chunks could not be written
+    """
+    with pooled_client() as client:
+        _ensure_schema_once(client)
+        collection = client.collections.get(COLLECTION_NAME)
+        delete_chunks(collection, [attachment_id])
+        if not chunks:
+            return
+        
+        with collection.batch.fixed_size(batch_size=100) as batch:
+            for chunk in chunks:
+                batch.add_object(
+                    properties=_prepare_properties(chunk),
+                    uuid=_get_deterministic_uuid(CHUNK_TYPE, chunk['object_id']),
+                )
+        failed = collection.batch.failed_objects
+        if failed:
+            raise RuntimeError(
+                f"{len(failed)} of {len(chunks)} chunks of attachment {attachment_id} "
+                f"could not be written: {getattr(failed[0], 'message', failed[0])}"
+            )
+    logger.debug(f"Wrote {len(chunks)} chunks for attachment {attachment_id}")
@@ -1,104 +1,63 @@
 """
 Django signals for automatic Weaviate synchronization.
 
-This module sets up signal handlers to automatically sync Django models
-to Weaviate when they are saved or deleted.
+This module sets up signal handlers that record model saves and deletes in
+the Weaviate outbox (see core.services.weaviate.outbox). The outbox row is
+written in the same transaction as the change itself, and the
+weaviate_outbox_worker command pushes pending rows to Weaviate in batches.
+Saving a model therefore never waits for Weaviate, and no sync is lost when
+Weaviate is down or the process exits.
 """
 
 import logging
-from concurrent.futures import ThreadPoolExecutor
 
-from django.db import transaction
 from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 
-from core.services.weaviate.client import is_available
-from core.services.weaviate.service import (
-    upsert_instance,
-    delete_object,
-    is_meeting_transcript_attachment
-)
-from core.services.weaviate.serializers import _get_model_type
+from core.models import WeaviateSyncAction
+from core.services.weaviate import service as weaviate_service
+from core.services.weaviate.client import is_available, reset_client_pool
+from core.services.weaviate.outbox import enqueue
 
 logger = logging.getLogger(__name__)
 
-# Dedicated pool for Weaviate indexing that must not block the request/save path
-# (e.g. Item/Issue saves). Kept small since indexing is I/O-bound, not CPU-bound.
-_background_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="weaviate-index")
 
-
-def _safe_upsert(instance, *, background=False):
+def _safe_upsert(instance):
     """
-    Safely upsert an instance to Weaviate.
+    Safely queue an upsert of an instance to Weaviate.
 
     Catches all exceptions to prevent signal from breaking save operations.
-    Uses transaction.on_commit() to ensure DB transaction completes first.
-
-    Args:
-        instance: Django model instance to upsert.
-        background: If True, run the upsert on a worker thread after commit
-            instead of inline, so the caller (e.g. the Issue save request)
-            doesn't wait for Weaviate indexing to finish.
+    The outbox row commits or rolls back together with the caller's
+    transaction, so the worker only ever sees committed data.
     """
     if not is_available():
         return
 
-    # Skip meeting transcript attachments - they are too large and cause timeouts
-    from core.models import Attachment
-    if isinstance(instance, Attachment) and is_meeting_transcript_attachment(instance):
-        logger.info(
-            f"Skipping Weaviate sync for meeting transcript attachment {instance.id} "
-            f"(file: {instance.original_name})"
-        )
-        return
-
-    def sync_to_weaviate():
-        try:
-            upsert_instance(instance)
-        except Exception as e:
-            # Log error but don't break the save operation
-            logger.error(
-                f"Failed to sync {instance.__class__.__name__} (pk={instance.pk}) to Weaviate: {e}",
-                exc_info=True
-            )
-
-    def dispatch():
-        if background:
-            _background_executor.submit(sync_to_weaviate)
-        else:
-            sync_to_weaviate()
-
-    # Only sync after DB transaction commits successfully, so the background
-    # job never races the transaction and only ever sees committed data.
     try:
-        transaction.on_commit(dispatch)
+        enqueue(instance, WeaviateSyncAction.UPSERT)
     except Exception as e:
-        # If not in a transaction or other error, log and continue
-        logger.warning(
-            f"Could not schedule Weaviate sync for {instance.__class__.__name__} (pk={instance.pk}): {e}"
+        # Log error but don't break the save operation
+        logger.error(
+            f"Failed to queue Weaviate sync for {instance.__class__.__name__} (pk={instance.pk}): {e}",
+            exc_info=True
         )
 
 
 def _safe_delete(sender, instance):
     """
-    Safely delete an instance from Weaviate.
-    
+    Safely queue a delete of an instance from Weaviate.
+
     Catches all exceptions to prevent signal from breaking delete operations.
     """
     if not is_available():
         return
-    
-    # Get the type for this model
-    obj_type = _get_model_type(instance)
-    if obj_type is None:
-        return
-    
+
     try:
-        delete_object(obj_type, str(instance.pk))
+        enqueue(instance, WeaviateSyncAction.DELETE)
     except Exception as e:
         # Log error but don't break the delete operation
         logger.error(
-            f"Failed to delete {sender.__name__} (pk={instance.pk}) from Weaviate: {e}",
+            f"Failed to queue Weaviate delete for {sender.__name__} (pk={instance.pk}): {e}",
             exc_info=True
         )
 
@@ -106,8 +65,8 @@ def _safe_delete(sender, instance):
 # Register signal handlers for supported models
 @receiver(post_save, sender='core.Item')
 def sync_item_to_weaviate(sender, instance, created, **kwargs):
-    """Sync Item (Issue) to Weaviate on save, in the background so saving isn't slowed down."""
-    _safe_upsert(instance, background=True)
+    """Sync Item (Issue) to Weaviate on save."""
+    _safe_upsert(instance)
 
 
 @receiver(post_delete, sender='core.Item')
@@ -198,3 +157,14 @@ def sync_github_issue_to_weaviate(sender, instance, created, **kwargs):
 def delete_github_issue_from_weaviate(sender, instance, **kwargs):
     """Delete ExternalIssueMapping from Weaviate on delete."""
     _safe_delete(sender, instance)
+
+
+@receiver(post_save, sender='core.WeaviateConfiguration')
+@receiver(post_delete, sender='core.WeaviateConfiguration')
+def rebuild_client_pool_on_config_change(sender, instance, **kwargs):
+    """Drop pooled connections and cached config when the Weaviate configuration changes."""
+    from core.services.config import invalidate_singleton
+    invalidate_singleton(sender)
+    reset_client_pool()
+    # A different instance may not have the AgiraObject collection yet
+    weaviate_service._schema_ensured = False
@@ -0,0 +1,172 @@
+"""
+Tests for chunked indexing of long attachments
+"""
+
+from unittest.mock import MagicMock, patch
+
+from django.test import TestCase, override_settings
+
+from core.models import Attachment, Project, WeaviateSyncEvent
+from core.services.weaviate.chunking import (
+    CHUNK_TYPE, result_type, serialize_chunks, split_into_chunks, with_chunk_types,
+)
+from core.services.weaviate.serializers import to_agira_objects
+
+
+def _section(heading, paragraphs, words=40):
+    body = '\n\n'.join(f"{p} " + ' '.join(['text'] * words) for p in paragraphs)
+    return f"# {heading}\n\n{body}"
+
+
+class SplitIntoChunksTestCase(TestCase):
+    """Test the section-aware chunker."""
+
+    def test_short_text_is_one_chunk(self):
+        chunks = split_into_chunks('# Title\n\nShort text.', chunk_size=1000, overlap=100)
+
+        self.assertEqual(len(chunks), 1)
+        self.assertEqual(chunks[0].heading, 'Title')
+        self.assertEqual(chunks[0].text, '# Title\n\nShort text.')
+
+    def test_chunks_start_at_headings(self):
+        text = '\n\n'.join(_section(f"Part {n}", [f"P{n}a", f"P{n}b"]) for n in range(3))
+
+        chunks = split_into_chunks(text, chunk_size=500, overlap=50)
+
+        self.assertEqual([c.heading for c in chunks], ['Part 0', 'Part 1', 'Part 2'])
+        for chunk in chunks:
+            self.assertTrue(chunk.text.startswith(f"# {chunk.heading}"))
+
+    def test_long_section_is_cut_with_overlap(self):
+        text = _section('Protokoll', [f"Absatz{n}" for n in range(10)])
+
+        chunks = split_into_chunks(text, chunk_size=600, overlap=100)
+
+        self.assertGreater(len(chunks), 1)
+        for chunk in chunks:
+            self.assertLessEqual(len(chunk.text), 600)
+            self.assertEqual(chunk.heading, 'Protokoll')
+        for previous, chunk in zip(chunks, chunks[1:]):
+            # The start of each chunk repeats the end of the previous one
+            self.assertIn(chunk.text[:40], previous.text)
+        for n in range(10):
+            self.assertTrue(any(f"Absatz{n}" in c.text for c in chunks))
+
+    def test_text_without_whitespace_is_hard_cut(self):
+        chunks = split_into_chunks('x' * 2500, chunk_size=1000, overlap=0)
+
+        self.assertEqual([len(c.text) for c in chunks], [1000, 1000, 500])
+
+
+@override_settings(WEAVIATE_CHUNK_SIZE_CHARS=500, WEAVIATE_CHUNK_OVERLAP_CHARS=50, WEAVIATE_MAX_CHUNKS=500)
+class SerializeChunksTestCase(TestCase):
+    """Test splitting of serialized attachments into parent and chunk objects."""
+
+    def _obj(self, text):
+        return {
+            'type': 'attachment', 'object_id': '7', 'title': 'spec.md', 'text': text,
+            'project_id': '3', 'parent_object_id': '42', 'url': '/files/7/', 'mime_type': 'text/markdown',
+        }
+
+    def test_short_attachment_is_unchanged(self):
+        obj = self._obj('Short')
+
+        parent, chunks = serialize_chunks(obj)
+
+        self.assertIs(parent, obj)
+        self.assertEqual(chunks, [])
+
+    def test_long_attachment_is_split(self):
+        text = '\n\n'.join(_section(f"Part {n}", [f"P{n}"], words=80) for n in range(4))
+
+        parent, chunks = serialize_chunks(self._obj(text))
+
+        self.assertEqual(parent['object_id'], '7')
+        self.assertEqual(parent['parent_object_id'], '42')
+        self.assertTrue(parent['text'].startswith('# Part 0'))
+        self.assertEqual([c['object_id'] for c in chunks], ['7:1', '7:2', '7:3'])
+        for chunk in chunks:
+            self.assertEqual(chunk['type'], CHUNK_TYPE)
+            self.assertEqual(chunk['parent_object_id'], '7')
+            self.assertEqual(chunk['project_id'], '3')
+            self.assertEqual(chunk['url'], '/files/7/')
+        self.assertEqual(chunks[0]['title'], 'spec.md › Part 1')
+
+    @override_settings(WEAVIATE_MAX_CHUNKS=2)
+    def test_number_of_chunks_is_capped(self):
+        text = '\n\n'.join(_section(f"Part {n}", [f"P{n}"], words=80) for n in range(4))
+
+        _parent, chunks = serialize_chunks(self._obj(text))
+
+        self.assertEqual(len(chunks), 1)
+
+    def test_type_helpers(self):
+        self.assertEqual(with_chunk_types(['item', 'attachment']), ['item', 'attachment', CHUNK_TYPE])
+        self.assertEqual(with_chunk_types(['item']), ['item'])
+        self.assertEqual(result_type(CHUNK_TYPE), 'attachment')
+        self.assertEqual(result_type('item'), 'item')
+
+
+@override_settings(WEAVIATE_CHUNK_SIZE_CHARS=500, WEAVIATE_CHUNK_OVERLAP_CHARS=50)
+class ChunkedIndexingTestCase(TestCase):
+    """Test that attachment chunks reach Weaviate through the outbox."""
+
+    def setUp(self):
+        self.project = Project.objects.create(name='Chunk Project')
+        self.attachment = Attachment.objects.create(
+            original_name='transcript.md', content_type='text/markdown', size_bytes=4096,
+            storage_path='test/transcript.md',
+        )
+        self.text = '\n\n'.join(_section(f"Topic {n}", [f"T{n}"], words=80) for n in range(3))
+        WeaviateSyncEvent.objects.all().delete()
+
+    def test_to_agira_objects_returns_attachment_and_chunks(self):
+        with patch('core.services.weaviate.serializers.get_attachment_text', return_value=self.text):
+            objects = to_agira_objects(self.attachment)
+
+        self.assertEqual(objects[0]['type'], 'attachment')
+        self.assertEqual([o['type'] for o in objects[1:]], [CHUNK_TYPE, CHUNK_TYPE])
+
+    def test_drain_passes_chunks_to_write(self):
+        from core.services.weaviate.outbox import drain_once
+
+        WeaviateSyncEvent.objects.create(object_type='attachment', object_id=str(self.attachment.pk), action='upsert')
+
+        with patch('core.services.weaviate.serializers.get_attachment_text', return_value=self.text), \
+             patch('core.services.weaviate.outbox._write', return_value={}) as mock_write:
+            result = drain_once()
+
+        self.assertEqual(result.upserted, 1)
+        upserts, _deletes, _batch_size = mock_write.call_args[0]
+        key = ('attachment', str(self.attachment.pk))
+        self.assertEqual(upserts[key]['type'], 'attachment')
+        self.assertEqual(len(mock_write.call_args[1]['chunks'][key]), 2)
+
+    def test_write_replaces_chunks(self):
+        from core.services.weaviate.outbox import _write
+
+        mock_client = MagicMock()
+        mock_collection = mock_client.collections.get.return_value
+        mock_collection.batch.failed_objects = []
+        batch = mock_collection.batch.fixed_size.return_value.__enter__.return_value
+        key = ('attachment', '7')
+        chunks = [
+            {'type': CHUNK_TYPE, 'object_id': '7:1', 'parent_object_id': '7', 'text': 'b'},
+            {'type': CHUNK_TYPE, 'object_id': '7:2', 'parent_object_id': '7', 'text': 'c'},
+        ]
+
+        with patch('core.services.weaviate.client.pooled_client') as mock_pooled, \
+             patch('core.services.weaviate.service._ensure_schema_once'):
+            mock_pooled.return_value.__enter__.return_value = mock_client
+            failures = _write(
+                {key: {'type': 'attachment', 'object_id': '7', 'text': 'a'}},
+                [('attachment', '8')],
+                batch_size=50,
+                chunks={key: chunks},
+            )
+
+        self.assertEqual(failures, {})
+        self.assertEqual(batch.add_object.call_count, 3)
+        # Old chunks of the rewritten and the deleted attachment are dropped,
+        # then the attachment itself is deleted
+        self.assertEqual(mock_collection.data.delete_many.call_count, 2)
@@ -7,6 +7,7 @@ from datetime import datetime
 from unittest.mock import Mock, patch, MagicMock
 
 from django.test import TestCase
+from django.utils import timezone
 
 from core.models import WeaviateConfiguration
 from core.services.exceptions import ServiceDisabled, ServiceNotConfigured
@@ -281,6 +282,175 @@ class ClientTestCase(TestCase):
         config.full_clean()
 
 
+class ClientPoolTestCase(TestCase):
+    """Test the process-wide Weaviate client pool."""
+    
+    def setUp(self):
+        """Create an enabled configuration and a fresh pool."""
+        from core.services.config import invalidate_singleton
+        invalidate_singleton(WeaviateConfiguration)
+        WeaviateConfiguration.objects.create(
+            url="http://localhost:8080",
+            api_key="",
+            enabled=True
+        )
+        self.pool = client.WeaviateClientPool(max_size=2, health_check_interval=60)
+    
+    def tearDown(self):
+        """Clean up test data."""
+        from core.services.config import invalidate_singleton
+        WeaviateConfiguration.objects.all().delete()
+        invalidate_singleton(WeaviateConfiguration)
+    
+    @patch('core.services.weaviate.client.weaviate.connect_to_custom')
+    def test_connection_is_reused_between_checkouts(self, mock_connect):
+        """Test that sequential checkouts share one connection."""
+        mock_connect.return_value = Mock()
+        
+        with self.pool.connection() as first:
+            pass
+        with self.pool.connection() as second:
+            pass
+        
+        self.assertIs(first, second)
+        mock_connect.assert_called_once()
+        first.close.assert_not_called()
+        stats = self.pool.snapshot()
+        self.assertEqual(stats['connects'], 1)
+        self.assertEqual(stats['checkouts'], 2)
+        self.assertEqual(stats['reuses'], 1)
+        self.assertEqual(stats['idle'], 1)
+        self.assertIsNotNone(stats['avg_connect_ms'])
+    
+    @patch('core.services.weaviate.client.weaviate.connect_to_custom')
+    def test_concurrent_checkouts_get_separate_connections(self, mock_connect):
+        """Test that nested checkouts open a second connection."""
+        mock_connect.side_effect = [Mock(), Mock()]
+        
+        with self.pool.connection() as first:
+            with self.pool.connection() as second:
+                self.assertIsNot(first, second)
+        
+        self.assertEqual(mock_connect.call_count, 2)
+        self.assertEqual(self.pool.snapshot()['idle'], 2)
+    
+    @patch('core.services.weaviate.client.weaviate.connect_to_custom')
+    def test_acquire_times_out_when_pool_exhausted(self, mock_connect):
+        """Test that checkout fails after acquire_timeout when all connections are busy."""
+        mock_connect.side_effect = [Mock(), Mock()]
+        self.pool.acquire_timeout = 0.01
+        
+        with self.pool.connection():
+            with self.pool.connection():
+                with self.assertRaises(TimeoutError):
+                    with self.pool.connection():
+                        pass
+    
+    @patch('core.services.weaviate.client.weaviate.connect_to_custom')
+    def test_connection_error_discards_client(self, mock_connect):
+        """Test that a connection-level error closes the client instead of pooling it."""
+        from weaviate.exceptions import WeaviateConnectionError
+        broken_client = Mock()
+        mock_connect.side_effect = [broken_client, Mock()]
+        
+        with self.assertRaises(WeaviateConnectionError):
+            with self.pool.connection():
+                raise WeaviateConnectionError("connection refused")
+        
+        broken_client.close.assert_called_once()
+        with self.pool.connection() as replacement:
+            self.assertIsNot(replacement, broken_client)
+        self.assertEqual(self.pool.snapshot()['discarded'], 1)
+    
+    @patch('core.services.weaviate.client.weaviate.connect_to_custom')
+    def test_application_error_keeps_client(self, mock_connect):
+        """Test that a non-connection error returns the client to the pool."""
+        mock_connect.return_value = Mock()
+        
+        with self.assertRaises(ValueError):
+            with self.pool.connection():
+                raise ValueError("bad query")
+        
+        mock_connect.return_value.close.assert_not_called()
+        self.assertEqual(self.pool.snapshot()['idle'], 1)
+    
+    @patch('core.services.weaviate.client.weaviate.connect_to_custom')
+    def test_disconnected_client_is_not_pooled(self, mock_connect):
+        """Test that a client reporting is_connected() False is replaced."""
+        dead_client = Mock()
+        dead_client.is_connected.return_value = False
+        mock_connect.side_effect = [dead_client, Mock()]
+        
+        with self.pool.connection():
+            pass
+        
+        dead_client.close.assert_called_once()
+        self.assertEqual(self.pool.snapshot()['idle'], 0)
+    
+    @patch('core.services.weaviate.client.weaviate.connect_to_custom')
+    def test_failed_health_check_reconnects(self, mock_connect):
+        """Test that an idle client failing is_ready() is replaced."""
+        stale_client = Mock()
+        stale_client.is_ready.return_value = False
+        fresh_client = Mock()
+        mock_connect.side_effect = [stale_client, fresh_client]
+        self.pool.health_check_interval = 0
+        
+        with self.pool.connection():
+            pass
+        with self.pool.connection() as conn:
+            self.assertIs(conn, fresh_client)
+        
+        stale_client.close.assert_called_once()
+        self.assertEqual(self.pool.snapshot()['health_check_failures'], 1)
+    
+    @patch('core.services.weaviate.client.weaviate.connect_to_custom')
+    def test_config_change_rebuilds_pool(self, mock_connect):
+        """Test that saving WeaviateConfiguration leads to a new connection."""
+        from core.services.config import invalidate_singleton
+        old_client = Mock()
+        mock_connect.side_effect = [old_client, Mock()]
+        
+        with self.pool.connection():
+            pass
+        
+        config = WeaviateConfiguration.objects.get()
+        config.url = "http://weaviate.internal:8080"
+        config.save()
+        invalidate_singleton(WeaviateConfiguration)
+        
+        with self.pool.connection() as conn:
+            self.assertIsNot(conn, old_client)
+        
+        old_client.close.assert_called_once()
+        self.assertEqual(mock_connect.call_args[1]['http_host'], 'weaviate.internal')
+        self.assertEqual(self.pool.snapshot()['rebuilds'], 1)
+    
+    def test_checkout_raises_when_disabled(self):
+        """Test that the pool enforces the same configuration checks as get_client."""
+        WeaviateConfiguration.objects.update(enabled=False)
+        from core.services.config import invalidate_singleton
+        invalidate_singleton(WeaviateConfiguration)
+        
+        with self.assertRaises(ServiceDisabled):
+            with self.pool.connection():
+                pass
+        self.assertEqual(self.pool.snapshot()['in_use'], 0)
+    
+    @patch('core.services.weaviate.client.weaviate.connect_to_custom')
+    def test_connect_failure_releases_slot(self, mock_connect):
+        """Test that a failed connect does not leak a pool slot."""
+        mock_connect.side_effect = ConnectionError("unreachable")
+        
+        with self.assertRaises(ConnectionError):
+            with self.pool.connection():
+                pass
+        
+        stats = self.pool.snapshot()
+        self.assertEqual(stats['in_use'], 0)
+        self.assertEqual(stats['connect_failures'], 1)
+
+
 class SchemaTestCase(TestCase):
     """Test Weaviate schema management."""
     
@@ -356,15 +526,15 @@ class ServiceTestCase(TestCase):
         invalidate_singleton(WeaviateConfiguration)
         service._schema_ensured = False
     
-    @patch('core.services.weaviate.service.get_client')
+    @patch('core.services.weaviate.service.pooled_client')
     @patch('core.services.weaviate.service.ensure_schema')
-    def test_upsert_document_creates_document(self, mock_ensure_schema, mock_get_client):
+    def test_upsert_document_creates_document(self, mock_ensure_schema, mock_pooled_client):
         """Test that upsert_document creates a document."""
         # Setup mocks
         mock_client = MagicMock()
         mock_collection = MagicMock()
         mock_client.collections.get.return_value = mock_collection
-        mock_get_client.return_value = mock_client
+        mock_pooled_client.return_value.__enter__.return_value = mock_client
         
         # Call upsert
         result = service.upsert_document(
@@ -412,19 +582,20 @@ class ServiceTestCase(TestCase):
         # Verify result is UUID string
         self.assertEqual(result, str(expected_uuid))
         
-        # Verify client was closed
-        mock_client.close.assert_called_once()
+        # Verify client was returned to the pool, not closed
+        mock_pooled_client.return_value.__exit__.assert_called_once()
+        mock_client.close.assert_not_called()
     
-    @patch('core.services.weaviate.service.get_client')
+    @patch('core.services.weaviate.service.pooled_client')
     @patch('core.services.weaviate.service.ensure_schema')
-    def test_upsert_document_converts_int_ids_to_strings(self, mock_ensure_schema, mock_get_client):
+    def test_upsert_document_converts_int_ids_to_strings(self, mock_ensure_schema, mock_pooled_client):
         """Test that upsert_document converts integer IDs to strings."""
         mock_client = MagicMock()
         mock_collection = MagicMock()
         # Make replace fail so it falls back to insert
         mock_collection.data.replace.side_effect = Exception("Not found")
         mock_client.collections.get.return_value = mock_collection
-        mock_get_client.return_value = mock_client
+        mock_pooled_client.return_value.__enter__.return_value = mock_client
         
         service.upsert_document(
             source_type="item",
@@ -442,14 +613,14 @@ class ServiceTestCase(TestCase):
         self.assertEqual(props['source_id'], "123")
         self.assertEqual(props['project_id'], "456")
     
-    @patch('core.services.weaviate.service.get_client')
+    @patch('core.services.weaviate.service.pooled_client')
     @patch('core.services.weaviate.service.ensure_schema')
-    def test_upsert_document_ensures_schema_only_once(self, mock_ensure_schema, mock_get_client):
+    def test_upsert_document_ensures_schema_only_once(self, mock_ensure_schema, mock_pooled_client):
         """Test that ensure_schema is only called once per process."""
         mock_client = MagicMock()
         mock_collection = MagicMock()
         mock_client.collections.get.return_value = mock_collection
-        mock_get_client.return_value = mock_client
+        mock_pooled_client.return_value.__enter__.return_value = mock_client
         
         # First call
         service.upsert_document(
@@ -472,13 +643,13 @@ class ServiceTestCase(TestCase):
         # Schema should only be ensured once
         self.assertEqual(mock_ensure_schema.call_count, 1)
     
-    @patch('core.services.weaviate.service.get_client')
-    def test_delete_document_deletes_by_uuid(self, mock_get_client):
+    @patch('core.services.weaviate.service.pooled_client')
+    def test_delete_document_deletes_by_uuid(self, mock_pooled_client):
         """Test that delete_document deletes using deterministic UUID."""
         mock_client = MagicMock()
         mock_collection = MagicMock()
         mock_client.collections.get.return_value = mock_collection
-        mock_get_client.return_value = mock_client
+        mock_pooled_client.return_value.__enter__.return_value = mock_client
         
         result = service.delete_document("item", "123")
         
@@ -492,25 +663,26 @@ class ServiceTestCase(TestCase):
         # Verify result
         self.assertTrue(result)
         
-        # Verify client was closed
-        mock_client.close.assert_called_once()
+        # Verify client was returned to the pool, not closed
+        mock_pooled_client.return_value.__exit__.assert_called_once()
+        mock_client.close.assert_not_called()
     
-    @patch('core.services.weaviate.service.get_client')
-    def test_delete_document_returns_false_on_error(self, mock_get_client):
+    @patch('core.services.weaviate.service.pooled_client')
+    def test_delete_document_returns_false_on_error(self, mock_pooled_client):
         """Test that delete_document returns False when deletion fails."""
         mock_client = MagicMock()
         mock_collection = MagicMock()
         mock_collection.data.delete_by_id.side_effect = Exception("Not found")
         mock_client.collections.get.return_value = mock_collection
-        mock_get_client.return_value = mock_client
+        mock_pooled_client.return_value.__enter__.return_value = mock_client
         
         result = service.delete_document("item", "123")
         
         self.assertFalse(result)
     
-    @patch('core.services.weaviate.service.get_client')
+    @patch('core.services.weaviate.service.pooled_client')
     @patch('core.services.weaviate.service.ensure_schema')
-    def test_query_filters_by_project_id(self, mock_ensure_schema, mock_get_client):
+    def test_query_filters_by_project_id(self, mock_ensure_schema, mock_pooled_client):
         """Test that query filters by project_id."""
         mock_client = MagicMock()
         mock_collection = MagicMock()
@@ -518,7 +690,7 @@ class ServiceTestCase(TestCase):
         mock_response.objects = []
         mock_collection.query.near_text.return_value = mock_response
         mock_client.collections.get.return_value = mock_collection
-        mock_get_client.return_value = mock_client
+        mock_pooled_client.return_value.__enter__.return_value = mock_client
         
         service.query(
             project_id="proj-1",
@@ -538,9 +710,9 @@ class ServiceTestCase(TestCase):
         # but we can verify where parameter exists
         self.assertIn('where', call_kwargs)
     
-    @patch('core.services.weaviate.service.get_client')
+    @patch('core.services.weaviate.service.pooled_client')
     @patch('core.services.weaviate.service.ensure_schema')
-    def test_query_returns_formatted_results(self, mock_ensure_schema, mock_get_client):
+    def test_query_returns_formatted_results(self, mock_ensure_schema, mock_pooled_client):
         """Test that query returns properly formatted results."""
         # Setup mock response
         mock_obj = MagicMock()
@@ -560,7 +732,7 @@ class ServiceTestCase(TestCase):
         mock_collection = MagicMock()
         mock_collection.query.near_text.return_value = mock_response
         mock_client.collections.get.return_value = mock_collection
-        mock_get_client.return_value = mock_client
+        mock_pooled_client.return_value.__enter__.return_value = mock_client
         
         results = service.query(
             project_id="proj-1",
@@ -579,9 +751,9 @@ class ServiceTestCase(TestCase):
         self.assertEqual(result['url'], "/items/123")
         self.assertEqual(result['score'], 0.123)
     
-    @patch('core.services.weaviate.service.get_client')
+    @patch('core.services.weaviate.service.pooled_client')
     @patch('core.services.weaviate.service.ensure_schema')
-    def test_query_truncates_long_text(self, mock_ensure_schema, mock_get_client):
+    def test_query_truncates_long_text(self, mock_ensure_schema, mock_pooled_client):
         """Test that query truncates text preview to 200 characters."""
         # Create long text (300 characters)
         long_text = "a" * 300
@@ -602,7 +774,7 @@ class ServiceTestCase(TestCase):
         mock_collection = MagicMock()
         mock_collection.query.near_text.return_value = mock_response
         mock_client.collections.get.return_value = mock_collection
-        mock_get_client.return_value = mock_client
+        mock_pooled_client.return_value.__enter__.return_value = mock_client
         
         results = service.query(
             project_id="proj-1",
@@ -613,16 +785,16 @@ class ServiceTestCase(TestCase):
         self.assertEqual(len(results[0]['text_preview']), 203)  # 200 + "..."
         self.assertTrue(results[0]['text_preview'].endswith("..."))
     
-    @patch('core.services.weaviate.service.get_client')
+    @patch('core.services.weaviate.service.pooled_client')
     @patch('core.services.weaviate.service._ensure_schema_once')
-    def test_upsert_agira_object_replace_succeeds(self, mock_ensure_schema, mock_get_client):
+    def test_upsert_agira_object_replace_succeeds(self, mock_ensure_schema, mock_pooled_client):
         """Test that _upsert_agira_object uses replace when object exists."""
         mock_client = MagicMock()
         mock_collection = MagicMock()
         # Make replace succeed
         mock_collection.data.replace.return_value = None
         mock_client.collections.get.return_value = mock_collection
-        mock_get_client.return_value = mock_client
+        mock_pooled_client.return_value.__enter__.return_value = mock_client
         
         obj_dict = {
             'type': 'item',
@@ -642,9 +814,9 @@ class ServiceTestCase(TestCase):
         expected_uuid = service._get_deterministic_uuid('item', '123')
         self.assertEqual(result, str(expected_uuid))
     
-    @patch('core.services.weaviate.service.get_client')
+    @patch('core.services.weaviate.service.pooled_client')
     @patch('core.services.weaviate.service._ensure_schema_once')
-    def test_upsert_agira_object_falls_back_to_insert_on_404(self, mock_ensure_schema, mock_get_client):
+    def test_upsert_agira_object_falls_back_to_insert_on_404(self, mock_ensure_schema, mock_pooled_client):
         """Test that _upsert_agira_object falls back to insert on 404 error.
         
         Note: Uses generic Exception with "404" in message because the Weaviate
@@ -656,7 +828,7 @@ class ServiceTestCase(TestCase):
         mock_collection.data.replace.side_effect = Exception("404 not found")
         mock_collection.data.insert.return_value = None
         mock_client.collections.get.return_value = mock_collection
-        mock_get_client.return_value = mock_client
+        mock_pooled_client.return_value.__enter__.return_value = mock_client
         
         obj_dict = {
             'type': 'item',
@@ -676,9 +848,9 @@ class ServiceTestCase(TestCase):
         expected_uuid = service._get_deterministic_uuid('item', '123')
         self.assertEqual(result, str(expected_uuid))
     
-    @patch('core.services.weaviate.service.get_client')
+    @patch('core.services.weaviate.service.pooled_client')
     @patch('core.services.weaviate.service._ensure_schema_once')
-    def test_upsert_agira_object_raises_on_500_error(self, mock_ensure_schema, mock_get_client):
+    def test_upsert_agira_object_raises_on_500_error(self, mock_ensure_schema, mock_pooled_client):
         """Test that _upsert_agira_object raises exception on 500 error instead of blind fallback.
         
         Note: Uses generic Exception with "500" in message because the Weaviate
@@ -689,7 +861,7 @@ class ServiceTestCase(TestCase):
         # Simulate Weaviate 500 error (server error)
         mock_collection.data.replace.side_effect = Exception("500 Internal Server Error")
         mock_client.collections.get.return_value = mock_collection
-        mock_get_client.return_value = mock_client
+        mock_pooled_client.return_value.__enter__.return_value = mock_client
         
         obj_dict = {
             'type': 'item',
@@ -709,9 +881,9 @@ class ServiceTestCase(TestCase):
         # Verify insert was NOT called (no blind fallback on 5xx)
         mock_collection.data.insert.assert_not_called()
     
-    @patch('core.services.weaviate.service.get_client')
+    @patch('core.services.weaviate.service.pooled_client')
     @patch('core.services.weaviate.service._ensure_schema_once')
-    def test_upsert_agira_object_falls_back_to_insert_on_500_with_no_object_message(self, mock_ensure_schema, mock_get_client):
+    def test_upsert_agira_object_falls_back_to_insert_on_500_with_no_object_message(self, mock_ensure_schema, mock_pooled_client):
         """Test that _upsert_agira_object falls back to insert on 500 error with 'no object with id' message.
         
         This test addresses the issue where Weaviate returns 500 Internal Server Error
@@ -728,7 +900,7 @@ class ServiceTestCase(TestCase):
         mock_collection.data.replace.side_effect = Exception(f"500 Internal Server Error: no object with id '{test_uuid}'")
         mock_collection.data.insert.return_value = None
         mock_client.collections.get.return_value = mock_collection
-        mock_get_client.return_value = mock_client
+        mock_pooled_client.return_value.__enter__.return_value = mock_client
         
         obj_dict = {
             'type': 'item',
@@ -748,9 +920,9 @@ class ServiceTestCase(TestCase):
         expected_uuid = service._get_deterministic_uuid('item', '277')
         self.assertEqual(result, str(expected_uuid))
     
-    @patch('core.services.weaviate.service.get_client')
+    @patch('core.services.weaviate.service.pooled_client')
     @patch('core.services.weaviate.service._ensure_schema_once')
-    def test_upsert_agira_object_creates_timezone_aware_datetimes(self, mock_ensure_schema, mock_get_client):
+    def test_upsert_agira_object_creates_timezone_aware_datetimes(self, mock_ensure_schema, mock_pooled_client):
         """Test that _upsert_agira_object creates timezone-aware datetime objects."""
         from datetime import timezone as dt_timezone
         
@@ -758,7 +930,7 @@ class ServiceTestCase(TestCase):
         mock_collection = MagicMock()
         mock_collection.data.replace.return_value = None
         mock_client.collections.get.return_value = mock_collection
-        mock_get_client.return_value = mock_client
+        mock_pooled_client.return_value.__enter__.return_value = mock_client
         
         obj_dict = {
             'type': 'item',
@@ -780,9 +952,9 @@ class ServiceTestCase(TestCase):
         self.assertEqual(properties['created_at'].tzinfo, dt_timezone.utc)
         self.assertEqual(properties['updated_at'].tzinfo, dt_timezone.utc)
     
-    @patch('core.services.weaviate.service.get_client')
+    @patch('core.services.weaviate.service.pooled_client')
     @patch('core.services.weaviate.service._ensure_schema_once')
-    def test_upsert_agira_object_makes_naive_datetimes_aware(self, mock_ensure_schema, mock_get_client):
+    def test_upsert_agira_object_makes_naive_datetimes_aware(self, mock_ensure_schema, mock_pooled_client):
         """Test that _upsert_agira_object converts naive datetimes to timezone-aware."""
         from datetime import datetime as dt, timezone as dt_timezone
         
@@ -790,7 +962,7 @@ class ServiceTestCase(TestCase):
         mock_collection = MagicMock()
         mock_collection.data.replace.return_value = None
         mock_client.collections.get.return_value = mock_collection
-        mock_get_client.return_value = mock_client
+        mock_pooled_client.return_value.__enter__.return_value = mock_client
         
         # Create naive datetime (no timezone)
         naive_datetime = dt(2024, 1, 1, 12, 0, 0)
@@ -817,6 +989,129 @@ class ServiceTestCase(TestCase):
         self.assertEqual(properties['updated_at'].tzinfo, dt_timezone.utc)
 
 
+class BulkIndexerTestCase(TestCase):
+    """Test batch-API based bulk indexing."""
+    
+    def setUp(self):
+        """Create a project with items and comments."""
+        from core.models import Item, ItemComment, Project, ItemType
+        
+        self.project = Project.objects.create(name="Bulk Project")
+        self.other_project = Project.objects.create(name="Other Project")
+        item_type = ItemType.objects.create(key="bug", name="Bug")
+        self.items = [
+            Item.objects.create(title=f"Item {i}", project=self.project, type=item_type)
+            for i in range(5)
+        ]
+        Item.objects.create(title="Foreign", project=self.other_project, type=item_type)
+        ItemComment.objects.create(item=self.items[0], body="First comment")
+    
+    def _mock_client(self):
+        mock_client = MagicMock()
+        mock_collection = mock_client.collections.get.return_value
+        mock_batch = mock_collection.batch.fixed_size.return_value.__enter__.return_value
+        mock_collection.batch.failed_objects = []
+        return mock_client, mock_collection, mock_batch
+    
+    @patch('core.services.weaviate.service._ensure_schema_once')
+    @patch('core.services.weaviate.bulk.pooled_client')
+    def test_index_adds_objects_to_batch(self, mock_pooled_client, mock_ensure_schema):
+        """Test that each object is added to the batch with its deterministic UUID."""
+        from core.services.weaviate.bulk import BulkIndexer, build_queryset
+        mock_client, mock_collection, mock_batch = self._mock_client()
+        mock_pooled_client.return_value.__enter__.return_value = mock_client
+        
+        stats = BulkIndexer(batch_size=50, concurrent_requests=3).index(
+            'item', build_queryset('item', project_id=self.project.id)
+        )
+        
+        self.assertEqual(stats.indexed, 5)
+        self.assertEqual(stats.failed, 0)
+        self.assertEqual(stats.last_pk, self.items[-1].pk)
+        mock_collection.batch.fixed_size.assert_called_once_with(batch_size=50, concurrent_requests=3)
+        self.assertEqual(mock_batch.add_object.call_count, 5)
+        first_call = mock_batch.add_object.call_args_list[0][1]
+        self.assertEqual(first_call['uuid'], service._get_deterministic_uuid('item', str(self.items[0].pk)))
+        self.assertEqual(first_call['properties']['title'], "Item 0")
+        self.assertIsNotNone(first_call['properties']['created_at'].tzinfo)
+    
+    @patch('core.services.weaviate.service._ensure_schema_once')
+    @patch('core.services.weaviate.bulk.pooled_client')
+    def test_index_resumes_after_pk_and_checkpoints(self, mock_pooled_client, mock_ensure_schema):
+        """Test start_after_pk skipping and per-batch checkpoint callbacks."""
+        from core.services.weaviate.bulk import BulkIndexer, build_queryset
+        mock_client, mock_collection, mock_batch = self._mock_client()
+        mock_pooled_client.return_value.__enter__.return_value = mock_client
+        checkpoints = []
+        
+        indexer = BulkIndexer(batch_size=2, on_checkpoint=lambda t, pk: checkpoints.append((t, pk)))
+        stats = indexer.index(
+            'item',
+            build_queryset('item', project_id=self.project.id),
+            start_after_pk=self.items[0].pk,
+        )
+        
+        self.assertEqual(stats.indexed, 4)
+        self.assertEqual(mock_batch.flush.call_count, 2)
+        self.assertEqual(checkpoints[0], ('item', self.items[2].pk))
+        self.assertEqual(checkpoints[-1], ('item', self.items[-1].pk))
+    
+    @patch('core.services.weaviate.service._ensure_schema_once')
+    @patch('core.services.weaviate.bulk.pooled_client')
+    def test_failed_batch_objects_are_counted(self, mock_pooled_client, mock_ensure_schema):
+        """Test that objects rejected by Weaviate are reported as failed."""
+        from core.services.weaviate.bulk import BulkIndexer, build_queryset
+        mock_client, mock_collection, mock_batch = self._mock_client()
+        mock_collection.batch.failed_objects = [Mock(message="invalid property")]
+        mock_pooled_client.return_value.__enter__.return_value = mock_client
+        
+        stats = BulkIndexer().index('item', build_queryset('item', project_id=self.project.id))
+        
+        self.assertEqual(stats.indexed, 4)
+        self.assertEqual(stats.failed, 1)
+        self.assertIn("invalid property", stats.errors[0])
+    
+    def test_build_queryset_filters_project_and_since(self):
+        """Test project and since filters of build_queryset."""
+        from django.utils import timezone
+        from core.models import Item
+        from core.services.weaviate.bulk import build_queryset
+        
+        self.assertEqual(build_queryset('item').count(), 6)
+        self.assertEqual(build_queryset('item', project_id=self.project.id).count(), 5)
+        
+        cutoff = timezone.now()
+        Item.objects.filter(pk=self.items[1].pk).update(updated_at=cutoff + timezone.timedelta(minutes=1))
+        Item.objects.exclude(pk=self.items[1].pk).update(updated_at=cutoff - timezone.timedelta(days=1))
+        self.assertEqual(list(build_queryset('item', since=cutoff)), [self.items[1]])
+        
+        with self.assertRaises(ValueError):
+            build_queryset('unknown')
+    
+    def test_comment_serialization_does_not_query_per_row(self):
+        """Test that comment rows come with their item preloaded."""
+        from core.models import ItemComment
+        from core.services.weaviate.bulk import build_queryset
+        from core.services.weaviate.serializers import to_agira_object
+        
+        ItemComment.objects.create(item=self.items[1], body="Second comment")
+        with self.assertNumQueries(1):
+            for comment in build_queryset('comment', project_id=self.project.id):
+                to_agira_object(comment)
+    
+    @patch('core.services.weaviate.service._ensure_schema_once')
+    @patch('core.services.weaviate.bulk.pooled_client')
+    def test_sync_project_uses_bulk_indexer(self, mock_pooled_client, mock_ensure_schema):
+        """Test that sync_project returns per-type counts from the bulk path."""
+        mock_client, mock_collection, mock_batch = self._mock_client()
+        mock_pooled_client.return_value.__enter__.return_value = mock_client
+        
+        stats = service.sync_project(self.project.id)
+        
+        self.assertEqual(stats, {'item': 5, 'comment': 1, 'change': 0, 'node': 0, 'release': 0})
+        self.assertEqual(mock_batch.add_object.call_count, 6)
+
+
 class GetWeaviateTypeTestCase(TestCase):
     """Test get_weaviate_type function."""
     
@@ -873,15 +1168,15 @@ class GetWeaviateTypeTestCase(TestCase):
 class ExistsObjectTestCase(TestCase):
     """Test exists_object and exists_instance functions."""
     
-    @patch('core.services.weaviate.service.get_client')
-    def test_exists_object_returns_true_when_object_exists(self, mock_get_client):
+    @patch('core.services.weaviate.service.pooled_client')
+    def test_exists_object_returns_true_when_object_exists(self, mock_pooled_client):
         """Test that exists_object returns True when object exists."""
         mock_client = MagicMock()
         mock_collection = MagicMock()
         mock_obj = MagicMock()
         mock_collection.query.fetch_object_by_id.return_value = mock_obj
         mock_client.collections.get.return_value = mock_collection
-        mock_get_client.return_value = mock_client
+        mock_pooled_client.return_value.__enter__.return_value = mock_client
         
         result = service.exists_object("item", "123")
         
@@ -890,30 +1185,32 @@ class ExistsObjectTestCase(TestCase):
         mock_collection.query.fetch_object_by_id.assert_called_once_with(expected_uuid)
         
         self.assertTrue(result)
-        mock_client.close.assert_called_once()
+        mock_pooled_client.return_value.__exit__.assert_called_once()
+        mock_client.close.assert_not_called()
     
-    @patch('core.services.weaviate.service.get_client')
-    def test_exists_object_returns_false_when_object_not_found(self, mock_get_client):
+    @patch('core.services.weaviate.service.pooled_client')
+    def test_exists_object_returns_false_when_object_not_found(self, mock_pooled_client):
         """Test that exists_object returns False when object doesn't exist."""
         mock_client = MagicMock()
         mock_collection = MagicMock()
         mock_collection.query.fetch_object_by_id.return_value = None
         mock_client.collections.get.return_value = mock_collection
-        mock_get_client.return_value = mock_client
+        mock_pooled_client.return_value.__enter__.return_value = mock_client
         
         result = service.exists_object("item", "123")
         
         self.assertFalse(result)
-        mock_client.close.assert_called_once()
+        mock_pooled_client.return_value.__exit__.assert_called_once()
+        mock_client.close.assert_not_called()
     
-    @patch('core.services.weaviate.service.get_client')
-    def test_exists_object_returns_false_on_exception(self, mock_get_client):
+    @patch('core.services.weaviate.service.pooled_client')
+    def test_exists_object_returns_false_on_exception(self, mock_pooled_client):
         """Test that exists_object returns False when an exception occurs."""
         mock_client = MagicMock()
         mock_collection = MagicMock()
         mock_collection.query.fetch_object_by_id.side_effect = Exception("Connection error")
         mock_client.collections.get.return_value = mock_collection
-        mock_get_client.return_value = mock_client
+        mock_pooled_client.return_value.__enter__.return_value = mock_client
         
         result = service.exists_object("item", "123")
         
@@ -944,9 +1241,9 @@ class ExistsObjectTestCase(TestCase):
 class FetchObjectTestCase(TestCase):
     """Test fetch_object and fetch_object_by_type functions."""
     
-    @patch('core.services.weaviate.service.get_client')
+    @patch('core.services.weaviate.service.pooled_client')
     @patch('core.services.weaviate.service._ensure_schema_once')
-    def test_fetch_object_by_type_returns_object_data(self, mock_ensure_schema, mock_get_client):
+    def test_fetch_object_by_type_returns_object_data(self, mock_ensure_schema, mock_pooled_client):
         """Test that fetch_object_by_type returns object data when found."""
         mock_client = MagicMock()
         mock_collection = MagicMock()
@@ -963,7 +1260,7 @@ class FetchObjectTestCase(TestCase):
         
         mock_collection.query.fetch_object_by_id.return_value = mock_obj
         mock_client.collections.get.return_value = mock_collection
-        mock_get_client.return_value = mock_client
+        mock_pooled_client.return_value.__enter__.return_value = mock_client
         
         result = service.fetch_object_by_type("item", "123")
         
@@ -975,22 +1272,24 @@ class FetchObjectTestCase(TestCase):
         self.assertEqual(result['text'], "Test text")
         self.assertIn('uuid', result)
         
-        mock_client.close.assert_called_once()
+        mock_pooled_client.return_value.__exit__.assert_called_once()
+        mock_client.close.assert_not_called()
     
-    @patch('core.services.weaviate.service.get_client')
+    @patch('core.services.weaviate.service.pooled_client')
     @patch('core.services.weaviate.service._ensure_schema_once')
-    def test_fetch_object_by_type_returns_none_when_not_found(self, mock_ensure_schema, mock_get_client):
+    def test_fetch_object_by_type_returns_none_when_not_found(self, mock_ensure_schema, mock_pooled_client):
         """Test that fetch_object_by_type returns None when object not found."""
         mock_client = MagicMock()
         mock_collection = MagicMock()
         mock_collection.query.fetch_object_by_id.return_value = None
         mock_client.collections.get.return_value = mock_collection
-        mock_get_client.return_value = mock_client
+        mock_pooled_client.return_value.__enter__.return_value = mock_client
         
         result = service.fetch_object_by_type("item", "123")
         
         self.assertIsNone(result)
-        mock_client.close.assert_called_once()
+        mock_pooled_client.return_value.__exit__.assert_called_once()
+        mock_client.close.assert_not_called()
     
     @patch('core.services.weaviate.service.fetch_object_by_type')
     def test_fetch_object_calls_fetch_object_by_type(self, mock_fetch_by_type):
@@ -1760,9 +2059,9 @@ namespace TestNamespace
 class GlobalSearchTestCase(TestCase):
     """Test global_search function."""
     
-    @patch('core.services.weaviate.service.get_client')
+    @patch('core.services.weaviate.service.pooled_client')
     @patch('core.services.weaviate.service._ensure_schema_once')
-    def test_global_search_returns_list(self, mock_ensure_schema, mock_get_client):
+    def test_global_search_returns_list(self, mock_ensure_schema, mock_pooled_client):
         """Test that global_search returns a list of AgiraSearchHit objects."""
         # Mock Weaviate client and collection
         mock_client = MagicMock()
@@ -1786,7 +2085,7 @@ class GlobalSearchTestCase(TestCase):
         mock_response.objects = [mock_obj]
         mock_collection.query.hybrid.return_value = mock_response
         mock_client.collections.get.return_value = mock_collection
-        mock_get_client.return_value = mock_client
+        mock_pooled_client.return_value.__enter__.return_value = mock_client
         
         # Execute search
         from core.services.weaviate.service import global_search
@@ -1806,9 +2105,9 @@ class GlobalSearchTestCase(TestCase):
         self.assertEqual(hit.object_id, '123')
         self.assertEqual(hit.score, 0.85)
     
-    @patch('core.services.weaviate.service.get_client')
+    @patch('core.services.weaviate.service.pooled_client')
     @patch('core.services.weaviate.service._ensure_schema_once')
-    def test_global_search_with_filters(self, mock_ensure_schema, mock_get_client):
+    def test_global_search_with_filters(self, mock_ensure_schema, mock_pooled_client):
         """Test that global_search applies filters correctly."""
         mock_client = MagicMock()
         mock_collection = MagicMock()
@@ -1817,7 +2116,7 @@ class GlobalSearchTestCase(TestCase):
         
         mock_collection.query.hybrid.return_value = mock_response
         mock_client.collections.get.return_value = mock_collection
-        mock_get_client.return_value = mock_client
+        mock_pooled_client.return_value.__enter__.return_value = mock_client
         
         # Execute search with filters
         from core.services.weaviate.service import global_search
@@ -1832,9 +2131,9 @@ class GlobalSearchTestCase(TestCase):
         self.assertEqual(call_kwargs['query'], 'test')
         self.assertIsNotNone(call_kwargs['filters'])
     
-    @patch('core.services.weaviate.service.get_client')
+    @patch('core.services.weaviate.service.pooled_client')
     @patch('core.services.weaviate.service._ensure_schema_once')
-    def test_global_search_alpha_parameter(self, mock_ensure_schema, mock_get_client):
+    def test_global_search_alpha_parameter(self, mock_ensure_schema, mock_pooled_client):
         """Test that global_search passes alpha parameter correctly."""
         mock_client = MagicMock()
         mock_collection = MagicMock()
@@ -1843,7 +2142,7 @@ class GlobalSearchTestCase(TestCase):
         
         mock_collection.query.hybrid.return_value = mock_response
         mock_client.collections.get.return_value = mock_collection
-        mock_get_client.return_value = mock_client
+        mock_pooled_client.return_value.__enter__.return_value = mock_client
         
         # Execute search with custom alpha
         from core.services.weaviate.service import global_search
@@ -1854,9 +2153,9 @@ class GlobalSearchTestCase(TestCase):
         self.assertEqual(call_kwargs['alpha'], 0.75)
         self.assertEqual(call_kwargs['limit'], 50)
     
-    @patch('core.services.weaviate.service.get_client')
+    @patch('core.services.weaviate.service.pooled_client')
     @patch('core.services.weaviate.service._ensure_schema_once')
-    def test_global_search_uses_relative_score_fusion(self, mock_ensure_schema, mock_get_client):
+    def test_global_search_uses_relative_score_fusion(self, mock_ensure_schema, mock_pooled_client):
         """Test that global_search uses RELATIVE_SCORE fusion for consistent scoring."""
         mock_client = MagicMock()
         mock_collection = MagicMock()
@@ -1865,7 +2164,7 @@ class GlobalSearchTestCase(TestCase):
         
         mock_collection.query.hybrid.return_value = mock_response
         mock_client.collections.get.return_value = mock_collection
-        mock_get_client.return_value = mock_client
+        mock_pooled_client.return_value.__enter__.return_value = mock_client
         
         # Execute search
         from core.services.weaviate.service import global_search
@@ -1876,9 +2175,9 @@ class GlobalSearchTestCase(TestCase):
         call_kwargs = mock_collection.query.hybrid.call_args[1]
         self.assertEqual(call_kwargs['fusion_type'], HybridFusion.RELATIVE_SCORE)
     
-    @patch('core.services.weaviate.service.get_client')
+    @patch('core.services.weaviate.service.pooled_client')
     @patch('core.services.weaviate.service._ensure_schema_once')
-    def test_global_search_sorts_by_score_descending(self, mock_ensure_schema, mock_get_client):
+    def test_global_search_sorts_by_score_descending(self, mock_ensure_schema, mock_pooled_client):
         """Test that global_search sorts results by score in descending order."""
         mock_client = MagicMock()
         mock_collection = MagicMock()
@@ -1901,7 +2200,7 @@ class GlobalSearchTestCase(TestCase):
         mock_response.objects = [mock_obj1, mock_obj2, mock_obj3]
         mock_collection.query.hybrid.return_value = mock_response
         mock_client.collections.get.return_value = mock_collection
-        mock_get_client.return_value = mock_client
+        mock_pooled_client.return_value.__enter__.return_value = mock_client
         
         # Execute search
         from core.services.weaviate.service import global_search
@@ -1916,9 +2215,9 @@ class GlobalSearchTestCase(TestCase):
         self.assertEqual(results[2].score, 0.3)  # Lowest last
         self.assertEqual(results[2].title, 'Low Score')
     
-    @patch('core.services.weaviate.service.get_client')
+    @patch('core.services.weaviate.service.pooled_client')
     @patch('core.services.weaviate.service._ensure_schema_once')
-    def test_global_search_mode_keyword(self, mock_ensure_schema, mock_get_client):
+    def test_global_search_mode_keyword(self, mock_ensure_schema, mock_pooled_client):
         """Test that keyword mode uses alpha=0.0 for pure BM25."""
         mock_client = MagicMock()
         mock_collection = MagicMock()
@@ -1927,7 +2226,7 @@ class GlobalSearchTestCase(TestCase):
         
         mock_collection.query.hybrid.return_value = mock_response
         mock_client.collections.get.return_value = mock_collection
-        mock_get_client.return_value = mock_client
+        mock_pooled_client.return_value.__enter__.return_value = mock_client
         
         # Execute search with keyword mode
         from core.services.weaviate.service import global_search
@@ -1937,9 +2236,9 @@ class GlobalSearchTestCase(TestCase):
         call_kwargs = mock_collection.query.hybrid.call_args[1]
         self.assertEqual(call_kwargs['alpha'], 0.0)
     
-    @patch('core.services.weaviate.service.get_client')
+    @patch('core.services.weaviate.service.pooled_client')
     @patch('core.services.weaviate.service._ensure_schema_once')
-    def test_global_search_mode_similar(self, mock_ensure_schema, mock_get_client):
+    def test_global_search_mode_similar(self, mock_ensure_schema, mock_pooled_client):
         """Test that similar mode uses near_text query."""
         mock_client = MagicMock()
         mock_collection = MagicMock()
@@ -1948,7 +2247,7 @@ class GlobalSearchTestCase(TestCase):
         
         mock_collection.query.near_text.return_value = mock_response
         mock_client.collections.get.return_value = mock_collection
-        mock_get_client.return_value = mock_client
+        mock_pooled_client.return_value.__enter__.return_value = mock_client
         
         # Execute search with similar mode
         from core.services.weaviate.service import global_search
@@ -2032,95 +2331,10 @@ class MeetingTranscriptExclusionTestCase(TestCase):
         self.Attachment = Attachment
         self.AttachmentLink = AttachmentLink
     
-    def test_is_meeting_transcript_attachment_returns_true_for_transcript(self):
-        """Test that is_meeting_transcript_attachment correctly identifies meeting transcripts."""
-        from core.services.weaviate.service import is_meeting_transcript_attachment
-        
-        # Create attachment
-        attachment = self.Attachment.objects.create(
-            original_name='transcript.docx',
-            content_type='application/vnd.openxmlformats-officedocument.wordprocessingml.document',
-            size_bytes=1024,
-            storage_path='/test/path',
-            created_by=self.user
-        )
-        
-        # Link it to meeting item with transkript role
-        self.AttachmentLink.objects.create(
-            attachment=attachment,
-            target=self.meeting_item,
-            role=self.AttachmentRole.TRANSKRIPT
-        )
-        
-        # Should identify as meeting transcript
-        self.assertTrue(is_meeting_transcript_attachment(attachment))
-    
-    def test_is_meeting_transcript_attachment_returns_false_for_regular_file(self):
-        """Test that is_meeting_transcript_attachment returns False for regular files."""
-        from core.services.weaviate.service import is_meeting_transcript_attachment
-        
-        # Create attachment
-        attachment = self.Attachment.objects.create(
-            original_name='document.pdf',
-            content_type='application/pdf',
-            size_bytes=1024,
-            storage_path='/test/path',
-            created_by=self.user
-        )
-        
-        # Link it to meeting item with ITEM_FILE role (not transkript)
-        self.AttachmentLink.objects.create(
-            attachment=attachment,
-            target=self.meeting_item,
-            role=self.AttachmentRole.ITEM_FILE
-        )
-        
-        # Should NOT identify as meeting transcript (wrong role)
-        self.assertFalse(is_meeting_transcript_attachment(attachment))
-    
-    def test_is_meeting_transcript_attachment_returns_false_for_non_meeting_item(self):
-        """Test that is_meeting_transcript_attachment returns False for non-meeting items."""
-        from core.services.weaviate.service import is_meeting_transcript_attachment
-        
-        # Create attachment
-        attachment = self.Attachment.objects.create(
-            original_name='file.docx',
-            content_type='application/vnd.openxmlformats-officedocument.wordprocessingml.document',
-            size_bytes=1024,
-            storage_path='/test/path',
-            created_by=self.user
-        )
-        
-        # Link it to bug item (not meeting) with transkript role
-        self.AttachmentLink.objects.create(
-            attachment=attachment,
-            target=self.bug_item,
-            role=self.AttachmentRole.TRANSKRIPT
-        )
-        
-        # Should NOT identify as meeting transcript (wrong item type)
-        self.assertFalse(is_meeting_transcript_attachment(attachment))
-    
-    def test_is_meeting_transcript_attachment_returns_false_for_unlinked(self):
-        """Test that is_meeting_transcript_attachment returns False for unlinked attachments."""
-        from core.services.weaviate.service import is_meeting_transcript_attachment
-        
-        # Create attachment without any links
-        attachment = self.Attachment.objects.create(
-            original_name='file.docx',
-            content_type='application/vnd.openxmlformats-officedocument.wordprocessingml.document',
-            size_bytes=1024,
-            storage_path='/test/path',
-            created_by=self.user
-        )
-        
-        # Should NOT identify as meeting transcript (no links)
-        self.assertFalse(is_meeting_transcript_attachment(attachment))
-    
     @patch('core.services.weaviate.signals.is_available')
-    @patch('core.services.weaviate.signals.upsert_instance')
-    def test_signal_skips_meeting_transcript(self, mock_upsert, mock_is_available):
-        """Test that post_save signal skips Weaviate sync for meeting transcripts."""
+    @patch('core.services.weaviate.signals.enqueue')
+    def test_signal_syncs_meeting_transcript(self, mock_enqueue, mock_is_available):
+        """Test that post_save signal queues meeting transcripts (indexed in chunks)."""
         from core.services.weaviate.signals import sync_attachment_to_weaviate
         
         # Mock Weaviate as available
@@ -2141,6 +2355,8 @@ class MeetingTranscriptExclusionTestCase(TestCase):
             target=self.meeting_item,
             role=self.AttachmentRole.TRANSKRIPT
         )
+        # Ignore the event queued by create(), before the link existed
+        mock_enqueue.reset_mock()
         
         # Manually trigger the signal handler
         sync_attachment_to_weaviate(
@@ -2149,23 +2365,18 @@ class MeetingTranscriptExclusionTestCase(TestCase):
             created=True
         )
         
-        # Verify upsert_instance was NOT called (excluded from sync)
-        mock_upsert.assert_not_called()
+        # Verify an upsert was queued (transcripts are no longer excluded)
+        mock_enqueue.assert_called_once_with(attachment, 'upsert')
     
     @patch('core.services.weaviate.signals.is_available')
-    @patch('core.services.weaviate.signals.transaction')
-    def test_signal_syncs_regular_attachment(self, mock_transaction, mock_is_available):
+    def test_signal_syncs_regular_attachment(self, mock_is_available):
         """Test that post_save signal still syncs regular attachments."""
+        from core.models import WeaviateSyncEvent
         from core.services.weaviate.signals import sync_attachment_to_weaviate
         
         # Mock Weaviate as available
         mock_is_available.return_value = True
         
-        # Mock transaction.on_commit to execute callback immediately
-        def execute_immediately(callback):
-            callback()
-        mock_transaction.on_commit.side_effect = execute_immediately
-        
         # Create attachment
         attachment = self.Attachment.objects.create(
             original_name='document.pdf',
@@ -2181,21 +2392,25 @@ class MeetingTranscriptExclusionTestCase(TestCase):
             target=self.bug_item,
             role=self.AttachmentRole.ITEM_FILE
         )
+        WeaviateSyncEvent.objects.all().delete()
         
-        # Patch upsert_instance
-        with patch('core.services.weaviate.signals.upsert_instance') as mock_upsert:
-            # Manually trigger the signal handler
-            sync_attachment_to_weaviate(
-                sender=self.Attachment,
-                instance=attachment,
-                created=True
-            )
-            
-            # Verify upsert_instance WAS called (not excluded)
-            mock_upsert.assert_called_once_with(attachment)
+        # Manually trigger the signal handler
+        sync_attachment_to_weaviate(
+            sender=self.Attachment,
+            instance=attachment,
+            created=True
+        )
+        
+        # Verify an upsert WAS queued (not excluded)
+        self.assertTrue(
+            WeaviateSyncEvent.objects.filter(
+                object_type='attachment', object_id=str(attachment.id), action='upsert'
+            ).exists()
+        )
     
-    def test_upsert_object_skips_meeting_transcript(self):
-        """Test that upsert_object returns None for meeting transcripts."""
+    @patch('core.services.weaviate.service._upsert_agira_objects', return_value='uuid-1')
+    def test_upsert_object_indexes_meeting_transcript(self, mock_upsert):
+        """Test that upsert_object indexes meeting transcripts."""
         from core.services.weaviate.service import upsert_object
         
         # Create attachment
@@ -2214,12 +2429,15 @@ class MeetingTranscriptExclusionTestCase(TestCase):
             role=self.AttachmentRole.TRANSKRIPT
         )
         
-        # Try to upsert - should return None (excluded)
         result = upsert_object('attachment', str(attachment.id))
-        self.assertIsNone(result)
-    
-    def test_upsert_instance_skips_meeting_transcript(self):
-        """Test that upsert_instance returns None for meeting transcripts."""
+        self.assertEqual(result, 'uuid-1')
+        objects = mock_upsert.call_args[0][0]
+        self.assertEqual(objects[0]['type'], 'attachment')
+        self.assertEqual(objects[0]['object_id'], str(attachment.id))
+    
+    @patch('core.services.weaviate.service._upsert_agira_objects', return_value='uuid-1')
+    def test_upsert_instance_indexes_meeting_transcript(self, mock_upsert):
+        """Test that upsert_instance indexes meeting transcripts."""
         from core.services.weaviate.service import upsert_instance
         
         # Create attachment
@@ -2238,12 +2456,12 @@ class MeetingTranscriptExclusionTestCase(TestCase):
             role=self.AttachmentRole.TRANSKRIPT
         )
         
-        # Try to upsert - should return None (excluded)
         result = upsert_instance(attachment)
-        self.assertIsNone(result)
+        self.assertEqual(result, 'uuid-1')
+        mock_upsert.assert_called_once()
     
-    def test_is_excluded_from_sync_returns_true_for_meeting_transcript(self):
-        """Test that is_excluded_from_sync correctly identifies meeting transcripts."""
+    def test_is_excluded_from_sync_returns_false_for_meeting_transcript(self):
+        """Test that meeting transcripts are no longer excluded from sync."""
         from core.services.weaviate.service import is_excluded_from_sync
         
         # Create attachment
@@ -2264,9 +2482,8 @@ class MeetingTranscriptExclusionTestCase(TestCase):
         
         # Check exclusion
         is_excluded, reason = is_excluded_from_sync('attachment', str(attachment.id))
-        self.assertTrue(is_excluded)
-        self.assertIsNotNone(reason)
-        self.assertIn('Meeting transcript', reason)
+        self.assertFalse(is_excluded)
+        self.assertIsNone(reason)
     
     def test_is_excluded_from_sync_returns_false_for_regular_attachment(self):
         """Test that is_excluded_from_sync returns False for regular attachments."""
@@ -2478,12 +2695,13 @@ class WeaviateViewTestCase(TestCase):
 
 
 class ItemAsyncWeaviateSyncTestCase(TestCase):
-    """Test that saving an Item (Issue) does not block on Weaviate indexing."""
+    """Test that saving an Item (Issue) only queues Weaviate indexing in the outbox."""
 
     def setUp(self):
         """Set up test data."""
         from core.models import (
             User, Organisation, UserOrganisation, Project, ItemType, Item, ItemStatus,
+            WeaviateSyncEvent,
         )
 
         self.user = User.objects.create_user(
@@ -2515,193 +2733,242 @@ class ItemAsyncWeaviateSyncTestCase(TestCase):
 
         self.Item = Item
         self.ItemStatus = ItemStatus
+        self.WeaviateSyncEvent = WeaviateSyncEvent
 
-    def _run_on_commit_immediately(self, callback):
-        callback()
-
-    def test_item_create_succeeds_even_if_background_job_fails(self):
-        """Creating an Issue must persist even though the Weaviate job later raises."""
-        with patch('core.services.weaviate.signals.is_available', return_value=True), \
-             patch('core.services.weaviate.signals.transaction') as mock_transaction, \
-             patch('core.services.weaviate.signals._background_executor') as mock_executor, \
-             patch('core.services.weaviate.signals.upsert_instance', side_effect=RuntimeError('weaviate down')):
-            mock_transaction.on_commit.side_effect = self._run_on_commit_immediately
-            # Run whatever gets submitted to the pool synchronously, in-process,
-            # so we can observe that a failure there doesn't affect the save.
-            mock_executor.submit.side_effect = lambda fn: fn()
-
-            item = self.Item.objects.create(
-                project=self.project,
-                type=self.bug_type,
-                title='Issue with failing background sync',
-                description='Body',
-                status=self.ItemStatus.INBOX,
-            )
-
-        self.assertIsNotNone(item.pk)
-        self.assertTrue(self.Item.objects.filter(pk=item.pk).exists())
-
-    def test_item_update_succeeds_even_if_background_job_fails(self):
-        """Updating an Issue must persist even though the Weaviate job later raises."""
-        item = self.Item.objects.create(
+    def _create_item(self, title):
+        return self.Item.objects.create(
             project=self.project,
             type=self.bug_type,
-            title='Original title',
+            title=title,
             description='Body',
             status=self.ItemStatus.INBOX,
         )
 
+    def _item_events(self, item):
+        return self.WeaviateSyncEvent.objects.filter(object_type='item', object_id=str(item.pk))
+
+    def test_item_save_queues_outbox_event_not_inline_upsert(self):
+        """The save path must write an outbox row, never call Weaviate inline."""
         with patch('core.services.weaviate.signals.is_available', return_value=True), \
-             patch('core.services.weaviate.signals.transaction') as mock_transaction, \
-             patch('core.services.weaviate.signals._background_executor') as mock_executor, \
-             patch('core.services.weaviate.signals.upsert_instance', side_effect=RuntimeError('weaviate down')):
-            mock_transaction.on_commit.side_effect = self._run_on_commit_immediately
-            mock_executor.submit.side_effect = lambda fn: fn()
+             patch('core.services.weaviate.service.upsert_instance') as mock_upsert, \
+             patch('core.services.weaviate.outbox._write') as mock_write:
+            item = self._create_item('Dispatch check')
+
+        mock_upsert.assert_not_called()
+        mock_write.assert_not_called()
+        events = list(self._item_events(item))
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0].action, 'upsert')
+
+    def test_item_update_succeeds_even_if_worker_fails(self):
+        """Updating an Issue must persist even though the outbox worker later fails."""
+        from core.services.weaviate.outbox import drain_once
 
+        with patch('core.services.weaviate.signals.is_available', return_value=True):
+            item = self._create_item('Original title')
             item.title = 'Updated title'
             item.save(update_fields=['title'])
 
+        with patch('core.services.weaviate.outbox._write', side_effect=RuntimeError('weaviate down')):
+            result = drain_once()
+
         item.refresh_from_db()
         self.assertEqual(item.title, 'Updated title')
-
-    def test_item_save_dispatches_to_background_executor_not_inline(self):
-        """The save path must hand indexing off to the executor, not call it inline."""
+        self.assertEqual(result.retried, 1)
+        # The event stays queued for a later attempt
+        event = self._item_events(item).first()
+        self.assertEqual(event.attempts, 1)
+        self.assertIn('weaviate down', event.last_error)
+
+    def test_item_save_succeeds_if_enqueue_fails(self):
+        """A broken outbox must never break saving an Issue."""
         with patch('core.services.weaviate.signals.is_available', return_value=True), \
-             patch('core.services.weaviate.signals.transaction') as mock_transaction, \
-             patch('core.services.weaviate.signals._background_executor') as mock_executor, \
-             patch('core.services.weaviate.signals.upsert_instance') as mock_upsert:
-            mock_transaction.on_commit.side_effect = self._run_on_commit_immediately
-
-            self.Item.objects.create(
-                project=self.project,
-                type=self.bug_type,
-                title='Dispatch check',
-                description='Body',
-                status=self.ItemStatus.INBOX,
-            )
+             patch('core.services.weaviate.signals.enqueue', side_effect=RuntimeError('db hiccup')):
+            item = self._create_item('Enqueue failure')
 
-            # Work was handed to the executor...
-            mock_executor.submit.assert_called_once()
-            # ...and, since the executor itself is mocked out, the real
-            # Weaviate call never ran inline on the save path.
-            mock_upsert.assert_not_called()
+        self.assertTrue(self.Item.objects.filter(pk=item.pk).exists())
 
-    def test_item_save_does_not_wait_for_weaviate_processing(self):
-        """The save call returns before the (slow) Weaviate upsert completes."""
-        import threading
+    def test_repeated_saves_coalesce_into_one_upsert(self):
+        """Several saves of the same Issue are written to Weaviate once."""
+        from core.services.weaviate.outbox import drain_once
+
+        with patch('core.services.weaviate.signals.is_available', return_value=True):
+            item = self._create_item('Coalesce check')
+            for _ in range(3):
+                item.save(update_fields=['title'])
+        self.assertEqual(self._item_events(item).count(), 4)
+
+        with patch('core.services.weaviate.outbox._write', return_value={}) as mock_write:
+            result = drain_once()
+
+        upserts, deletes, _batch_size = mock_write.call_args[0]
+        self.assertEqual(list(upserts.keys()), [('item', str(item.pk))])
+        self.assertEqual(deletes, [])
+        self.assertEqual(result.claimed_events, 4)
+        self.assertEqual(result.coalesced, 3)
+        self.assertEqual(result.upserted, 1)
+        self.assertFalse(self._item_events(item).exists())
+
+    def test_outbox_event_committed_with_transaction(self):
+        """The outbox row becomes visible together with the Issue itself."""
+        from django.db import transaction as real_transaction
 
-        release_upsert = threading.Event()
-        upsert_started = threading.Event()
-        upsert_finished = threading.Event()
+        with patch('core.services.weaviate.signals.is_available', return_value=True):
+            with real_transaction.atomic():
+                item = self._create_item('Post-commit check')
+                self.assertTrue(self._item_events(item).exists())
 
-        def slow_upsert(instance):
-            upsert_started.set()
-            release_upsert.wait(timeout=5)
-            upsert_finished.set()
+        self.assertTrue(self._item_events(item).exists())
 
-        with patch('core.services.weaviate.signals.is_available', return_value=True), \
-             patch('core.services.weaviate.signals.transaction') as mock_transaction, \
-             patch('core.services.weaviate.signals.upsert_instance', side_effect=slow_upsert):
-            mock_transaction.on_commit.side_effect = self._run_on_commit_immediately
-
-            self.Item.objects.create(
-                project=self.project,
-                type=self.bug_type,
-                title='Non-blocking save',
-                description='Body',
-                status=self.ItemStatus.INBOX,
-            )
+    def test_no_outbox_event_on_rollback(self):
+        """If the enclosing transaction rolls back, nothing stays queued."""
+        from django.db import transaction as real_transaction
 
-            # The save has already returned control to us here, while the
-            # background thread may still be blocked inside the slow upsert.
-            self.assertTrue(upsert_started.wait(timeout=5))
-            self.assertFalse(upsert_finished.is_set())
+        with patch('core.services.weaviate.signals.is_available', return_value=True):
+            try:
+                with real_transaction.atomic():
+                    self._create_item('Rollback check')
+                    raise RuntimeError('force rollback')
+            except RuntimeError:
+                pass
 
-            # Let the background thread finish so it doesn't leak into other tests.
-            release_upsert.set()
-            self.assertTrue(upsert_finished.wait(timeout=5))
+        self.assertFalse(self.Item.objects.filter(title='Rollback check').exists())
+        self.assertFalse(self.WeaviateSyncEvent.objects.filter(object_type='item').exists())
 
-    def test_repeated_background_job_execution_is_idempotent(self):
-        """Running the indexing job twice for the same Issue must target the same object."""
-        from core.services.weaviate.service import make_weaviate_uuid
+    def test_no_outbox_event_when_weaviate_disabled(self):
+        """Without Weaviate configured, saves do not fill the outbox."""
+        with patch('core.services.weaviate.signals.is_available', return_value=False):
+            item = self._create_item('Disabled check')
 
-        item = self.Item.objects.create(
-            project=self.project,
-            type=self.bug_type,
-            title='Idempotency check',
-            description='Body',
-            status=self.ItemStatus.INBOX,
+        self.assertFalse(self._item_events(item).exists())
+
+
+class WeaviateOutboxDrainTestCase(TestCase):
+    """Test draining of the Weaviate outbox."""
+
+    def setUp(self):
+        """Set up test data."""
+        from core.models import Project, WeaviateSyncEvent
+
+        self.project = Project.objects.create(name='Outbox Project')
+        self.WeaviateSyncEvent = WeaviateSyncEvent
+        WeaviateSyncEvent.objects.all().delete()
+
+    def _event(self, object_type, object_id, action='upsert', **kwargs):
+        return self.WeaviateSyncEvent.objects.create(
+            object_type=object_type, object_id=str(object_id), action=action, **kwargs
         )
 
-        with patch('core.services.weaviate.signals.is_available', return_value=True), \
-             patch('core.services.weaviate.signals.transaction') as mock_transaction, \
-             patch('core.services.weaviate.signals._background_executor') as mock_executor, \
-             patch('core.services.weaviate.signals.upsert_instance', return_value=make_weaviate_uuid('item', str(item.pk))) as mock_upsert:
-            mock_transaction.on_commit.side_effect = self._run_on_commit_immediately
-            mock_executor.submit.side_effect = lambda fn: fn()
+    def test_last_action_wins(self):
+        """An upsert followed by a delete results in a delete only."""
+        from core.services.weaviate.outbox import drain_once
 
-            # Simulate the job firing twice for the same Issue (e.g. two saves).
-            item.save(update_fields=['title'])
-            item.save(update_fields=['title'])
+        self._event('project', self.project.pk, 'upsert')
+        self._event('project', self.project.pk, 'delete')
 
-            self.assertEqual(mock_upsert.call_count, 2)
-            first_uuid = mock_upsert.return_value
-            second_uuid = mock_upsert.return_value
-            self.assertEqual(first_uuid, second_uuid)
-            # Both calls resolve to the same deterministic Weaviate object,
-            # i.e. an overwrite rather than a duplicate insert.
-            self.assertEqual(first_uuid, make_weaviate_uuid('item', str(item.pk)))
+        with patch('core.services.weaviate.outbox._write', return_value={}) as mock_write:
+            result = drain_once()
 
-    def test_background_job_only_dispatched_after_commit(self):
-        """The executor must not be touched until the enclosing transaction commits."""
-        from django.db import transaction as real_transaction
+        upserts, deletes, _batch_size = mock_write.call_args[0]
+        self.assertEqual(upserts, {})
+        self.assertEqual(deletes, [('project', str(self.project.pk))])
+        self.assertEqual(result.deleted, 1)
+        self.assertEqual(self.WeaviateSyncEvent.objects.count(), 0)
 
-        with patch('core.services.weaviate.signals.is_available', return_value=True), \
-             patch('core.services.weaviate.signals._background_executor') as mock_executor:
-            with self.captureOnCommitCallbacks(execute=False) as callbacks:
-                with real_transaction.atomic():
-                    self.Item.objects.create(
-                        project=self.project,
-                        type=self.bug_type,
-                        title='Post-commit check',
-                        description='Body',
-                        status=self.ItemStatus.INBOX,
-                    )
-                    # Still inside the transaction: nothing dispatched yet.
-                    mock_executor.submit.assert_not_called()
-
-            # Transaction committed, but we deferred executing the captured
-            # on_commit callbacks ourselves.
-            mock_executor.submit.assert_not_called()
-
-            for callback in callbacks:
-                callback()
-
-            mock_executor.submit.assert_called_once()
-
-    def test_background_job_not_dispatched_on_rollback(self):
-        """If the enclosing transaction rolls back, no indexing job may run."""
-        from django.db import transaction as real_transaction
+    def test_upsert_of_missing_object_becomes_delete(self):
+        """Objects deleted before the worker ran are removed from Weaviate."""
+        from core.services.weaviate.outbox import drain_once
 
-        with patch('core.services.weaviate.signals.is_available', return_value=True), \
-             patch('core.services.weaviate.signals._background_executor') as mock_executor:
-            with self.captureOnCommitCallbacks(execute=True):
-                try:
-                    with real_transaction.atomic():
-                        self.Item.objects.create(
-                            project=self.project,
-                            type=self.bug_type,
-                            title='Rollback check',
-                            description='Body',
-                            status=self.ItemStatus.INBOX,
-                        )
-                        raise RuntimeError('force rollback')
-                except RuntimeError:
-                    pass
-
-            mock_executor.submit.assert_not_called()
-            self.assertFalse(
-                self.Item.objects.filter(title='Rollback check').exists()
-            )
+        self._event('item', 999999, 'upsert')
+
+        with patch('core.services.weaviate.outbox._write', return_value={}) as mock_write:
+            drain_once()
+
+        upserts, deletes, _batch_size = mock_write.call_args[0]
+        self.assertEqual(upserts, {})
+        self.assertEqual(deletes, [('item', '999999')])
+
+    def test_partial_batch_failure_only_retries_failed_objects(self):
+        """Objects rejected by Weaviate are retried with backoff, the rest is done."""
+        from core.models import Project
+        from core.services.weaviate.outbox import drain_once
+
+        other = Project.objects.create(name='Other Project')
+        self._event('project', self.project.pk)
+        self._event('project', other.pk)
+
+        failed_key = ('project', str(other.pk))
+        with patch('core.services.weaviate.outbox._write', return_value={failed_key: 'rejected'}):
+            result = drain_once()
+
+        self.assertEqual(result.upserted, 1)
+        self.assertEqual(result.retried, 1)
+        remaining = list(self.WeaviateSyncEvent.objects.all())
+        self.assertEqual(len(remaining), 1)
+        self.assertEqual(remaining[0].object_id, str(other.pk))
+        self.assertEqual(remaining[0].attempts, 1)
+        self.assertGreater(remaining[0].next_attempt_at, timezone.now())
+
+    def test_exhausted_events_are_not_claimed(self):
+        """Events that reached max_attempts stay as dead letters."""
+        from core.services.weaviate.outbox import drain_once, get_outbox_stats
 
+        self._event('project', self.project.pk, attempts=3)
+
+        with patch('core.services.weaviate.outbox._write') as mock_write:
+            result = drain_once(max_attempts=3)
+
+        mock_write.assert_not_called()
+        self.assertEqual(result.claimed_events, 0)
+        stats = get_outbox_stats(max_attempts=3)
+        self.assertEqual(stats['dead'], 1)
+        self.assertEqual(stats['pending'], 0)
+
+    def test_events_not_yet_due_are_skipped(self):
+        """Events in backoff are left alone until next_attempt_at."""
+        from datetime import timedelta
+        from core.services.weaviate.outbox import drain_once
+
+        self._event('project', self.project.pk, next_attempt_at=timezone.now() + timedelta(minutes=5))
+
+        with patch('core.services.weaviate.outbox._write') as mock_write:
+            result = drain_once()
+
+        mock_write.assert_not_called()
+        self.assertEqual(result.claimed_events, 0)
+
+    def test_stats_report_depth_and_lag(self):
+        """Queue depth counts events and distinct objects; lag is the oldest age."""
+        from datetime import timedelta
+        from core.services.weaviate.outbox import get_outbox_stats
+
+        self._event('project', self.project.pk, created_at=timezone.now() - timedelta(seconds=90))
+        self._event('project', self.project.pk)
+
+        stats = get_outbox_stats()
+        self.assertEqual(stats['pending'], 2)
+        self.assertEqual(stats['pending_objects'], 1)
+        self.assertGreaterEqual(stats['lag_seconds'], 90)
+
+    def test_write_batches_upserts_and_deletes(self):
+        """Upserts go through the batch API, deletes through one delete_many."""
+        from core.services.weaviate.outbox import _write
+
+        mock_client = MagicMock()
+        mock_collection = mock_client.collections.get.return_value
+        mock_collection.batch.failed_objects = []
+        batch = mock_collection.batch.fixed_size.return_value.__enter__.return_value
+
+        with patch('core.services.weaviate.client.pooled_client') as mock_pooled, \
+             patch('core.services.weaviate.service._ensure_schema_once'):
+            mock_pooled.return_value.__enter__.return_value = mock_client
+            failures = _write(
+                {('item', '1'): {'type': 'item', 'object_id': '1', 'title': 'A'}},
+                [('item', '2'), ('github_issue', '3')],
+                batch_size=50,
+            )
 
+        self.assertEqual(failures, {})
+        mock_collection.batch.fixed_size.assert_called_once_with(batch_size=50)
+        batch.add_object.assert_called_once()
+        mock_collection.data.delete_many.assert_called_once()
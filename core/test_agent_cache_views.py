@@ -44,20 +44,10 @@ class AgentCacheConfigurationTestCase(TestCase):
         self.original_agents_dir = self.agent_service.agents_dir
         self.agent_service.agents_dir = self.test_agents_dir
         
-        # Mock the AgentService in views
+        # Serve the test service from the views' shared-service accessor
         import core.views
-        self.original_agent_service = core.views.AgentService
-        
-        # Store test_agents_dir reference for use in TestAgentService
-        test_agents_dir_ref = self.test_agents_dir
-        
-        # Create a mock class that uses our test directory
-        class TestAgentService(AgentService):
-            def __init__(self):
-                super().__init__()
-                self.agents_dir = test_agents_dir_ref
-        
-        core.views.AgentService = TestAgentService
+        self.original_get_agent_service = core.views.get_agent_service
+        core.views.get_agent_service = lambda: self.agent_service
         
         # Client for making requests
         self.client = Client()
@@ -65,9 +55,9 @@ class AgentCacheConfigurationTestCase(TestCase):
     
     def tearDown(self):
         """Clean up after each test."""
-        # Restore original AgentService
+        # Restore the shared-service accessor
         import core.views
-        core.views.AgentService = self.original_agent_service
+        core.views.get_agent_service = self.original_get_agent_service
         
         # Remove temporary directory
         if self.test_agents_dir.exists():
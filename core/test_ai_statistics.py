@@ -282,7 +282,7 @@ class AIJobStatisticsViewTests(TestCase):
         for key in (
             'costs_today', 'costs_week', 'costs_month', 'errors_7d',
             'by_agent', 'by_model', 'by_user',
-            'requests_chart_json', 'duration_chart_json',
+            'requests_chart_json', 'duration_chart_json', 'rag_cache_stats',
         ):
             self.assertIn(key, response.context, f"Missing context key: {key}")
 
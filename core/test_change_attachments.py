@@ -2,8 +2,11 @@
 Tests for Change Attachment views
 """
 
+import shutil
+import tempfile
 from datetime import datetime
 from io import BytesIO
+from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 from django.contrib.contenttypes.models import ContentType
@@ -158,14 +161,18 @@ class ChangeAttachmentViewTestCase(TestCase):
     def test_download_attachment_success(self, mock_storage_cls):
         mock_storage = MagicMock()
         mock_storage_cls.return_value = mock_storage
-        mock_storage.read_attachment.return_value = b"file content"
+        file_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, file_dir, True)
+        file_path = Path(file_dir) / "change_file.txt"
+        file_path.write_bytes(b"file content")
+        mock_storage.get_file_path.return_value = file_path
 
         self.client.force_login(self.user)
         url = reverse('change-download-attachment', kwargs={'attachment_id': self.attachment.id})
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(response.content, b"file content")
+        self.assertEqual(b"".join(response.streaming_content), b"file content")
 
     @patch('core.views.AttachmentStorageService')
     def test_download_deleted_attachment_returns_404(self, _mock):
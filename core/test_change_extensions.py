@@ -658,3 +658,63 @@ Risk Level: Medium-High"""
         self.change.refresh_from_db()
         self.assertEqual(self.change.risk_description, "This is a risky change that needs better description.")
 
+    
+    @patch('core.services.agents.agent_service.AgentService.execute_agent')
+    def test_improve_texts_runs_all_agents(self, mock_execute_agent):
+        """Test that all non-empty texts are improved in one request"""
+        mock_execute_agent.side_effect = lambda filename, input_text, **kwargs: f"Improved: {input_text}"
+        
+        url = reverse('change-improve-texts-ai', args=[self.change.id])
+        response = self.client.post(url)
+        
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertTrue(data['success'])
+        self.assertEqual(data['errors'], {})
+        self.assertEqual(mock_execute_agent.call_count, 3)
+        filenames = sorted(c.kwargs['filename'] for c in mock_execute_agent.call_args_list)
+        self.assertEqual(filenames, [
+            'change-text-polish-agent.yml',
+            'text-optimization-agent.yml',
+            'text-optimization-agent.yml',
+        ])
+        
+        self.change.refresh_from_db()
+        self.assertEqual(self.change.risk_description, "Improved: This is a risky change that needs better description.")
+        self.assertEqual(self.change.mitigation, "Improved: We will do some mitigation steps.")
+        self.assertEqual(self.change.rollback_plan, "Improved: Rollback by reversing changes.")
+    
+    @patch('core.services.agents.agent_service.AgentService.execute_agent')
+    def test_improve_texts_keeps_text_of_failed_call(self, mock_execute_agent):
+        """Test that a failing agent call only leaves its own field unchanged"""
+        def execute(filename, input_text, **kwargs):
+            if input_text == self.change.mitigation:
+                raise Exception("AI service unavailable")
+            return f"Improved: {input_text}"
+        mock_execute_agent.side_effect = execute
+        
+        url = reverse('change-improve-texts-ai', args=[self.change.id])
+        response = self.client.post(url)
+        
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertTrue(data['success'])
+        self.assertEqual(list(data['errors']), ['mitigation'])
+        
+        self.change.refresh_from_db()
+        self.assertEqual(self.change.mitigation, "We will do some mitigation steps.")
+        self.assertEqual(self.change.rollback_plan, "Improved: Rollback by reversing changes.")
+    
+    def test_improve_texts_requires_text(self):
+        """Test that a change without texts cannot be improved"""
+        empty_change = Change.objects.create(
+            project=self.project,
+            title="Empty Change",
+            created_by=self.user
+        )
+        
+        url = reverse('change-improve-texts-ai', args=[empty_change.id])
+        response = self.client.post(url)
+        
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('empty', response.json()['error'].lower())
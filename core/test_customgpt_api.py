@@ -6,6 +6,7 @@ This module tests the API endpoints for CustomGPT Actions including:
 - Projects CRUD operations (without Delete)
 - Items CRUD operations (without Delete)
 - Status filtering (open items = status != Closed)
+- Item list pagination, field selection and streaming
 - RAG context endpoint
 """
 import json
@@ -572,6 +573,111 @@ class CustomGPTItemsAPITest(TestCase):
         self.assertIsNone(self.open_item.parent)
 
 
+class CustomGPTItemListPaginationTest(TestCase):
+    """Test cursor pagination, fields= and updated_since on the item lists."""
+
+    def setUp(self):
+        """Set up test data."""
+        os.environ['CUSTOMGPT_API_SECRET'] = 'test-secret-123'
+        self.client = Client()
+        self.headers = {'HTTP_X_API_SECRET': 'test-secret-123'}
+
+        self.project = Project.objects.create(name='Paged Project', status=ProjectStatus.WORKING)
+        self.item_type = ItemType.objects.create(key='task', name='Task')
+        self.items = [
+            Item.objects.create(
+                project=self.project,
+                type=self.item_type,
+                title=f'Item {i}',
+                description='Long description',
+                status=ItemStatus.WORKING,
+            )
+            for i in range(5)
+        ]
+        Item.objects.create(project=self.project, type=self.item_type, title='Closed', status=ItemStatus.CLOSED)
+
+    def tearDown(self):
+        """Clean up after tests."""
+        if 'CUSTOMGPT_API_SECRET' in os.environ:
+            del os.environ['CUSTOMGPT_API_SECRET']
+
+    def _get(self, url, **params):
+        return self.client.get(url, params, **self.headers)
+
+    def test_cursor_pagination_walks_all_open_items(self):
+        """Following X-Next-Cursor returns every open item exactly once."""
+        seen = []
+        params = {'limit': 2}
+        while True:
+            response = self._get('/api/customgpt/items', **params)
+            self.assertEqual(response.status_code, 200)
+            page = json.loads(response.content)
+            self.assertLessEqual(len(page), 2)
+            seen.extend(item['id'] for item in page)
+            cursor = response.get('X-Next-Cursor')
+            if not cursor:
+                break
+            self.assertIn('rel="next"', response['Link'])
+            params['cursor'] = cursor
+
+        self.assertEqual(seen, [item.id for item in self.items])
+
+    def test_last_page_has_no_cursor(self):
+        """A page that holds the remaining items carries no next cursor."""
+        response = self._get(f'/api/customgpt/projects/{self.project.id}/open-items', limit=5)
+        self.assertEqual(len(json.loads(response.content)), 5)
+        self.assertNotIn('X-Next-Cursor', response)
+
+    def test_fields_projection(self):
+        """fields= returns only the requested keys plus id."""
+        response = self._get('/api/customgpt/items', fields='title,status,project_id')
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.content)
+        self.assertEqual(set(data[0]), {'id', 'title', 'status', 'project_id'})
+
+    def test_fields_projection_defers_text_columns(self):
+        """Text columns that were not requested are not selected."""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        with CaptureQueriesContext(connection) as ctx:
+            self._get('/api/customgpt/items', fields='title')
+        item_queries = [q['sql'] for q in ctx.captured_queries if 'core_item' in q['sql']]
+        self.assertTrue(item_queries)
+        self.assertFalse(any('"description"' in sql for sql in item_queries))
+
+    def test_updated_since_filter(self):
+        """updated_since only returns items changed at or after the timestamp."""
+        stale = self.items[0]
+        Item.objects.filter(pk=stale.pk).update(updated_at='2020-01-01T00:00:00Z')
+
+        response = self._get('/api/customgpt/items', updated_since='2021-01-01')
+        ids = [item['id'] for item in json.loads(response.content)]
+
+        self.assertNotIn(stale.id, ids)
+        self.assertEqual(len(ids), 4)
+
+    def test_invalid_parameters_return_400(self):
+        """Invalid limit, cursor, fields and updated_since are rejected."""
+        for params in ({'limit': 0}, {'limit': 'x'}, {'cursor': '!!!'},
+                       {'fields': 'title,secret'}, {'updated_since': 'yesterday'}):
+            response = self._get('/api/customgpt/items', **params)
+            self.assertEqual(response.status_code, 400, params)
+
+    @patch('core.views_api.ITEM_LIST_STREAM_THRESHOLD', 2)
+    def test_large_lists_are_streamed(self):
+        """Lists above the streaming threshold are sent as a streamed JSON array."""
+        response = self._get('/api/customgpt/items', fields='title')
+        self.assertTrue(response.streaming)
+        data = json.loads(b''.join(response.streaming_content))
+        self.assertEqual(len(data), 5)
+
+        paged = self._get('/api/customgpt/items', limit=4)
+        self.assertTrue(paged.streaming)
+        self.assertEqual(len(json.loads(b''.join(paged.streaming_content))), 4)
+        self.assertIn('X-Next-Cursor', paged)
+
+
 class CustomGPTItemContextAPITest(TestCase):
     """Test Item Context API endpoint."""
     
@@ -175,6 +175,51 @@ class DashboardViewsTestCase(TestCase):
         
         self.assertEqual(response.status_code, 200)
     
+    def test_dashboard_activity_stream_cursor_pagination(self):
+        """Test that the cursor walks the stream without gaps or duplicates"""
+        from core.services.activity import ActivityService
+        
+        self.client.force_login(self.user)
+        service = ActivityService()
+        items = list(Item.objects.filter(project=self.project).order_by('id'))
+        with ActivityService.batch():
+            for n in range(60):
+                service.log(verb='item.updated', target=items[n % len(items)], summary=f'Update {n}')
+        
+        url = reverse('dashboard-activity-stream')
+        first = self.client.get(url)
+        self.assertEqual(len(first.context['activities']), 50)
+        self.assertTrue(first.context['has_more'])
+        self.assertEqual(first.context['activities'][0]['summary'], 'Update 59')
+        
+        second = self.client.get(url, {'cursor': first.context['next_cursor']})
+        summaries = [a['summary'] for a in second.context['activities']]
+        self.assertEqual(summaries, [f'Update {n}' for n in range(9, -1, -1)])
+        self.assertFalse(second.context['has_more'])
+    
+    def test_dashboard_activity_stream_resolves_targets_in_bulk(self):
+        """Test that target titles are loaded with one query per content type"""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        from core.services.activity import ActivityService
+        
+        self.client.force_login(self.user)
+        service = ActivityService()
+        for item in Item.objects.filter(project=self.project):
+            service.log(verb='item.updated', target=item)
+        service.log(verb='project.updated', target=self.project)
+        
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('dashboard-activity-stream'))
+        
+        target_queries = [
+            q for q in queries.captured_queries
+            if 'FROM "core_item"' in q['sql'] or 'FROM "core_project"' in q['sql']
+        ]
+        self.assertEqual(len(target_queries), 2)
+        self.assertContains(response, 'Working Item')
+        self.assertContains(response, f'/projects/{self.project.id}/')
+    
     def test_dashboard_closed_items_chart_data(self):
         """Test that closed items chart data is calculated correctly"""
         self.client.force_login(self.user)
@@ -93,7 +93,7 @@ class EmailIngestionServiceTest(TestCase):
             EmailIngestionService()
     
     @patch('core.services.graph.email_ingestion_service.get_client')
-    @patch('core.services.graph.email_ingestion_service.AgentService')
+    @patch('core.services.graph.email_ingestion_service.get_agent_service')
     def test_process_inbox_dry_run(self, mock_agent_service, mock_get_client):
         """Test process_inbox in dry run mode."""
         # Mock client
@@ -129,7 +129,7 @@ class EmailIngestionServiceTest(TestCase):
         self.assertEqual(Item.objects.count(), 0)
     
     @patch('core.services.graph.email_ingestion_service.get_client')
-    @patch('core.services.graph.email_ingestion_service.AgentService')
+    @patch('core.services.graph.email_ingestion_service.get_agent_service')
     def test_get_or_create_user_existing(self, mock_agent_service, mock_get_client):
         """Test getting existing user."""
         # Create existing user
@@ -154,7 +154,7 @@ class EmailIngestionServiceTest(TestCase):
         self.assertEqual(user.id, existing_user.id)
     
     @patch('core.services.graph.email_ingestion_service.get_client')
-    @patch('core.services.graph.email_ingestion_service.AgentService')
+    @patch('core.services.graph.email_ingestion_service.get_agent_service')
     def test_get_or_create_user_new(self, mock_agent_service, mock_get_client):
         """Test creating new user."""
         # Mock client
@@ -176,7 +176,7 @@ class EmailIngestionServiceTest(TestCase):
         self.assertEqual(org, self.org)
     
     @patch('core.services.graph.email_ingestion_service.get_client')
-    @patch('core.services.graph.email_ingestion_service.AgentService')
+    @patch('core.services.graph.email_ingestion_service.get_agent_service')
     def test_find_organisation_by_domain(self, mock_agent_service, mock_get_client):
         """Test finding organization by email domain."""
         # Mock client
@@ -198,7 +198,7 @@ class EmailIngestionServiceTest(TestCase):
         self.assertIsNone(org)
     
     @patch('core.services.graph.email_ingestion_service.get_client')
-    @patch('core.services.graph.email_ingestion_service.AgentService')
+    @patch('core.services.graph.email_ingestion_service.get_agent_service')
     def test_classify_email(self, mock_agent_service, mock_get_client):
         """Test email classification."""
         # Mock client
@@ -225,7 +225,7 @@ class EmailIngestionServiceTest(TestCase):
         self.assertEqual(item_type, self.bug_type)
     
     @patch('core.services.graph.email_ingestion_service.get_client')
-    @patch('core.services.graph.email_ingestion_service.AgentService')
+    @patch('core.services.graph.email_ingestion_service.get_agent_service')
     def test_classify_email_fallback_project(self, mock_agent_service, mock_get_client):
         """Test email classification with fallback to Incoming project."""
         # Mock client
@@ -252,7 +252,7 @@ class EmailIngestionServiceTest(TestCase):
         self.assertEqual(item_type, self.task_type)
     
     @patch('core.services.graph.email_ingestion_service.get_client')
-    @patch('core.services.graph.email_ingestion_service.AgentService')
+    @patch('core.services.graph.email_ingestion_service.get_agent_service')
     def test_classify_email_invalid_type(self, mock_agent_service, mock_get_client):
         """Test email classification with invalid type defaults to task."""
         # Mock client
@@ -278,7 +278,7 @@ class EmailIngestionServiceTest(TestCase):
         self.assertEqual(item_type, self.task_type)
     
     @patch('core.services.graph.email_ingestion_service.get_client')
-    @patch('core.services.graph.email_ingestion_service.AgentService')
+    @patch('core.services.graph.email_ingestion_service.get_agent_service')
     def test_convert_html_to_markdown(self, mock_agent_service, mock_get_client):
         """Test HTML to Markdown conversion."""
         # Mock client
@@ -297,7 +297,7 @@ class EmailIngestionServiceTest(TestCase):
         self.assertEqual(markdown, "# Heading\n\nParagraph")
     
     @patch('core.services.graph.email_ingestion_service.get_client')
-    @patch('core.services.graph.email_ingestion_service.AgentService')
+    @patch('core.services.graph.email_ingestion_service.get_agent_service')
     def test_process_message_creates_item(self, mock_agent_service, mock_get_client):
         """Test processing a message creates an item."""
         # Mock client
@@ -470,7 +470,7 @@ class EmailReplyHandlingTestCase(TestCase):
         self.assertEqual(issue_id, 111)
     
     @patch('core.services.graph.email_ingestion_service.get_client')
-    @patch('core.services.graph.email_ingestion_service.AgentService')
+    @patch('core.services.graph.email_ingestion_service.get_agent_service')
     def test_add_email_as_comment(self, mock_agent_service, mock_get_client):
         """Test adding email as comment to existing item."""
         # Mock client
@@ -516,7 +516,7 @@ class EmailReplyHandlingTestCase(TestCase):
         self.assertIsNotNone(comment.author)
     
     @patch('core.services.graph.email_ingestion_service.get_client')
-    @patch('core.services.graph.email_ingestion_service.AgentService')
+    @patch('core.services.graph.email_ingestion_service.get_agent_service')
     def test_process_message_reply_creates_comment(self, mock_agent_service, mock_get_client):
         """Test that processing a reply email creates a comment instead of new item."""
         # Mock client
@@ -564,7 +564,7 @@ class EmailReplyHandlingTestCase(TestCase):
         self.assertEqual(comment.external_from, "reply@example.com")
     
     @patch('core.services.graph.email_ingestion_service.get_client')
-    @patch('core.services.graph.email_ingestion_service.AgentService')
+    @patch('core.services.graph.email_ingestion_service.get_agent_service')
     def test_process_message_invalid_issue_id_creates_new_item(self, mock_agent_service, mock_get_client):
         """Test that invalid issue ID falls back to creating new item."""
         # Mock client
@@ -611,7 +611,7 @@ class EmailReplyHandlingTestCase(TestCase):
         self.assertEqual(comments.count(), 0)
     
     @patch('core.services.graph.email_ingestion_service.get_client')
-    @patch('core.services.graph.email_ingestion_service.AgentService')
+    @patch('core.services.graph.email_ingestion_service.get_agent_service')
     def test_user_input_stored_with_html_body(self, mock_agent_service, mock_get_client):
         """Test that user_input field is populated with original HTML body."""
         # Mock client
@@ -656,7 +656,7 @@ class EmailReplyHandlingTestCase(TestCase):
         self.assertEqual(item.description, "Converted markdown")
     
     @patch('core.services.graph.email_ingestion_service.get_client')
-    @patch('core.services.graph.email_ingestion_service.AgentService')
+    @patch('core.services.graph.email_ingestion_service.get_agent_service')
     def test_user_input_stored_with_text_body(self, mock_agent_service, mock_get_client):
         """Test that user_input field is populated with text body when no HTML."""
         # Mock client
@@ -701,7 +701,7 @@ class EmailReplyHandlingTestCase(TestCase):
         self.assertEqual(item.description, text_body)
     
     @patch('core.services.graph.email_ingestion_service.get_client')
-    @patch('core.services.graph.email_ingestion_service.AgentService')
+    @patch('core.services.graph.email_ingestion_service.get_agent_service')
     def test_user_input_not_modified_on_followup(self, mock_agent_service, mock_get_client):
         """Test that user_input is not modified when processing follow-up emails."""
         # Use the user created in setUp
@@ -815,7 +815,7 @@ class EmailAttachmentProcessingTest(TestCase):
         )
     
     @patch('core.services.graph.email_ingestion_service.get_client')
-    @patch('core.services.graph.email_ingestion_service.AgentService')
+    @patch('core.services.graph.email_ingestion_service.get_agent_service')
     def test_process_message_with_pdf_attachment(self, mock_agent_service, mock_get_client):
         """Test processing email with PDF attachment."""
         import base64
@@ -902,7 +902,7 @@ class EmailAttachmentProcessingTest(TestCase):
         self.assertEqual(content, pdf_content)
     
     @patch('core.services.graph.email_ingestion_service.get_client')
-    @patch('core.services.graph.email_ingestion_service.AgentService')
+    @patch('core.services.graph.email_ingestion_service.get_agent_service')
     def test_process_message_with_inline_image(self, mock_agent_service, mock_get_client):
         """Test processing email with inline image and CID rewrite."""
         import base64
@@ -988,7 +988,7 @@ class EmailAttachmentProcessingTest(TestCase):
         self.assertNotIn('cid:', comment.body)
     
     @patch('core.services.graph.email_ingestion_service.get_client')
-    @patch('core.services.graph.email_ingestion_service.AgentService')
+    @patch('core.services.graph.email_ingestion_service.get_agent_service')
     def test_process_message_with_mixed_attachments(self, mock_agent_service, mock_get_client):
         """Test processing email with both inline and regular attachments."""
         import base64
@@ -1079,7 +1079,7 @@ class EmailAttachmentProcessingTest(TestCase):
         self.assertIn(f'/items/attachments/{img_att.id}/view/', comment.body_original_html)
     
     @patch('core.services.graph.email_ingestion_service.get_client')
-    @patch('core.services.graph.email_ingestion_service.AgentService')
+    @patch('core.services.graph.email_ingestion_service.get_agent_service')
     def test_process_message_with_inline_image_without_inline_flag(self, mock_agent_service, mock_get_client):
         """Test processing email with inline image that doesn't have isInline flag set.
         
@@ -10,6 +10,7 @@ from core.models import (
     Organisation, AIProvider, AIModel, Activity
 )
 from core.services.rag.models import RAGContext, RAGContextObject
+from core.services.rag.extended_service import ExtendedRAGContext
 
 
 class ItemOptimizeDescriptionAITestCase(TestCase):
@@ -308,3 +309,48 @@ This is an optimized description with better structure.
         
         # Should return 404
         self.assertEqual(response.status_code, 404)
+    
+    @patch('core.services.agents.agent_service.AgentService.execute_agent_stream')
+    @patch('core.services.rag.build_extended_context')
+    def test_optimize_description_stream(self, mock_build_context, mock_execute_agent_stream):
+        """Test that the streaming endpoint applies the streamed JSON response"""
+        mock_build_context.return_value = ExtendedRAGContext(
+            query='test', optimized_query=None, layer_a=[], layer_b=[], layer_c=[],
+            all_items=[], summary='', stats={}
+        )
+        mock_execute_agent_stream.return_value = iter([
+            '{"issue": {"description": "Streamed ',
+            'description"}, "open_questions": ["Which browser?"]}',
+        ])
+        
+        self.client.login(username='agent_user', password='testpass123')
+        url = reverse('item-optimize-description-ai-stream', kwargs={'item_id': self.item.id})
+        response = self.client.post(url)
+        
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        body = b''.join(response.streaming_content).decode()
+        self.assertIn('event: delta', body)
+        self.assertIn('event: done\ndata: {"status": "ok", "questions_added": 1}', body)
+        
+        self.item.refresh_from_db()
+        self.assertEqual(self.item.description, 'Streamed description')
+    
+    @patch('core.services.agents.agent_service.AgentService.execute_agent_stream')
+    @patch('core.services.rag.build_extended_context')
+    def test_optimize_description_stream_truncated_json(self, mock_build_context, mock_execute_agent_stream):
+        """Test that a truncated streamed response leaves the description unchanged"""
+        mock_build_context.return_value = ExtendedRAGContext(
+            query='test', optimized_query=None, layer_a=[], layer_b=[], layer_c=[],
+            all_items=[], summary='', stats={}
+        )
+        mock_execute_agent_stream.return_value = iter(['{"issue": {"description": "Cut o'])
+        initial_description = self.item.description
+        
+        self.client.login(username='agent_user', password='testpass123')
+        url = reverse('item-optimize-description-ai-stream', kwargs={'item_id': self.item.id})
+        body = b''.join(self.client.post(url).streaming_content).decode()
+        
+        self.assertIn('event: error', body)
+        self.assertNotIn('event: done', body)
+        self.item.refresh_from_db()
+        self.assertEqual(self.item.description, initial_description)
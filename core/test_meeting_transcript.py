@@ -132,7 +132,7 @@ class MeetingTranscriptUploadTest(TestCase):
         self.assertFalse(data['success'])
         self.assertIn('.docx', data['error'])
     
-    @patch('core.views.AgentService')
+    @patch('core.views.get_agent_service')
     @patch('core.views.AttachmentStorageService')
     @patch('docx.Document')
     def test_upload_transcript_success(self, mock_document, mock_storage_service, mock_agent_service):
@@ -216,7 +216,7 @@ class MeetingTranscriptUploadTest(TestCase):
         self.assertIsNotNone(task2)
         self.assertEqual(task2.description, 'Create presentation for next stakeholder meeting')
     
-    @patch('core.views.AgentService')
+    @patch('core.views.get_agent_service')
     @patch('core.views.AttachmentStorageService')
     @patch('docx.Document')
     def test_upload_transcript_empty_tasks(self, mock_document, mock_storage_service, mock_agent_service):
@@ -273,7 +273,7 @@ class MeetingTranscriptUploadTest(TestCase):
         child_tasks = Item.objects.filter(parent=self.meeting_item)
         self.assertEqual(child_tasks.count(), 0)
     
-    @patch('core.views.AgentService')
+    @patch('core.views.get_agent_service')
     @patch('core.views.AttachmentStorageService')
     @patch('docx.Document')
     def test_upload_transcript_invalid_agent_response(self, mock_document, mock_storage_service, mock_agent_service):
@@ -357,7 +357,7 @@ class MeetingTranscriptUploadTest(TestCase):
         """Test that files within the 50 MB limit are accepted."""
         # This test would pass through to the agent service mocking
         # We're primarily testing that the 50 MB limit is configured correctly
-        with patch('core.views.AgentService') as mock_agent_service, \
+        with patch('core.views.get_agent_service') as mock_agent_service, \
              patch('core.views.AttachmentStorageService') as mock_storage_service, \
              patch('docx.Document') as mock_document:
             
@@ -954,7 +954,7 @@ class ItemAnswerQuestionAITest(TestCase):
         
         self.client = Client()
     
-    @patch('core.views.AgentService')
+    @patch('core.views.get_agent_service')
     @patch('core.views.build_context')
     def test_answer_question_with_ai_success(self, mock_build_context, mock_agent_service):
         """Test successfully answering a question with AI"""
@@ -1056,7 +1056,7 @@ class ItemAnswerQuestionAITest(TestCase):
         
         self.assertEqual(response.status_code, 404)
     
-    @patch('core.views.AgentService')
+    @patch('core.views.get_agent_service')
     @patch('core.views.build_context')
     def test_answer_question_ai_handles_agent_error(self, mock_build_context, mock_agent_service):
         """Test handling of agent execution errors"""
@@ -1086,7 +1086,7 @@ class ItemAnswerQuestionAITest(TestCase):
         self.assertEqual(self.question.status, OpenQuestionStatus.OPEN)
         self.assertIsNone(self.question.answer_text)
     
-    @patch('core.views.AgentService')
+    @patch('core.views.get_agent_service')
     @patch('core.views.build_context')
     def test_answer_question_ai_empty_response(self, mock_build_context, mock_agent_service):
         """Test handling of empty AI response"""
@@ -1111,7 +1111,7 @@ class ItemAnswerQuestionAITest(TestCase):
         self.assertEqual(data['status'], 'error')
         self.assertIn('empty answer', data['message'])
     
-    @patch('core.views.AgentService')
+    @patch('core.views.get_agent_service')
     @patch('core.views.build_context')
     def test_answer_question_ai_syncs_to_description(self, mock_build_context, mock_agent_service):
         """Test that answering updates the item description"""
@@ -1140,7 +1140,7 @@ class ItemAnswerQuestionAITest(TestCase):
         self.assertIn('[x]', self.item.description)
         self.assertIn('Answer point 1', self.item.description)
     
-    @patch('core.views.AgentService')
+    @patch('core.views.get_agent_service')
     @patch('core.views.build_context')
     def test_answer_question_ai_with_no_rag_context(self, mock_build_context, mock_agent_service):
         """Test answering when no RAG context is available"""
@@ -0,0 +1,98 @@
+"""
+Tests for the typeahead endpoints behind the item detail pickers.
+"""
+
+from django.test import TestCase
+from django.urls import reverse
+
+from core.models import Item, ItemStatus, ItemType, Organisation, Project, User
+
+
+class TypeaheadTestCase(TestCase):
+    """Test user_search, organisation_search and item_search."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='alice', email='alice@example.com', password='pass', name='Alice Adams',
+        )
+        User.objects.create_user(username='bob', email='bob@example.com', password='pass', name='Bob Alison')
+        self.project = Project.objects.create(name='Typeahead Project')
+        self.item_type = ItemType.objects.create(key='task', name='Task')
+        self.client.force_login(self.user)
+
+    def _item(self, title, status=ItemStatus.INBOX):
+        return Item.objects.create(project=self.project, title=title, type=self.item_type, status=status)
+
+    def test_user_search_json_matches_substring(self):
+        # The @mention picker finds users by surname
+        response = self.client.get(reverse('user-search'), {'q': 'ali'})
+
+        self.assertEqual([row['username'] for row in response.json()['results']], ['alice', 'bob'])
+
+    def test_user_search_htmx_matches_prefix(self):
+        bob = User.objects.get(username='bob')
+
+        response = self.client.get(reverse('user-search'), {'q': 'ali'}, HTTP_HX_REQUEST='true')
+
+        content = response.content.decode()
+        self.assertIn(f'value="{self.user.id}"', content)
+        self.assertNotIn(f'value="{bob.id}"', content)
+
+    def test_user_search_htmx_keeps_selected_value_first(self):
+        bob = User.objects.get(username='bob')
+
+        response = self.client.get(
+            reverse('user-search'), {'q': 'ali', 'value': bob.id, 'blank': '—'}, HTTP_HX_REQUEST='true',
+        )
+
+        content = response.content.decode()
+        self.assertIn('<option value="">—</option>', content)
+        self.assertLess(content.index(f'value="{bob.id}"'), content.index(f'value="{self.user.id}"'))
+        self.assertIn(f'<option value="{bob.id}" data-name="Bob Alison" selected>', content)
+
+    def test_organisation_search(self):
+        Organisation.objects.create(name='Acme Corp', short='ACME')
+        Organisation.objects.create(name='Globex', short='GLX')
+
+        response = self.client.get(reverse('organisation-search'), {'q': 'glx'})
+
+        self.assertEqual([row['name'] for row in response.json()['results']], ['Globex'])
+
+    def test_item_search_excludes_closed_items_and_self(self):
+        item = self._item('Parent candidate A')
+        other = self._item('Parent candidate B')
+        self._item('Parent candidate C', status=ItemStatus.CLOSED)
+
+        response = self.client.get(reverse('item-search'), {'q': 'parent', 'exclude': item.id})
+
+        self.assertEqual([row['id'] for row in response.json()['results']], [other.id])
+
+    def test_item_search_matches_id(self):
+        item = self._item('Something else')
+
+        response = self.client.get(reverse('item-search'), {'q': f'#{item.id}'})
+
+        self.assertEqual([row['id'] for row in response.json()['results']], [item.id])
+
+    def test_item_search_is_limited(self):
+        for i in range(25):
+            self._item(f'Bulk {i:02d}')
+
+        response = self.client.get(reverse('item-search'), {'q': 'bulk'})
+
+        self.assertEqual(len(response.json()['results']), 20)
+
+    def test_item_detail_renders_only_current_values(self):
+        parent = self._item('Current parent')
+        self._item('Unrelated item')
+        item = Item.objects.create(
+            project=self.project, title='Child', type=self.item_type, parent=parent, requester=self.user,
+        )
+
+        response = self.client.get(reverse('item-detail', args=[item.id]))
+
+        self.assertNotIn('users', response.context)
+        self.assertNotIn('parent_items', response.context)
+        self.assertContains(response, f'<option value="{parent.id}" selected>Current parent (#{parent.id})</option>')
+        self.assertNotContains(response, 'Unrelated item')
+        self.assertNotContains(response, 'bob@example.com')
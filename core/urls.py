@@ -64,6 +64,7 @@ urlpatterns = [
     path('items/github/open/', views.items_github_open, name='items-github-open'),
     path('items/new/', views.item_create, name='item-create'),
     path('items/lookup/<int:item_id>/', views.item_lookup, name='item-lookup'),
+    path('items/search/', views.item_search, name='item-search'),
     path('items/<int:item_id>/', views.item_detail, name='item-detail'),
     path('items/<int:item_id>/status/', views.item_status, name='item-status'),
     path('items/<int:item_id>/edit/', views.item_edit, name='item-edit'),
@@ -103,7 +104,9 @@ urlpatterns = [
     path('items/<int:item_id>/link-github/', views.item_link_github, name='item-link-github'),
     path('items/<int:item_id>/create-github-issue/', views.item_create_github_issue, name='item-create-github-issue'),
     path('items/<int:item_id>/ai/optimize-description/', views.item_optimize_description_ai, name='item-optimize-description-ai'),
+    path('items/<int:item_id>/ai/optimize-description/stream/', views.item_optimize_description_ai_stream, name='item-optimize-description-ai-stream'),
     path('items/<int:item_id>/ai/generate-solution/', views.item_generate_solution_ai, name='item-generate-solution-ai'),
+    path('items/<int:item_id>/ai/generate-solution/stream/', views.item_generate_solution_ai_stream, name='item-generate-solution-ai-stream'),
     path('items/<int:item_id>/ai/generate-short-description/', views.item_generate_short_description_ai, name='item-generate-short-description-ai'),
     path('items/<int:item_id>/ai/pre-review/', views.item_pre_review, name='item-pre-review'),
     path('items/<int:item_id>/ai/save-pre-review/', views.item_save_pre_review, name='item-save-pre-review'),
@@ -155,6 +158,7 @@ urlpatterns = [
     path('changes/<int:id>/ai/polish-risk-description/', views.change_polish_risk_description, name='change-polish-risk-description'),
     path('changes/<int:id>/ai/optimize-mitigation/', views.change_optimize_mitigation, name='change-optimize-mitigation'),
     path('changes/<int:id>/ai/optimize-rollback/', views.change_optimize_rollback, name='change-optimize-rollback'),
+    path('changes/<int:id>/ai/improve-texts/', views.change_improve_texts_ai, name='change-improve-texts-ai'),
     path('changes/<int:id>/ai/assess-risk/', views.change_assess_risk, name='change-assess-risk'),
     path('changes/<int:change_id>/upload-attachment/', views.change_upload_attachment, name='change-upload-attachment'),
     path('changes/<int:change_id>/tabs/attachments/', views.change_attachments_tab, name='change-attachments-tab'),
@@ -164,6 +168,7 @@ urlpatterns = [
     # Organisation URLs
     path('organisations/', views.organisations, name='organisations'),
     path('organisations/new/', views.organisation_create, name='organisation-create'),
+    path('organisations/search/', views.organisation_search, name='organisation-search'),
     path('organisations/<int:id>/', views.organisation_detail, name='organisation-detail'),
     path('organisations/<int:id>/edit/', views.organisation_edit, name='organisation-edit'),
     path('organisations/<int:id>/update/', views.organisation_update, name='organisation-update'),
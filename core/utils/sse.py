@@ -0,0 +1,61 @@
+"""
+Server-Sent Events helpers.
+
+Streaming AI endpoints answer with ``text/event-stream`` and emit named
+events whose data is JSON:
+
+- ``meta``: context known before generation starts (e.g. RAG sources)
+- ``delta``: ``{"text": "..."}`` - next piece of the generated answer
+- ``done``: final result after the answer was processed and saved
+- ``error``: ``{"message": "..."}`` - generation failed, nothing was saved
+"""
+
+import json
+import logging
+from typing import Any, Iterable, Iterator
+
+from django.http import StreamingHttpResponse
+
+logger = logging.getLogger(__name__)
+
+
+def sse_event(event: str, data: Any) -> str:
+    """
+    Format one Server-Sent Event.
+
+    Args:
+        event: Event name
+        data: JSON-serializable payload
+
+    Returns:
+        Event text terminated by a blank line
+    """
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+def _with_error_event(events: Iterable[str]) -> Iterator[str]:
+    """Turn an exception inside the stream into a final ``error`` event."""
+    try:
+        yield from events
+    except Exception as e:
+        logger.error(f"Event stream failed: {e}", exc_info=True)
+        yield sse_event('error', {'message': str(e)})
+
+
+def sse_response(events: Iterable[str]) -> StreamingHttpResponse:
+    """
+    Wrap formatted events in a streaming response.
+
+    Proxy buffering (nginx) and caching are disabled, so every event reaches
+    the browser as soon as it is produced.
+
+    Args:
+        events: Iterable of strings produced by sse_event()
+
+    Returns:
+        StreamingHttpResponse with content type text/event-stream
+    """
+    response = StreamingHttpResponse(_with_error_event(events), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
@@ -33,19 +33,22 @@ from .models import (
     ExternalIssueMapping, ExternalIssueKind, Change, ChangeStatus, ChangeApproval, ApprovalStatus, RiskLevel, ReleaseType,
     MailTemplate, MailActionMapping, IssueOpenQuestion, IssueStandardAnswer, OpenQuestionStatus, OpenQuestionSource,
     GlobalSettings, SystemSetting, ChangePolicy, ChangePolicyRole,
-    ClaudeQueueJob, ClaudeQueueJobKind, ClaudeQueueJobStatus, ClaudeQueueJobModel,
-    ClaudeQueueJobAuthMode, MCP_TOKEN_ROTATION_DAYS)
+    ClaudeQueueJob, ClaudeQueueJobStatus, ClaudeQueueJobModel,
+    ClaudeQueueJobAuthMode, MCP_TOKEN_ROTATION_DAYS,
+    AnalyticsRollupKind, AIJobDailyRollup, ClaudeQueueDailyRollup, ItemDailyRollup)
 
 
 from .services.workflow import ItemWorkflowGuard
 from .services.activity import ActivityService
-from .services.storage import AttachmentStorageService
+from .services.storage import AttachmentStorageService, attachment_response
 from .services.storage.errors import AttachmentTooLarge
-from .services.agents import AgentService
+from .services.agents import AgentCall, get_agent_service
+from .utils.sse import sse_event, sse_response
 from .services.claude_queue.model_classifier import ModelClassifierService
 from .services.mail import check_mail_trigger, prepare_mail_preview
 from .services.comments.mentions import extract_mentioned_user_ids
 from .services.change_policy_service import ChangePolicyService
+from .services.search import search_items
 from .backends.azuread import AzureADAuth, AzureADAuthError
 
 # Configure logging
@@ -413,11 +416,9 @@ def project_items_tab(request, id):
         except (ValueError, TypeError):
             pass
     
-    # Apply search filter (title and description)
+    # Apply search filter (title, short description and description)
     if search_query:
-        items = items.filter(
-            Q(title__icontains=search_query) | Q(description__icontains=search_query)
-        )
+        items = search_items(items, search_query)
     
     # Apply status filter - simplified to closed vs not closed
     if status_filter_type == 'closed':
@@ -770,48 +771,49 @@ def _claude_queue_dashboard_context():
 
     Kept separate from the filtered list query below: the dashboard reflects
     overall queue health regardless of the project/status filter applied to
-    the table beneath it.
+    the table beneath it. Read from the daily ClaudeQueueDailyRollup rows
+    (see core.services.analytics), not from the jobs themselves — this
+    fragment polls every few seconds.
     """
     from datetime import timedelta
-
-    all_jobs = ClaudeQueueJob.objects.all()
-    total_jobs = all_jobs.count()
-
-    # Duration has no persisted field or existing helper anywhere in the
-    # project (checked models.py/admin.py/templates) — derived here from
+    from core.services.analytics import DASHBOARD_MAX_DIRTY_DAYS, combine_percentiles, refresh_dirty_days
+
+    refresh_dirty_days(AnalyticsRollupKind.CLAUDE_QUEUE, max_days=DASHBOARD_MAX_DIRTY_DAYS)
+    rollups = ClaudeQueueDailyRollup.objects.all()
+
+    totals = rollups.aggregate(
+        jobs=models.Sum('jobs'),
+        cost=models.Sum('total_cost'),
+        cost_jobs=models.Sum('cost_jobs'),
+        turns=models.Sum('turns_total'),
+        turns_jobs=models.Sum('turns_jobs'),
+        duration=models.Sum('duration_total_seconds'),
+        duration_jobs=models.Sum('duration_jobs'),
+    )
+    total_jobs = totals['jobs'] or 0
+    # Duration has no persisted field — the rollup derives it from
     # started_at/finished_at, the same pair is_long_running already uses.
-    duration_avg = all_jobs.filter(
-        started_at__isnull=False, finished_at__isnull=False,
-    ).annotate(
-        duration=models.ExpressionWrapper(
-            models.F('finished_at') - models.F('started_at'),
-            output_field=models.DurationField(),
-        )
-    ).aggregate(avg=models.Avg('duration'))['avg']
-    avg_duration_seconds = duration_avg.total_seconds() if duration_avg else None
+    avg_duration_seconds = totals['duration'] / totals['duration_jobs'] if totals['duration_jobs'] else None
+    avg_cost = totals['cost'] / totals['cost_jobs'] if totals['cost_jobs'] else None
+    avg_turns = totals['turns'] / totals['turns_jobs'] if totals['turns_jobs'] else None
 
-    avg_cost = all_jobs.filter(total_cost_usd__isnull=False).aggregate(
-        avg=models.Avg('total_cost_usd')
-    )['avg']
-    avg_turns = all_jobs.filter(num_turns__isnull=False).aggregate(
-        avg=models.Avg('num_turns')
-    )['avg']
+    durations = list(rollups.filter(duration_jobs__gt=0).values_list(
+        'duration_p50_seconds', 'duration_p90_seconds', 'duration_jobs',
+    ))
+    p50_duration_seconds = combine_percentiles((p50, n) for p50, _p90, n in durations)
+    p90_duration_seconds = combine_percentiles((p90, n) for _p50, p90, n in durations)
 
     # 7 calendar days incl. today, grouped on created_at using the project's
     # established local-date convention (see ai_job_statistics()).
-    from django.db.models.functions import TruncDate
-
     today = timezone.localdate()
     start_of_7d = today - timedelta(days=6)
-    start_of_7d_dt = timezone.make_aware(datetime.combine(start_of_7d, time.min))
 
     by_day_qs = (
-        all_jobs.filter(created_at__gte=start_of_7d_dt)
-        .annotate(day=TruncDate('created_at'))
-        .values('day')
-        .annotate(count=models.Count('id'), total_cost=models.Sum('total_cost_usd'))
+        rollups.filter(date__gte=start_of_7d)
+        .values('date')
+        .annotate(count=models.Sum('jobs'), total_cost=models.Sum('total_cost'))
     )
-    by_day = {item['day']: item for item in by_day_qs}
+    by_day = {item['date']: item for item in by_day_qs}
 
     date_labels = []
     jobs_series = []
@@ -826,6 +828,8 @@ def _claude_queue_dashboard_context():
     return {
         'queue_total_jobs': total_jobs,
         'queue_avg_duration_display': _format_duration_seconds(avg_duration_seconds),
+        'queue_p50_duration_display': _format_duration_seconds(p50_duration_seconds),
+        'queue_p90_duration_display': _format_duration_seconds(p90_duration_seconds),
         'queue_avg_cost': avg_cost,
         'queue_avg_turns': avg_turns,
         'queue_chart_json': json.dumps({
@@ -1028,6 +1032,50 @@ def item_lookup(request, item_id):
             'error': 'Es existiert kein Issue mit dieser ID.',
         }, status=404)
 
+def _item_option(item):
+    return {'id': item.id, 'label': item.title, 'detail': f'#{item.id}'}
+
+
+@login_required
+def item_search(request):
+    """
+    Typeahead endpoint for the parent item picker.
+
+    GET /items/search/?q=<query>&exclude=<item id> returns up to
+    TYPEAHEAD_LIMIT non-closed items from all projects (#352) whose title
+    starts with the query, or the item with that ID for ``123``/``#123``.
+    ``exclude`` drops the item being edited. Scripts get JSON; HTMX pickers
+    get ``<option>`` elements.
+    """
+    query = request.GET.get('q', '').strip()
+    items = Item.objects.exclude(status=ItemStatus.CLOSED).select_related('project')
+    try:
+        items = items.exclude(id=int(request.GET.get('exclude', '')))
+    except ValueError:
+        pass
+    if query:
+        match = Q(title__istartswith=query)
+        if query.lstrip('#').isdigit():
+            match |= Q(id=int(query.lstrip('#')))
+        items = items.filter(match)
+    items = items.order_by('title')[:TYPEAHEAD_LIMIT]
+
+    if request.headers.get('HX-Request'):
+        selected = Item.objects.filter(pk=_typeahead_selected_id(request)).first()
+        return _typeahead_options(
+            request,
+            [_item_option(item) for item in items],
+            _item_option(selected) if selected else None,
+        )
+
+    return JsonResponse({
+        'results': [
+            {'id': item.id, 'title': item.title, 'project': item.project.name}
+            for item in items
+        ]
+    })
+
+
 @login_required
 def item_status(request, item_id):
     """
@@ -1068,9 +1116,9 @@ def item_detail(request, item_id):
     # Get followers for this item
     followers = item.get_followers()
     
-    # Get all users for the follower selection dropdown
-    users = User.objects.all().order_by('name')
-    
+    # User, parent item and organisation pickers load their options on
+    # demand (user_search, item_search, organisation_search).
+
     # Get agents for responsible field
     agents = User.objects.filter(role=UserRole.AGENT).order_by('name')
     
@@ -1084,14 +1132,6 @@ def item_detail(request, item_id):
         status=ReleaseStatus.CLOSED
     ).order_by('-version')
     
-    # Get parent items for the inline edit (exclude closed and self)
-    # Filter as per issue #352 - allow items from all projects, status != closed
-    parent_items = Item.objects.exclude(
-        status=ItemStatus.CLOSED
-    ).exclude(
-        id=item.id
-    ).order_by('title')
-    
     # Get requester's primary organisation short code
     requester_org_short = None
     if item.requester:
@@ -1104,9 +1144,6 @@ def item_detail(request, item_id):
         except UserOrganisation.DoesNotExist:
             requester_org_short = None
     
-    # Get all organisations for quick-create user modal / inline organisation edit
-    organisations = Organisation.objects.all().order_by('name')
-
     # Get active item types for inline type edit
     item_types = ItemType.objects.filter(is_active=True).order_by('name')
 
@@ -1135,13 +1172,10 @@ def item_detail(request, item_id):
         'external_mappings': external_mappings,
         'has_closed_github_issue': has_closed_github_issue,
         'followers': followers,
-        'users': users,
         'agents': agents,
         'projects': projects,
         'releases': releases,
-        'parent_items': parent_items,
         'requester_org_short': requester_org_short,
-        'organisations': organisations,
         'item_types': item_types,
         'active_tab': active_tab,
         'available_statuses': ItemStatus.choices,
@@ -2204,6 +2238,164 @@ def _sync_answered_questions_to_description(item):
     item.save(update_fields=['description'])
 
 
+def _build_optimize_description_input(item, request):
+    """
+    Build the github-issue-creation-agent input: description plus RAG context.
+    """
+    from core.services.rag import build_extended_context
+
+    current_description = item.description or ""
+
+    # Build extended RAG context with question optimization
+    rag_context = build_extended_context(
+        query=current_description,
+        project_id=str(item.project.id),
+        item_id=str(item.id),
+        current_item_id=str(item.id),  # Exclude current item from results (Issue #392)
+        user=request.user,
+        client_ip=request.META.get('REMOTE_ADDR')
+    )
+    
+    # Build input text for agent: description + RAG context
+    context_text = rag_context.to_context_text() if rag_context.all_items else "No additional context found."
+    
+    agent_input = f"""Original Description:
+{current_description}
+
+---
+Context from similar items and related information:
+{context_text}
+"""
+
+    return agent_input
+
+
+def _apply_optimized_description(item, agent_response, user):
+    """
+    Parse the github-issue-creation-agent response and save it to the item.
+
+    Updates the description, adds new open questions and logs the activity.
+
+    Returns:
+        Number of open questions added
+
+    Raises:
+        AIResponseFormatError: If the response is empty or truncated JSON
+    """
+    from core.services.exceptions import AIResponseFormatError
+
+    # Parse the response - expect JSON format:
+    # {"issue": {"description": "..."}, "open_questions": [...]}
+    
+    # Clean the response: remove markdown code fences if present
+    cleaned_response = agent_response.strip()
+    
+    # Remove ```json or ``` code fences
+    if cleaned_response.startswith('```'):
+        # Find the end of the first line (```json or just ```)
+        first_newline = cleaned_response.find('\n')
+        if first_newline != -1:
+            # Multi-line: remove first line
+            cleaned_response = cleaned_response[first_newline + 1:]
+        else:
+            # Single line like ```json{...}``` - remove opening fence
+            cleaned_response = cleaned_response[3:]  # Remove ```
+            # Also strip any language identifier (json, etc)
+            if cleaned_response and cleaned_response[0] not in ('{', '['):
+                # Find where JSON actually starts
+                for i, char in enumerate(cleaned_response):
+                    if char in ('{', '['):
+                        cleaned_response = cleaned_response[i:]
+                        break
+        
+        # Remove trailing ```
+        if cleaned_response.endswith('```'):
+            cleaned_response = cleaned_response[:-3]
+        
+        cleaned_response = cleaned_response.strip()
+    
+    try:
+        # Try to parse as JSON
+        response_data = json.loads(cleaned_response)
+        
+        if isinstance(response_data, dict) and 'issue' in response_data and isinstance(response_data['issue'], dict):
+            # Expected format: nested issue object with description
+            optimized_description = response_data['issue'].get('description', '').strip()
+            open_questions = response_data.get('open_questions', [])
+        elif isinstance(response_data, dict) and 'description' in response_data:
+            # Fallback format: direct description field (for backward compatibility)
+            optimized_description = response_data.get('description', '').strip()
+            open_questions = response_data.get('open_questions', [])
+        else:
+            # No recognized JSON format
+            # Save cleaned response (code fences removed) as fallback
+            # This preserves agent output even if format is unexpected
+            optimized_description = cleaned_response
+            open_questions = []
+    except json.JSONDecodeError:
+        if cleaned_response.startswith('{') or cleaned_response.startswith('['):
+            # Response was clearly meant to be JSON (e.g. an object literal)
+            # but failed to parse - most likely truncated because the
+            # provider's output token limit was hit. Surface this as an
+            # error instead of silently writing the broken JSON/partial
+            # JSON into the description field.
+            raise AIResponseFormatError(
+                "AI agent returned malformed JSON (response may have been "
+                "truncated by the provider's output token limit)"
+            )
+        # Not JSON at all - treat as a plain-text response (backward
+        # compatibility with agents that don't return the JSON envelope)
+        optimized_description = cleaned_response
+        open_questions = []
+
+    # Validate we have a description
+    if not optimized_description:
+        raise AIResponseFormatError("AI agent returned empty description")
+    
+    # Update item description (only the issue.description part)
+    item.description = optimized_description
+    item.save()
+    
+    # Process open questions
+    questions_added = 0
+    if open_questions and isinstance(open_questions, list):
+        for question_text in open_questions:
+            if not question_text or not isinstance(question_text, str):
+                continue
+            
+            question_text = question_text.strip()
+            if not question_text:
+                continue
+            
+            # Check if an open question with identical text already exists
+            existing = IssueOpenQuestion.objects.filter(
+                issue=item,
+                question=question_text,
+                status=OpenQuestionStatus.OPEN
+            ).exists()
+            
+            if not existing:
+                # Create new open question
+                IssueOpenQuestion.objects.create(
+                    issue=item,
+                    question=question_text,
+                    source=OpenQuestionSource.AI_AGENT,
+                    sort_order=questions_added
+                )
+                questions_added += 1
+    
+    # Log activity - success
+    activity_service = ActivityService()
+    activity_service.log(
+        verb='item.description.ai_optimized',
+        target=item,
+        actor=user,
+        summary='Item description optimized via AI (RAG + GitHub agent)',
+    )
+
+    return questions_added
+
+
 @login_required
 
 @require_POST
@@ -2216,7 +2408,6 @@ def item_optimize_description_ai(request, item_id):
 
     Only available to users with Agent role.
     """
-    from core.services.rag import build_extended_context
     from core.services.exceptions import AIResponseFormatError
 
     # Check user role
@@ -2238,29 +2429,10 @@ def item_optimize_description_ai(request, item_id):
                 'message': 'Item has no description to optimize'
             }, status=400)
         
-        # Build extended RAG context with question optimization
-        rag_context = build_extended_context(
-            query=current_description,
-            project_id=str(item.project.id),
-            item_id=str(item.id),
-            current_item_id=str(item.id),  # Exclude current item from results (Issue #392)
-            user=request.user,
-            client_ip=request.META.get('REMOTE_ADDR')
-        )
-        
-        # Build input text for agent: description + RAG context
-        context_text = rag_context.to_context_text() if rag_context.all_items else "No additional context found."
-        
-        agent_input = f"""Original Description:
-{current_description}
-
----
-Context from similar items and related information:
-{context_text}
-"""
+        agent_input = _build_optimize_description_input(item, request)
         
         # Execute the github-issue-creation-agent
-        agent_service = AgentService()
+        agent_service = get_agent_service()
         agent_response = agent_service.execute_agent(
             filename='github-issue-creation-agent.yml',
             input_text=agent_input,
@@ -2268,114 +2440,7 @@ Context from similar items and related information:
             client_ip=request.META.get('REMOTE_ADDR')
         )
         
-        # Parse the response - expect JSON format:
-        # {"issue": {"description": "..."}, "open_questions": [...]}
-        
-        # Clean the response: remove markdown code fences if present
-        cleaned_response = agent_response.strip()
-        
-        # Remove ```json or ``` code fences
-        if cleaned_response.startswith('```'):
-            # Find the end of the first line (```json or just ```)
-            first_newline = cleaned_response.find('\n')
-            if first_newline != -1:
-                # Multi-line: remove first line
-                cleaned_response = cleaned_response[first_newline + 1:]
-            else:
-                # Single line like ```json{...}``` - remove opening fence
-                cleaned_response = cleaned_response[3:]  # Remove ```
-                # Also strip any language identifier (json, etc)
-                if cleaned_response and cleaned_response[0] not in ('{', '['):
-                    # Find where JSON actually starts
-                    for i, char in enumerate(cleaned_response):
-                        if char in ('{', '['):
-                            cleaned_response = cleaned_response[i:]
-                            break
-            
-            # Remove trailing ```
-            if cleaned_response.endswith('```'):
-                cleaned_response = cleaned_response[:-3]
-            
-            cleaned_response = cleaned_response.strip()
-        
-        try:
-            # Try to parse as JSON
-            response_data = json.loads(cleaned_response)
-            
-            if isinstance(response_data, dict) and 'issue' in response_data and isinstance(response_data['issue'], dict):
-                # Expected format: nested issue object with description
-                optimized_description = response_data['issue'].get('description', '').strip()
-                open_questions = response_data.get('open_questions', [])
-            elif isinstance(response_data, dict) and 'description' in response_data:
-                # Fallback format: direct description field (for backward compatibility)
-                optimized_description = response_data.get('description', '').strip()
-                open_questions = response_data.get('open_questions', [])
-            else:
-                # No recognized JSON format
-                # Save cleaned response (code fences removed) as fallback
-                # This preserves agent output even if format is unexpected
-                optimized_description = cleaned_response
-                open_questions = []
-        except json.JSONDecodeError:
-            if cleaned_response.startswith('{') or cleaned_response.startswith('['):
-                # Response was clearly meant to be JSON (e.g. an object literal)
-                # but failed to parse - most likely truncated because the
-                # provider's output token limit was hit. Surface this as an
-                # error instead of silently writing the broken JSON/partial
-                # JSON into the description field.
-                raise AIResponseFormatError(
-                    "AI agent returned malformed JSON (response may have been "
-                    "truncated by the provider's output token limit)"
-                )
-            # Not JSON at all - treat as a plain-text response (backward
-            # compatibility with agents that don't return the JSON envelope)
-            optimized_description = cleaned_response
-            open_questions = []
-
-        # Validate we have a description
-        if not optimized_description:
-            raise AIResponseFormatError("AI agent returned empty description")
-        
-        # Update item description (only the issue.description part)
-        item.description = optimized_description
-        item.save()
-        
-        # Process open questions
-        questions_added = 0
-        if open_questions and isinstance(open_questions, list):
-            for question_text in open_questions:
-                if not question_text or not isinstance(question_text, str):
-                    continue
-                
-                question_text = question_text.strip()
-                if not question_text:
-                    continue
-                
-                # Check if an open question with identical text already exists
-                existing = IssueOpenQuestion.objects.filter(
-                    issue=item,
-                    question=question_text,
-                    status=OpenQuestionStatus.OPEN
-                ).exists()
-                
-                if not existing:
-                    # Create new open question
-                    IssueOpenQuestion.objects.create(
-                        issue=item,
-                        question=question_text,
-                        source=OpenQuestionSource.AI_AGENT,
-                        sort_order=questions_added
-                    )
-                    questions_added += 1
-        
-        # Log activity - success
-        activity_service = ActivityService()
-        activity_service.log(
-            verb='item.description.ai_optimized',
-            target=item,
-            actor=request.user,
-            summary='Item description optimized via AI (RAG + GitHub agent)',
-        )
+        _apply_optimized_description(item, agent_response, request.user)
         
         return JsonResponse({
             'status': 'ok'
@@ -2428,6 +2493,84 @@ Context from similar items and related information:
         }, status=500)
 
 
+@login_required
+@require_POST
+def item_optimize_description_ai_stream(request, item_id):
+    """
+    Streaming variant of item_optimize_description_ai (Server-Sent Events).
+
+    Emits ``delta`` events while the agent writes, then saves the result like
+    the blocking view and emits ``done`` (or ``error``; the description is
+    left unchanged in that case).
+    """
+    from core.services.exceptions import AIResponseFormatError
+
+    if request.user.role != UserRole.AGENT:
+        return JsonResponse({
+            'status': 'error',
+            'message': 'This feature is only available to users with Agent role'
+        }, status=403)
+
+    item = get_object_or_404(Item, id=item_id)
+
+    if not (item.description or "").strip():
+        return JsonResponse({
+            'status': 'error',
+            'message': 'Item has no description to optimize'
+        }, status=400)
+
+    def events():
+        activity_service = ActivityService()
+        try:
+            # Send the headers right away; RAG retrieval takes a moment
+            yield sse_event('meta', {'stage': 'context'})
+            agent_input = _build_optimize_description_input(item, request)
+
+            yield sse_event('meta', {'stage': 'generating'})
+            parts = []
+            for text in get_agent_service().execute_agent_stream(
+                filename='github-issue-creation-agent.yml',
+                input_text=agent_input,
+                user=request.user,
+                client_ip=request.META.get('REMOTE_ADDR')
+            ):
+                parts.append(text)
+                yield sse_event('delta', {'text': text})
+
+            questions_added = _apply_optimized_description(item, ''.join(parts), request.user)
+            yield sse_event('done', {'status': 'ok', 'questions_added': questions_added})
+
+        except AIResponseFormatError as e:
+            logger.warning(
+                f"AI description optimization got an unusable response for item {item_id}: {str(e)}"
+            )
+            activity_service.log(
+                verb='item.description.ai_error',
+                target=item,
+                actor=request.user,
+                summary=f'AI description optimization got an unusable AI response: {str(e)}',
+            )
+            yield sse_event('error', {
+                'message': (
+                    'Die KI-Antwort konnte nicht verarbeitet werden (leer oder '
+                    'unvollständig). Die Beschreibung wurde nicht verändert. '
+                    'Bitte versuche es erneut.'
+                )
+            })
+
+        except Exception as e:
+            activity_service.log(
+                verb='item.description.ai_error',
+                target=item,
+                actor=request.user,
+                summary=f'AI description optimization failed: {str(e)}',
+            )
+            logger.error(f"AI description optimization failed for item {item_id}: {str(e)}")
+            yield sse_event('error', {'message': str(e)})
+
+    return sse_response(events())
+
+
 def _get_newest_pr_context(item):
     """
     Get context from the newest linked GitHub PR for an item.
@@ -2513,6 +2656,61 @@ def _get_newest_pr_context(item):
         return None
 
 
+def _build_solution_input(item, request):
+    """
+    Build the create-user-description agent input: description, RAG context
+    and, for items in testing, the newest linked PR.
+    """
+    from core.services.rag import build_extended_context
+
+    current_description = item.description or ""
+
+    # Build extended RAG context with question optimization
+    rag_context = build_extended_context(
+        query=current_description,
+        project_id=str(item.project.id),
+        item_id=str(item.id),
+        current_item_id=str(item.id),  # Exclude current item from results (Issue #392)
+        user=request.user,
+        client_ip=request.META.get('REMOTE_ADDR')
+    )
+    
+    # Build input text for agent: description + RAG context
+    context_text = rag_context.to_context_text() if rag_context.all_items else "No additional context found."
+    
+    agent_input = f"""Item Description:
+{current_description}
+
+---
+Context from similar items and related information:
+{context_text}
+"""
+    
+    # If item status is TESTING, add PR context from newest linked PR
+    if item.status == ItemStatus.TESTING:
+        pr_context = _get_newest_pr_context(item)
+        if pr_context:
+            agent_input += f"\n\n---\n{pr_context}"
+
+    return agent_input
+
+
+def _apply_generated_solution(item, solution_description, user):
+    """Save a generated solution description and log the activity."""
+    # Update item solution_description
+    item.solution_description = solution_description.strip()
+    item.save(update_fields=['solution_description'])
+    
+    # Log activity - success
+    activity_service = ActivityService()
+    activity_service.log(
+        verb='item.solution_description.ai_generated',
+        target=item,
+        actor=user,
+        summary='Solution description generated via AI (RAG + create-user-description agent)',
+    )
+
+
 @login_required
 @require_POST
 def item_generate_solution_ai(request, item_id):
@@ -2527,8 +2725,6 @@ def item_generate_solution_ai(request, item_id):
     
     Only available to users with Agent role.
     """
-    from core.services.rag import build_extended_context
-    
     # Check user role
     if request.user.role != UserRole.AGENT:
         return JsonResponse({
@@ -2548,35 +2744,10 @@ def item_generate_solution_ai(request, item_id):
                 'message': 'Item has no description. Please provide a description first.'
             }, status=400)
         
-        # Build extended RAG context with question optimization
-        rag_context = build_extended_context(
-            query=current_description,
-            project_id=str(item.project.id),
-            item_id=str(item.id),
-            current_item_id=str(item.id),  # Exclude current item from results (Issue #392)
-            user=request.user,
-            client_ip=request.META.get('REMOTE_ADDR')
-        )
-        
-        # Build input text for agent: description + RAG context
-        context_text = rag_context.to_context_text() if rag_context.all_items else "No additional context found."
-        
-        agent_input = f"""Item Description:
-{current_description}
-
----
-Context from similar items and related information:
-{context_text}
-"""
-        
-        # If item status is TESTING, add PR context from newest linked PR
-        if item.status == ItemStatus.TESTING:
-            pr_context = _get_newest_pr_context(item)
-            if pr_context:
-                agent_input += f"\n\n---\n{pr_context}"
+        agent_input = _build_solution_input(item, request)
         
         # Execute the create-user-description agent
-        agent_service = AgentService()
+        agent_service = get_agent_service()
         solution_description = agent_service.execute_agent(
             filename='create-user-description.yml',
             input_text=agent_input,
@@ -2584,18 +2755,7 @@ Context from similar items and related information:
             client_ip=request.META.get('REMOTE_ADDR')
         )
         
-        # Update item solution_description
-        item.solution_description = solution_description.strip()
-        item.save(update_fields=['solution_description'])
-        
-        # Log activity - success
-        activity_service = ActivityService()
-        activity_service.log(
-            verb='item.solution_description.ai_generated',
-            target=item,
-            actor=request.user,
-            summary='Solution description generated via AI (RAG + create-user-description agent)',
-        )
+        _apply_generated_solution(item, solution_description, request.user)
         
         return JsonResponse({
             'status': 'ok'
@@ -2619,6 +2779,64 @@ Context from similar items and related information:
         }, status=500)
 
 
+@login_required
+@require_POST
+def item_generate_solution_ai_stream(request, item_id):
+    """
+    Streaming variant of item_generate_solution_ai (Server-Sent Events).
+
+    Emits ``delta`` events while the agent writes, then saves the solution
+    description and emits ``done`` (or ``error``).
+    """
+    if request.user.role != UserRole.AGENT:
+        return JsonResponse({
+            'status': 'error',
+            'message': 'This feature is only available to users with Agent role'
+        }, status=403)
+
+    item = get_object_or_404(Item, id=item_id)
+
+    if not (item.description or "").strip():
+        return JsonResponse({
+            'status': 'error',
+            'message': 'Item has no description. Please provide a description first.'
+        }, status=400)
+
+    def events():
+        try:
+            # Send the headers right away; RAG retrieval takes a moment
+            yield sse_event('meta', {'stage': 'context'})
+            agent_input = _build_solution_input(item, request)
+
+            yield sse_event('meta', {'stage': 'generating'})
+            parts = []
+            for text in get_agent_service().execute_agent_stream(
+                filename='create-user-description.yml',
+                input_text=agent_input,
+                user=request.user,
+                client_ip=request.META.get('REMOTE_ADDR')
+            ):
+                parts.append(text)
+                yield sse_event('delta', {'text': text})
+
+            _apply_generated_solution(item, ''.join(parts), request.user)
+            yield sse_event('done', {'status': 'ok'})
+
+        except Exception as e:
+            ActivityService().log(
+                verb='item.solution_description.ai_error',
+                target=item,
+                actor=request.user,
+                summary=f'AI solution description generation failed: {str(e)}',
+            )
+            logger.error(f"AI solution description generation failed for item {item_id}: {str(e)}")
+            yield sse_event('error', {
+                'message': 'Failed to generate solution description. Please try again later.'
+            })
+
+    return sse_response(events())
+
+
 @login_required
 @require_POST
 def item_generate_short_description_ai(request, item_id):
@@ -2651,7 +2869,7 @@ def item_generate_short_description_ai(request, item_id):
             }, status=400)
         
         # Execute the item-short-description-agent
-        agent_service = AgentService()
+        agent_service = get_agent_service()
         short_description = agent_service.execute_agent(
             filename='item-short-description-agent.yml',
             input_text=current_description,
@@ -2750,7 +2968,7 @@ Context from similar items and related information:
 """
         
         # Execute the issue-analyse-agent
-        agent_service = AgentService()
+        agent_service = get_agent_service()
         review = agent_service.execute_agent(
             filename='issue-analyse-agent.yml',
             input_text=agent_input,
@@ -3301,7 +3519,7 @@ Relevant context from knowledge base:
 """
         
         # Execute the item-answer-question agent
-        agent_service = AgentService()
+        agent_service = get_agent_service()
         agent_response = agent_service.execute_agent(
             filename='item-answer-question.yml',
             input_text=agent_input,
@@ -3655,21 +3873,69 @@ def item_change_status(request, item_id):
         return JsonResponse({'success': False, 'error': str(e)}, status=400)
 
 
+# Results per typeahead request (user, item and organisation pickers)
+TYPEAHEAD_LIMIT = 20
+
+
+def _typeahead_selected_id(request):
+    """The picker's current value (sent along via hx-include), or None."""
+    try:
+        return int(request.GET.get('value', ''))
+    except ValueError:
+        return None
+
+
+def _typeahead_options(request, options, selected=None):
+    """Render typeahead results as ``<option>`` elements for an HTMX picker.
+
+    The picker's current value (``selected``) stays first and selected, so
+    swapping in new results never changes the field on its own. ``blank``
+    is the label of the empty option.
+    """
+    if selected is not None:
+        options = [dict(selected, selected=True)] + [o for o in options if o['id'] != selected['id']]
+    return render(request, 'partials/typeahead_options.html', {
+        'options': options,
+        'blank_label': request.GET.get('blank'),
+    })
+
+
+def _user_option(user):
+    return {'id': user.id, 'label': user.name or user.username, 'detail': user.email}
+
+
 @login_required
 def user_search(request):
     """
-    JSON endpoint for the comment @mention picker (and similar user pickers).
-
-    GET /users/search/?q=<query> returns active users whose name, username or
-    email contains the query, for use as autocomplete suggestions.
+    Typeahead endpoint for user pickers (comment @mentions, requester,
+    assigned to, followers).
+
+    GET /users/search/?q=<query> returns up to TYPEAHEAD_LIMIT active users
+    whose name, username or email matches the query (case-insensitive).
+    Scripts such as the @mention picker get JSON and match substrings, so a
+    surname finds the user. HTMX pickers get ``<option>`` elements (see
+    _typeahead_options) and match prefixes, backed by the prefix indexes of
+    migration 0087.
     """
     query = request.GET.get('q', '').strip()
+    is_htmx = bool(request.headers.get('HX-Request'))
     users = User.objects.filter(active=True)
     if query:
+        lookup = 'istartswith' if is_htmx else 'icontains'
         users = users.filter(
-            Q(name__icontains=query) | Q(username__icontains=query) | Q(email__icontains=query)
+            Q(**{f'name__{lookup}': query})
+            | Q(**{f'username__{lookup}': query})
+            | Q(**{f'email__{lookup}': query})
+        )
+    users = users.order_by('name')[:TYPEAHEAD_LIMIT]
+
+    if is_htmx:
+        selected = User.objects.filter(pk=_typeahead_selected_id(request)).first()
+        return _typeahead_options(
+            request,
+            [_user_option(user) for user in users],
+            _user_option(selected) if selected else None,
         )
-    users = users.order_by('name')[:20]
 
     return JsonResponse({
         'results': [
@@ -3684,6 +3950,41 @@ def user_search(request):
     })
 
 
+def _organisation_option(organisation):
+    return {'id': organisation.id, 'label': organisation.name, 'detail': organisation.short}
+
+
+@login_required
+def organisation_search(request):
+    """
+    Typeahead endpoint for organisation pickers.
+
+    GET /organisations/search/?q=<query> returns up to TYPEAHEAD_LIMIT
+    organisations whose name or short code starts with the query. Scripts
+    get JSON; HTMX pickers get ``<option>`` elements.
+    """
+    query = request.GET.get('q', '').strip()
+    organisations = Organisation.objects.all()
+    if query:
+        organisations = organisations.filter(Q(name__istartswith=query) | Q(short__istartswith=query))
+    organisations = organisations.order_by('name')[:TYPEAHEAD_LIMIT]
+
+    if request.headers.get('HX-Request'):
+        selected = Organisation.objects.filter(pk=_typeahead_selected_id(request)).first()
+        return _typeahead_options(
+            request,
+            [_organisation_option(org) for org in organisations],
+            _organisation_option(selected) if selected else None,
+        )
+
+    return JsonResponse({
+        'results': [
+            {'id': org.id, 'name': org.name, 'short': org.short}
+            for org in organisations
+        ]
+    })
+
+
 @login_required
 
 @require_POST
@@ -3915,18 +4216,30 @@ def item_delete_attachment(request, attachment_id):
 @login_required
 def attachment_ai_summary(request, attachment_id):
     """
-    Generate AI summary for an attachment using text from Weaviate.
+    Generate AI summary for an attachment.
+    
+    Uses the cached extracted text of PDF/DOCX files if available, otherwise
+    the text indexed in Weaviate.
     
     Returns HTML for modal content showing the AI-generated summary.
     """
     from core.services.weaviate.client import is_available
     from core.services.weaviate.service import fetch_object_by_type, exists_object
-    from core.services.agents import AgentService
+    from core.services.agents import get_agent_service
+    from core.services.storage.text_extraction import (
+        EXTRACTOR_PLAIN, get_attachment_text, get_cached_text, get_extractor,
+    )
     
     attachment = get_object_or_404(Attachment, id=attachment_id)
     
+    # Weaviate only holds the first chunk of long files; prefer the full text
+    if get_extractor(attachment) == EXTRACTOR_PLAIN:
+        cached_text = get_attachment_text(attachment)
+    else:
+        cached_text = get_cached_text(attachment)
+    
     # Check if Weaviate is available
-    if not is_available():
+    if cached_text is None and not is_available():
         context = {
             'attachment': attachment,
             'error': 'Weaviate service is not configured or disabled.',
@@ -3935,7 +4248,7 @@ def attachment_ai_summary(request, attachment_id):
         return render(request, 'partials/attachment_summary_modal_content.html', context)
     
     # Check if Weaviate object exists
-    if not exists_object('attachment', str(attachment_id)):
+    if cached_text is None and not exists_object('attachment', str(attachment_id)):
         context = {
             'attachment': attachment,
             'error': 'This attachment has not been indexed in Weaviate yet.',
@@ -3945,8 +4258,11 @@ def attachment_ai_summary(request, attachment_id):
         return render(request, 'partials/attachment_summary_modal_content.html', context)
     
     try:
-        # Fetch Weaviate object to get text
-        obj_data = fetch_object_by_type('attachment', str(attachment_id))
+        if cached_text is not None:
+            obj_data = {'text': cached_text}
+        else:
+            # Fetch Weaviate object to get text
+            obj_data = fetch_object_by_type('attachment', str(attachment_id))
         
         if not obj_data or 'text' not in obj_data:
             context = {
@@ -3969,7 +4285,7 @@ def attachment_ai_summary(request, attachment_id):
             return render(request, 'partials/attachment_summary_modal_content.html', context)
         
         # Execute AI agent to generate summary
-        agent_service = AgentService()
+        agent_service = get_agent_service()
         summary = agent_service.execute_agent(
             filename='summarize-text-agent.yml',
             input_text=text_content,
@@ -4080,7 +4396,7 @@ def item_upload_transcript(request, item_id):
         
         # Execute AI agent
         logger.info(f"Executing AI agent for transcript processing (item {item_id})...")
-        agent_service = AgentService()
+        agent_service = get_agent_service()
         agent_response = agent_service.execute_agent(
             filename='get-meeting-details.yml',
             input_text=transcript_text,
@@ -4270,16 +4586,8 @@ def item_download_attachment(request, attachment_id):
         if attachment.is_deleted:
             return HttpResponse("Attachment not found", status=404)
         
-        # Read file content
-        storage_service = AttachmentStorageService()
-        file_content = storage_service.read_attachment(attachment)
-        
-        # Create response with file
-        response = HttpResponse(file_content, content_type=attachment.content_type or 'application/octet-stream')
-        response['Content-Disposition'] = f'attachment; filename="{attachment.original_name}"'
-        response['Content-Length'] = len(file_content)
-        
-        return response
+        # Stream file from disk (Range, ETag and sendfile aware)
+        return attachment_response(request, attachment, storage=AttachmentStorageService())
     except Exception as e:
         return HttpResponse(f"Download failed: {str(e)}", status=500)
 
@@ -4316,43 +4624,43 @@ def attachment_view(request, attachment_id):
         _, extension = os.path.splitext(attachment.original_name.lower())
         extension = extension.lstrip('.')
         
-        # Read file content
         storage_service = AttachmentStorageService()
+        
+        # PDFs and non-viewable files are streamed from disk
+        if extension == 'pdf':
+            return attachment_response(
+                request, attachment, disposition='inline',
+                content_type='application/pdf', storage=storage_service
+            )
+        if extension not in ['md', 'txt', 'html', 'htm']:
+            return attachment_response(request, attachment, storage=storage_service)
+        
+        # Text types are rendered, so their content is needed
         file_content = storage_service.read_attachment(attachment)
         
-        # Determine content type and response
-        if extension in ['md', 'txt', 'html', 'htm', 'pdf']:
-            # For viewable types, return content for display
-            if extension == 'md':
-                md_parser = markdown.Markdown(extensions=['extra', 'fenced_code'])
-                html_content = md_parser.convert(file_content.decode('utf-8', errors='replace'))
-                clean_html = bleach.clean(
-                    html_content,
-                    tags=ALLOWED_TAGS,
-                    attributes=ALLOWED_ATTRIBUTES,
-                    strip=True
-                )
-                # Return as HTML page
-                return HttpResponse(clean_html, content_type='text/html')
-            elif extension == 'pdf':
-                return HttpResponse(file_content, content_type='application/pdf')
-            elif extension in ['html', 'htm']:
-                html_content = file_content.decode('utf-8', errors='replace')
-                clean_html = bleach.clean(
-                    html_content,
-                    tags=ALLOWED_TAGS + ['html', 'head', 'body', 'meta', 'title', 'style'],
-                    attributes=ALLOWED_ATTRIBUTES,
-                    strip=True
-                )
-                return HttpResponse(clean_html, content_type='text/html')
-            else:  # txt
-                return HttpResponse(file_content.decode('utf-8', errors='replace'), content_type='text/plain')
-        else:
-            # For other file types, trigger download
-            response = HttpResponse(file_content, content_type=attachment.content_type or 'application/octet-stream')
-            response['Content-Disposition'] = f'attachment; filename="{attachment.original_name}"'
-            response['Content-Length'] = len(file_content)
-            return response
+        # Render viewable text types for display
+        if extension == 'md':
+            md_parser = markdown.Markdown(extensions=['extra', 'fenced_code'])
+            html_content = md_parser.convert(file_content.decode('utf-8', errors='replace'))
+            clean_html = bleach.clean(
+                html_content,
+                tags=ALLOWED_TAGS,
+                attributes=ALLOWED_ATTRIBUTES,
+                strip=True
+            )
+            # Return as HTML page
+            return HttpResponse(clean_html, content_type='text/html')
+        elif extension in ['html', 'htm']:
+            html_content = file_content.decode('utf-8', errors='replace')
+            clean_html = bleach.clean(
+                html_content,
+                tags=ALLOWED_TAGS + ['html', 'head', 'body', 'meta', 'title', 'style'],
+                attributes=ALLOWED_ATTRIBUTES,
+                strip=True
+            )
+            return HttpResponse(clean_html, content_type='text/html')
+        else:  # txt
+            return HttpResponse(file_content.decode('utf-8', errors='replace'), content_type='text/plain')
             
     except Http404:
         # Re-raise Http404 to let Django handle it properly
@@ -4425,7 +4733,7 @@ def _auto_generate_title_from_description(description, user=None):
         return ''
     
     try:
-        agent_service = AgentService()
+        agent_service = get_agent_service()
         title = agent_service.execute_agent(
             filename='text-to-title-generator.yml',
             input_text=description,
@@ -5447,7 +5755,7 @@ def ai_generate_title(request):
             return JsonResponse({'success': False, 'error': 'No text provided'}, status=400)
         
         # Use AgentService to execute the text-to-title-generator agent
-        agent_service = AgentService()
+        agent_service = get_agent_service()
         title = agent_service.execute_agent(
             filename='text-to-title-generator.yml',
             input_text=text,
@@ -5478,7 +5786,7 @@ def ai_optimize_text(request):
             return JsonResponse({'success': False, 'error': 'No text provided'}, status=400)
         
         # Use AgentService to execute the text-optimization-agent
-        agent_service = AgentService()
+        agent_service = get_agent_service()
         optimized_text = agent_service.execute_agent(
             filename='text-optimization-agent.yml',
             input_text=text,
@@ -6199,16 +6507,8 @@ def project_download_attachment(request, attachment_id):
         if attachment.is_deleted:
             return HttpResponse("Attachment not found", status=404)
         
-        # Read file content
-        storage_service = AttachmentStorageService()
-        file_content = storage_service.read_attachment(attachment)
-        
-        # Create response with file
-        response = HttpResponse(file_content, content_type=attachment.content_type or 'application/octet-stream')
-        response['Content-Disposition'] = f'attachment; filename="{attachment.original_name}"'
-        response['Content-Length'] = len(file_content)
-        
-        return response
+        # Stream file from disk (Range, ETag and sendfile aware)
+        return attachment_response(request, attachment, storage=AttachmentStorageService())
     except Exception as e:
         return HttpResponse(f"Download failed: {str(e)}", status=500)
 
@@ -7165,7 +7465,7 @@ def ai_model_toggle_active(request, provider_id, model_id):
 @login_required
 def agents(request):
     """Agent list page view."""
-    agent_service = AgentService()
+    agent_service = get_agent_service()
     agents_list = agent_service.list_agents()
     
     # Server-side search filter
@@ -7193,7 +7493,7 @@ def agents(request):
 @login_required
 def agent_detail(request, filename):
     """Agent detail/edit page view."""
-    agent_service = AgentService()
+    agent_service = get_agent_service()
     agent = agent_service.get_agent(filename)
     
     if not agent:
@@ -7257,7 +7557,7 @@ def agent_create(request):
 @require_http_methods(["POST"])
 def agent_save(request, filename):
     """Save agent (update existing)."""
-    agent_service = AgentService()
+    agent_service = get_agent_service()
     
     try:
         # Load existing agent to check for task changes
@@ -7387,7 +7687,7 @@ def agent_save(request, filename):
 @require_http_methods(["POST"])
 def agent_create_save(request):
     """Save agent (create new)."""
-    agent_service = AgentService()
+    agent_service = get_agent_service()
     
     try:
         # Get form data
@@ -7495,7 +7795,7 @@ def agent_create_save(request):
 @require_http_methods(["POST"])
 def agent_delete(request, filename):
     """Delete an agent."""
-    agent_service = AgentService()
+    agent_service = get_agent_service()
     
     try:
         success = agent_service.delete_agent(filename)
@@ -7514,7 +7814,7 @@ def agent_delete(request, filename):
 @require_http_methods(["POST"])
 def agent_test(request, filename):
     """Test an agent with input text."""
-    agent_service = AgentService()
+    agent_service = get_agent_service()
     
     try:
         # Get input text and parameters from request
@@ -7614,87 +7914,94 @@ def ai_jobs_history(request):
 
 @login_required
 def ai_job_statistics(request):
-    """AI Job Statistics dashboard with aggregated KPIs, tables, and charts."""
-    from datetime import timedelta
-    from django.db.models.functions import TruncDate
-    from django.db.models import Sum, Avg, Count
-    from .models import AIJobStatus
+    """AI Job Statistics dashboard with aggregated KPIs, tables, and charts.
 
-    def _start_of_day(d):
-        """Return timezone-aware start-of-day datetime for a date object."""
-        return timezone.make_aware(datetime.combine(d, time.min))
+    Reads the daily AIJobDailyRollup rows (see core.services.analytics), so
+    the page does not scan AIJobsHistory.
+    """
+    from collections import defaultdict
+    from datetime import timedelta
+    from django.db.models import Sum
+    from .models import AIAgentDedupStats
+    from core.services.analytics import DASHBOARD_MAX_DIRTY_DAYS, combine_percentiles, refresh_dirty_days
 
-    now = timezone.now()
     today = timezone.localdate()
 
+    refresh_dirty_days(AnalyticsRollupKind.AI_JOBS, max_days=DASHBOARD_MAX_DIRTY_DAYS)
+    rollups = AIJobDailyRollup.objects.all()
+
     # KPI: Costs today
-    costs_today = AIJobsHistory.objects.filter(
-        timestamp__gte=_start_of_day(today)
-    ).aggregate(total=Sum('costs'))['total'] or Decimal('0')
+    costs_today = rollups.filter(date=today).aggregate(
+        total=Sum('total_costs')
+    )['total'] or Decimal('0')
 
     # KPI: Costs current calendar week (Mon–Sun)
     start_of_week = today - timedelta(days=today.weekday())  # Monday
-    costs_week = AIJobsHistory.objects.filter(
-        timestamp__gte=_start_of_day(start_of_week)
-    ).aggregate(total=Sum('costs'))['total'] or Decimal('0')
+    costs_week = rollups.filter(date__gte=start_of_week).aggregate(
+        total=Sum('total_costs')
+    )['total'] or Decimal('0')
 
     # KPI: Costs current calendar month
     start_of_month = today.replace(day=1)
-    costs_month = AIJobsHistory.objects.filter(
-        timestamp__gte=_start_of_day(start_of_month)
-    ).aggregate(total=Sum('costs'))['total'] or Decimal('0')
+    costs_month = rollups.filter(date__gte=start_of_month).aggregate(
+        total=Sum('total_costs')
+    )['total'] or Decimal('0')
 
     # KPI: Errors last 7 days (today + 6 preceding days = 7-day window)
     start_of_7d_window = today - timedelta(days=6)
-    errors_7d = AIJobsHistory.objects.filter(
-        timestamp__gte=_start_of_day(start_of_7d_window),
-        status=AIJobStatus.ERROR
-    ).count()
-
-    # Table: per Agent
-    by_agent = (
-        AIJobsHistory.objects.values('agent')
-        .annotate(requests=Count('id'), total_costs=Sum('costs'))
+    errors_7d = rollups.filter(date__gte=start_of_7d_window).aggregate(
+        total=Sum('errors')
+    )['total'] or 0
+
+    # Table: per Agent, with the typical p50/p90 duration of its days
+    by_agent = list(
+        rollups.values('agent')
+        .annotate(requests=Sum('requests'), total_costs=Sum('total_costs'))
         .order_by('-requests')
     )
+    durations_by_agent = defaultdict(list)
+    for agent, p50, p90, count in rollups.filter(duration_count__gt=0).values_list(
+        'agent', 'duration_p50_ms', 'duration_p90_ms', 'duration_count'
+    ):
+        durations_by_agent[agent].append((p50, p90, count))
+    for row in by_agent:
+        durations = durations_by_agent.get(row['agent'], [])
+        row['p50_duration_ms'] = combine_percentiles((p50, n) for p50, _p90, n in durations)
+        row['p90_duration_ms'] = combine_percentiles((p90, n) for _p50, p90, n in durations)
 
     # Table: per Model
     by_model = (
-        AIJobsHistory.objects.filter(model__isnull=False)
+        rollups.filter(model__isnull=False)
         .values('model__name')
-        .annotate(requests=Count('id'), total_costs=Sum('costs'))
+        .annotate(requests=Sum('requests'), total_costs=Sum('total_costs'))
         .order_by('-requests')
     )
 
     # Table: per User
     by_user = (
-        AIJobsHistory.objects.filter(user__isnull=False)
+        rollups.filter(user__isnull=False)
         .values('user__username')
-        .annotate(requests=Count('id'), total_costs=Sum('costs'))
+        .annotate(requests=Sum('requests'), total_costs=Sum('total_costs'))
         .order_by('-requests')
     )
 
     # Timeseries last 7 days: requests per day
     requests_by_day_qs = (
-        AIJobsHistory.objects.filter(timestamp__gte=_start_of_day(start_of_7d_window))
-        .annotate(day=TruncDate('timestamp'))
-        .values('day')
-        .annotate(count=Count('id'))
-        .order_by('day')
+        rollups.filter(date__gte=start_of_7d_window)
+        .values('date')
+        .annotate(count=Sum('requests'))
+        .order_by('date')
     )
-    requests_by_day_dict = {item['day']: item['count'] for item in requests_by_day_qs}
+    requests_by_day_dict = {item['date']: item['count'] for item in requests_by_day_qs}
 
     # Timeseries last 7 days: avg duration per day per agent
-    duration_by_day_agent_qs = (
-        AIJobsHistory.objects.filter(
-            timestamp__gte=_start_of_day(start_of_7d_window),
-            duration_ms__isnull=False
-        )
-        .annotate(day=TruncDate('timestamp'))
-        .values('day', 'agent')
-        .annotate(avg_duration=Avg('duration_ms'))
-        .order_by('day', 'agent')
-    )
+    duration_by_day_agent_qs = [
+        {'day': item['date'], 'agent': item['agent'], 'avg_duration': item['total_ms'] / item['count']}
+        for item in rollups.filter(date__gte=start_of_7d_window, duration_count__gt=0)
+        .values('date', 'agent')
+        .annotate(total_ms=Sum('duration_total_ms'), count=Sum('duration_count'))
+        .order_by('date', 'agent')
+    ]
 
     # Build chart data structures
     date_labels = []
@@ -7736,11 +8043,22 @@ def ai_job_statistics(request):
             'spanGaps': True,
         })
 
+    # RAG result cache hit/miss counters (Redis)
+    from core.services.rag.cache import get_rag_cache
+    rag_cache_stats = get_rag_cache().get_stats()
+
+    # Agent calls answered by single-flight deduplication (last 7 days)
+    deduplicated_calls_7d = AIAgentDedupStats.objects.filter(
+        date__gte=start_of_7d_window
+    ).aggregate(total=Sum('deduplicated_calls'))['total'] or 0
+
     context = {
         'costs_today': costs_today,
         'costs_week': costs_week,
         'costs_month': costs_month,
         'errors_7d': errors_7d,
+        'rag_cache_stats': rag_cache_stats,
+        'deduplicated_calls_7d': deduplicated_calls_7d,
         'by_agent': list(by_agent),
         'by_model': list(by_model),
         'by_user': list(by_user),
@@ -7762,14 +8080,18 @@ def system_analytics(request):
 
     Wertet die eigenen Daten (Item, ClaudeQueueJob, Release, Activity) aus:
     Durchsatz, Cycle-/Kigil-Lead-Time, Kosten, Autonomie/Qualität, Top-Listen
-    und ein leichtgewichtiger Meilenstein-Marker. Alles DB-seitig aggregiert
-    (Sum/Count/Avg/Max/Min + Zeit-Buckets), keine Queries pro Item.
+    und ein leichtgewichtiger Meilenstein-Marker. Durchsatz, Lead-Times,
+    Kosten und Qualität kommen aus den Tages-Rollups (ItemDailyRollup,
+    ClaudeQueueDailyRollup, siehe core.services.analytics) inkl. vorberechneter
+    p50/p90 - die Seite scannt weder Activity noch alle Items.
     """
-    import statistics
     from collections import defaultdict
     from datetime import date, timedelta
     from django.db.models import Sum
-    from django.db.models.functions import TruncWeek, TruncMonth
+    from django.db.models.functions import TruncMonth
+    from core.services.analytics import (
+        DASHBOARD_MAX_DIRTY_DAYS, TURNS_BUCKETS, combine_percentiles, refresh_dirty_days,
+    )
 
     MILESTONE_TARGET = 1000
     # Seit Anfang Juli 2026 läuft die autonome Umsetzung über die (zählbare)
@@ -7801,40 +8123,22 @@ def system_analytics(request):
     # Items = bewusst verworfene/gelöschte Issues, nicht "offen" (#1002).
     discarded_items_count = max(highest_item_number - total_items, 0)
 
-    # ------------------------------------------------------------------
-    # Closed-Zeitpunkt je Item: jüngste "-> Closed"-Aktivität, sonst
-    # updated_at als Fallback (z.B. Statusänderung ohne Activity-Log-Eintrag).
-    # Zwei Aggregat-Queries, keine Pro-Item-Lookups.
-    # ------------------------------------------------------------------
-    closed_activity_qs = (
-        Activity.objects.filter(verb='item.status_changed', summary__endswith=f'→ {ItemStatus.CLOSED}')
-        .values('target_object_id')
-        .annotate(closed_at=models.Max('created_at'))
-    )
-    closed_at_by_item_id = {int(r['target_object_id']): r['closed_at'] for r in closed_activity_qs}
-
-    closed_items_rows = list(
-        Item.objects.filter(status=ItemStatus.CLOSED).values('id', 'created_at', 'updated_at')
-    )
-    item_closed_dates = []  # (item_id, created_at, closed_at)
-    for row in closed_items_rows:
-        closed_at = closed_at_by_item_id.get(row['id'], row['updated_at'])
-        if closed_at and closed_at >= row['created_at']:
-            item_closed_dates.append((row['id'], row['created_at'], closed_at))
+    refresh_dirty_days(AnalyticsRollupKind.ITEMS, max_days=DASHBOARD_MAX_DIRTY_DAYS)
+    refresh_dirty_days(AnalyticsRollupKind.CLAUDE_QUEUE, max_days=DASHBOARD_MAX_DIRTY_DAYS)
+    item_rollups = ItemDailyRollup.objects.all()
+    queue_rollups = ClaudeQueueDailyRollup.objects.all()
 
     # ------------------------------------------------------------------
-    # Durchsatz über die Zeit: erstellt vs. geschlossen je Woche + offene-Kurve
+    # Durchsatz über die Zeit: erstellt vs. geschlossen je Woche + offene-Kurve.
+    # Geschlossen zählt am Closed-Zeitpunkt: jüngste "-> Closed"-Aktivität,
+    # sonst updated_at als Fallback (z.B. Statusänderung ohne Activity-Log).
     # ------------------------------------------------------------------
-    created_by_week_qs = (
-        Item.objects.annotate(week=TruncWeek('created_at'))
-        .values('week').annotate(count=Count('id')).order_by('week')
-    )
-    created_by_week = {row['week'].date(): row['count'] for row in created_by_week_qs}
-
+    created_by_week = defaultdict(int)
     closed_by_week = defaultdict(int)
-    for _id, _created_at, closed_at in item_closed_dates:
-        week_start = closed_at.date() - timedelta(days=closed_at.weekday())
-        closed_by_week[week_start] += 1
+    for row in item_rollups.values('date').annotate(created=Sum('created'), closed=Sum('closed')):
+        week_start = row['date'] - timedelta(days=row['date'].weekday())
+        created_by_week[week_start] += row['created']
+        closed_by_week[week_start] += row['closed']
 
     week_labels, created_series, closed_series, open_series = [], [], [], []
     claude_queue_marker_index = None
@@ -7854,15 +8158,21 @@ def system_analytics(request):
                 claude_queue_marker_index = len(week_labels) - 1
             week_cursor += timedelta(days=7)
 
+    item_totals = item_rollups.aggregate(
+        closed=Sum('closed'), cycle_days=Sum('cycle_total_days'),
+        deployed=Sum('deployed'), lead_days=Sum('lead_total_days'),
+    )
+
     # ------------------------------------------------------------------
     # Cycle-Time (erstellt -> geschlossen) für aktuell geschlossene Items
     # ------------------------------------------------------------------
-    cycle_days = [
-        (closed_at - created_at).total_seconds() / 86400
-        for _id, created_at, closed_at in item_closed_dates
-    ]
-    avg_cycle_days = statistics.mean(cycle_days) if cycle_days else None
-    median_cycle_days = statistics.median(cycle_days) if cycle_days else None
+    cycle_time_sample_size = item_totals['closed'] or 0
+    avg_cycle_days = item_totals['cycle_days'] / cycle_time_sample_size if cycle_time_sample_size else None
+    cycle_percentiles = list(item_rollups.filter(closed__gt=0).values_list(
+        'cycle_p50_days', 'cycle_p90_days', 'closed', 'longest_cycle_items',
+    ))
+    median_cycle_days = combine_percentiles((p50, n) for p50, _p90, n, _top in cycle_percentiles)
+    p90_cycle_days = combine_percentiles((p90, n) for _p50, p90, n, _top in cycle_percentiles)
 
     # ------------------------------------------------------------------
     # Kigil-Lead-Time: Idee (created_at) -> Deployment.
@@ -7870,49 +8180,31 @@ def system_analytics(request):
     # Nicht jedes Item hat bereits eine Deployment-Spur - lead_time_coverage_pct
     # macht das im UI sichtbar, statt stillschweigend nur einen Teil zu zeigen.
     # ------------------------------------------------------------------
-    pr_deploy_qs = (
-        ExternalIssueMapping.objects.filter(kind=ExternalIssueKind.PR, merged_at__isnull=False)
-        .values('item_id').annotate(first_merge=models.Min('merged_at'))
-    )
-    pr_deploy_by_item = {r['item_id']: r['first_merge'] for r in pr_deploy_qs}
-
-    release_deploy_by_item = {
-        r['id']: r['solution_release__closed_at']
-        for r in Item.objects.filter(solution_release__closed_at__isnull=False)
-        .values('id', 'solution_release__closed_at')
-    }
-
-    lead_time_rows = []  # (item_id, created_at, deploy_at, lead_days)
-    for item_id, created_at in Item.objects.values_list('id', 'created_at'):
-        candidates = [d for d in (pr_deploy_by_item.get(item_id), release_deploy_by_item.get(item_id)) if d]
-        if not candidates:
-            continue
-        deploy_at = min(candidates)
-        if deploy_at < created_at:
-            continue
-        lead_time_rows.append((item_id, created_at, deploy_at, (deploy_at - created_at).total_seconds() / 86400))
-
-    lead_days = [row[3] for row in lead_time_rows]
-    avg_lead_days = statistics.mean(lead_days) if lead_days else None
-    median_lead_days = statistics.median(lead_days) if lead_days else None
-    lead_time_coverage_pct = (len(lead_days) / total_items * 100) if total_items else 0
+    lead_time_sample_size = item_totals['deployed'] or 0
+    avg_lead_days = item_totals['lead_days'] / lead_time_sample_size if lead_time_sample_size else None
+    lead_percentiles = list(item_rollups.filter(deployed__gt=0).values_list(
+        'lead_p50_days', 'lead_p90_days', 'deployed', 'fastest_lead_item',
+    ))
+    median_lead_days = combine_percentiles((p50, n) for p50, _p90, n, _fastest in lead_percentiles)
+    p90_lead_days = combine_percentiles((p90, n) for _p50, p90, n, _fastest in lead_percentiles)
+    lead_time_coverage_pct = (lead_time_sample_size / total_items * 100) if total_items else 0
 
     # ------------------------------------------------------------------
     # Kosten über die Zeit + Modell-Mix (basiert auf ClaudeQueueJob.total_cost_usd,
     # Claudes eigener Schätzwert - keine Neuberechnung, siehe #997)
     # ------------------------------------------------------------------
-    total_cost_all_time = ClaudeQueueJob.objects.aggregate(total=Sum('total_cost_usd'))['total'] or Decimal('0')
+    total_cost_all_time = queue_rollups.aggregate(total=Sum('total_cost'))['total'] or Decimal('0')
 
     cost_by_month_qs = (
-        ClaudeQueueJob.objects.annotate(month=TruncMonth('created_at'))
-        .values('month').annotate(total=Sum('total_cost_usd')).order_by('month')
+        queue_rollups.annotate(month=TruncMonth('date'))
+        .values('month').annotate(total=Sum('total_cost')).order_by('month')
     )
     month_labels = [row['month'].strftime('%m/%Y') for row in cost_by_month_qs]
     month_cost_series = [float(row['total'] or 0) for row in cost_by_month_qs]
 
     model_mix = list(
-        ClaudeQueueJob.objects.values('model')
-        .annotate(total_cost=Sum('total_cost_usd'), count=Count('id'))
+        queue_rollups.values('model')
+        .annotate(total_cost=Sum('total_cost'), count=Sum('jobs'))
         .order_by('-total_cost')
     )
 
@@ -7926,22 +8218,22 @@ def system_analytics(request):
     # abgerechnet, Abo-Läufe liefen auf bereits bezahltem Kontingent - ihre
     # Summe ist das, was pay-per-use gekostet HÄTTE (also das Eingesparte).
     # ------------------------------------------------------------------
-    _api_filter = Q(auth_mode=ClaudeQueueJobAuthMode.API_KEY)
-    _abo_filter = ~Q(auth_mode=ClaudeQueueJobAuthMode.API_KEY)
+    _api_filter = Q(billed=True)
+    _abo_filter = Q(billed=False)
     cost_by_auth_user = list(
-        ClaudeQueueJob.objects
+        queue_rollups
         .values('auth_user', 'auth_user__name', 'auth_user__username')
         .annotate(
-            api_cost=Sum('total_cost_usd', filter=_api_filter),
-            api_jobs=Count('id', filter=_api_filter),
-            abo_cost=Sum('total_cost_usd', filter=_abo_filter),
-            abo_jobs=Count('id', filter=_abo_filter),
+            api_cost=Sum('total_cost', filter=_api_filter),
+            api_jobs=Coalesce(Sum('jobs', filter=_api_filter), 0),
+            abo_cost=Sum('total_cost', filter=_abo_filter),
+            abo_jobs=Coalesce(Sum('jobs', filter=_abo_filter), 0),
         )
         .order_by('-api_cost', '-abo_cost')
     )
-    cost_totals = ClaudeQueueJob.objects.aggregate(
-        api=Sum('total_cost_usd', filter=_api_filter),
-        abo=Sum('total_cost_usd', filter=_abo_filter),
+    cost_totals = queue_rollups.aggregate(
+        api=Sum('total_cost', filter=_api_filter),
+        abo=Sum('total_cost', filter=_abo_filter),
     )
     total_cost_api = cost_totals['api'] or Decimal('0')
     total_cost_subscription = cost_totals['abo'] or Decimal('0')
@@ -7954,40 +8246,38 @@ def system_analytics(request):
     # Run quality is about *runs*: epic nodes (#1079) are excluded throughout,
     # since a node never invokes Claude and would otherwise count as a free
     # success in the rate below.
-    run_jobs = ClaudeQueueJob.objects.filter(kind=ClaudeQueueJobKind.ISSUE)
-    total_jobs = run_jobs.count()
+    run_totals = queue_rollups.aggregate(
+        run_jobs=Sum('run_jobs'),
+        done_ok=Sum('done_ok'),
+        done_uncertain=Sum('done_uncertain'),
+        failed=Sum('failed'),
+        cancelled=Sum('cancelled'),
+        # Everything that has not settled yet, including the entries a chain
+        # is still holding back — they are queued work, just not claimable work.
+        in_flight=Sum('in_flight'),
+        turns=Sum('turns_total'),
+        turns_jobs=Sum('turns_jobs'),
+        **{field: Sum(field) for _label, field, _low, _high in TURNS_BUCKETS},
+    )
+    total_jobs = run_totals['run_jobs'] or 0
     claude_queue_share_pct = (items_with_jobs_count / total_items * 100) if total_items else 0
 
-    done_jobs = run_jobs.filter(status=ClaudeQueueJobStatus.DONE)
-    jobs_done_ok = done_jobs.filter(completion_uncertain=False).count()
-    jobs_done_uncertain = done_jobs.filter(completion_uncertain=True).count()
-    jobs_failed = run_jobs.filter(status=ClaudeQueueJobStatus.FAILED).count()
-    jobs_cancelled = run_jobs.filter(status=ClaudeQueueJobStatus.CANCELLED).count()
-    # Everything that has not settled yet, including the entries a chain is
-    # still holding back — they are queued work, just not claimable work.
-    jobs_in_flight = run_jobs.filter(
-        status__in=[
-            ClaudeQueueJobStatus.BLOCKED,
-            ClaudeQueueJobStatus.QUEUED,
-            ClaudeQueueJobStatus.RUNNING,
-        ]
-    ).count()
+    jobs_done_ok = run_totals['done_ok'] or 0
+    jobs_done_uncertain = run_totals['done_uncertain'] or 0
+    jobs_failed = run_totals['failed'] or 0
+    jobs_cancelled = run_totals['cancelled'] or 0
+    jobs_in_flight = run_totals['in_flight'] or 0
     success_rate = (jobs_done_ok / total_jobs * 100) if total_jobs else 0
 
-    turns_list = sorted(
-        ClaudeQueueJob.objects.filter(num_turns__isnull=False).values_list('num_turns', flat=True)
-    )
-    avg_turns = statistics.mean(turns_list) if turns_list else None
-    median_turns = statistics.median(turns_list) if turns_list else None
-
-    turns_buckets = [('1-10', 0, 10), ('11-25', 11, 25), ('26-50', 26, 50), ('51-100', 51, 100), ('100+', 101, None)]
-    turns_histogram = []
-    for label, low, high in turns_buckets:
-        if high is None:
-            count = sum(1 for t in turns_list if t >= low)
-        else:
-            count = sum(1 for t in turns_list if low <= t <= high)
-        turns_histogram.append({'label': label, 'count': count})
+    avg_turns = run_totals['turns'] / run_totals['turns_jobs'] if run_totals['turns_jobs'] else None
+    turns_percentiles = list(queue_rollups.filter(turns_jobs__gt=0).values_list('turns_p50', 'turns_p90', 'turns_jobs'))
+    median_turns = combine_percentiles((p50, n) for p50, _p90, n in turns_percentiles)
+    p90_turns = combine_percentiles((p90, n) for _p50, p90, n in turns_percentiles)
+
+    turns_histogram = [
+        {'label': label, 'count': run_totals[field] or 0}
+        for label, field, _low, _high in TURNS_BUCKETS
+    ]
 
     # ------------------------------------------------------------------
     # Top-Listen
@@ -8013,19 +8303,24 @@ def system_analytics(request):
         .order_by('-total_turns')[:10]
     )
 
-    top_cycle_time_rows = sorted(item_closed_dates, key=lambda row: row[2] - row[1], reverse=True)[:10]
+    # Every rollup row keeps its longest cycle times, so the overall top 10
+    # is among them.
+    top_cycle_time_rows = sorted(
+        (pair for _p50, _p90, _n, top in cycle_percentiles for pair in top),
+        key=lambda pair: pair[1], reverse=True,
+    )[:10]
     top_cycle_time_items = []
     if top_cycle_time_rows:
         items_by_id = {
             it.id: it for it in
             Item.objects.select_related('project').filter(id__in=[row[0] for row in top_cycle_time_rows])
         }
-        for item_id, created_at, closed_at in top_cycle_time_rows:
+        for item_id, cycle_days in top_cycle_time_rows:
             item = items_by_id.get(item_id)
             if item:
                 top_cycle_time_items.append({
                     'item': item,
-                    'cycle_days': (closed_at - created_at).total_seconds() / 86400,
+                    'cycle_days': cycle_days,
                 })
 
     # ------------------------------------------------------------------
@@ -8040,11 +8335,12 @@ def system_analytics(request):
         .filter(comment_count__gt=0).order_by('-comment_count').first()
     )
     fastest_lead_time_item = None
-    if lead_time_rows:
-        fastest_row = min(lead_time_rows, key=lambda row: row[3])
+    fastest_rows = [fastest for _p50, _p90, _n, fastest in lead_percentiles if fastest]
+    if fastest_rows:
+        fastest_item_id, fastest_lead_days = min(fastest_rows, key=lambda pair: pair[1])
         fastest_lead_time_item = {
-            'item': Item.objects.select_related('project').filter(pk=fastest_row[0]).first(),
-            'lead_days': fastest_row[3],
+            'item': Item.objects.select_related('project').filter(pk=fastest_item_id).first(),
+            'lead_days': fastest_lead_days,
         }
 
     context = {
@@ -8072,11 +8368,13 @@ def system_analytics(request):
 
         'avg_cycle_days': avg_cycle_days,
         'median_cycle_days': median_cycle_days,
-        'cycle_time_sample_size': len(cycle_days),
+        'p90_cycle_days': p90_cycle_days,
+        'cycle_time_sample_size': cycle_time_sample_size,
 
         'avg_lead_days': avg_lead_days,
         'median_lead_days': median_lead_days,
-        'lead_time_sample_size': len(lead_days),
+        'p90_lead_days': p90_lead_days,
+        'lead_time_sample_size': lead_time_sample_size,
         'lead_time_coverage_pct': lead_time_coverage_pct,
 
         'total_cost_all_time': total_cost_all_time,
@@ -8101,6 +8399,7 @@ def system_analytics(request):
         'jobs_in_flight': jobs_in_flight,
         'avg_turns': avg_turns,
         'median_turns': median_turns,
+        'p90_turns': p90_turns,
         'turns_histogram_json': json.dumps(turns_histogram),
 
         'top_cost_items': top_cost_items,
@@ -8883,14 +9182,7 @@ def change_download_attachment(request, attachment_id):
         if attachment.is_deleted:
             return HttpResponse("Attachment not found", status=404)
 
-        storage_service = AttachmentStorageService()
-        file_content = storage_service.read_attachment(attachment)
-
-        response = HttpResponse(file_content, content_type=attachment.content_type or 'application/octet-stream')
-        response['Content-Disposition'] = f'attachment; filename="{attachment.original_name}"'
-        response['Content-Length'] = len(file_content)
-
-        return response
+        return attachment_response(request, attachment, storage=AttachmentStorageService())
     except Exception as e:
         return HttpResponse(f"Download failed: {str(e)}", status=500)
 
@@ -9833,7 +10125,7 @@ def change_polish_risk_description(request, id):
             }, status=400)
         
         # Execute the change-text-polish-agent
-        agent_service = AgentService()
+        agent_service = get_agent_service()
         polished_text = agent_service.execute_agent(
             filename='change-text-polish-agent.yml',
             input_text=risk_description,
@@ -9881,7 +10173,7 @@ def change_optimize_mitigation(request, id):
             }, status=400)
         
         # Execute the text-optimization-agent
-        agent_service = AgentService()
+        agent_service = get_agent_service()
         optimized_text = agent_service.execute_agent(
             filename='text-optimization-agent.yml',
             input_text=mitigation,
@@ -9929,7 +10221,7 @@ def change_optimize_rollback(request, id):
             }, status=400)
         
         # Execute the text-optimization-agent
-        agent_service = AgentService()
+        agent_service = get_agent_service()
         optimized_text = agent_service.execute_agent(
             filename='text-optimization-agent.yml',
             input_text=rollback_plan,
@@ -9960,6 +10252,82 @@ def change_optimize_rollback(request, id):
         return JsonResponse({'success': False, 'error': str(e)}, status=500)
 
 
+# Change text fields improved together by change_improve_texts_ai:
+# (field, agent, activity verb, label)
+CHANGE_AI_TEXT_FIELDS = [
+    ('risk_description', 'change-text-polish-agent.yml', 'change.ai_risk_polished', 'risk description'),
+    ('mitigation', 'text-optimization-agent.yml', 'change.ai_mitigation_optimized', 'mitigation plan'),
+    ('rollback_plan', 'text-optimization-agent.yml', 'change.ai_rollback_optimized', 'rollback plan'),
+]
+
+
+@login_required
+@require_http_methods(["POST"])
+def change_improve_texts_ai(request, id):
+    """Improve risk description, mitigation and rollback plan in one step using AI agents.
+
+    The agent calls are independent and run concurrently. Fields whose call
+    failed keep their text and are reported in ``errors``.
+    """
+    change = get_object_or_404(Change, id=id)
+    
+    fields = [
+        (field, agent, verb, label)
+        for field, agent, verb, label in CHANGE_AI_TEXT_FIELDS
+        if (getattr(change, field) or '').strip()
+    ]
+    if not fields:
+        return JsonResponse({
+            'success': False,
+            'error': 'Risk description, mitigation plan and rollback plan are empty. Please add some text first.'
+        }, status=400)
+    
+    try:
+        user = request.user if request.user.is_authenticated else None
+        results = get_agent_service().execute_many(
+            [AgentCall(filename=agent, input_text=getattr(change, field)) for field, agent, _, _ in fields],
+            user=user,
+            client_ip=request.META.get('REMOTE_ADDR'),
+            return_exceptions=True
+        )
+        
+        texts = {}
+        errors = {}
+        for (field, _, _, _), result in zip(fields, results):
+            if isinstance(result, Exception):
+                errors[field] = str(result)
+            else:
+                texts[field] = result
+        
+        if not texts:
+            logger.error(f"Error improving change texts: {errors}")
+            return JsonResponse({'success': False, 'error': '; '.join(errors.values()), 'errors': errors}, status=500)
+        
+        for field, text in texts.items():
+            setattr(change, field, text)
+        change.save()
+        
+        activity_service = ActivityService()
+        for field, _, verb, label in fields:
+            if field in texts:
+                activity_service.log(
+                    verb=verb,
+                    target=change,
+                    actor=user,
+                    summary=f'AI improved {label} for change "{change.title}"'
+                )
+        
+        return JsonResponse({
+            'success': True,
+            'texts': texts,
+            'errors': errors,
+            'message': f'{len(texts)} of {len(fields)} texts improved successfully'
+        })
+    except Exception as e:
+        logger.error(f"Error improving change texts: {e}")
+        return JsonResponse({'success': False, 'error': str(e)}, status=500)
+
+
 @login_required
 @require_http_methods(["POST"])
 def change_assess_risk(request, id):
@@ -9989,7 +10357,7 @@ Rollback Plan:
             }, status=400)
         
         # Execute the change-risk-assessment-agent
-        agent_service = AgentService()
+        agent_service = get_agent_service()
         assessment_result = agent_service.execute_agent(
             filename='change-risk-assessment-agent.yml',
             input_text=agent_input,
@@ -10158,12 +10526,12 @@ def dashboard_activity_stream(request):
     
     # Get filter parameter
     filter_type = request.GET.get('filter', 'all')
-    offset = int(request.GET.get('offset', 0))
+    cursor = request.GET.get('cursor')
     limit = 50
     
     # Base queryset
     activity_service = ActivityService()
-    activities = Activity.objects.select_related('actor', 'target_content_type').order_by('-created_at')
+    activities = Activity.objects.select_related('actor', 'target_content_type')
     
     # Apply filter
     if filter_type and filter_type != 'all':
@@ -10181,37 +10549,13 @@ def dashboard_activity_stream(request):
         elif filter_type == 'ai':
             activities = activities.filter(verb__startswith='ai.')
     
-    # Paginate
-    activities = activities[offset:offset + limit]
+    # Paginate by (created_at, id) cursor and load all targets per type at once
+    activities, next_cursor = activity_service.page(activities, cursor=cursor, limit=limit)
+    activity_service.resolve_targets(activities)
     
     # Build activity list with human-readable verbs and relative times
     activity_list = []
     for activity in activities:
-        # Get target URL if possible
-        target_url = None
-        target_title = None
-        if activity.target_content_type.model == 'item' and activity.target_object_id:
-            try:
-                item = Item.objects.get(id=activity.target_object_id)
-                target_url = f'/items/{item.id}/'
-                target_title = item.title
-            except Item.DoesNotExist:
-                pass
-        elif activity.target_content_type.model == 'project' and activity.target_object_id:
-            try:
-                project = Project.objects.get(id=activity.target_object_id)
-                target_url = f'/projects/{project.id}/'
-                target_title = project.name
-            except Project.DoesNotExist:
-                pass
-        elif activity.target_content_type.model == 'change' and activity.target_object_id:
-            try:
-                change = Change.objects.get(id=activity.target_object_id)
-                target_url = f'/changes/{change.id}/'
-                target_title = change.title
-            except Change.DoesNotExist:
-                pass
-        
         activity_list.append({
             'id': activity.id,
             'verb': get_human_readable_verb(activity.verb),
@@ -10219,17 +10563,16 @@ def dashboard_activity_stream(request):
             'summary': activity.summary,
             'created_at': activity.created_at,
             'time_ago': timesince(activity.created_at),
-            'target_url': target_url,
-            'target_title': target_title,
+            'target_url': activity.target_url,
+            'target_title': activity.target_title,
         })
     
     context = {
         'activities': activity_list,
         'filter_type': filter_type,
-        'offset': offset,
         'limit': limit,
-        'has_more': len(activities) == limit,
-        'next_offset': offset + limit,
+        'has_more': next_cursor is not None,
+        'next_cursor': next_cursor,
     }
     return render(request, 'partials/dashboard_activity_stream.html', context)
 
@@ -10517,7 +10860,7 @@ def mail_template_generate_ai(request, id):
             }, status=400)
         
         # Execute the create-mail-template agent
-        agent_service = AgentService()
+        agent_service = get_agent_service()
         result = agent_service.execute_agent(
             filename='create-mail-template.yml',
             input_text=context,
@@ -4,9 +4,15 @@ CustomGPT Actions API Views.
 This module provides HTTP API endpoints for CustomGPT Actions to interact with
 Projects and Items. All endpoints require authentication via x-api-secret header.
 """
+import base64
+import binascii
+import itertools
 import logging
 import json
-from django.http import JsonResponse, Http404
+from datetime import datetime
+from django.http import JsonResponse, Http404, StreamingHttpResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
 from django.views.decorators.http import require_http_methods
 from django.views.decorators.csrf import csrf_exempt
 from django.core.exceptions import ValidationError
@@ -106,16 +112,19 @@ def serialize_project(project):
 
 
 # Helper function to serialize Item model
-def serialize_item(item):
+def serialize_item(item, fields=None):
     """
     Serialize an Item instance to a dictionary.
     
     Args:
         item: Item instance
+        fields: Optional list of keys to include (default: all)
         
     Returns:
         Dictionary with item data
     """
+    if fields is not None:
+        return {field: _ITEM_FIELD_GETTERS[field](item) for field in fields}
     return {
         'id': item.id,
         'title': item.title,
@@ -138,6 +147,202 @@ def serialize_item(item):
     }
 
 
+def _isoformat_or_none(value):
+    return value.isoformat() if value else None
+
+
+# Serializable item keys and how to read them from a (possibly deferred) Item.
+# Keys ending in _id read the foreign key column without loading the relation.
+_ITEM_FIELD_GETTERS = {
+    'id': lambda item: item.id,
+    'title': lambda item: item.title,
+    'description': lambda item: item.description,
+    'user_input': lambda item: item.user_input,
+    'solution_description': lambda item: item.solution_description,
+    'pr_description': lambda item: item.pr_description,
+    'status': lambda item: item.status,
+    'project_id': lambda item: item.project_id,
+    'type_id': lambda item: item.type_id,
+    'organisation_id': lambda item: item.organisation_id,
+    'requester_id': lambda item: item.requester_id,
+    'assigned_to_id': lambda item: item.assigned_to_id,
+    'responsible_id': lambda item: item.responsible_id,
+    'parent_id': lambda item: item.parent_id,
+    'solution_release_id': lambda item: item.solution_release_id,
+    'intern': lambda item: item.intern,
+    'created_at': lambda item: _isoformat_or_none(item.created_at),
+    'updated_at': lambda item: _isoformat_or_none(item.updated_at),
+}
+
+# Largest page a client may request with ?limit=
+ITEM_LIST_MAX_LIMIT = 500
+
+# Lists with more items than this are streamed instead of built in memory
+ITEM_LIST_STREAM_THRESHOLD = 200
+
+# Rows fetched per database round trip while streaming
+ITEM_LIST_CHUNK_SIZE = 100
+
+
+class ItemListParamError(ValueError):
+    """Raised for invalid list query parameters (answered with 400)."""
+
+
+def _encode_item_cursor(item_id):
+    """Encode the id of the last item on a page as an opaque cursor."""
+    return base64.urlsafe_b64encode(f'id:{item_id}'.encode('ascii')).decode('ascii').rstrip('=')
+
+
+def _decode_item_cursor(cursor):
+    """Decode a cursor created by _encode_item_cursor() into an item id."""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        prefix, _, value = base64.urlsafe_b64decode(padded.encode('ascii')).decode('ascii').partition(':')
+        if prefix != 'id':
+            raise ValueError(cursor)
+        return int(value)
+    except (ValueError, UnicodeError, binascii.Error):
+        raise ItemListParamError('Invalid cursor')
+
+
+def _parse_item_list_params(request):
+    """
+    Parse the pagination, projection and filter parameters of item lists.
+
+    Query parameters:
+        limit: Page size (1..ITEM_LIST_MAX_LIMIT); enables cursor pagination
+        cursor: Opaque cursor from the X-Next-Cursor header of the previous page
+        fields: Comma-separated item keys to return (id is always included)
+        updated_since: ISO 8601 date or datetime; only items updated at or after it
+
+    Returns:
+        Dictionary with limit, after_id, fields and updated_since
+        (each None if not given)
+
+    Raises:
+        ItemListParamError: If a parameter is invalid
+    """
+    params = {'limit': None, 'after_id': None, 'fields': None, 'updated_since': None}
+
+    limit = request.GET.get('limit', '').strip()
+    if limit:
+        try:
+            params['limit'] = int(limit)
+        except ValueError:
+            raise ItemListParamError('limit must be an integer')
+        if not 1 <= params['limit'] <= ITEM_LIST_MAX_LIMIT:
+            raise ItemListParamError(f'limit must be between 1 and {ITEM_LIST_MAX_LIMIT}')
+
+    cursor = request.GET.get('cursor', '').strip()
+    if cursor:
+        params['after_id'] = _decode_item_cursor(cursor)
+
+    fields = request.GET.get('fields', '').strip()
+    if fields:
+        requested = [f.strip() for f in fields.split(',') if f.strip()]
+        unknown = [f for f in requested if f not in _ITEM_FIELD_GETTERS]
+        if unknown:
+            raise ItemListParamError(f"Unknown fields: {', '.join(unknown)}")
+        params['fields'] = ['id'] + [f for f in dict.fromkeys(requested) if f != 'id']
+
+    updated_since = request.GET.get('updated_since', '').strip()
+    if updated_since:
+        try:
+            value = parse_datetime(updated_since)
+            if value is None:
+                date = parse_date(updated_since)
+                if date is not None:
+                    value = datetime.combine(date, datetime.min.time())
+        except ValueError:
+            value = None
+        if value is None:
+            raise ItemListParamError('updated_since must be an ISO 8601 date or datetime')
+        if timezone.is_naive(value):
+            value = timezone.make_aware(value)
+        params['updated_since'] = value
+
+    return params
+
+
+def item_list_response(request, queryset):
+    """
+    Build the response for an item list endpoint.
+
+    Without ``limit`` or ``cursor`` all matching items are returned in the
+    default item order, as before. With them, items are paged by id and the
+    cursor of the next page is sent in the ``X-Next-Cursor`` and ``Link``
+    headers; the body stays a plain JSON array in both cases.
+
+    With ``fields``, only the columns behind the requested keys are loaded,
+    so the large text columns are not read unless asked for. Lists longer
+    than ITEM_LIST_STREAM_THRESHOLD are streamed in chunks instead of being
+    serialized in memory.
+
+    Args:
+        request: The HTTP request carrying the list query parameters
+        queryset: Item queryset with the endpoint's filters applied
+
+    Returns:
+        JsonResponse or StreamingHttpResponse with a JSON array of items,
+        or a 400 JsonResponse for invalid parameters
+    """
+    try:
+        params = _parse_item_list_params(request)
+    except ItemListParamError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+
+    fields = params['fields']
+    if fields:
+        queryset = queryset.only(*{f[:-3] if f.endswith('_id') and f != 'id' else f for f in fields})
+    if params['updated_since'] is not None:
+        queryset = queryset.filter(updated_at__gte=params['updated_since'])
+
+    next_cursor = None
+    if params['limit'] is not None or params['after_id'] is not None:
+        limit = params['limit'] or ITEM_LIST_MAX_LIMIT
+        queryset = queryset.order_by('id')
+        if params['after_id'] is not None:
+            queryset = queryset.filter(id__gt=params['after_id'])
+        # Resolve the page on the primary key index first, so the cursor is
+        # known before the body is streamed; one extra id tells if more exist.
+        page_ids = list(queryset.values_list('id', flat=True)[:limit + 1])
+        if len(page_ids) > limit:
+            page_ids = page_ids[:limit]
+            next_cursor = _encode_item_cursor(page_ids[-1])
+        queryset = queryset.filter(id__lte=page_ids[-1]) if page_ids else queryset.none()
+
+    rows = queryset.iterator(chunk_size=ITEM_LIST_CHUNK_SIZE)
+    head = list(itertools.islice(rows, ITEM_LIST_STREAM_THRESHOLD + 1))
+
+    if len(head) <= ITEM_LIST_STREAM_THRESHOLD:
+        response = JsonResponse([serialize_item(item, fields) for item in head], safe=False)
+    else:
+        response = StreamingHttpResponse(
+            _stream_items(itertools.chain(head, rows), fields),
+            content_type='application/json',
+        )
+
+    if next_cursor:
+        response['X-Next-Cursor'] = next_cursor
+        query = request.GET.copy()
+        query['cursor'] = next_cursor
+        response['Link'] = f'<{request.path}?{query.urlencode()}>; rel="next"'
+    return response
+
+
+def _stream_items(items, fields):
+    """Yield a JSON array of serialized items piece by piece."""
+    yield '['
+    try:
+        for index, item in enumerate(items):
+            yield (',' if index else '') + json.dumps(serialize_item(item, fields))
+    except Exception as e:
+        # Headers are already sent; the truncated body makes the client fail
+        logger.error(f"Error while streaming item list: {e}", exc_info=True)
+        return
+    yield ']'
+
+
 # Helper function to serialize ExtendedRAGContext to dict
 def serialize_rag_context(context):
     """
@@ -297,12 +502,15 @@ def api_project_open_items(request, project_id):
     GET /api/customgpt/projects/{project_id}/open-items
     
     List all items in a project with status != Closed.
+    Supports limit/cursor pagination, fields=, and updated_since
+    (see item_list_response).
     
     Args:
         project_id: Project ID
         
     Returns:
         200: Array of Item objects
+        400: Invalid list parameters
         404: Project not found
     """
     try:
@@ -316,7 +524,7 @@ def api_project_open_items(request, project_id):
             status=ItemStatus.CLOSED
         )
         
-        return JsonResponse([serialize_item(item) for item in items], safe=False)
+        return item_list_response(request, items)
         
     except Project.DoesNotExist:
         return JsonResponse({'error': 'Project not found'}, status=404)
@@ -350,14 +558,17 @@ def api_items_list(request):
     GET /api/customgpt/items
     
     List all items (across all projects) with status != Closed.
+    Supports limit/cursor pagination, fields=, and updated_since
+    (see item_list_response).
     
     Returns:
         200: Array of Item objects
+        400: Invalid list parameters
     """
     try:
         # Get all items excluding Closed status
         items = Item.objects.exclude(status=ItemStatus.CLOSED)
-        return JsonResponse([serialize_item(item) for item in items], safe=False)
+        return item_list_response(request, items)
     except Exception as e:
         logger.error(f"Error listing items: {e}", exc_info=True)
         return JsonResponse({'error': 'Internal server error'}, status=500)
@@ -22,7 +22,7 @@ from .models import (
     Release, UserRole
 )
 from .services.activity import ActivityService
-from .services.storage import AttachmentStorageService
+from .services.storage import AttachmentStorageService, attachment_response
 from .tables import EmbedItemTable
 from .filters import EmbedItemFilter
 
@@ -264,37 +264,19 @@ def embed_attachment_pre_upload(request, project_id):
         # Store attachment using the storage service with custom max size
         storage_service = AttachmentStorageService(max_size_mb=MAX_ATTACHMENT_SIZE_MB)
         
-        # Create a temporary Item placeholder to store the attachment
-        # We'll use the project as the temporary target and update the link later
+        # Store the file in the blob store; the attachment is linked to the
+        # item when the issue is created
+        sha256, relative_path = storage_service.store_blob(uploaded_file)
         attachment = Attachment.objects.create(
             created_by=None,
             original_name=uploaded_file.name,
             content_type=uploaded_file.content_type or '',
             size_bytes=uploaded_file.size,
-            sha256='',  # Will be computed if needed
-            storage_path='',  # Will be set below
+            sha256=sha256,
+            storage_path=relative_path,
             is_deleted=False
         )
         
-        # Build storage path for temporary attachment
-        from core.services.storage.paths import build_attachment_path, get_absolute_path, sanitize_filename
-        relative_path = build_attachment_path(embed_access.project, attachment.id, uploaded_file.name)
-        absolute_path = get_absolute_path(storage_service.data_dir, relative_path)
-        
-        # Ensure parent directory exists
-        absolute_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Write file to storage
-        with open(absolute_path, 'wb') as dest:
-            uploaded_file.seek(0)
-            # Write in chunks
-            while chunk := uploaded_file.read(8192):
-                dest.write(chunk)
-        
-        # Update attachment with storage path
-        attachment.storage_path = relative_path
-        attachment.save(update_fields=['storage_path'])
-        
         # Generate URL for inline images
         attachment_url = ''
         if is_inline:
@@ -753,31 +735,15 @@ def embed_attachment_download(request, attachment_id):
             if not valid_link:
                 raise Http404("Attachment not found")
         
-        # Read file content
-        storage_service = AttachmentStorageService()
-        file_content = storage_service.read_attachment(attachment)
-        
-        # Determine if this is an image for inline display
+        # Images are displayed inline, other files are downloaded
         content_type = attachment.content_type or 'application/octet-stream'
-        is_image = content_type.startswith('image/')
+        disposition = 'inline' if content_type.startswith('image/') else 'attachment'
         
-        # Sanitize filename for header (prevent header injection)
-        from urllib.parse import quote
-        safe_filename = quote(attachment.original_name)
-        
-        # Create response with file
-        response = HttpResponse(file_content, content_type=content_type)
-        
-        if is_image:
-            # For images, display inline
-            response['Content-Disposition'] = f'inline; filename="{safe_filename}"'
-        else:
-            # For other files, force download
-            response['Content-Disposition'] = f'attachment; filename="{safe_filename}"'
-        
-        response['Content-Length'] = len(file_content)
-        
-        return response
+        # Stream file from disk (Range, ETag and sendfile aware)
+        return attachment_response(
+            request, attachment, disposition=disposition,
+            content_type=content_type, storage=AttachmentStorageService()
+        )
         
     except Exception as e:
         import logging
@@ -9,13 +9,13 @@ This service provides:
 
 import json
 import logging
-from typing import List, Dict, Any, Optional
+from typing import Iterator, List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 
 from django.contrib.auth import get_user_model
 from django.db import models
 from core.services.rag.extended_service import build_extended_context
-from core.services.agents.agent_service import AgentService
+from core.services.agents.agent_service import get_agent_service
 from core.models import Item, Attachment, ExternalIssueMapping, Project
 
 User = get_user_model()
@@ -49,7 +49,7 @@ class FirstAIDService:
     
     def __init__(self):
         """Initialize the First AID service."""
-        self.agent_service = AgentService()
+        self.agent_service = get_agent_service()
     
     def _build_external_title(self, mapping, project, prefix: str) -> str:
         """
@@ -209,118 +209,10 @@ class FirstAIDService:
             Dictionary with answer, sources, and metadata
         """
         try:
-            # Retrieve project for project context
-            try:
-                project = Project.objects.get(id=project_id)
-                project_description = project.description if project.description else ""
-            except Project.DoesNotExist:
-                logger.warning(f"Project {project_id} not found for chat")
-                project_description = ""
-            
-            # Process chat history if provided
-            # Strategy: Last 5 pairs (10 messages) are sent fully, older messages are summarized
-            chat_summary = ""
-            chat_keywords = []
-            recent_transcript = ""
-            
-            if chat_history and len(chat_history) > 0:
-                # Separate recent (last 5 pairs = 10 messages) from older history
-                if len(chat_history) <= 10:
-                    # All history is recent - send fully, no summary needed
-                    recent_messages = chat_history
-                    older_messages = []
-                else:
-                    # Split: older messages for summary, recent for full transcript
-                    recent_messages = chat_history[-10:]  # Last 5 pairs (10 messages)
-                    older_messages = chat_history[:-10]   # Everything before that
-                
-                # Build recent transcript (last 5 pairs, always sent fully)
-                if recent_messages:
-                    recent_text = []
-                    for msg in recent_messages:
-                        role = msg.get('role', 'user')
-                        content = msg.get('content', '')
-                        recent_text.append(f"{role.upper()}: {content}")
-                    recent_transcript = '\n'.join(recent_text)
-                    logger.info(f"Recent transcript: {len(recent_messages)} messages")
-                
-                # Summarize only older messages (if any)
-                if older_messages:
-                    # Build older history text for summarization
-                    older_text = []
-                    for msg in older_messages:
-                        role = msg.get('role', 'user')
-                        content = msg.get('content', '')
-                        older_text.append(f"{role.upper()}: {content}")
-                    
-                    older_str = '\n'.join(older_text)
-                    
-                    # Use chat-summary-agent to generate summary and keywords
-                    try:
-                        agent_response = self.agent_service.execute_agent(
-                            filename='chat-summary-agent.yml',
-                            input_text=older_str,
-                            user=user,
-                        )
-                        
-                        # Parse JSON response
-                        summary_data = json.loads(agent_response)
-                        chat_summary = summary_data.get('summary', '')
-                        chat_keywords = summary_data.get('keywords', [])
-                        
-                        logger.info(f"Older chat summary generated: {len(chat_summary)} chars, {len(chat_keywords)} keywords")
-                    except Exception as e:
-                        logger.warning(f"Failed to generate chat summary: {e}", exc_info=True)
-            
-            # Build extended RAG context for the project using ONLY the raw user question.
-            # Per Issue #421: RAG retrieval and question-optimization-agent should receive
-            # ONLY the raw user message, without chat history, summary, or keywords.
-            # This prevents topic changes from polluting the retrieval results.
-            # Chat history will be added later for the question-answering-agent.
-            # MAX_CONTENT_LENGTH from RAG config remains in effect unless a custom
-            # max_content_length is explicitly provided by caller.
-            context = build_extended_context(
-                query=question,
-                project_id=project_id,
-                max_content_length=max_content_length,
+            agent_filename, input_text, context = self._prepare_chat(
+                project_id, question, user, chat_history, max_content_length, mode
             )
             
-            # Select agent based on mode
-            if mode == 'coding':
-                agent_filename = 'coding-answer-agent.yml'
-            else:
-                # Default to support mode (question-answering-agent)
-                agent_filename = 'question-answering-agent.yml'
-            
-            # Build input text with question and context for the answering agent
-            input_parts = [f"Frage: {question}"]
-            
-            # Add project context (project description)
-            if project_description:
-                input_parts.append(f"\nproject_Context:\n{project_description}")
-            
-            # Add chat context if available
-            # Note: We provide the recent transcript and older summary to the answering agent.
-            # Recent messages (up to the last 10 messages/5 pairs) are sent in full for better context.
-            if recent_transcript:
-                input_parts.append(f"\nLetzte Konversation:\n{recent_transcript}")
-            if chat_summary:
-                input_parts.append(f"\nÄltere Chat-Zusammenfassung: {chat_summary}")
-            if chat_keywords:
-                input_parts.append(f"\nRelevante Keywords: {', '.join(chat_keywords)}")
-            
-            if context:
-                if hasattr(context, 'summary') and context.summary:
-                    input_parts.append(f"\nKontext-Zusammenfassung: {context.summary}")
-
-                # Include full LLM context text (all selected A/B/C snippets with content),
-                # not only titles.
-                if hasattr(context, 'to_context_text'):
-                    input_parts.append("\nVollständiger Kontext aus der Wissensdatenbank:")
-                    input_parts.append(context.to_context_text())
-            
-            input_text = '\n'.join(input_parts)
-            
             # Execute the agent to generate answer
             answer = self.agent_service.execute_agent(
                 filename=agent_filename,
@@ -330,9 +222,7 @@ class FirstAIDService:
             
             return {
                 'answer': answer if isinstance(answer, str) else str(answer),
-                'sources': [item.to_dict() for item in context.all_items] if context and hasattr(context, 'all_items') else [],
-                'summary': context.summary if context and hasattr(context, 'summary') else '',
-                'stats': context.stats if context and hasattr(context, 'stats') else {},
+                **self._context_result(context),
             }
         except Exception as e:
             logger.error(f"Error in FirstAID chat: {e}", exc_info=True)
@@ -343,6 +233,169 @@ class FirstAIDService:
                 'stats': {},
             }
     
+    def chat_stream(self, project_id: int, question: str, user: User, chat_history: Optional[List[Dict]] = None, max_content_length: Optional[int] = None, mode: str = 'support') -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Streaming variant of chat().
+        
+        Sources are sent as soon as the RAG context is built, then the
+        answer follows piece by piece. Errors are raised to the caller.
+        
+        Args:
+            Same as chat()
+            
+        Yields:
+            ('meta', {sources, summary, stats}), then ('delta', {text}) per
+            piece of the answer, then ('done', {answer, sources, summary, stats})
+        """
+        agent_filename, input_text, context = self._prepare_chat(
+            project_id, question, user, chat_history, max_content_length, mode
+        )
+        result = self._context_result(context)
+        yield 'meta', result
+        
+        parts = []
+        for text in self.agent_service.execute_agent_stream(
+            filename=agent_filename,
+            input_text=input_text,
+            user=user,
+        ):
+            parts.append(text)
+            yield 'delta', {'text': text}
+        
+        yield 'done', {'answer': ''.join(parts), **result}
+    
+    def _context_result(self, context: Any) -> Dict[str, Any]:
+        """Sources, summary and stats of a RAG context for the chat response."""
+        return {
+            'sources': [item.to_dict() for item in context.all_items] if context and hasattr(context, 'all_items') else [],
+            'summary': context.summary if context and hasattr(context, 'summary') else '',
+            'stats': context.stats if context and hasattr(context, 'stats') else {},
+        }
+    
+    def _prepare_chat(self, project_id: int, question: str, user: User, chat_history: Optional[List[Dict]], max_content_length: Optional[int], mode: str) -> Tuple[str, str, Any]:
+        """
+        Build the answering agent's input for a chat question.
+        
+        Summarizes older chat history, retrieves the RAG context and selects
+        the agent for the mode.
+        
+        Returns:
+            Tuple of (agent filename, agent input text, RAG context)
+        """
+        # Retrieve project for project context
+        try:
+            project = Project.objects.get(id=project_id)
+            project_description = project.description if project.description else ""
+        except Project.DoesNotExist:
+            logger.warning(f"Project {project_id} not found for chat")
+            project_description = ""
+        
+        # Process chat history if provided
+        # Strategy: Last 5 pairs (10 messages) are sent fully, older messages are summarized
+        chat_summary = ""
+        chat_keywords = []
+        recent_transcript = ""
+        
+        if chat_history and len(chat_history) > 0:
+            # Separate recent (last 5 pairs = 10 messages) from older history
+            if len(chat_history) <= 10:
+                # All history is recent - send fully, no summary needed
+                recent_messages = chat_history
+                older_messages = []
+            else:
+                # Split: older messages for summary, recent for full transcript
+                recent_messages = chat_history[-10:]  # Last 5 pairs (10 messages)
+                older_messages = chat_history[:-10]   # Everything before that
+            
+            # Build recent transcript (last 5 pairs, always sent fully)
+            if recent_messages:
+                recent_text = []
+                for msg in recent_messages:
+                    role = msg.get('role', 'user')
+                    content = msg.get('content', '')
+                    recent_text.append(f"{role.upper()}: {content}")
+                recent_transcript = '\n'.join(recent_text)
+                logger.info(f"Recent transcript: {len(recent_messages)} messages")
+            
+            # Summarize only older messages (if any)
+            if older_messages:
+                # Build older history text for summarization
+                older_text = []
+                for msg in older_messages:
+                    role = msg.get('role', 'user')
+                    content = msg.get('content', '')
+                    older_text.append(f"{role.upper()}: {content}")
+                
+                older_str = '\n'.join(older_text)
+                
+                # Use chat-summary-agent to generate summary and keywords
+                try:
+                    agent_response = self.agent_service.execute_agent(
+                        filename='chat-summary-agent.yml',
+                        input_text=older_str,
+                        user=user,
+                    )
+                    
+                    # Parse JSON response
+                    summary_data = json.loads(agent_response)
+                    chat_summary = summary_data.get('summary', '')
+                    chat_keywords = summary_data.get('keywords', [])
+                    
+                    logger.info(f"Older chat summary generated: {len(chat_summary)} chars, {len(chat_keywords)} keywords")
+                except Exception as e:
+                    logger.warning(f"Failed to generate chat summary: {e}", exc_info=True)
+        
+        # Build extended RAG context for the project using ONLY the raw user question.
+        # Per Issue #421: RAG retrieval and question-optimization-agent should receive
+        # ONLY the raw user message, without chat history, summary, or keywords.
+        # This prevents topic changes from polluting the retrieval results.
+        # Chat history will be added later for the question-answering-agent.
+        # MAX_CONTENT_LENGTH from RAG config remains in effect unless a custom
+        # max_content_length is explicitly provided by caller.
+        context = build_extended_context(
+            query=question,
+            project_id=project_id,
+            max_content_length=max_content_length,
+        )
+        
+        # Select agent based on mode
+        if mode == 'coding':
+            agent_filename = 'coding-answer-agent.yml'
+        else:
+            # Default to support mode (question-answering-agent)
+            agent_filename = 'question-answering-agent.yml'
+        
+        # Build input text with question and context for the answering agent
+        input_parts = [f"Frage: {question}"]
+        
+        # Add project context (project description)
+        if project_description:
+            input_parts.append(f"\nproject_Context:\n{project_description}")
+        
+        # Add chat context if available
+        # Note: We provide the recent transcript and older summary to the answering agent.
+        # Recent messages (up to the last 10 messages/5 pairs) are sent in full for better context.
+        if recent_transcript:
+            input_parts.append(f"\nLetzte Konversation:\n{recent_transcript}")
+        if chat_summary:
+            input_parts.append(f"\nÄltere Chat-Zusammenfassung: {chat_summary}")
+        if chat_keywords:
+            input_parts.append(f"\nRelevante Keywords: {', '.join(chat_keywords)}")
+        
+        if context:
+            if hasattr(context, 'summary') and context.summary:
+                input_parts.append(f"\nKontext-Zusammenfassung: {context.summary}")
+
+            # Include full LLM context text (all selected A/B/C snippets with content),
+            # not only titles.
+            if hasattr(context, 'to_context_text'):
+                input_parts.append("\nVollständiger Kontext aus der Wissensdatenbank:")
+                input_parts.append(context.to_context_text())
+        
+        input_text = '\n'.join(input_parts)
+        
+        return agent_filename, input_text, context
+    
     def _generate_answer_fallback(self, question: str, context: Any) -> str:
         """
         Fallback answer generation when agent execution fails.
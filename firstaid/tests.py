@@ -2,6 +2,7 @@
 Tests for First AID views and services.
 """
 
+import json
 from unittest.mock import patch, Mock
 from django.test import TestCase, Client
 from django.urls import reverse
@@ -119,7 +120,7 @@ class FirstAIDViewTestCase(TestCase):
         self.assertIn(b'Items', response.content)  # Should show Items section
     
     @patch('firstaid.services.firstaid_service.build_extended_context')
-    @patch('firstaid.services.firstaid_service.AgentService.execute_agent')
+    @patch('core.services.agents.agent_service.AgentService.execute_agent')
     def test_firstaid_chat_uses_question_answering_agent(self, mock_execute_agent, mock_build_context):
         """Test that chat uses question-answering-agent by default"""
         # Mock the RAG context
@@ -197,7 +198,7 @@ class FirstAIDViewTestCase(TestCase):
         self.assertIn('sources', response_data)
     
     @patch('firstaid.services.firstaid_service.build_extended_context')
-    @patch('firstaid.services.firstaid_service.AgentService.execute_agent')
+    @patch('core.services.agents.agent_service.AgentService.execute_agent')
     def test_firstaid_chat_no_configure_message_on_agent_error(self, mock_execute_agent, mock_build_context):
         """Test that 'Please configure' message does not appear even on agent errors"""
         # Mock the RAG context
@@ -448,7 +449,7 @@ class ChatHistoryTestCase(TestCase):
         )
     
     @patch('firstaid.services.firstaid_service.build_extended_context')
-    @patch('firstaid.services.firstaid_service.AgentService.execute_agent')
+    @patch('core.services.agents.agent_service.AgentService.execute_agent')
     def test_chat_with_thinking_level(self, mock_execute_agent, mock_build_context):
         """Test that thinking level is passed to the RAG pipeline"""
         # Mock the RAG context
@@ -488,7 +489,7 @@ class ChatHistoryTestCase(TestCase):
             self.assertEqual(call_kwargs['max_content_length'], expected_length)
     
     @patch('firstaid.services.firstaid_service.build_extended_context')
-    @patch('firstaid.services.firstaid_service.AgentService.execute_agent')
+    @patch('core.services.agents.agent_service.AgentService.execute_agent')
     def test_chat_history_stored_in_session(self, mock_execute_agent, mock_build_context):
         """Test that chat history is stored in session"""
         # Mock the RAG context
@@ -537,7 +538,7 @@ class ChatHistoryTestCase(TestCase):
         self.assertIn('timestamp', history[1])
     
     @patch('firstaid.services.firstaid_service.build_extended_context')
-    @patch('firstaid.services.firstaid_service.AgentService.execute_agent')
+    @patch('core.services.agents.agent_service.AgentService.execute_agent')
     def test_chat_history_summarization(self, mock_execute_agent, mock_build_context):
         """Test that chat history is summarized when follow-up questions are asked"""
         # Mock the RAG context
@@ -582,7 +583,7 @@ class ChatHistoryTestCase(TestCase):
         self.assertEqual(len(calls), 0, "chat-summary-agent should NOT be called when history <= 10 messages")
     
     @patch('firstaid.services.firstaid_service.build_extended_context')
-    @patch('firstaid.services.firstaid_service.AgentService.execute_agent')
+    @patch('core.services.agents.agent_service.AgentService.execute_agent')
     def test_chat_history_recent_transcript_only(self, mock_execute_agent, mock_build_context):
         """Test that recent history (< 10 messages) is sent as transcript only, no summary"""
         from firstaid.services.firstaid_service import FirstAIDService
@@ -637,7 +638,7 @@ class ChatHistoryTestCase(TestCase):
         self.assertIn('Answer 2', qa_input)
         
     @patch('firstaid.services.firstaid_service.build_extended_context')
-    @patch('firstaid.services.firstaid_service.AgentService.execute_agent')
+    @patch('core.services.agents.agent_service.AgentService.execute_agent')
     def test_chat_history_split_recent_and_older(self, mock_execute_agent, mock_build_context):
         """Test that history > 10 messages is split into recent transcript and older summary"""
         from firstaid.services.firstaid_service import FirstAIDService
@@ -709,7 +710,7 @@ class ChatHistoryTestCase(TestCase):
         self.assertIn('Answer 6', qa_input)
         
     @patch('firstaid.services.firstaid_service.build_extended_context')
-    @patch('firstaid.services.firstaid_service.AgentService.execute_agent')
+    @patch('core.services.agents.agent_service.AgentService.execute_agent')
     def test_chat_history_exactly_10_messages(self, mock_execute_agent, mock_build_context):
         """Test that exactly 10 messages (5 pairs) are sent as recent transcript only"""
         from firstaid.services.firstaid_service import FirstAIDService
@@ -784,7 +785,7 @@ class ChatHistoryTestCase(TestCase):
         self.assertNotIn(session_key, session)
     
     @patch('firstaid.services.firstaid_service.build_extended_context')
-    @patch('firstaid.services.firstaid_service.AgentService.execute_agent')
+    @patch('core.services.agents.agent_service.AgentService.execute_agent')
     def test_chat_history_truncation(self, mock_execute_agent, mock_build_context):
         """Test that chat history is truncated to last 20 messages"""
         # Mock the RAG context
@@ -830,7 +831,7 @@ class ChatHistoryTestCase(TestCase):
         self.assertNotEqual(updated_history[0]['content'], 'Question 0')
     
     @patch('firstaid.services.firstaid_service.build_extended_context')
-    @patch('firstaid.services.firstaid_service.AgentService.execute_agent')
+    @patch('core.services.agents.agent_service.AgentService.execute_agent')
     def test_chat_includes_project_description(self, mock_execute_agent, mock_build_context):
         """Test that chat includes project description in agent input"""
         from firstaid.services.firstaid_service import FirstAIDService
@@ -871,7 +872,7 @@ class ChatHistoryTestCase(TestCase):
         self.assertEqual(result['answer'], "Test answer")
     
     @patch('firstaid.services.firstaid_service.build_extended_context')
-    @patch('firstaid.services.firstaid_service.AgentService.execute_agent')
+    @patch('core.services.agents.agent_service.AgentService.execute_agent')
     def test_chat_without_project_description(self, mock_execute_agent, mock_build_context):
         """Test that chat works when project has no description"""
         from firstaid.services.firstaid_service import FirstAIDService
@@ -911,3 +912,88 @@ class ChatHistoryTestCase(TestCase):
         self.assertEqual(result['answer'], "Test answer")
 
 
+class FirstAIDChatStreamTestCase(TestCase):
+    """Test cases for the streaming chat endpoint"""
+    
+    def setUp(self):
+        """Set up test data"""
+        self.client = Client()
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass'
+        )
+        self.client.force_login(self.user)
+        self.project = Project.objects.create(
+            name='Test Project',
+            description='Test project description',
+            status='Working'
+        )
+        
+        self.mock_context = Mock()
+        self.mock_context.summary = 'Test summary'
+        self.mock_context.all_items = []
+        self.mock_context.stats = {}
+        self.mock_context.to_context_text.return_value = 'Test context text'
+    
+    def _events(self, response):
+        """Parse the event stream into (event, data) pairs"""
+        events = []
+        for block in b''.join(response.streaming_content).decode().strip().split('\n\n'):
+            lines = block.split('\n')
+            events.append((lines[0][len('event: '):], json.loads(lines[1][len('data: '):])))
+        return events
+    
+    @patch('firstaid.services.firstaid_service.build_extended_context')
+    @patch('core.services.agents.agent_service.AgentService.execute_agent_stream')
+    def test_chat_stream_sends_meta_deltas_and_done(self, mock_stream, mock_build_context):
+        """Test that sources come first, then the answer in pieces"""
+        mock_build_context.return_value = self.mock_context
+        mock_stream.return_value = iter(['Test ', 'answer'])
+        
+        response = self.client.post(
+            reverse('firstaid:chat-stream'),
+            data={'question': 'Test question?', 'project_id': self.project.id},
+            content_type='application/json'
+        )
+        
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        self.assertEqual(response['X-Accel-Buffering'], 'no')
+        events = self._events(response)
+        self.assertEqual([e for e, _ in events], ['meta', 'delta', 'delta', 'done'])
+        self.assertEqual(events[0][1]['summary'], 'Test summary')
+        self.assertEqual(events[-1][1]['answer'], 'Test answer')
+        self.assertEqual(mock_stream.call_args[1]['filename'], 'question-answering-agent.yml')
+        
+        # History is saved although the session middleware ran before the stream
+        history = self.client.session[f'firstaid_chat_history_{self.project.id}']
+        self.assertEqual([m['role'] for m in history], ['user', 'assistant'])
+        self.assertEqual(history[1]['content'], 'Test answer')
+    
+    @patch('firstaid.services.firstaid_service.build_extended_context')
+    @patch('core.services.agents.agent_service.AgentService.execute_agent_stream')
+    def test_chat_stream_error_event(self, mock_stream, mock_build_context):
+        """Test that agent errors end the stream with an error event"""
+        mock_build_context.return_value = self.mock_context
+        mock_stream.side_effect = ServiceNotConfigured('No active AI model configured')
+        
+        response = self.client.post(
+            reverse('firstaid:chat-stream'),
+            data={'question': 'Test question?', 'project_id': self.project.id},
+            content_type='application/json'
+        )
+        
+        events = self._events(response)
+        self.assertEqual(events[-1][0], 'error')
+        self.assertIn('No active AI model', events[-1][1]['message'])
+        self.assertNotIn(f'firstaid_chat_history_{self.project.id}', self.client.session)
+    
+    def test_chat_stream_requires_question(self):
+        """Test that invalid payloads are rejected before streaming"""
+        response = self.client.post(
+            reverse('firstaid:chat-stream'),
+            data={'project_id': self.project.id},
+            content_type='application/json'
+        )
+        
+        self.assertEqual(response.status_code, 400)
@@ -12,6 +12,7 @@ urlpatterns = [
     
     # Chat endpoints
     path('chat/', views.firstaid_chat, name='chat'),
+    path('chat/stream/', views.firstaid_chat_stream, name='chat-stream'),
     path('chat/clear-history/', views.clear_chat_history, name='clear-chat-history'),
     
     # Source endpoints
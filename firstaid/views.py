@@ -11,6 +11,7 @@ from django.http import JsonResponse, HttpResponse
 from django.views.decorators.http import require_http_methods, require_POST
 
 from core.models import Project
+from core.utils.sse import sse_event, sse_response
 from .services.firstaid_service import FirstAIDService
 
 logger = logging.getLogger(__name__)
@@ -81,24 +82,9 @@ def firstaid_chat(request):
     """
     try:
         data = json.loads(request.body)
-        question = data.get('question', '').strip()
-        project_id = data.get('project_id')
-        thinking_level = data.get('thinking_level', 'standard')
-        mode = data.get('mode', 'support')
-        
-        if not question:
-            return JsonResponse({'error': 'Question is required'}, status=400)
-        
-        if not project_id:
-            return JsonResponse({'error': 'Project ID is required'}, status=400)
-        
-        # Map thinking level to max_content_length
-        thinking_levels = {
-            'standard': 3000,
-            'erweitert': 6000,
-            'professionell': 10000,
-        }
-        max_content_length = thinking_levels.get(thinking_level, 3000)
+        question, project_id, max_content_length, mode, error = _parse_chat_payload(data)
+        if error:
+            return JsonResponse({'error': error}, status=400)
         
         # Get chat history from session
         session_key = f'firstaid_chat_history_{project_id}'
@@ -123,21 +109,7 @@ def firstaid_chat(request):
             mode=mode,
         )
         
-        # Add assistant message to history
-        assistant_message = {
-            'role': 'assistant',
-            'content': result.get('answer', ''),
-            'timestamp': datetime.now().isoformat(),
-        }
-        chat_history.append(assistant_message)
-        
-        # Keep only last 20 messages (10 exchanges)
-        if len(chat_history) > 20:
-            chat_history = chat_history[-20:]
-        
-        # Save updated history to session
-        request.session[session_key] = chat_history
-        request.session.modified = True
+        _save_chat_history(request, session_key, chat_history, result.get('answer', ''))
         
         return JsonResponse(result)
     
@@ -148,6 +120,103 @@ def firstaid_chat(request):
         return JsonResponse({'error': str(e)}, status=500)
 
 
+@login_required
+@require_POST
+def firstaid_chat_stream(request):
+    """
+    Process a chat message and stream the response as Server-Sent Events.
+    
+    Expects the same JSON payload as firstaid_chat. Emits a ``meta`` event
+    with the sources, ``delta`` events with pieces of the answer, and a
+    final ``done`` event with the same fields as the firstaid_chat response
+    (or an ``error`` event). The exchange is added to the chat history once
+    the answer is complete.
+    """
+    try:
+        data = json.loads(request.body)
+    except json.JSONDecodeError:
+        return JsonResponse({'error': 'Invalid JSON'}, status=400)
+    
+    question, project_id, max_content_length, mode, error = _parse_chat_payload(data)
+    if error:
+        return JsonResponse({'error': error}, status=400)
+    
+    session_key = f'firstaid_chat_history_{project_id}'
+    chat_history = request.session.get(session_key, [])
+    chat_history.append({
+        'role': 'user',
+        'content': question,
+        'timestamp': datetime.now().isoformat(),
+    })
+    
+    def events():
+        service = FirstAIDService()
+        for event, payload in service.chat_stream(
+            project_id=int(project_id),
+            question=question,
+            user=request.user,
+            chat_history=chat_history[:-1],
+            max_content_length=max_content_length,
+            mode=mode,
+        ):
+            if event == 'done':
+                # The session middleware already ran when the response
+                # started, so the history has to be saved explicitly.
+                _save_chat_history(request, session_key, chat_history, payload['answer'])
+                request.session.save()
+            yield sse_event(event, payload)
+    
+    return sse_response(events())
+
+
+def _parse_chat_payload(data):
+    """
+    Validate a chat request payload.
+    
+    Returns:
+        Tuple of (question, project_id, max_content_length, mode, error);
+        error is None if the payload is valid
+    """
+    question = data.get('question', '').strip()
+    project_id = data.get('project_id')
+    thinking_level = data.get('thinking_level', 'standard')
+    mode = data.get('mode', 'support')
+    
+    if not question:
+        return question, project_id, None, mode, 'Question is required'
+    
+    if not project_id:
+        return question, project_id, None, mode, 'Project ID is required'
+    
+    # Map thinking level to max_content_length
+    thinking_levels = {
+        'standard': 3000,
+        'erweitert': 6000,
+        'professionell': 10000,
+    }
+    max_content_length = thinking_levels.get(thinking_level, 3000)
+    
+    return question, project_id, max_content_length, mode, None
+
+
+def _save_chat_history(request, session_key, chat_history, answer):
+    """Append the assistant answer and store the last 20 messages in the session."""
+    # Add assistant message to history
+    chat_history.append({
+        'role': 'assistant',
+        'content': answer,
+        'timestamp': datetime.now().isoformat(),
+    })
+    
+    # Keep only last 20 messages (10 exchanges)
+    if len(chat_history) > 20:
+        chat_history = chat_history[-20:]
+    
+    # Save updated history to session
+    request.session[session_key] = chat_history
+    request.session.modified = True
+
+
 @login_required
 def firstaid_sources(request):
     """
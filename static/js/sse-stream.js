@@ -0,0 +1,69 @@
+/**
+ * Client for the streaming AI endpoints (Server-Sent Events over POST)
+ */
+
+/**
+ * POST to an event-stream endpoint and dispatch the events as they arrive.
+ *
+ * EventSource only supports GET, so the response body is read with fetch.
+ * Each event's JSON data is passed to handlers[eventName] (meta, delta,
+ * done, error). Non-stream responses (e.g. a 400/403 JSON error) are passed
+ * to handlers.error.
+ *
+ * @param {string} url - Endpoint URL
+ * @param {Object} options - {body, headers} for the request
+ * @param {Object} handlers - Callbacks keyed by event name
+ * @returns {Promise<void>} Resolves when the stream has ended
+ */
+async function postEventStream(url, options, handlers) {
+    const response = await fetch(url, {
+        method: 'POST',
+        headers: options.headers || {},
+        body: options.body,
+    });
+
+    const contentType = response.headers.get('Content-Type') || '';
+    if (!response.ok || !contentType.startsWith('text/event-stream')) {
+        let message = 'Request failed (' + response.status + ')';
+        try {
+            const data = await response.json();
+            message = data.message || data.error || message;
+        } catch (e) {
+            // Not JSON - keep the generic message
+        }
+        if (handlers.error) handlers.error({message: message});
+        return;
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+
+    const dispatch = function(rawEvent) {
+        let eventName = 'message';
+        const dataLines = [];
+        rawEvent.split('\n').forEach(function(line) {
+            if (line.startsWith('event:')) {
+                eventName = line.slice(6).trim();
+            } else if (line.startsWith('data:')) {
+                dataLines.push(line.slice(5).trim());
+            }
+        });
+        if (!dataLines.length || !handlers[eventName]) return;
+        handlers[eventName](JSON.parse(dataLines.join('\n')));
+    };
+
+    while (true) {
+        const {value, done} = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, {stream: true});
+
+        let boundary = buffer.indexOf('\n\n');
+        while (boundary !== -1) {
+            dispatch(buffer.slice(0, boundary));
+            buffer = buffer.slice(boundary + 2);
+            boundary = buffer.indexOf('\n\n');
+        }
+    }
+    if (buffer.trim()) dispatch(buffer);
+}